@@ -17,6 +17,7 @@ import jwt
 
 from marshmallow import fields
 
+from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
 from ..core.profile import Profile
 from ..core.plugin_registry import PluginRegistry
@@ -531,6 +532,9 @@ class AdminServer(BaseAdminServer):
         collector = self.context.inject(Collector, required=False)
         if collector:
             status["timing"] = collector.results
+        cache = self.context.inject(BaseCache, required=False)
+        if cache:
+            status["cache"] = await cache.get_stats()
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
         return web.json_response(status)
@@ -551,6 +555,9 @@ class AdminServer(BaseAdminServer):
         collector = self.context.inject(Collector, required=False)
         if collector:
             collector.reset()
+        cache = self.context.inject(BaseCache, required=False)
+        if cache:
+            cache.stats.reset()
         return web.json_response({})
 
     async def redirect_handler(self, request: web.BaseRequest):
@@ -4,6 +4,8 @@ from aiohttp.test_utils import unused_port
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.default_context import DefaultContextBuilder
 from ...config.injection_context import InjectionContext
 from ...core.in_memory import InMemoryProfile
@@ -225,6 +227,32 @@ class TestAdminServer(AsyncTestCase):
 
         await server.stop()
 
+    async def test_status_cache(self):
+        context = InjectionContext()
+        cache = InMemoryCache()
+        context.injector.bind_instance(BaseCache, cache)
+        await cache.set("schema::id", {"name": "schema"})
+        await cache.get("schema::id")
+        server = self.get_admin_server(
+            {"admin.admin_insecure_mode": True, "task_queue": True}, context
+        )
+        await server.start()
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status", headers={}
+        ) as response:
+            result = await response.json()
+            assert result["cache"]["entries"] == 1
+            assert result["cache"]["prefixes"]["schema"]["hits"] == 1
+
+        async with self.client_session.post(
+            f"http://127.0.0.1:{self.port}/status/reset", headers={}
+        ) as response:
+            assert response.status == 200
+        assert cache.stats.results == {}
+
+        await server.stop()
+
     async def test_visit_secure_mode(self):
         settings = {
             "admin.admin_insecure_mode": False,
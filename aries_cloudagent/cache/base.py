@@ -1,8 +1,10 @@
 """Abstract base classes for cache."""
 
 import asyncio
+import sys
+
 from abc import ABC, abstractmethod
-from typing import Any, Sequence, Text, Union
+from typing import Any, Mapping, Sequence, Text, Union
 
 from ..core.error import BaseError
 
@@ -11,12 +13,56 @@ class CacheError(BaseError):
     """Base class for cache-related errors."""
 
 
+def estimate_size(value: Any) -> int:
+    """Estimate the memory used by a cached value, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v) for v in value)
+    return size
+
+
+def cache_key_prefix(key: Text) -> Text:
+    """Determine the prefix used to group statistics for a cache key."""
+    prefix, sep, _ = key.partition("::")
+    return prefix if sep else "*"
+
+
+class CacheStats:
+    """Counters for cache operations, grouped by key prefix."""
+
+    COUNTERS = ("hits", "misses", "sets", "evictions", "lock_waits")
+
+    def __init__(self):
+        """Initialize the cache statistics."""
+        self._counts = {}
+
+    def log(self, counter: Text, key: Text, count: int = 1):
+        """Increment a counter for a cache key."""
+        prefix = cache_key_prefix(key)
+        counts = self._counts.get(prefix)
+        if counts is None:
+            counts = self._counts[prefix] = dict.fromkeys(self.COUNTERS, 0)
+        counts[counter] += count
+
+    def reset(self):
+        """Reset all counters."""
+        self._counts = {}
+
+    @property
+    def results(self) -> dict:
+        """Accessor for the counters per key prefix."""
+        return {prefix: counts.copy() for prefix, counts in self._counts.items()}
+
+
 class BaseCache(ABC):
     """Abstract cache interface."""
 
     def __init__(self):
         """Initialize the cache instance."""
         self._key_locks = {}
+        self.stats = CacheStats()
 
     @abstractmethod
     async def get(self, key: Text):
@@ -57,12 +103,81 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    async def get_many(self, keys: Sequence[Text]) -> dict:
+        """
+        Get multiple items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            A dictionary of the keys which were found to their values
+
+        """
+        result = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def set_many(self, values: Mapping[Text, Any], ttl: int = None):
+        """
+        Add multiple items to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            values: a dictionary of keys to the values to store
+            ttl: number of seconds that the records should persist
+
+        """
+        for key, value in values.items():
+            await self.set(key, value, ttl)
+
+    async def clear_many(self, keys: Sequence[Text]):
+        """
+        Remove multiple items from the cache, if present.
+
+        Args:
+            keys: the keys to remove
+
+        """
+        for key in keys:
+            await self.clear(key)
+
+    async def get_size(self) -> dict:
+        """
+        Estimate the current size of the cache.
+
+        Returns:
+            A dictionary of key prefixes to the number of entries and the
+            estimated size in bytes of their values
+
+        """
+        return {}
+
+    async def get_stats(self) -> dict:
+        """Get the operation counters and size estimates of the cache."""
+        prefixes = self.stats.results
+        for counts in prefixes.values():
+            counts.update(entries=0, bytes=0)
+        entries = 0
+        size = 0
+        for prefix, prefix_size in (await self.get_size()).items():
+            prefixes.setdefault(prefix, dict.fromkeys(CacheStats.COUNTERS, 0))
+            prefixes[prefix].update(prefix_size)
+            entries += prefix_size["entries"]
+            size += prefix_size["bytes"]
+        return {"entries": entries, "bytes": size, "prefixes": prefixes}
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
         first = self._key_locks.setdefault(key, result)
         if first is not result:
             result.parent = first
+            self.stats.log("lock_waits", key)
         return result
 
     def release(self, key: Text):
@@ -1,29 +1,107 @@
 """Basic in-memory cache implementation."""
 
+import heapq
 import time
-from typing import Any, Sequence, Text, Union
 
-from .base import BaseCache
+from collections import OrderedDict
+from typing import Any, Mapping, Sequence, Text, Union
+
+from .base import BaseCache, cache_key_prefix, estimate_size
+
+DEFAULT_MAX_ENTRIES = 10000
 
 
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """Basic in-memory cache class.
+
+    Items are evicted in least recently used order when the cache holds more
+    than its maximum number of entries. Expiry times are tracked in a min-heap,
+    so expired items are removed in amortized logarithmic time per operation.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize a `InMemoryCache` instance.
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+        Args:
+            max_entries: the maximum number of entries to hold, or None for
+                no limit
+
+        """
         super().__init__()
-        # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        self.max_entries = max_entries
+        # looks like { "key": { "expires": <timestamp>, "value": <val>, "size": <n> } }
+        self._cache = OrderedDict()
+        # looks like [ (<epoch timestamp>, "key"), ... ]
+        self._expiry = []
+        # looks like { "prefix": { "entries": <count>, "bytes": <size> } }
+        self._sizes = {}
+
+    def _add_entry(self, key: Text, entry: dict):
+        """Store an entry, replacing any previous entry for the key."""
+        prev = self._cache.get(key)
+        if prev:
+            self._remove_entry(key, prev)
+        self._cache[key] = entry
+        size = self._sizes.setdefault(cache_key_prefix(key), {"entries": 0, "bytes": 0})
+        size["entries"] += 1
+        size["bytes"] += entry["size"]
+
+    def _remove_entry(self, key: Text, entry: dict, evicted: bool = False):
+        """Update size estimates for a removed entry."""
+        size = self._sizes[cache_key_prefix(key)]
+        size["entries"] -= 1
+        size["bytes"] -= entry["size"]
+        if evicted:
+            self.stats.log("evictions", key)
 
     def _remove_expired_cache_items(self):
-        """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
+        """Remove expired items from the cache."""
+        expiry = self._expiry
+        if not expiry:
+            return
+        now = time.perf_counter()
+        while expiry and expiry[0][0] <= now:
+            expires, key = heapq.heappop(expiry)
+            entry = self._cache.get(key)
+            # skip heap entries superseded by a later set or clear
+            if entry and entry["expires"] == expires:
                 del self._cache[key]
+                self._remove_entry(key, entry, True)
+        if len(expiry) > 2 * len(self._cache) + 64:
+            # compact heap entries superseded by a later set or clear
+            self._expiry = [
+                (entry["expires"], key)
+                for key, entry in self._cache.items()
+                if entry["expires"] is not None
+            ]
+            heapq.heapify(self._expiry)
+
+    def _get_entry(self, key: Text):
+        """Look up an unexpired value, marking it as recently used."""
+        entry = self._cache.get(key)
+        if not entry:
+            self.stats.log("misses", key)
+            return None
+        self.stats.log("hits", key)
+        self._cache.move_to_end(key)
+        return entry["value"]
+
+    def _set_entry(self, key: Text, value: Any, expires_ts: float, value_size: int):
+        """Store a value as the most recently used entry."""
+        self._add_entry(
+            key, {"expires": expires_ts, "value": value, "size": value_size}
+        )
+        self._cache.move_to_end(key)
+        self.stats.log("sets", key)
+        if expires_ts is not None:
+            heapq.heappush(self._expiry, (expires_ts, key))
+
+    def _evict_entries(self):
+        """Remove the least recently used entries beyond the size limit."""
+        if self.max_entries:
+            while len(self._cache) > self.max_entries:
+                self._remove_entry(*self._cache.popitem(last=False), True)
 
     async def get(self, key: Text):
         """
@@ -37,7 +115,26 @@ class InMemoryCache(BaseCache):
 
         """
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        return self._get_entry(key)
+
+    async def get_many(self, keys: Sequence[Text]) -> dict:
+        """
+        Get multiple items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            A dictionary of the keys which were found to their values
+
+        """
+        self._remove_expired_cache_items()
+        result = {}
+        for key in keys:
+            value = self._get_entry(key)
+            if value is not None:
+                result[key] = value
+        return result
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """
@@ -53,8 +150,27 @@ class InMemoryCache(BaseCache):
         """
         self._remove_expired_cache_items()
         expires_ts = time.perf_counter() + ttl if ttl else None
+        value_size = estimate_size(value)
         for key in [keys] if isinstance(keys, Text) else keys:
-            self._cache[key] = {"expires": expires_ts, "value": value}
+            self._set_entry(key, value, expires_ts, value_size)
+        self._evict_entries()
+
+    async def set_many(self, values: Mapping[Text, Any], ttl: int = None):
+        """
+        Add multiple items to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            values: a dictionary of keys to the values to store
+            ttl: number of seconds that the records should persist
+
+        """
+        self._remove_expired_cache_items()
+        expires_ts = time.perf_counter() + ttl if ttl else None
+        for key, value in values.items():
+            self._set_entry(key, value, expires_ts, estimate_size(value))
+        self._evict_entries()
 
     async def clear(self, key: Text):
         """
@@ -64,10 +180,35 @@ class InMemoryCache(BaseCache):
             key: the key to remove
 
         """
-        if key in self._cache:
-            del self._cache[key]
+        entry = self._cache.pop(key, None)
+        if entry:
+            self._remove_entry(key, entry)
+
+    async def clear_many(self, keys: Sequence[Text]):
+        """
+        Remove multiple items from the cache, if present.
+
+        Args:
+            keys: the keys to remove
+
+        """
+        for key in keys:
+            entry = self._cache.pop(key, None)
+            if entry:
+                self._remove_entry(key, entry)
 
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry = []
+        self._sizes = {}
+
+    async def get_size(self) -> dict:
+        """Estimate the current size of the cache."""
+        self._remove_expired_cache_items()
+        return {
+            prefix: size.copy()
+            for prefix, size in self._sizes.items()
+            if size["entries"]
+        }
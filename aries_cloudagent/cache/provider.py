@@ -0,0 +1,50 @@
+"""Cache provider."""
+
+import logging
+
+from ..config.base import InjectionError
+from ..config.injector import BaseInjector
+from ..config.provider import BaseProvider
+from ..config.settings import BaseSettings
+from ..utils.classloader import ClassLoader, ClassNotFoundError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CacheProvider(BaseProvider):
+    """The standard cache provider which keys off the selected cache type."""
+
+    CACHE_TYPES = {
+        "in_memory": "aries_cloudagent.cache.in_memory.InMemoryCache",
+        "sqlite": "aries_cloudagent.cache.sqlite.SqliteCache",
+    }
+
+    def __init__(self):
+        """Initialize the cache provider."""
+        self._inst = None
+
+    def provide(self, settings: BaseSettings, injector: BaseInjector):
+        """Create and return the shared cache instance."""
+
+        if not self._inst:
+            cache_type = settings.get_value("cache.type", default="in_memory")
+            # cache_type may be a fully qualified class name
+            cache_class = self.CACHE_TYPES.get(cache_type.lower(), cache_type)
+            LOGGER.info("Create cache: %s", cache_type)
+            try:
+                cache_cls = ClassLoader.load_class(cache_class)
+            except ClassNotFoundError as err:
+                raise InjectionError(f"Unknown cache type: {cache_type}") from err
+
+            kwargs = {}
+            max_entries = settings.get_value("cache.max_entries")
+            if max_entries is not None:
+                kwargs["max_entries"] = max_entries
+            if cache_class == self.CACHE_TYPES["sqlite"]:
+                path = settings.get_value("cache.path")
+                if not path:
+                    raise InjectionError("Cache path is required for sqlite cache")
+                kwargs["path"] = path
+            self._inst = cache_cls(**kwargs)
+
+        return self._inst
@@ -0,0 +1,345 @@
+"""SQLite-backed persistent cache implementation."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping, Sequence, Text, Union
+
+from .base import BaseCache, CacheError, cache_key_prefix
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PURGE_INTERVAL = 60
+DEFAULT_TIMEOUT = 5
+# stay below the default SQLite limit on the number of query parameters
+MAX_QUERY_KEYS = 500
+
+
+class SqliteCache(BaseCache):
+    """Cache class backed by a local SQLite database.
+
+    The database is opened in WAL mode, so that several agent processes on the
+    same host may share one cache file. Values must be JSON serializable, and
+    expiry times use the system clock so that they are consistent between
+    processes. Expired entries are purged periodically in the background.
+    Key locks remain local to each process.
+
+    When `max_entries` is set, each write trims the cache to that size by
+    evicting the values written least recently. Reads do not refresh a value,
+    so unlike the in-memory cache this is write-order, not LRU, eviction.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = None,
+        purge_interval: float = DEFAULT_PURGE_INTERVAL,
+    ):
+        """
+        Initialize a `SqliteCache` instance.
+
+        Args:
+            path: the path to the SQLite database file
+            max_entries: the maximum number of unexpired entries to retain, or
+                None for no limit
+            purge_interval: the minimum number of seconds between purges of
+                expired entries
+
+        """
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.purge_interval = purge_interval
+        self._conn: sqlite3.Connection = None
+        # a single worker thread serializes access to the connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SqliteCache"
+        )
+        self._last_purge = time.time()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection and create the schema if needed."""
+        if not self._conn:
+            conn = sqlite3.connect(
+                self.path, timeout=DEFAULT_TIMEOUT, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_entries ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS cache_entries_expires "
+                    "ON cache_entries (expires) WHERE expires IS NOT NULL"
+                )
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, method: Callable, *args):
+        """Run a database operation on the worker thread."""
+        loop = asyncio.get_event_loop()
+        now = time.time()
+        if now - self._last_purge >= self.purge_interval:
+            self._last_purge = now
+            purge = loop.run_in_executor(self._executor, self._purge, now)
+            purge.add_done_callback(self._handle_purge_done)
+        try:
+            return await loop.run_in_executor(self._executor, method, *args)
+        except sqlite3.Error as err:
+            raise CacheError(f"Error accessing cache database: {err}") from err
+
+    def _handle_purge_done(self, fut: asyncio.Future):
+        """Record evictions from a background purge, or log any error."""
+        if fut.cancelled():
+            return
+        if fut.exception():
+            LOGGER.warning("Error purging cache database: %s", fut.exception())
+            return
+        for key in fut.result():
+            self.stats.log("evictions", key)
+
+    def _get(self, key: Text, now: float):
+        """Fetch an unexpired value from the database."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value FROM cache_entries WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (key, now),
+            )
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def _get_many(self, keys: Sequence[Text], now: float) -> dict:
+        """Fetch multiple unexpired values from the database."""
+        conn = self._connect()
+        result = {}
+        for start in range(0, len(keys), MAX_QUERY_KEYS):
+            end = start + MAX_QUERY_KEYS
+            chunk = keys[start:end]
+            for key, value in conn.execute(
+                "SELECT key, value FROM cache_entries WHERE key IN ({}) "
+                "AND (expires IS NULL OR expires > ?)".format(
+                    ", ".join("?" * len(chunk))
+                ),
+                (*chunk, now),
+            ):
+                result[key] = json.loads(value)
+        return result
+
+    def _set(self, rows: Sequence[tuple], now: float) -> Sequence[Text]:
+        """Insert or replace values in the database, and trim it to size."""
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            return self._delete_rows(conn, self._excess_rows(conn, now))
+
+    def _clear(self, key: Text = None):
+        """Remove one or all values from the database."""
+        conn = self._connect()
+        with conn:
+            if key is None:
+                conn.execute("DELETE FROM cache_entries")
+            else:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def _clear_many(self, keys: Sequence[Text]):
+        """Remove multiple values from the database."""
+        conn = self._connect()
+        with conn:
+            for start in range(0, len(keys), MAX_QUERY_KEYS):
+                end = start + MAX_QUERY_KEYS
+                chunk = keys[start:end]
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ({})".format(
+                        ", ".join("?" * len(chunk))
+                    ),
+                    chunk,
+                )
+
+    def _excess_rows(self, conn: sqlite3.Connection, now: float) -> list:
+        """Find the unexpired values written least recently beyond the size limit.
+
+        Replacing a value assigns it a new rowid, so rowid order is write order.
+        """
+        if not self.max_entries:
+            return []
+        return conn.execute(
+            "SELECT rowid, key FROM cache_entries "
+            "WHERE expires IS NULL OR expires > ? "
+            "ORDER BY rowid DESC LIMIT -1 OFFSET ?",
+            (now, self.max_entries),
+        ).fetchall()
+
+    def _delete_rows(
+        self, conn: sqlite3.Connection, rows: Sequence[tuple]
+    ) -> Sequence[Text]:
+        """Delete rows found by rowid, returning their keys."""
+        conn.executemany(
+            "DELETE FROM cache_entries WHERE rowid = ?",
+            ((rowid,) for rowid, _ in rows),
+        )
+        return [key for _, key in rows]
+
+    def _purge(self, now: float) -> Sequence[Text]:
+        """Remove expired values, and the values beyond the size limit."""
+        conn = self._connect()
+        with conn:
+            rows = conn.execute(
+                "SELECT rowid, key FROM cache_entries WHERE expires <= ?", (now,)
+            ).fetchall()
+            rows.extend(self._excess_rows(conn, now))
+            return self._delete_rows(conn, rows)
+
+    def _get_size(self, now: float) -> dict:
+        """Count unexpired values and their sizes by key prefix."""
+        result = {}
+        for key, size in self._connect().execute(
+            "SELECT key, length(value) FROM cache_entries "
+            "WHERE expires IS NULL OR expires > ?",
+            (now,),
+        ):
+            prefix_size = result.setdefault(
+                cache_key_prefix(key), {"entries": 0, "bytes": 0}
+            )
+            prefix_size["entries"] += 1
+            prefix_size["bytes"] += size
+        return result
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        result = await self._run(self._get, key, time.time())
+        self.stats.log("misses" if result is None else "hits", key)
+        return result
+
+    async def get_many(self, keys: Sequence[Text]) -> dict:
+        """
+        Get multiple items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            A dictionary of the keys which were found to their values
+
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        result = await self._run(self._get_many, keys, time.time())
+        for key in keys:
+            self.stats.log("hits" if key in result else "misses", key)
+        return result
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        try:
+            stored = json.dumps(value)
+        except (TypeError, ValueError) as err:
+            raise CacheError(f"Cache value is not JSON serializable: {err}") from err
+        now = time.time()
+        expires_ts = now + ttl if ttl else None
+        keys = [keys] if isinstance(keys, Text) else keys
+        evicted = await self._run(
+            self._set, [(key, stored, expires_ts) for key in keys], now
+        )
+        for key in keys:
+            self.stats.log("sets", key)
+        for key in evicted:
+            self.stats.log("evictions", key)
+
+    async def set_many(self, values: Mapping[Text, Any], ttl: int = None):
+        """
+        Add multiple items to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            values: a dictionary of keys to the values to store
+            ttl: number of seconds that the records should persist
+
+        """
+        now = time.time()
+        expires_ts = now + ttl if ttl else None
+        try:
+            rows = [
+                (key, json.dumps(value), expires_ts) for key, value in values.items()
+            ]
+        except (TypeError, ValueError) as err:
+            raise CacheError(f"Cache value is not JSON serializable: {err}") from err
+        evicted = await self._run(self._set, rows, now) if rows else ()
+        for key in values:
+            self.stats.log("sets", key)
+        for key in evicted:
+            self.stats.log("evictions", key)
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await self._run(self._clear, key)
+
+    async def clear_many(self, keys: Sequence[Text]):
+        """
+        Remove multiple items from the cache, if present.
+
+        Args:
+            keys: the keys to remove
+
+        """
+        keys = list(keys)
+        if keys:
+            await self._run(self._clear_many, keys)
+
+    async def flush(self):
+        """Remove all items from the cache."""
+        await self._run(self._clear)
+
+    async def get_size(self) -> dict:
+        """Estimate the current size of the cache from the stored values."""
+        return await self._run(self._get_size, time.time())
+
+    async def close(self):
+        """Close the database connection."""
+
+        def close():
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+        await asyncio.get_event_loop().run_in_executor(self._executor, close)
+        self._executor.shutdown(wait=False)
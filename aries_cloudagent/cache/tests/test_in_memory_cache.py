@@ -66,6 +66,101 @@ class TestBasicCache:
             item = await cache.get(key)
             assert item is None
 
+    @pytest.mark.asyncio
+    async def test_set_expires_superseded(self, cache):
+        await cache.set("key", "first", 0.05)
+        await cache.set("key", "second", 10)
+        await sleep(0.05)
+        assert await cache.get("key") == "second"
+
+        await cache.set("key", "third")
+        assert await cache.get("key") == "third"
+
+        await cache.set("other", "value", 0.05)
+        await cache.clear("other")
+        await cache.set("other", "value", 10)
+        assert await cache.get("other") == "value"
+
+    @pytest.mark.asyncio
+    async def test_expiry_compaction(self, cache):
+        for i in range(200):
+            await cache.set("key", i, 10)
+        assert await cache.get("key") == 199
+        assert len(cache._expiry) < 200
+
+    @pytest.mark.asyncio
+    async def test_max_entries(self):
+        cache = InMemoryCache(max_entries=3)
+        await cache.set([f"key{i}" for i in range(3)], "value")
+        assert await cache.get("key0") == "value"
+        await cache.set("key3", "value")
+        assert list(cache._cache) == ["key2", "key0", "key3"]
+        assert await cache.get("key1") is None
+
+        await cache.set([f"other{i}" for i in range(5)], "value")
+        assert list(cache._cache) == ["other2", "other3", "other4"]
+
+        cache = InMemoryCache(max_entries=None)
+        await cache.set([f"key{i}" for i in range(20000)], "value")
+        assert len(cache._cache) == 20000
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        cache = InMemoryCache(max_entries=3)
+        await cache.set("schema::a", {"name": "schema"})
+        await cache.set("schema::a", {"name": "schema"})
+        await cache.set(["schema::b", "target::c"], "value", 0.05)
+        assert await cache.get("schema::a")
+        assert not await cache.get("plain")
+        lock = cache.acquire("target::d")
+        cache.acquire("target::d")
+        lock.release()
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["bytes"] > 0
+        schema = stats["prefixes"]["schema"]
+        assert (schema["hits"], schema["sets"], schema["entries"]) == (1, 3, 2)
+        assert stats["prefixes"]["*"]["misses"] == 1
+        assert stats["prefixes"]["target"]["lock_waits"] == 1
+
+        await sleep(0.05)
+        await cache.set(["x::1", "x::2", "x::3"], "value")
+        stats = await cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["prefixes"]["schema"]["evictions"] == 2
+        assert stats["prefixes"]["schema"]["entries"] == 0
+        assert stats["prefixes"]["target"]["evictions"] == 1
+
+        await cache.clear("x::1")
+        assert (await cache.get_size())["x"]["entries"] == 2
+        await cache.flush()
+        assert await cache.get_size() == {}
+        cache.stats.reset()
+        assert (await cache.get_stats())["prefixes"] == {}
+
+    @pytest.mark.asyncio
+    async def test_many(self):
+        cache = InMemoryCache(max_entries=3)
+        await cache.set_many({"schema::a": {"name": "a"}, "schema::b": "b"}, 0.05)
+        await cache.set_many({"schema::c": "c"})
+        assert await cache.get_many(["schema::a", "schema::c", "schema::x"]) == {
+            "schema::a": {"name": "a"},
+            "schema::c": "c",
+        }
+        assert cache.stats.results["schema"]["hits"] == 2
+        assert cache.stats.results["schema"]["misses"] == 1
+
+        await cache.set_many({"schema::d": "d"})
+        assert list(cache._cache) == ["schema::a", "schema::c", "schema::d"]
+
+        await sleep(0.05)
+        assert await cache.get_many(["schema::a", "schema::c"]) == {"schema::c": "c"}
+
+        await cache.clear_many(["schema::c", "schema::x"])
+        assert await cache.get_many(["schema::c", "schema::d"]) == {"schema::d": "d"}
+        assert (await cache.get_size())["schema"]["entries"] == 1
+
     @pytest.mark.asyncio
     async def test_flush(self, cache):
         await cache.flush()
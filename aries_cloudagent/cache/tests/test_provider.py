@@ -0,0 +1,45 @@
+import os
+
+from tempfile import TemporaryDirectory
+
+from asynctest import TestCase as AsyncTestCase
+
+from ...config.base import InjectionError
+from ...config.injection_context import InjectionContext
+
+from ..in_memory import InMemoryCache
+from ..provider import CacheProvider
+from ..sqlite import SqliteCache
+
+
+class TestCacheProvider(AsyncTestCase):
+    async def test_in_memory(self):
+        context = InjectionContext()
+        provider = CacheProvider()
+        cache = provider.provide(context.settings, context.injector)
+        assert isinstance(cache, InMemoryCache)
+        assert provider.provide(context.settings, context.injector) is cache
+
+        context.settings["cache.max_entries"] = 5
+        cache = CacheProvider().provide(context.settings, context.injector)
+        assert cache.max_entries == 5
+
+    async def test_sqlite(self):
+        context = InjectionContext()
+        context.settings["cache.type"] = "sqlite"
+        with self.assertRaises(InjectionError):
+            CacheProvider().provide(context.settings, context.injector)
+
+        with TemporaryDirectory() as tmp:
+            context.settings["cache.path"] = os.path.join(tmp, "cache.sqlite")
+            cache = CacheProvider().provide(context.settings, context.injector)
+            assert isinstance(cache, SqliteCache)
+            await cache.set("key", "value")
+            assert await cache.get("key") == "value"
+            await cache.close()
+
+    async def test_invalid_cache_type(self):
+        context = InjectionContext()
+        context.settings["cache.type"] = "invalid-type"
+        with self.assertRaises(InjectionError):
+            CacheProvider().provide(context.settings, context.injector)
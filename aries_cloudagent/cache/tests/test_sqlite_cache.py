@@ -0,0 +1,150 @@
+import os
+
+from asyncio import sleep, wait_for
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from ..base import CacheError
+from ..sqlite import SqliteCache
+
+
+@pytest.fixture()
+async def cache():
+    with TemporaryDirectory() as tmp:
+        cache = SqliteCache(os.path.join(tmp, "cache.sqlite"))
+        await cache.set("valid key", "value")
+        yield cache
+        await cache.close()
+
+
+class TestSqliteCache:
+    @pytest.mark.asyncio
+    async def test_get_none(self, cache):
+        item = await cache.get("doesn't exist")
+        assert item is None
+
+    @pytest.mark.asyncio
+    async def test_get_valid(self, cache):
+        item = await cache.get("valid key")
+        assert item == "value"
+
+    @pytest.mark.asyncio
+    async def test_set_dict_multi(self, cache):
+        await cache.set([f"key{i}" for i in range(4)], {"dictkey": "dval"})
+        for key in [f"key{i}" for i in range(4)]:
+            assert await cache.get(key) == {"dictkey": "dval"}
+
+    @pytest.mark.asyncio
+    async def test_set_x(self, cache):
+        with pytest.raises(CacheError):
+            await cache.set("key", object())
+
+    @pytest.mark.asyncio
+    async def test_set_expires(self, cache):
+        await cache.set("key", {"dictkey": "dval"}, 0.05)
+        assert await cache.get("key") == {"dictkey": "dval"}
+
+        await sleep(0.05)
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_flush_clear(self, cache):
+        await cache.set("key", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        assert await cache.get("valid key") == "value"
+        await cache.flush()
+        assert await cache.get("valid key") is None
+
+    @pytest.mark.asyncio
+    async def test_many(self, cache):
+        values = {f"schema::{i}": {"seq_no": i} for i in range(1200)}
+        await cache.set_many(values)
+        await cache.set_many({"target::a": "a"}, 0.05)
+        assert await cache.get_many(list(values) + ["schema::x"]) == values
+        assert await cache.get_many([]) == {}
+        assert cache.stats.results["schema"]["hits"] == 1200
+        assert cache.stats.results["schema"]["misses"] == 1
+
+        await sleep(0.05)
+        assert await cache.get_many(["target::a", "valid key"]) == {
+            "valid key": "value"
+        }
+
+        await cache.clear_many(list(values)[:600])
+        assert len(await cache.get_many(list(values))) == 600
+
+        with pytest.raises(CacheError):
+            await cache.set_many({"key": object()})
+
+    @pytest.mark.asyncio
+    async def test_shared_file(self, cache):
+        other = SqliteCache(cache.path)
+        assert await other.get("valid key") == "value"
+        await other.set("key", "other value")
+        await other.close()
+        assert await cache.get("key") == "other value"
+
+    @pytest.mark.asyncio
+    async def test_purge(self, cache):
+        cache.max_entries = 2
+        cache.purge_interval = 0
+        await cache.set("key0", "value", 0.01)
+        await sleep(0.01)
+        await cache.set(["key1", "key2", "key3"], "value")
+        await cache.get("key1")  # purge queued before the read
+        count = cache._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        assert count[0] == 2
+        assert await cache.get("key3") == "value"
+
+    @pytest.mark.asyncio
+    async def test_set_max_entries(self, cache):
+        cache.max_entries = 2
+        await cache.set("key1", "value")
+        assert await cache.get("valid key") == "value"  # reads do not refresh
+        await cache.set_many({"key2": "value", "key1": "new value"})
+        assert await cache.get_many(["valid key", "key1", "key2"]) == {
+            "key1": "new value",
+            "key2": "value",
+        }
+        await cache.set("key3", "value")
+        assert await cache.get("key2") is None
+        stats = await cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["prefixes"]["*"]["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stats(self, cache):
+        cache.purge_interval = 0
+        await cache.set(["schema::a", "schema::b"], {"name": "schema"}, 0.01)
+        assert await cache.get("schema::a")
+        assert not await cache.get("schema::c")
+        stats = await cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["prefixes"]["schema"]["entries"] == 2
+        assert stats["prefixes"]["schema"]["bytes"] == 2 * len('{"name": "schema"}')
+        assert stats["prefixes"]["schema"]["hits"] == 1
+        assert stats["prefixes"]["schema"]["misses"] == 1
+
+        await sleep(0.01)
+        await cache.get_stats()
+        stats = await cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["prefixes"]["schema"]["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_release_with_waiter(self, cache):
+        test_key = "test_key"
+        test_result = "test_result"
+        lock = cache.acquire(test_key)
+        await lock.__aenter__()
+
+        lock2 = cache.acquire(test_key)
+        assert lock2.parent is lock
+        await lock.set_result(test_result)
+        await lock.__aexit__(None, None, None)
+
+        assert await cache.get(test_key) == test_result
+        assert await wait_for(lock2, 1) == test_result
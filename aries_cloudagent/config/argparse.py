@@ -182,6 +182,76 @@ class AdminGroup(ArgumentGroup):
         return settings
 
 
+@group(CAT_START)
+class CacheGroup(ArgumentGroup):
+    """Cache settings."""
+
+    GROUP_NAME = "Cache"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add cache command line arguments to the parser."""
+        parser.add_argument(
+            "--cache-type",
+            type=str,
+            metavar="<cache-type>",
+            env_var="ACAPY_CACHE_TYPE",
+            help="Specifies the type of cache shared by the agent. Supported types\
+            are 'in_memory' and 'sqlite', which persists the cache in a local\
+            database file that several agent processes on the same host may\
+            share. Default: 'in_memory'.",
+        )
+        parser.add_argument(
+            "--cache-path",
+            type=str,
+            metavar="<cache-path>",
+            env_var="ACAPY_CACHE_PATH",
+            help="Specifies the database file for the 'sqlite' cache type.",
+        )
+        parser.add_argument(
+            "--cache-max-entries",
+            type=int,
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help="Specifies the maximum number of entries held in the cache,\
+            evicting the least recently used entries (or for the 'sqlite' cache\
+            type, the least recently written entries) beyond it. Set to 0 for\
+            no limit.\
+            Default: 10000 for the 'in_memory' cache type, otherwise no limit.",
+        )
+        parser.add_argument(
+            "--record-cache-ttl",
+            type=int,
+            metavar="<seconds>",
+            env_var="ACAPY_RECORD_CACHE_TTL",
+            help="Enables a process-local cache of connection, credential exchange,\
+            presentation exchange and mediation records read by ID, holding each\
+            for at most this many seconds. Writes by other agent processes\
+            sharing the wallet are only seen once cached records expire, so\
+            enable only where that staleness is acceptable. Default: disabled.",
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract cache settings."""
+        settings = {}
+        if args.cache_type:
+            settings["cache.type"] = args.cache_type
+            if args.cache_type == "sqlite" and not args.cache_path:
+                raise ArgsParseError(
+                    "Parameter --cache-path is required for cache type 'sqlite'"
+                )
+        if args.cache_path:
+            settings["cache.path"] = args.cache_path
+        if args.cache_max_entries is not None:
+            if args.cache_max_entries < 0:
+                raise ArgsParseError("Parameter --cache-max-entries must be >= 0")
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.record_cache_ttl is not None:
+            if args.record_cache_ttl < 0:
+                raise ArgsParseError("Parameter --record-cache-ttl must be >= 0")
+            settings["record_cache.ttl"] = args.record_cache_ttl
+        return settings
+
+
 @group(CAT_START)
 class DebugGroup(ArgumentGroup):
     """Debug settings."""
@@ -479,6 +549,53 @@ class GeneralGroup(ArgumentGroup):
             help="Sets the base url of the tails server for upload, defaulting to the\
             tails server base url.",
         )
+        parser.add_argument(
+            "--tails-server-upload-concurrency",
+            type=int,
+            metavar="<count>",
+            env_var="ACAPY_TAILS_SERVER_UPLOAD_CONCURRENCY",
+            help="Sets the maximum number of tails files to upload to the tails\
+            server at once; further uploads wait their turn. Default: 4.",
+        )
+        parser.add_argument(
+            "--tails-cache-max-size",
+            type=int,
+            metavar="<megabytes>",
+            env_var="ACAPY_TAILS_CACHE_MAX_SIZE",
+            help="Limit the disk space used by tails files downloaded from tails\
+            servers to <megabytes>, removing the least recently used files beyond\
+            it. Tails files of the agent's own revocation registries are never\
+            removed. Default: no limit.",
+        )
+        parser.add_argument(
+            "--tails-cache-prefetch",
+            action="store_true",
+            env_var="ACAPY_TAILS_CACHE_PREFETCH",
+            help="Download in the background the tails files likely to be needed\
+            for incoming credential offers and proof requests, so that storing\
+            the credential or creating the presentation need not wait on them.\
+            Default: false.",
+        )
+        parser.add_argument(
+            "--revocation-spare-registries",
+            type=int,
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_SPARE_REGISTRIES",
+            help="Keep <count> revocation registries staged in the background for\
+            each revocable credential definition, in addition to the registry in\
+            use, so that issuance does not wait on registry creation when a\
+            registry fills. Default: no spare registries are staged in advance.",
+        )
+        parser.add_argument(
+            "--revocation-issuance-shards",
+            type=int,
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_ISSUANCE_SHARDS",
+            help="Issue credentials round-robin across <count> active revocation\
+            registries for each revocable credential definition, so that\
+            concurrent issuance does not contend for a single registry. Registries\
+            are staged in the background to keep <count> in use. Default: 1.",
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -503,6 +620,34 @@ class GeneralGroup(ArgumentGroup):
             settings["tails_server_upload_url"] = args.tails_server_base_url
         if args.tails_server_upload_url:
             settings["tails_server_upload_url"] = args.tails_server_upload_url
+        if args.tails_server_upload_concurrency is not None:
+            if args.tails_server_upload_concurrency < 1:
+                raise ArgsParseError(
+                    "Parameter --tails-server-upload-concurrency must be at least 1"
+                )
+            settings[
+                "tails_server.upload_concurrency"
+            ] = args.tails_server_upload_concurrency
+        if args.tails_cache_max_size is not None:
+            if args.tails_cache_max_size < 1:
+                raise ArgsParseError(
+                    "Parameter --tails-cache-max-size must be at least 1"
+                )
+            settings["tails_cache.max_size"] = args.tails_cache_max_size * 1048576
+        if args.tails_cache_prefetch:
+            settings["tails_cache.prefetch"] = True
+        if args.revocation_spare_registries is not None:
+            if args.revocation_spare_registries < 0:
+                raise ArgsParseError(
+                    "Parameter --revocation-spare-registries must not be negative"
+                )
+            settings["revocation.spare_registries"] = args.revocation_spare_registries
+        if args.revocation_issuance_shards is not None:
+            if args.revocation_issuance_shards < 1:
+                raise ArgsParseError(
+                    "Parameter --revocation-issuance-shards must be at least 1"
+                )
+            settings["revocation.issuance_shards"] = args.revocation_issuance_shards
         return settings
 
 
@@ -559,6 +704,63 @@ class LedgerGroup(ArgumentGroup):
             This must be set if running in no-ledger mode.  Overrides any\
             specified ledger or genesis configurations.  Default: false.",
         )
+        parser.add_argument(
+            "--ledger-type",
+            type=str,
+            choices=("indy", "in_memory"),
+            metavar="<ledger-type>",
+            env_var="ACAPY_LEDGER_TYPE",
+            help="Specifies the type of ledger: 'indy' for an Indy ledger pool,\
+            or 'in_memory' for a ledger held in memory by the agent, for testing\
+            and benchmarking without a pool. The 'in_memory' ledger does not\
+            need genesis transactions. Default: 'indy'.",
+        )
+        parser.add_argument(
+            "--ledger-latency",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_LEDGER_LATENCY",
+            help="Specifies an artificial delay for each request to the\
+            'in_memory' ledger, in seconds. Default: 0.",
+        )
+        parser.add_argument(
+            "--ledger-journal-file",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_LEDGER_JOURNAL_FILE",
+            help="Specifies a file to which the 'in_memory' ledger appends its\
+            transactions, and from which it reads those of other agents, so\
+            that agents on the same host may share the ledger.",
+        )
+        parser.add_argument(
+            "--ledger-did-cache-ttl",
+            type=int,
+            metavar="<seconds>",
+            env_var="ACAPY_LEDGER_DID_CACHE_TTL",
+            help="Specifies the number of seconds for which verkeys and endpoints\
+            looked up for ledger DIDs are cached, or 0 to disable caching of\
+            these lookups. Default: 600.",
+        )
+        parser.add_argument(
+            "--ledger-object-store",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_LEDGER_OBJECT_STORE",
+            help="Specifies a local SQLite database file in which to keep schemas,\
+            credential definitions and revocation registry definitions read from\
+            the ledger, so that they need not be read again after a restart.\
+            Objects are stored against the hash of the genesis transactions, so\
+            that the file may be shared between ledgers.",
+        )
+        parser.add_argument(
+            "--ledger-warm-up",
+            action="store_true",
+            env_var="ACAPY_LEDGER_WARM_UP",
+            help="Loads the schemas, credential definitions and active revocation\
+            registry definitions created by this agent from the ledger at startup,\
+            in the background, and checks that the local tails files of its\
+            active revocation registries exist. Default: false.",
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract ledger settings."""
@@ -566,7 +768,15 @@ class LedgerGroup(ArgumentGroup):
         if args.no_ledger:
             settings["ledger.disabled"] = True
         else:
-            if args.genesis_url:
+            if args.ledger_type == "in_memory":
+                settings["ledger.type"] = args.ledger_type
+                if args.ledger_latency is not None:
+                    if args.ledger_latency < 0:
+                        raise ArgsParseError("Parameter --ledger-latency must be >= 0")
+                    settings["ledger.latency"] = args.ledger_latency
+                if args.ledger_journal_file:
+                    settings["ledger.journal_file"] = args.ledger_journal_file
+            elif args.genesis_url:
                 settings["ledger.genesis_url"] = args.genesis_url
             elif args.genesis_file:
                 settings["ledger.genesis_file"] = args.genesis_file
@@ -575,11 +785,22 @@ class LedgerGroup(ArgumentGroup):
             else:
                 raise ArgsParseError(
                     "One of --genesis-url --genesis-file or --genesis-transactions "
-                    + "must be specified (unless --no-ledger is specified to "
+                    + "must be specified (unless --ledger-type in_memory is "
+                    + "specified, or --no-ledger is specified to "
                     + "explicitely configure aca-py to run with no ledger)."
                 )
             if args.ledger_pool_name:
                 settings["ledger.pool_name"] = args.ledger_pool_name
+            if args.ledger_did_cache_ttl is not None:
+                if args.ledger_did_cache_ttl < 0:
+                    raise ArgsParseError(
+                        "Parameter --ledger-did-cache-ttl must be >= 0"
+                    )
+                settings["ledger.did_cache_ttl"] = args.ledger_did_cache_ttl
+            if args.ledger_object_store:
+                settings["ledger.object_store_path"] = args.ledger_object_store
+            if args.ledger_warm_up:
+                settings["ledger.warm_up"] = True
         return settings
 
 
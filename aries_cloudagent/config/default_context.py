@@ -5,11 +5,14 @@ from .injection_context import InjectionContext
 from .provider import CachedProvider, ClassProvider
 
 from ..cache.base import BaseCache
-from ..cache.in_memory import InMemoryCache
+from ..cache.provider import CacheProvider
 from ..core.plugin_registry import PluginRegistry
 from ..core.profile import ProfileManager, ProfileManagerProvider
 from ..core.protocol_registry import ProtocolRegistry
 from ..tails.base import BaseTailsServer
+from ..tails.cache import TailsCache
+from ..tails.upload import DEFAULT_MAX_CONCURRENT_UPLOADS, TailsUploadPipeline
+from ..ledger.in_memory import InMemoryLedgerState, InMemoryLedgerStateProvider
 from ..ledger.indy import IndySdkLedgerPool, IndySdkLedgerPoolProvider
 
 from ..protocols.actionmenu.v1_0.base_service import BaseMenuService
@@ -17,6 +20,7 @@ from ..protocols.actionmenu.v1_0.driver_service import DriverMenuService
 from ..protocols.didcomm_prefix import DIDCommPrefix
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
+from ..revocation.provisioner import RevRegProvisioner
 
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
@@ -35,8 +39,10 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache
+        context.injector.bind_instance(
+            BaseCache, CacheProvider().provide(context.settings, context.injector)
+        )
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
@@ -58,6 +64,11 @@ class DefaultContextBuilder(ContextBuilder):
             IndySdkLedgerPool,
             CachedProvider(IndySdkLedgerPoolProvider(), ("ledger.pool_name",)),
         )
+        # Bind in-memory ledger state provider, shared between wallets in the same way
+        context.injector.bind_provider(
+            InMemoryLedgerState,
+            CachedProvider(InMemoryLedgerStateProvider(), ("ledger.journal_file",)),
+        )
 
         context.injector.bind_provider(ProfileManager, ProfileManagerProvider())
 
@@ -81,6 +92,29 @@ class DefaultContextBuilder(ContextBuilder):
             ),
         )
 
+        # Stream tails file uploads, a limited number at a time
+        context.injector.bind_instance(
+            TailsUploadPipeline,
+            TailsUploadPipeline(
+                context.settings.get_int("tails_server.upload_concurrency")
+                or DEFAULT_MAX_CONCURRENT_UPLOADS
+            ),
+        )
+
+        # Manage downloaded tails files
+        max_size = context.settings.get_int("tails_cache.max_size")
+        prefetch = context.settings.get_bool("tails_cache.prefetch")
+        if max_size or prefetch:
+            context.injector.bind_instance(
+                TailsCache, TailsCache(max_size=max_size, prefetch=bool(prefetch))
+            )
+
+        # Stage spare revocation registries, and issuance shards, ahead of issuance
+        spares = context.settings.get_int("revocation.spare_registries") or 0
+        shards = context.settings.get_int("revocation.issuance_shards") or 1
+        if spares or shards > 1:
+            context.injector.bind_instance(RevRegProvisioner, RevRegProvisioner(spares))
+
         # Allow action menu to be provided by driver
         context.injector.bind_instance(BaseMenuService, DriverMenuService(context))
         context.injector.bind_instance(
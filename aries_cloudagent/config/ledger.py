@@ -15,6 +15,7 @@ from ..core.profile import Profile
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
 from ..ledger.error import LedgerError
+from ..ledger.write_queue import LedgerWriteQueue
 from ..utils.http import fetch, FetchError
 from ..wallet.base import BaseWallet
 
@@ -93,9 +94,18 @@ async def ledger_config(
             # Publish profile endpoint if ledger is NOT read-only
             profile_endpoint = session.settings.get("profile_endpoint")
             if profile_endpoint and not ledger.read_only:
-                await ledger.update_endpoint_for_did(
-                    public_did, profile_endpoint, EndpointType.PROFILE
-                )
+                write_queue = session.inject(LedgerWriteQueue, required=False)
+                if write_queue:
+                    # provisioning may exit next, so wait for the write
+                    await (
+                        await write_queue.update_endpoint_for_did(
+                            public_did, profile_endpoint, EndpointType.PROFILE
+                        )
+                    )
+                else:
+                    await ledger.update_endpoint_for_did(
+                        public_did, profile_endpoint, EndpointType.PROFILE
+                    )
 
     return True
 
@@ -78,6 +78,179 @@ class TestArgParse(AsyncTestCase):
 
         assert settings.get("external_plugins") == ["foo"]
         assert settings.get("storage_type") == "bar"
+        assert "revocation.spare_registries" not in settings
+
+    async def test_general_settings_spare_registries(self):
+        """Test spare revocation registry argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--revocation-spare-registries", "2"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("revocation.spare_registries") == 2
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--revocation-spare-registries", "-1"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--revocation-issuance-shards", "4"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("revocation.issuance_shards") == 4
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--revocation-issuance-shards", "0"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_general_settings_tails_cache(self):
+        """Test tails cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "-e",
+                "http://1.2.3.4:8020",
+                "--tails-cache-max-size",
+                "64",
+                "--tails-cache-prefetch",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("tails_cache.max_size") == 64 * 1048576
+        assert settings.get("tails_cache.prefetch") is True
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--tails-cache-max-size", "0"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_general_settings_tails_server_upload_concurrency(self):
+        """Test tails server upload concurrency argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--tails-server-upload-concurrency", "2"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("tails_server.upload_concurrency") == 2
+
+        result = parser.parse_args(
+            ["-e", "http://1.2.3.4:8020", "--tails-server-upload-concurrency", "0"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_cache_settings(self):
+        """Test cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.CacheGroup()
+        group.add_arguments(parser)
+
+        settings = group.get_settings(parser.parse_args([]))
+        assert "cache.max_entries" not in settings
+
+        result = parser.parse_args(["--cache-max-entries", "500"])
+        settings = group.get_settings(result)
+        assert settings.get("cache.max_entries") == 500
+
+        result = parser.parse_args(["--cache-max-entries", "-1"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+        result = parser.parse_args(["--cache-type", "sqlite"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+        result = parser.parse_args(
+            ["--cache-type", "sqlite", "--cache-path", "/tmp/cache.sqlite"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.type") == "sqlite"
+        assert settings.get("cache.path") == "/tmp/cache.sqlite"
+
+        assert "record_cache.ttl" not in group.get_settings(parser.parse_args([]))
+        result = parser.parse_args(["--record-cache-ttl", "30"])
+        settings = group.get_settings(result)
+        assert settings.get("record_cache.ttl") == 30
+
+        result = parser.parse_args(["--record-cache-ttl", "-1"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_ledger_settings(self):
+        """Test ledger argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.LedgerGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--genesis-url", "http://1.2.3.4:9000/genesis"])
+        settings = group.get_settings(result)
+        assert "ledger.did_cache_ttl" not in settings
+        assert "ledger.warm_up" not in settings
+
+        result = parser.parse_args(
+            [
+                "--genesis-url",
+                "http://1.2.3.4:9000/genesis",
+                "--ledger-did-cache-ttl",
+                "60",
+                "--ledger-warm-up",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("ledger.did_cache_ttl") == 60
+        assert settings.get("ledger.warm_up") is True
+
+        result = parser.parse_args(
+            [
+                "--genesis-url",
+                "http://1.2.3.4:9000/genesis",
+                "--ledger-did-cache-ttl",
+                "-1",
+            ]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+        result = parser.parse_args(
+            [
+                "--ledger-type",
+                "in_memory",
+                "--ledger-latency",
+                "0.05",
+                "--ledger-journal-file",
+                "/tmp/ledger.journal",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("ledger.type") == "in_memory"
+        assert settings.get("ledger.latency") == 0.05
+        assert settings.get("ledger.journal_file") == "/tmp/ledger.journal"
+        assert "ledger.genesis_url" not in settings
+
+        result = parser.parse_args(
+            ["--ledger-type", "in_memory", "--ledger-latency", "-1"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
 
     async def test_transport_settings_file(self):
         """Test file argument parsing."""
@@ -5,6 +5,9 @@ from asynctest import TestCase as AsyncTestCase
 from ...cache.base import BaseCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
+from ...revocation.provisioner import RevRegProvisioner
+from ...tails.cache import TailsCache
+from ...tails.upload import DEFAULT_MAX_CONCURRENT_UPLOADS, TailsUploadPipeline
 from ...transport.wire_format import BaseWireFormat
 
 from ..default_context import DefaultContextBuilder
@@ -32,7 +35,34 @@ class TestDefaultContext(AsyncTestCase):
                 "timing.enabled": True,
                 "timing.log.file": NamedTemporaryFile().name,
                 "multitenant.admin_enabled": True,
+                "cache.max_entries": 100,
             }
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+        assert result.inject(BaseCache).max_entries == 100
+        assert not result.inject(RevRegProvisioner, required=False)
+        assert not result.inject(TailsCache, required=False)
+        assert (
+            result.inject(TailsUploadPipeline).max_concurrent
+            == DEFAULT_MAX_CONCURRENT_UPLOADS
+        )
+
+        builder = DefaultContextBuilder(settings={"tails_server.upload_concurrency": 2})
+        result = await builder.build_context()
+        assert result.inject(TailsUploadPipeline).max_concurrent == 2
+
+        builder = DefaultContextBuilder(
+            settings={"tails_cache.max_size": 1048576, "tails_cache.prefetch": True}
+        )
+        result = await builder.build_context()
+        assert result.inject(TailsCache).max_size == 1048576
+        assert result.inject(TailsCache).prefetch
+
+        builder = DefaultContextBuilder(settings={"revocation.spare_registries": 2})
+        result = await builder.build_context()
+        assert result.inject(RevRegProvisioner).spares == 2
+
+        builder = DefaultContextBuilder(settings={"revocation.issuance_shards": 4})
+        result = await builder.build_context()
+        assert result.inject(RevRegProvisioner).spares == 0
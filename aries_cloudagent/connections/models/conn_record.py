@@ -141,6 +141,7 @@ class ConnRecord(BaseRecord):
             return self is ConnRecord.State.get(other)
 
     RECORD_ID_NAME = "connection_id"
+    RECORD_CACHE_SIZE = 1000
     WEBHOOK_TOPIC = "connections"
     LOG_STATE_FLAG = "debug.connections"
     TAG_NAMES = {"my_did", "their_did", "request_id", "invitation_key"}
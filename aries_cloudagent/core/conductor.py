@@ -8,12 +8,14 @@ wallet.
 
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import get_genesis_transactions, ledger_config
@@ -21,6 +23,8 @@ from ..config.logging import LoggingConfigurator
 from ..config.wallet import wallet_config
 from ..core.profile import Profile
 from ..ledger.error import LedgerConfigError, LedgerTransactionError
+from ..ledger.warm_up import warm_up_ledger
+from ..ledger.write_queue import LedgerWriteQueue
 from ..messaging.responder import BaseResponder
 from ..multitenant.manager import MultitenantManager
 from ..protocols.connections.v1_0.manager import (
@@ -36,6 +40,8 @@ from ..protocols.coordinate_mediation.v1_0.models.mediation_record import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import InvitationMessage
+from ..revocation.provisioner import RevRegProvisioner
+from ..tails.upload import TailsUploadPipeline
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.base import OutboundDeliveryError
@@ -75,6 +81,8 @@ class Conductor:
         self.outbound_transport_manager: OutboundTransportManager = None
         self.root_profile: Profile = None
         self.setup_public_did: DIDInfo = None
+        self.warm_up_task: asyncio.Task = None
+        self.provision_task: asyncio.Task = None
 
     @property
     def context(self) -> InjectionContext:
@@ -206,6 +214,16 @@ class Conductor:
             )
             context.injector.bind_instance(BaseResponder, responder)
 
+        # Load ledger objects used for issuance without delaying startup
+        if context.settings.get("ledger.warm_up"):
+            self.warm_up_task = asyncio.ensure_future(self.warm_up_ledger())
+
+        # Stage any spare revocation registries missing since the last run
+        if context.inject(RevRegProvisioner, required=False):
+            self.provision_task = asyncio.ensure_future(
+                self.provision_revocation_registries()
+            )
+
         # Get agent label
         default_label = context.settings.get("default_label")
 
@@ -322,8 +340,29 @@ class Conductor:
             except Exception:
                 LOGGER.exception("Error accepting mediation invitation")
 
+    async def warm_up_ledger(self):
+        """Prefetch the ledger objects used to issue credentials."""
+        try:
+            await warm_up_ledger(self.root_profile)
+        except Exception:
+            LOGGER.exception("Error warming up ledger")
+
+    async def provision_revocation_registries(self):
+        """Top up the spare revocation registries of each credential definition."""
+        provisioner = self.context.inject(RevRegProvisioner)
+        try:
+            await provisioner.top_up_all(self.root_profile)
+        except Exception:
+            LOGGER.exception("Error provisioning revocation registries")
+
     async def stop(self, timeout=1.0):
         """Stop the agent."""
+        for task in (self.warm_up_task, self.provision_task):
+            if task and not task.done():
+                task.cancel()
+        provisioner = self.context.inject(RevRegProvisioner, required=False)
+        if provisioner:
+            await provisioner.stop()
         shutdown = TaskQueue()
         if self.dispatcher:
             shutdown.run(self.dispatcher.complete())
@@ -424,6 +463,15 @@ class Conductor:
                 stats["out_encode"] += 1
             if m.state == QueuedOutboundMessage.STATE_DELIVER:
                 stats["out_deliver"] += 1
+        cache = self.context.inject(BaseCache, required=False)
+        if cache:
+            stats["cache"] = await cache.get_stats()
+        write_queue = self.context.inject(LedgerWriteQueue, required=False)
+        if write_queue:
+            stats["ledger_writes"] = write_queue.metrics()
+        tails_uploads = self.context.inject(TailsUploadPipeline, required=False)
+        if tails_uploads:
+            stats["tails_uploads"] = tails_uploads.metrics()
         return stats
 
     async def outbound_message_router(
@@ -1,6 +1,7 @@
 """Manage in-memory profile interaction."""
 
 from collections import OrderedDict
+from itertools import count
 from typing import Any, Mapping, Type
 
 from ..config.injection_context import InjectionContext
@@ -32,6 +33,12 @@ class InMemoryProfile(Profile):
         self.local_dids = {}
         self.pair_dids = {}
         self.records = OrderedDict()
+        # record indexes maintained by InMemoryStorage:
+        # type -> {record id: insertion sequence}
+        self.record_type_index = {}
+        # type -> {(tag name, tag value): set of record ids}
+        self.record_tag_index = {}
+        self.record_sequence = count()
 
     def session(self, context: InjectionContext = None) -> "ProfileSession":
         """Start a new interactive session with no transaction support requested."""
@@ -3,6 +3,8 @@ from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
 from ...admin.base_server import BaseAdminServer
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
 from ...config.base_context import ContextBuilder
 from ...config.injection_context import InjectionContext
 from ...connections.models.connection_target import ConnectionTarget
@@ -15,7 +17,9 @@ from ...connections.models.diddoc import (
 from ...core.in_memory import InMemoryProfileManager
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
+from ...ledger.write_queue import LedgerWriteQueue
 from ...multitenant.manager import MultitenantManager
+from ...tails.upload import TailsUploadPipeline
 from ...transport.inbound.message import InboundMessage
 from ...transport.inbound.receipt import MessageReceipt
 from ...transport.outbound.base import OutboundDeliveryError
@@ -189,6 +193,24 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
                     "task_pending",
                 ]
             )
+            assert "cache" not in stats
+
+            conductor.context.injector.bind_instance(BaseCache, InMemoryCache())
+            stats = await conductor.get_stats()
+            assert stats["cache"] == {"entries": 0, "bytes": 0, "prefixes": {}}
+            assert "ledger_writes" not in stats
+
+            conductor.context.injector.bind_instance(
+                LedgerWriteQueue, LedgerWriteQueue(async_mock.MagicMock())
+            )
+            stats = await conductor.get_stats()
+            assert stats["ledger_writes"]["depth"] == 0
+
+            conductor.context.injector.bind_instance(
+                TailsUploadPipeline, TailsUploadPipeline()
+            )
+            stats = await conductor.get_stats()
+            assert stats["tails_uploads"]["uploads"] == {}
 
     async def test_setup_x(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
@@ -760,6 +782,50 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             await conductor.stop()
             mock_mgr.return_value.clear_default_mediator.assert_called_once()
 
+    async def test_warm_up_ledger(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        builder.update_settings({"ledger.warm_up": True})
+        conductor = test_module.Conductor(builder)
+
+        await conductor.setup()
+
+        with async_mock.patch.object(
+            test_module, "warm_up_ledger", async_mock.CoroutineMock()
+        ) as mock_warm_up:
+            await conductor.start()
+            await conductor.warm_up_task
+            mock_warm_up.assert_awaited_once_with(conductor.root_profile)
+
+            mock_warm_up.side_effect = test_module.LedgerConfigError("bad ledger")
+            with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+                await conductor.warm_up_ledger()
+                mock_logger.exception.assert_called_once()
+            await conductor.stop()
+
+    async def test_provision_revocation_registries(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        await conductor.setup()
+        provisioner = async_mock.MagicMock(
+            top_up_all=async_mock.CoroutineMock(),
+            stop=async_mock.CoroutineMock(),
+        )
+        conductor.context.injector.bind_instance(
+            test_module.RevRegProvisioner, provisioner
+        )
+
+        await conductor.start()
+        await conductor.provision_task
+        provisioner.top_up_all.assert_awaited_once_with(conductor.root_profile)
+
+        provisioner.top_up_all.side_effect = test_module.LedgerConfigError("bad")
+        with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+            await conductor.provision_revocation_registries()
+            mock_logger.exception.assert_called_once()
+        await conductor.stop()
+        provisioner.stop.assert_awaited_once()
+
     async def test_set_default_mediator(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         builder.update_settings({"mediation.default_id": "test-id"})
@@ -9,6 +9,7 @@ import indy.blob_storage
 from indy.error import AnoncredsRevocationRegistryFullError, IndyError, ErrorCode
 
 from ...indy.sdk.profile import IndySdkProfile
+from ...ledger.util import merge_revoc_reg_entries
 from ...messaging.util import encode
 from ...revocation.models.issuer_cred_rev_record import IssuerCredRevRecord
 from ...storage.error import StorageError
@@ -277,70 +278,97 @@ class IndySdkIssuer(IndyIssuer):
 
         """
         failed_crids = []
+        revoked_crids = []
+        deltas = []
         tails_reader_handle = await create_tails_reader(tails_file_path)
 
-        result_json = None
         for cred_rev_id in cred_rev_ids:
-            with IndyErrorHandler(
-                "Exception when revoking credential", IndyIssuerError
-            ):
-                try:
-                    session = await self.profile.session()
-                    delta_json = await indy.anoncreds.issuer_revoke_credential(
-                        self.profile.wallet.handle,
-                        tails_reader_handle,
-                        rev_reg_id,
-                        cred_rev_id,
-                    )
-                    issuer_cr_rec = await IssuerCredRevRecord.retrieve_by_ids(
-                        session,
+            try:
+                delta_json = await indy.anoncreds.issuer_revoke_credential(
+                    self.profile.wallet.handle,
+                    tails_reader_handle,
+                    rev_reg_id,
+                    cred_rev_id,
+                )
+            except IndyError as err:
+                if err.error_code == ErrorCode.AnoncredsInvalidUserRevocId:
+                    LOGGER.error(
+                        (
+                            "Abstaining from revoking credential on "
+                            "rev reg id %s, cred rev id=%s: "
+                            "already revoked or not yet issued"
+                        ),
                         rev_reg_id,
                         cred_rev_id,
                     )
-                    await issuer_cr_rec.set_state(
-                        session, IssuerCredRevRecord.STATE_REVOKED
+                else:
+                    LOGGER.error(
+                        IndyErrorHandler.wrap_error(
+                            err, "Revocation error", IndyIssuerError
+                        ).roll_up
                     )
+                failed_crids.append(cred_rev_id)
+                continue
+            revoked_crids.append(cred_rev_id)
+            deltas.append(delta_json)
 
-                except IndyError as err:
-                    if err.error_code == ErrorCode.AnoncredsInvalidUserRevocId:
-                        LOGGER.error(
-                            (
-                                "Abstaining from revoking credential on "
-                                "rev reg id %s, cred rev id=%s: "
-                                "already revoked or not yet issued"
-                            ),
-                            rev_reg_id,
-                            cred_rev_id,
-                        )
-                    else:
-                        LOGGER.error(
-                            IndyErrorHandler.wrap_error(
-                                err, "Revocation error", IndyIssuerError
-                            ).roll_up
-                        )
-                    failed_crids.append(cred_rev_id)
-                    continue
-                except StorageError as err:
+        with IndyErrorHandler("Exception when revoking credential", IndyIssuerError):
+            result_json = await self._merge_revocation_deltas(deltas)
+
+        if revoked_crids:
+            try:
+                async with self.profile.session() as session:
+                    revoked_recs = await IssuerCredRevRecord.query_by_cred_rev_ids(
+                        session, rev_reg_id, revoked_crids
+                    )
+                    for issuer_cr_rec in revoked_recs:
+                        issuer_cr_rec.state = IssuerCredRevRecord.STATE_REVOKED
+                    await IssuerCredRevRecord.save_records(
+                        session,
+                        revoked_recs,
+                        reason=f"Marked {IssuerCredRevRecord.STATE_REVOKED}",
+                    )
+                missing_crids = set(revoked_crids) - {
+                    issuer_cr_rec.cred_rev_id for issuer_cr_rec in revoked_recs
+                }
+                if missing_crids:
                     LOGGER.warning(
                         (
-                            "Revoked credential on rev reg id %s, cred rev id %s "
-                            "without corresponding issuer cred rev record: %s"
+                            "Revoked credentials on rev reg id %s, cred rev ids %s "
+                            "without corresponding issuer cred rev records"
                         ),
                         rev_reg_id,
-                        cred_rev_id,
-                        err.roll_up,
+                        sorted(missing_crids),
                     )
-                    # carry on with delta merge; record is best-effort
-
-                if result_json:
-                    result_json = await self.merge_revocation_registry_deltas(
-                        result_json, delta_json
-                    )
-                else:
-                    result_json = delta_json
+            except StorageError as err:
+                LOGGER.warning(
+                    "Failed to mark issuer cred rev records revoked on rev reg id %s: %s",
+                    rev_reg_id,
+                    err.roll_up,
+                )
 
         return (result_json, failed_crids)
 
+    async def _merge_revocation_deltas(self, deltas: Sequence[str]) -> str:
+        """
+        Combine the deltas from revoking credentials one by one.
+
+        The deltas are consecutive, so they are merged in a single pass. Should
+        they not be, they are merged pairwise by indy.
+        """
+        if len(deltas) < 2:
+            return deltas[0] if deltas else None
+        merged = merge_revoc_reg_entries([json.loads(delta) for delta in deltas])
+        if merged:
+            return json.dumps(merged)
+
+        result_json = deltas[0]
+        for delta_json in deltas[1:]:
+            result_json = await self.merge_revocation_registry_deltas(
+                result_json, delta_json
+            )
+        return result_json
+
     async def merge_revocation_registry_deltas(
         self, fro_delta: str, to_delta: str
     ) -> str:
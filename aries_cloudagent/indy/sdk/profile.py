@@ -10,8 +10,11 @@ from ...config.provider import ClassProvider
 from ...core.profile import Profile, ProfileManager, ProfileSession
 from ...core.error import ProfileError
 from ...ledger.base import BaseLedger
+from ...ledger.in_memory import InMemoryLedger, InMemoryLedgerState
 from ...ledger.indy import IndySdkLedger, IndySdkLedgerPool
+from ...ledger.write_queue import LedgerWriteQueue
 from ...storage.base import BaseStorage, BaseStorageSearch
+from ...storage.indy import IndySdkStorage
 from ...wallet.base import BaseWallet
 from ...wallet.indy import IndySdkWallet
 
@@ -34,6 +37,7 @@ class IndySdkProfile(Profile):
         super().__init__(context=context, name=opened.name, created=opened.created)
         self.opened = opened
         self.ledger_pool: IndySdkLedgerPool = None
+        self.ledger_state: InMemoryLedgerState = None
         self.init_ledger_pool()
         self.bind_providers()
 
@@ -53,6 +57,11 @@ class IndySdkProfile(Profile):
             LOGGER.info("Ledger support is disabled")
             return
 
+        if self.settings.get("ledger.type") == "in_memory":
+            LOGGER.info("Using in-memory ledger")
+            self.ledger_state = self.context.inject(InMemoryLedgerState, self.settings)
+            return
+
         self.ledger_pool = self.context.inject(IndySdkLedgerPool, self.settings)
 
     def bind_providers(self):
@@ -75,10 +84,21 @@ class IndySdkProfile(Profile):
             ClassProvider("aries_cloudagent.indy.sdk.issuer.IndySdkIssuer", ref(self)),
         )
 
+        ledger = None
         if self.ledger_pool:
             ledger = IndySdkLedger(self.ledger_pool, IndySdkWallet(self.opened))
+        elif self.ledger_state:
+            ledger = InMemoryLedger(
+                self.ledger_state,
+                IndySdkWallet(self.opened),
+                IndySdkStorage(self.opened),
+                latency=float(self.settings.get("ledger.latency", 0)),
+                read_only=bool(self.settings.get("ledger.read_only", False)),
+            )
 
+        if ledger:
             injector.bind_instance(BaseLedger, ledger)
+            injector.bind_instance(LedgerWriteQueue, LedgerWriteQueue(ledger))
             injector.bind_provider(
                 IndyVerifier,
                 ClassProvider(
@@ -178,11 +178,13 @@ class TestIndySdkIssuer(AsyncTestCase):
             test_module, "IssuerCredRevRecord", async_mock.MagicMock()
         ) as mock_issuer_cr_rec:
             mock_issuer_cr_rec.return_value.save = async_mock.CoroutineMock()
-            mock_issuer_cr_rec.retrieve_by_ids = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(
-                    set_state=async_mock.CoroutineMock(),
-                )
+            mock_issuer_cr_rec.query_by_cred_rev_ids = async_mock.CoroutineMock(
+                return_value=[
+                    async_mock.MagicMock(cred_rev_id=cr_id)
+                    for cr_id in test_cred_rev_ids
+                ]
             )
+            mock_issuer_cr_rec.save_records = async_mock.CoroutineMock()
 
             with self.assertRaises(test_module.IndyIssuerError):  # missing attribute
                 cred_json, revoc_id = await self.issuer.create_credential(
@@ -217,14 +219,54 @@ class TestIndySdkIssuer(AsyncTestCase):
             values = json.loads(call_values)
             assert "attr1" in values
 
+            mock_indy_revoke_credential.side_effect = [
+                json.dumps(
+                    {
+                        "ver": "1.0",
+                        "value": {
+                            "prevAccum": "1 ...",
+                            "accum": "21 ...",
+                            "revoked": [42],
+                        },
+                    }
+                ),
+                json.dumps(
+                    {
+                        "ver": "1.0",
+                        "value": {
+                            "prevAccum": "21 ...",
+                            "accum": "22 ...",
+                            "revoked": [54],
+                        },
+                    }
+                ),
+            ]
+            (result, failed) = await self.issuer.revoke_credentials(
+                REV_REG_ID, tails_file_path="dummy", cred_rev_ids=test_cred_rev_ids
+            )
+            assert json.loads(result) == {
+                "ver": "1.0",
+                "value": {"prevAccum": "1 ...", "accum": "22 ...", "revoked": [42, 54]},
+            }
+            assert not failed
+            assert mock_indy_revoke_credential.call_count == 2
+            mock_indy_merge_rr_deltas.assert_not_called()
+            mock_issuer_cr_rec.query_by_cred_rev_ids.assert_awaited_once()
+            assert mock_issuer_cr_rec.query_by_cred_rev_ids.call_args[0][1:] == (
+                REV_REG_ID,
+                test_cred_rev_ids,
+            )
+            mock_issuer_cr_rec.save_records.assert_awaited_once()
+            assert len(mock_issuer_cr_rec.save_records.call_args[0][1]) == 2
+
+            # deltas which do not follow on are merged by indy
+            mock_indy_revoke_credential.side_effect = None
             mock_indy_revoke_credential.return_value = json.dumps(TEST_RR_DELTA)
             mock_indy_merge_rr_deltas.return_value = json.dumps(TEST_RR_DELTA)
             (result, failed) = await self.issuer.revoke_credentials(
                 REV_REG_ID, tails_file_path="dummy", cred_rev_ids=test_cred_rev_ids
             )
             assert json.loads(result) == TEST_RR_DELTA
-            assert not failed
-            assert mock_indy_revoke_credential.call_count == 2
             mock_indy_merge_rr_deltas.assert_called_once()
 
     @async_mock.patch("indy.anoncreds.issuer_create_credential")
@@ -285,13 +327,12 @@ class TestIndySdkIssuer(AsyncTestCase):
                     "could not store"  # not fatal; maximize coverage
                 )
             )
-            mock_issuer_cr_rec.retrieve_by_ids = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(
-                    set_state=async_mock.CoroutineMock(
-                        side_effect=test_module.StorageError(
-                            "could not store"  # not fatal; maximize coverage
-                        )
-                    ),
+            mock_issuer_cr_rec.query_by_cred_rev_ids = async_mock.CoroutineMock(
+                return_value=[]
+            )
+            mock_issuer_cr_rec.save_records = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError(
+                    "could not store"  # not fatal; maximize coverage
                 )
             )
 
@@ -367,10 +408,9 @@ class TestIndySdkIssuer(AsyncTestCase):
         ) as mock_issuer_cr_rec:
             mock_issuer_cr_rec.return_value.save = async_mock.CoroutineMock()
             mock_issuer_cr_rec.retrieve_by_ids = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(
-                    set_state=async_mock.CoroutineMock(),
-                )
+                return_value=async_mock.MagicMock()
             )
+            mock_issuer_cr_rec.save_records = async_mock.CoroutineMock()
 
             with self.assertRaises(IndyIssuerRevocationRegistryFullError):
                 await self.issuer.create_credential(
@@ -410,10 +450,9 @@ class TestIndySdkIssuer(AsyncTestCase):
         ) as mock_issuer_cr_rec:
             mock_issuer_cr_rec.return_value.save = async_mock.CoroutineMock()
             mock_issuer_cr_rec.retrieve_by_ids = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(
-                    set_state=async_mock.CoroutineMock(),
-                )
+                return_value=async_mock.MagicMock()
             )
+            mock_issuer_cr_rec.save_records = async_mock.CoroutineMock()
 
             with self.assertRaises(test_module.IndyIssuerError):
                 await self.issuer.create_credential(
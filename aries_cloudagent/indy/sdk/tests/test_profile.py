@@ -4,7 +4,10 @@ from asynctest import mock as async_mock
 
 from ....config.injection_context import InjectionContext
 from ....core.error import ProfileError
+from ....ledger.base import BaseLedger
+from ....ledger.in_memory import InMemoryLedger, InMemoryLedgerState
 from ....ledger.indy import IndySdkLedgerPool
+from ....ledger.write_queue import LedgerWriteQueue
 
 from ..profile import IndySdkProfile
 from ..wallet_setup import IndyWalletConfig, IndyOpenWallet
@@ -59,3 +62,24 @@ class TestIndySdkProfile:
             ),
             context,
         )
+
+    def test_in_memory_ledger(self):
+        context = InjectionContext(
+            settings={"ledger.type": "in_memory", "ledger.latency": 0.5}
+        )
+        context.injector.bind_instance(InMemoryLedgerState, InMemoryLedgerState())
+        in_memory_profile = IndySdkProfile(
+            IndyOpenWallet(
+                config=IndyWalletConfig({"name": "test-profile"}),
+                created=True,
+                handle=1,
+                master_secret_id="master-secret",
+            ),
+            context,
+        )
+        assert in_memory_profile.ledger_pool is None
+        ledger = in_memory_profile.inject(BaseLedger)
+        assert isinstance(ledger, InMemoryLedger)
+        assert ledger.state is in_memory_profile.ledger_state
+        assert ledger.latency == 0.5
+        assert in_memory_profile.inject(LedgerWriteQueue).ledger is ledger
@@ -9,6 +9,7 @@ from typing import Sequence, Tuple, Union
 from ..indy.issuer import IndyIssuer
 
 from .endpoint_type import EndpointType
+from .util import fetch_concurrently
 
 
 class BaseLedger(ABC, metaclass=ABCMeta):
@@ -156,7 +157,7 @@ class BaseLedger(ABC, metaclass=ABCMeta):
 
     @abstractmethod
     async def send_revoc_reg_def(self, revoc_reg_def: dict, issuer_did: str = None):
-        """Publish a revocation registry definition to the ledger."""
+        """Publish a revocation registry definition, returning its ledger timestamp."""
 
     @abstractmethod
     async def send_revoc_reg_entry(
@@ -166,7 +167,7 @@ class BaseLedger(ABC, metaclass=ABCMeta):
         revoc_reg_entry: dict,
         issuer_did: str = None,
     ):
-        """Publish a revocation registry entry to the ledger."""
+        """Publish a revocation registry entry, returning its ledger timestamp."""
 
     @abstractmethod
     async def create_and_send_credential_definition(
@@ -202,6 +203,25 @@ class BaseLedger(ABC, metaclass=ABCMeta):
 
         """
 
+    async def get_credential_definitions(
+        self, credential_definition_ids: Sequence[str]
+    ) -> dict:
+        """
+        Get multiple credential definitions, from the cache where available.
+
+        Credential definitions are fetched concurrently.
+
+        Args:
+            credential_definition_ids: The ids of the cred defs to retrieve
+
+        Returns:
+            A dictionary of cred def ids to cred defs (or None if not found)
+
+        """
+        return await fetch_concurrently(
+            self.get_credential_definition, credential_definition_ids
+        )
+
     @abstractmethod
     async def get_revoc_reg_delta(
         self, revoc_reg_id: str, timestamp_from=0, timestamp_to=None
@@ -218,6 +238,21 @@ class BaseLedger(ABC, metaclass=ABCMeta):
 
         """
 
+    async def get_schemas(self, schema_ids: Sequence[str]) -> dict:
+        """
+        Get multiple schemas, from the cache where available.
+
+        Schemas are fetched concurrently.
+
+        Args:
+            schema_ids: The schema ids (or stringified sequence numbers) to retrieve
+
+        Returns:
+            A dictionary of schema ids to schemas (or None if not found)
+
+        """
+        return await fetch_concurrently(self.get_schema, schema_ids)
+
     @abstractmethod
     async def get_revoc_reg_entry(self, revoc_reg_id: str, timestamp: int):
         """Get revocation registry entry by revocation registry ID and timestamp."""
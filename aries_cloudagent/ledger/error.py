@@ -21,3 +21,7 @@ class ClosedPoolError(LedgerError):
 
 class LedgerTransactionError(LedgerError):
     """The ledger rejected the transaction."""
+
+
+class LedgerTransientError(LedgerTransactionError):
+    """The ledger did not respond in time and the request may be retried."""
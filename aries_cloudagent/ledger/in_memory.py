@@ -0,0 +1,679 @@
+"""In-memory ledger implementation, for testing and benchmarking without a pool."""
+
+import asyncio
+import json
+import logging
+import os
+
+from copy import deepcopy
+from time import time
+from typing import Sequence, Tuple
+
+from ..config.base import BaseInjector, BaseProvider, BaseSettings
+from ..indy.issuer import IndyIssuer, IndyIssuerError, DEFAULT_CRED_DEF_TAG
+from ..messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
+from ..messaging.schemas.util import SCHEMA_SENT_RECORD_TYPE
+from ..storage.base import BaseStorage, StorageRecord
+from ..wallet.base import BaseWallet, DIDInfo
+from ..wallet.did_posture import DIDPosture
+from ..wallet.error import WalletNotFoundError
+from ..wallet.util import full_verkey
+
+from .base import BaseLedger, Role
+from .endpoint_type import EndpointType
+from .error import BadLedgerRequestError, LedgerError, LedgerTransactionError
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+LOGGER = logging.getLogger(__name__)
+
+
+class InMemoryLedgerStateProvider(BaseProvider):
+    """Provider for the in-memory ledger state shared by an agent's profiles."""
+
+    def provide(self, settings: BaseSettings, injector: BaseInjector):
+        """Create the ledger state instance."""
+        return InMemoryLedgerState(settings.get("ledger.journal_file"))
+
+
+class InMemoryLedgerState:
+    """The transactions written to an in-memory ledger.
+
+    The state is held by the agent process, and shared by all its profiles. If
+    a journal file is given, each transaction is also appended to the file and
+    transactions appended by other processes are read back from it, so that
+    agents on the same host may share a ledger.
+
+    Writes are checked against the rules a ledger would enforce on the
+    transaction content, but not on the author's role: authors unknown to the
+    ledger are registered on their first write.
+    """
+
+    def __init__(self, journal_file: str = None):
+        """
+        Initialize an InMemoryLedgerState instance.
+
+        Args:
+            journal_file: The path of the journal file shared with other agents
+        """
+        self.journal_file = journal_file
+        self._journal_offset = 0
+        self.txns = []
+        self.nyms = {}
+        self.attribs = {}
+        self.schemas = {}
+        self.cred_defs = {}
+        self.rev_reg_defs = {}
+        self.rev_reg_entries = {}
+
+    def _check(self, txn_type: str, data: dict):
+        """Check that a transaction may be written in the current state."""
+        if txn_type == "ATTRIB" and data["dest"] not in self.nyms:
+            raise LedgerTransactionError(f"Unknown DID {data['dest']}")
+        if txn_type == "SCHEMA" and data["id"] in self.schemas:
+            raise LedgerTransactionError(
+                f"{data['id']} can have one and only one SCHEMA with name "
+                f"{data['name']} and version {data['version']}"
+            )
+        if txn_type == "CRED_DEF" and data["id"] in self.cred_defs:
+            raise LedgerTransactionError(
+                f"Credential definition {data['id']} already exists"
+            )
+        if txn_type == "REVOC_REG_DEF":
+            if data["id"] in self.rev_reg_defs:
+                raise LedgerTransactionError(
+                    f"Revocation registry definition {data['id']} already exists"
+                )
+            if data["credDefId"] not in self.cred_defs:
+                raise LedgerTransactionError(
+                    f"Unknown credential definition {data['credDefId']}"
+                )
+        if txn_type == "REVOC_REG_ENTRY":
+            rev_reg_id = data["revocRegDefId"]
+            if rev_reg_id not in self.rev_reg_defs:
+                raise LedgerTransactionError(
+                    f"Unknown revocation registry definition {rev_reg_id}"
+                )
+            entries = self.rev_reg_entries.get(rev_reg_id)
+            prev_accum = data["value"].get("prevAccum")
+            if entries and prev_accum != entries[-1][1]["accum"]:
+                raise LedgerTransactionError(
+                    f"Previous accumulator does not match for {rev_reg_id}"
+                )
+
+    def _apply(self, txn: dict):
+        """Update the state with a written transaction."""
+        txn_type = txn["type"]
+        data = txn["data"]
+        self.txns.append(txn)
+        if txn_type == "NYM":
+            nym = self.nyms.setdefault(data["dest"], {"seqNo": txn["seqNo"]})
+            nym.update((key, value) for key, value in data.items() if value is not None)
+        elif txn_type == "ATTRIB":
+            self.attribs.setdefault(data["dest"], {}).update(data["raw"])
+        elif txn_type == "SCHEMA":
+            schema = {**data, "seqNo": txn["seqNo"]}
+            self.schemas[data["id"]] = schema
+            self.schemas[str(txn["seqNo"])] = schema
+        elif txn_type == "CRED_DEF":
+            self.cred_defs[data["id"]] = data
+        elif txn_type == "REVOC_REG_DEF":
+            self.rev_reg_defs[data["id"]] = {**data, "txnTime": txn["txnTime"]}
+        elif txn_type == "REVOC_REG_ENTRY":
+            entries = self.rev_reg_entries.setdefault(data["revocRegDefId"], [])
+            value = data["value"]
+            issued = set(value.get("issued") or ())
+            revoked = set(value.get("revoked") or ())
+            prev = entries[-1][1] if entries else {"issued": set(), "revoked": set()}
+            entries.append(
+                (
+                    txn["txnTime"],
+                    {
+                        "accum": value["accum"],
+                        "issued": (prev["issued"] - revoked) | issued,
+                        "revoked": (prev["revoked"] - issued) | revoked,
+                    },
+                )
+            )
+
+    def sync(self):
+        """Apply any transactions appended to the journal by other agents."""
+        if not self.journal_file:
+            return
+        try:
+            size = os.path.getsize(self.journal_file)
+        except FileNotFoundError:
+            return
+        if size <= self._journal_offset:
+            return
+        with open(self.journal_file, "rb") as journal:
+            journal.seek(self._journal_offset)
+            data = journal.read()
+        end = data.rfind(b"\n") + 1  # skip a partly written last line
+        for line in data[:end].splitlines():
+            self._apply(json.loads(line))
+        self._journal_offset += end
+
+    def write(self, txn_type: str, data: dict) -> dict:
+        """
+        Write a transaction to the ledger.
+
+        Args:
+            txn_type: The transaction type
+            data: The transaction data
+
+        Returns:
+            The written transaction, with its sequence number and time
+
+        """
+        if not self.journal_file:
+            return self._write(txn_type, data)
+        with open(self.journal_file, "ab") as journal:
+            if fcntl:
+                fcntl.flock(journal, fcntl.LOCK_EX)
+            self.sync()
+            txn = self._write(txn_type, data)
+            line = (json.dumps(txn) + "\n").encode("utf-8")
+            journal.write(line)
+            journal.flush()
+            self._journal_offset += len(line)
+        return txn
+
+    def _write(self, txn_type: str, data: dict) -> dict:
+        """Check and apply a new transaction."""
+        self._check(txn_type, data)
+        last_time = self.txns[-1]["txnTime"] if self.txns else 0
+        txn = {
+            "type": txn_type,
+            "seqNo": len(self.txns) + 1,
+            "txnTime": max(int(time()), last_time),
+            "data": deepcopy(data),
+        }
+        self._apply(txn)
+        return txn
+
+    def get_rev_reg_entry(self, rev_reg_id: str, timestamp: int) -> Tuple[int, dict]:
+        """Find the latest revocation registry entry at a time, if any."""
+        found = None
+        for entry in self.rev_reg_entries.get(rev_reg_id, ()):
+            if entry[0] > timestamp:
+                break
+            found = entry
+        return found
+
+
+class InMemoryLedger(BaseLedger):
+    """Ledger held in memory, with artificial latency.
+
+    Lets the agent's own throughput be measured without a ledger pool.
+    """
+
+    BACKEND_NAME = "in_memory"
+
+    def __init__(
+        self,
+        state: InMemoryLedgerState,
+        wallet: BaseWallet,
+        storage: BaseStorage,
+        *,
+        latency: float = 0.0,
+        read_only: bool = False,
+    ):
+        """
+        Initialize an InMemoryLedger instance.
+
+        Args:
+            state: The ledger state
+            wallet: The wallet instance to use
+            storage: The storage instance for records of published objects
+            latency: The number of seconds to delay each ledger request
+            read_only: Prevent any ledger write operations
+        """
+        self.state = state
+        self.wallet = wallet
+        self.storage = storage
+        self.latency = latency
+        self._read_only = read_only
+
+    @property
+    def read_only(self) -> bool:
+        """Accessor for the ledger read-only flag."""
+        return self._read_only
+
+    async def _read(self):
+        """Simulate a ledger read request."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.state.sync()
+
+    async def _write(self, txn_type: str, data: dict, author: DIDInfo) -> dict:
+        """Simulate a ledger write request, registering an unknown author."""
+        if self.read_only:
+            raise LedgerError(
+                f"Error cannot write {txn_type} when ledger is in read only mode"
+            )
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.state.sync()
+        if author and author.did not in self.state.nyms:
+            self.state.write(
+                "NYM", {"dest": author.did, "verkey": author.verkey, "role": None}
+            )
+        return self.state.write(txn_type, data)
+
+    async def _get_public_info(self, purpose: str) -> DIDInfo:
+        """Get the public DID to write with."""
+        public_info = await self.wallet.get_public_did()
+        if not public_info:
+            raise BadLedgerRequestError(f"Cannot {purpose} without a public DID")
+        return public_info
+
+    async def get_key_for_did(self, did: str) -> str:
+        """Fetch the verkey for a ledger DID.
+
+        Args:
+            did: The DID to look up on the ledger
+        """
+        await self._read()
+        nym = self.state.nyms.get(self.did_to_nym(did))
+        return full_verkey(did, nym["verkey"]) if nym else None
+
+    async def get_all_endpoints_for_did(self, did: str) -> dict:
+        """Fetch all endpoints for a ledger DID.
+
+        Args:
+            did: The DID to look up on the ledger
+        """
+        await self._read()
+        endpoints = self.state.attribs.get(self.did_to_nym(did), {}).get("endpoint")
+        return deepcopy(endpoints)
+
+    async def get_endpoint_for_did(
+        self, did: str, endpoint_type: EndpointType = None
+    ) -> str:
+        """Fetch the endpoint for a ledger DID.
+
+        Args:
+            did: The DID to look up on the ledger
+            endpoint_type: The type of the endpoint (default 'endpoint')
+        """
+        if not endpoint_type:
+            endpoint_type = EndpointType.ENDPOINT
+        endpoints = await self.get_all_endpoints_for_did(did)
+        return endpoints.get(endpoint_type.indy) if endpoints else None
+
+    async def update_endpoint_for_did(
+        self, did: str, endpoint: str, endpoint_type: EndpointType = None
+    ) -> bool:
+        """Check and update the endpoint on the ledger.
+
+        Args:
+            did: The ledger DID
+            endpoint: The endpoint address
+            endpoint_type: The type of the endpoint (default 'endpoint')
+        """
+        if not endpoint_type:
+            endpoint_type = EndpointType.ENDPOINT
+        endpoints = await self.get_all_endpoints_for_did(did) or {}
+        if endpoints.get(endpoint_type.indy) == endpoint:
+            return False
+
+        endpoints[endpoint_type.indy] = endpoint
+        did_info = await self.wallet.get_local_did(did)
+        await self._write(
+            "ATTRIB",
+            {"dest": self.did_to_nym(did), "raw": {"endpoint": endpoints}},
+            did_info,
+        )
+        return True
+
+    async def register_nym(
+        self, did: str, verkey: str, alias: str = None, role: str = None
+    ):
+        """
+        Register a nym on the ledger.
+
+        Args:
+            did: DID to register on the ledger.
+            verkey: The verification key of the keypair.
+            alias: Human-friendly alias to assign to the DID.
+            role: For permissioned ledgers, what role should the new DID have.
+        """
+        public_info = await self._get_public_info("register NYM")
+        await self._write(
+            "NYM",
+            {
+                "dest": self.did_to_nym(did),
+                "verkey": verkey,
+                "alias": alias,
+                "role": role,
+            },
+            public_info,
+        )
+
+        try:
+            did_info = await self.wallet.get_local_did(did)
+        except WalletNotFoundError:
+            pass  # registering another user's NYM
+        else:
+            if DIDPosture.get(did_info.metadata) == DIDPosture.WALLET_ONLY:
+                metadata = {**did_info.metadata, **DIDPosture.POSTED.metadata}
+                await self.wallet.replace_local_did_metadata(did, metadata)
+
+    async def get_nym_role(self, did: str) -> Role:
+        """
+        Return the role of the input public DID's NYM on the ledger.
+
+        Args:
+            did: DID to query for role on the ledger.
+        """
+        await self._read()
+        nym = self.state.nyms.get(self.did_to_nym(did))
+        if not nym:
+            raise BadLedgerRequestError(f"DID {did} is not public")
+        return Role.get(nym.get("role"))
+
+    def nym_to_did(self, nym: str) -> str:
+        """Format a nym with the ledger's DID prefix."""
+        if nym:
+            # remove any existing prefix
+            nym = self.did_to_nym(nym)
+            return f"did:sov:{nym}"
+
+    async def rotate_public_did_keypair(self, next_seed: str = None) -> None:
+        """
+        Rotate keypair for public DID: create new key, submit to ledger, update wallet.
+
+        Args:
+            next_seed: seed for incoming ed25519 keypair (default random)
+        """
+        public_info = await self._get_public_info("rotate keypair")
+        public_did = public_info.did
+        await self._read()
+        nym = self.state.nyms.get(public_did)
+        if not nym:
+            raise BadLedgerRequestError(f"Ledger has no public DID {public_did}")
+        verkey = await self.wallet.rotate_did_keypair_start(public_did, next_seed)
+        await self.register_nym(public_did, verkey, nym.get("alias"), nym.get("role"))
+        await self.wallet.rotate_did_keypair_apply(public_did)
+
+    async def get_txn_author_agreement(self, reload: bool = False) -> dict:
+        """Get the current transaction author agreement: none is required."""
+        return await self.fetch_txn_author_agreement()
+
+    async def fetch_txn_author_agreement(self) -> dict:
+        """Fetch the current AML and TAA from the ledger: none is required."""
+        return {"aml_record": None, "taa_record": None, "taa_required": False}
+
+    async def create_and_send_schema(
+        self,
+        issuer: IndyIssuer,
+        schema_name: str,
+        schema_version: str,
+        attribute_names: Sequence[str],
+    ) -> Tuple[str, dict]:
+        """
+        Send schema to ledger.
+
+        Args:
+            issuer: The issuer instance creating the schema
+            schema_name: The schema name
+            schema_version: The schema version
+            attribute_names: A list of schema attributes
+
+        """
+        public_info = await self._get_public_info("publish schema")
+        schema_id = f"{public_info.did}:2:{schema_name}:{schema_version}"
+        schema_def = await self.get_schema(schema_id)
+        if schema_def:
+            if sorted(schema_def["attrNames"]) != sorted(attribute_names):
+                raise LedgerTransactionError(
+                    "Schema already exists on ledger, but attributes do not match: "
+                    + f"{schema_name}:{schema_version} {schema_def['attrNames']} "
+                    + f"!= {list(attribute_names)}"
+                )
+            LOGGER.warning("Schema already exists on ledger. Returning details.")
+            return schema_id, schema_def
+
+        try:
+            schema_id, schema_json = await issuer.create_schema(
+                public_info.did, schema_name, schema_version, attribute_names
+            )
+        except IndyIssuerError as err:
+            raise LedgerError(err.message) from err
+        schema_def = json.loads(schema_json)
+        txn = await self._write("SCHEMA", schema_def, public_info)
+        schema_def["seqNo"] = txn["seqNo"]
+
+        schema_tags = {
+            "schema_id": schema_id,
+            "schema_issuer_did": public_info.did,
+            "schema_name": schema_name,
+            "schema_version": schema_version,
+            "epoch": str(int(time())),
+        }
+        await self.storage.add_record(
+            StorageRecord(SCHEMA_SENT_RECORD_TYPE, schema_id, schema_tags)
+        )
+        return schema_id, schema_def
+
+    async def get_schema(self, schema_id: str) -> dict:
+        """
+        Get a schema from the ledger.
+
+        Args:
+            schema_id: The schema id (or stringified sequence number) to retrieve
+
+        """
+        await self._read()
+        return deepcopy(self.state.schemas.get(schema_id))
+
+    async def create_and_send_credential_definition(
+        self,
+        issuer: IndyIssuer,
+        schema_id: str,
+        signature_type: str = None,
+        tag: str = None,
+        support_revocation: bool = False,
+    ) -> Tuple[str, dict, bool]:
+        """
+        Send credential definition to ledger and store relevant key matter in wallet.
+
+        Args:
+            issuer: The issuer instance to use for credential definition creation
+            schema_id: The schema id of the schema to create cred def for
+            signature_type: The signature type to use on the credential definition
+            tag: Optional tag to distinguish multiple credential definitions
+            support_revocation: Optional flag to enable revocation for this cred def
+
+        Returns:
+            Tuple with cred def id, cred def structure, and whether it's novel
+
+        """
+        public_info = await self._get_public_info("publish credential definition")
+        schema = await self.get_schema(schema_id)
+        if not schema:
+            raise LedgerError(f"In-memory ledger has no schema {schema_id}")
+
+        credential_definition_id = issuer.make_credential_definition_id(
+            public_info.did, schema, signature_type, tag or DEFAULT_CRED_DEF_TAG
+        )
+        try:
+            in_wallet = await issuer.credential_definition_in_wallet(
+                credential_definition_id
+            )
+        except IndyIssuerError as err:
+            raise LedgerError(err.message) from err
+        ledger_cred_def = await self.get_credential_definition(credential_definition_id)
+        if ledger_cred_def:
+            if not in_wallet:
+                raise LedgerError(
+                    f"Credential definition {credential_definition_id} is on "
+                    "ledger but not in wallet"
+                )
+            LOGGER.warning(
+                "Credential definition %s already exists on ledger",
+                credential_definition_id,
+            )
+            return credential_definition_id, ledger_cred_def, False
+        if in_wallet:
+            raise LedgerError(
+                f"Credential definition {credential_definition_id} is in "
+                "wallet but not on ledger"
+            )
+
+        try:
+            (
+                credential_definition_id,
+                credential_definition_json,
+            ) = await issuer.create_and_store_credential_definition(
+                public_info.did, schema, signature_type, tag, support_revocation
+            )
+        except IndyIssuerError as err:
+            raise LedgerError(err.message) from err
+        credential_definition = json.loads(credential_definition_json)
+        await self._write("CRED_DEF", credential_definition, public_info)
+
+        schema_id_parts = schema_id.split(":")
+        cred_def_tags = {
+            "schema_id": schema_id,
+            "schema_issuer_did": schema_id_parts[0],
+            "schema_name": schema_id_parts[-2],
+            "schema_version": schema_id_parts[-1],
+            "issuer_did": public_info.did,
+            "cred_def_id": credential_definition_id,
+            "epoch": str(int(time())),
+        }
+        await self.storage.add_record(
+            StorageRecord(
+                CRED_DEF_SENT_RECORD_TYPE, credential_definition_id, cred_def_tags
+            )
+        )
+        return credential_definition_id, credential_definition, True
+
+    async def get_credential_definition(self, credential_definition_id: str) -> dict:
+        """
+        Get a credential definition from the ledger.
+
+        Args:
+            credential_definition_id: The id of the cred def to retrieve
+
+        """
+        await self._read()
+        return deepcopy(self.state.cred_defs.get(credential_definition_id))
+
+    async def credential_definition_id2schema_id(self, credential_definition_id):
+        """
+        From a credential definition, get the identifier for its schema.
+
+        Args:
+            credential_definition_id: The identifier of the credential definition
+                from which to identify a schema
+        """
+        tokens = credential_definition_id.split(":")
+        if len(tokens) == 8:  # cred def id has 5 or 8 tokens
+            return ":".join(tokens[3:7])  # schema id spans 0-based positions 3-6
+        return (await self.get_schema(tokens[3]))["id"]
+
+    async def get_revoc_reg_def(self, revoc_reg_id: str) -> dict:
+        """Get revocation registry definition by ID, with its ledger timestamp."""
+        await self._read()
+        found_def = self.state.rev_reg_defs.get(revoc_reg_id)
+        if not found_def:
+            raise LedgerError(f"Revocation registry {revoc_reg_id} not found")
+        return deepcopy(found_def)
+
+    async def send_revoc_reg_def(self, revoc_reg_def: dict, issuer_did: str = None):
+        """Publish a revocation registry definition to the ledger."""
+        if issuer_did:
+            did_info = await self.wallet.get_local_did(issuer_did)
+        else:
+            did_info = await self._get_public_info(
+                "publish revocation registry definition"
+            )
+        txn = await self._write("REVOC_REG_DEF", revoc_reg_def, did_info)
+        return txn["txnTime"]
+
+    async def send_revoc_reg_entry(
+        self,
+        revoc_reg_id: str,
+        revoc_def_type: str,
+        revoc_reg_entry: dict,
+        issuer_did: str = None,
+    ):
+        """Publish a revocation registry entry to the ledger."""
+        if issuer_did:
+            did_info = await self.wallet.get_local_did(issuer_did)
+        else:
+            did_info = await self._get_public_info("publish revocation registry entry")
+        txn = await self._write(
+            "REVOC_REG_ENTRY",
+            {
+                "revocRegDefId": revoc_reg_id,
+                "revocDefType": revoc_def_type,
+                "value": revoc_reg_entry["value"],
+            },
+            did_info,
+        )
+        return txn["txnTime"]
+
+    async def get_revoc_reg_entry(self, revoc_reg_id: str, timestamp: int):
+        """Get revocation registry entry by revocation registry ID and timestamp."""
+        await self._read()
+        found = self.state.get_rev_reg_entry(revoc_reg_id, timestamp)
+        if not found:
+            raise LedgerError(
+                f"No revocation registry entry for {revoc_reg_id} at {timestamp}"
+            )
+        entry_time, entry = found
+        return {"ver": "1.0", "value": {"accum": entry["accum"]}}, entry_time
+
+    async def get_revoc_reg_delta(
+        self, revoc_reg_id: str, fro=0, to=None
+    ) -> (dict, int):
+        """
+        Look up a revocation registry delta by ID.
+
+        :param revoc_reg_id revocation registry id
+        :param fro earliest EPOCH time of interest
+        :param to latest EPOCH time of interest
+
+        :returns delta response, delta timestamp
+        """
+        if to is None:
+            to = int(time())
+        await self._read()
+        found_to = self.state.get_rev_reg_entry(revoc_reg_id, to)
+        if not found_to:
+            raise LedgerError(
+                f"No revocation registry entry for {revoc_reg_id} at {to} "
+                "(interval ends before rev reg creation?)"
+            )
+        to_time, to_entry = found_to
+        found_fro = (
+            self.state.get_rev_reg_entry(revoc_reg_id, fro) if fro != to else None
+        )
+        if found_fro:
+            fro_entry = found_fro[1]
+            value = {
+                "prevAccum": fro_entry["accum"],
+                "accum": to_entry["accum"],
+                "issued": sorted(
+                    (to_entry["issued"] - fro_entry["issued"])
+                    | (fro_entry["revoked"] - to_entry["revoked"])
+                ),
+                "revoked": sorted(
+                    (to_entry["revoked"] - fro_entry["revoked"])
+                    | (fro_entry["issued"] - to_entry["issued"])
+                ),
+            }
+        else:
+            value = {
+                "accum": to_entry["accum"],
+                "issued": sorted(to_entry["issued"]),
+                "revoked": sorted(to_entry["revoked"]),
+            }
+        return {"ver": "1.0", "value": value}, to_time
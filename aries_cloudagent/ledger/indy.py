@@ -9,8 +9,9 @@ from datetime import datetime, date
 from hashlib import sha256
 from os import path
 from time import time
-from typing import Sequence, Tuple
+from typing import Awaitable, Sequence, Tuple
 
+import indy.anoncreds
 import indy.ledger
 import indy.pool
 from indy.error import IndyError, ErrorCode
@@ -24,6 +25,7 @@ from ..messaging.schemas.util import SCHEMA_SENT_RECORD_TYPE
 from ..storage.base import StorageRecord
 from ..storage.indy import IndySdkStorage
 from ..utils import sentinel
+from ..utils.single_flight import SingleFlight
 from ..wallet.base import DIDInfo
 from ..wallet.error import WalletNotFoundError
 from ..wallet.indy import IndySdkWallet
@@ -38,13 +40,18 @@ from .error import (
     LedgerConfigError,
     LedgerError,
     LedgerTransactionError,
+    LedgerTransientError,
 )
-from .util import TAA_ACCEPTED_RECORD_TYPE
+from .object_store import LedgerObjectStore, genesis_ledger_id
+from .util import TAA_ACCEPTED_RECORD_TYPE, fetch_concurrently
 
 LOGGER = logging.getLogger(__name__)
 
 GENESIS_TRANSACTION_FILE = "indy_genesis_transactions.txt"
 
+# seconds after which the ledger state at a given time is taken to be final
+REVOC_REG_DELTA_SETTLE_TIME = 60
+
 
 class IndySdkLedgerPoolProvider(BaseProvider):
     """Indy ledger pool provider which keys off the selected pool name."""
@@ -54,6 +61,7 @@ class IndySdkLedgerPoolProvider(BaseProvider):
 
         pool_name = settings.get("ledger.pool_name", "default")
         keepalive = int(settings.get("ledger.keepalive", 5))
+        did_cache_duration = int(settings.get("ledger.did_cache_ttl", 600))
         read_only = bool(settings.get("ledger.read_only", False))
 
         if read_only:
@@ -62,10 +70,23 @@ class IndySdkLedgerPoolProvider(BaseProvider):
         genesis_transactions = settings.get("ledger.genesis_transactions")
         cache = injector.inject(BaseCache, required=False)
 
+        object_store = None
+        object_store_path = settings.get("ledger.object_store_path")
+        if object_store_path:
+            if genesis_transactions:
+                object_store = LedgerObjectStore(object_store_path)
+            else:
+                LOGGER.warning(
+                    "Ledger object store not used: no genesis transactions to "
+                    "identify the ledger"
+                )
+
         ledger_pool = IndySdkLedgerPool(
             pool_name,
             keepalive=keepalive,
             cache=cache,
+            did_cache_duration=did_cache_duration,
+            object_store=object_store,
             genesis_transactions=genesis_transactions,
             read_only=read_only,
         )
@@ -84,6 +105,9 @@ class IndySdkLedgerPool:
         keepalive: int = 0,
         cache: BaseCache = None,
         cache_duration: int = 600,
+        did_cache_duration: int = 600,
+        revoc_reg_cache_duration: int = 86400,
+        object_store: LedgerObjectStore = None,
         genesis_transactions: str = None,
         read_only: bool = False,
     ):
@@ -95,6 +119,12 @@ class IndySdkLedgerPool:
             keepalive: How many seconds to keep the ledger open
             cache: The cache instance to use
             cache_duration: The TTL for ledger cache entries
+            did_cache_duration: The TTL for cached DID verkeys and endpoints,
+                or 0 to disable caching them
+            revoc_reg_cache_duration: The TTL for cached revocation registry
+                definitions and historical deltas, which do not change
+            object_store: The persistent store for immutable ledger objects,
+                used only when the genesis transactions identify the ledger
             genesis_transactions: The ledger genesis transaction as a string
             read_only: Prevent any ledger write operations
         """
@@ -106,11 +136,19 @@ class IndySdkLedgerPool:
         self.close_task: asyncio.Future = None
         self.cache = cache
         self.cache_duration = cache_duration
+        self.did_cache_duration = did_cache_duration
+        self.revoc_reg_cache_duration = revoc_reg_cache_duration
         self.genesis_transactions = genesis_transactions
+        self.ledger_id = (
+            genesis_ledger_id(genesis_transactions) if genesis_transactions else None
+        )
+        self.object_store = object_store if self.ledger_id else None
         self.handle = None
         self.name = name
         self.taa_cache = None
         self.read_only = read_only
+        self.inflight_reads = SingleFlight()
+        self.did_generations = {}
 
     async def create_pool_config(
         self, genesis_transactions: str, recreate: bool = False
@@ -331,11 +369,45 @@ class IndySdkLedger(BaseLedger):
         else:
             submit_op = indy.ledger.submit_request(self.pool.handle, request_json)
 
-        with IndyErrorHandler(
-            "Exception raised by ledger transaction", LedgerTransactionError
-        ):
-            request_result_json = await submit_op
+        return self._check_reply(await self._await_submission(submit_op))
+
+    async def _submit_read(self, request_json: str) -> str:
+        """
+        Submit a read request to the ledger.
+
+        Read requests are never signed and never carry TAA acceptance, so no
+        wallet or storage access is needed to send them.
 
+        Args:
+            request_json: The json string to submit
+
+        """
+
+        if not self.pool.handle:
+            raise ClosedPoolError(
+                f"Cannot submit request to closed pool '{self.pool.name}'"
+            )
+
+        return self._check_reply(
+            await self._await_submission(
+                indy.ledger.submit_request(self.pool.handle, request_json)
+            )
+        )
+
+    async def _await_submission(self, submit_op: Awaitable[str]) -> str:
+        """Await a submitted request, marking pool timeouts as transient errors."""
+        try:
+            return await submit_op
+        except IndyError as err:
+            error_cls = LedgerTransactionError
+            if err.error_code == ErrorCode.PoolLedgerTimeout:
+                error_cls = LedgerTransientError
+            raise IndyErrorHandler.wrap_error(
+                err, "Exception raised by ledger transaction", error_cls
+            ) from err
+
+    def _check_reply(self, request_result_json: str) -> str:
+        """Check the ledger reply to a request, raising an error if rejected."""
         request_result = json.loads(request_result_json)
 
         operation = request_result.get("op", "")
@@ -469,6 +541,36 @@ class IndySdkLedger(BaseLedger):
                 )
             return fetch_schema_id, schema
 
+    async def _get_stored_objects(
+        self, keys: Sequence[str], cache_duration: int
+    ) -> dict:
+        """
+        Look up immutable ledger objects in the persistent object store.
+
+        Objects found are added to the cache.
+
+        Args:
+            keys: The cache keys of the objects
+            cache_duration: The TTL for cache entries added
+
+        Returns:
+            A dictionary of the keys which were found to their objects
+
+        """
+        if not self.pool.object_store:
+            return {}
+        found = await self.pool.object_store.get_many(self.pool.ledger_id, keys)
+        if found and self.pool.cache:
+            await self.pool.cache.set_many(found, cache_duration)
+        return found
+
+    async def _store_object(self, keys: Sequence[str], value: dict):
+        """Add an immutable ledger object to the persistent object store."""
+        if self.pool.object_store:
+            await self.pool.object_store.set_many(
+                self.pool.ledger_id, {key: value for key in keys}
+            )
+
     async def get_schema(self, schema_id: str) -> dict:
         """
         Get a schema from the cache if available, otherwise fetch from the ledger.
@@ -477,20 +579,71 @@ class IndySdkLedger(BaseLedger):
             schema_id: The schema id (or stringified sequence number) to retrieve
 
         """
+        cache_key = f"schema::{schema_id}"
         if self.pool.cache:
-            result = await self.pool.cache.get(f"schema::{schema_id}")
+            result = await self.pool.cache.get(cache_key)
             if result:
                 return result
+        stored = await self._get_stored_objects([cache_key], self.pool.cache_duration)
+        if stored:
+            return stored[cache_key]
 
         if schema_id.isdigit():
             return await self.fetch_schema_by_seq_no(int(schema_id))
         else:
             return await self.fetch_schema_by_id(schema_id)
 
+    async def get_schemas(self, schema_ids: Sequence[str]) -> dict:
+        """
+        Get multiple schemas, from the cache where available.
+
+        Cached schemas are looked up in a single cache operation, and the
+        remainder are fetched from the ledger concurrently.
+
+        Args:
+            schema_ids: The schema ids (or stringified sequence numbers) to retrieve
+
+        Returns:
+            A dictionary of schema ids to schemas (or None if not found)
+
+        """
+        schema_ids = list(dict.fromkeys(schema_ids))
+        found = {}
+        if self.pool.cache:
+            cached = await self.pool.cache.get_many(
+                [f"schema::{schema_id}" for schema_id in schema_ids]
+            )
+            found = {key.split("::", 1)[1]: value for key, value in cached.items()}
+        stored = await self._get_stored_objects(
+            [
+                f"schema::{schema_id}"
+                for schema_id in schema_ids
+                if schema_id not in found
+            ],
+            self.pool.cache_duration,
+        )
+        found.update((key.split("::", 1)[1], value) for key, value in stored.items())
+
+        async def fetch_schema(schema_id: str) -> dict:
+            if schema_id.isdigit():
+                return await self.fetch_schema_by_seq_no(int(schema_id))
+            return await self.fetch_schema_by_id(schema_id)
+
+        fetched = await fetch_concurrently(
+            fetch_schema,
+            (schema_id for schema_id in schema_ids if not found.get(schema_id)),
+        )
+        return {
+            schema_id: found.get(schema_id) or fetched[schema_id]
+            for schema_id in schema_ids
+        }
+
     async def fetch_schema_by_id(self, schema_id: str) -> dict:
         """
         Get schema from ledger.
 
+        Concurrent requests for the same schema share one ledger request.
+
         Args:
             schema_id: The schema id (or stringified sequence number) to retrieve
 
@@ -498,16 +651,17 @@ class IndySdkLedger(BaseLedger):
             Indy schema dict
 
         """
+        return await self.pool.inflight_reads.run(
+            f"schema::{schema_id}", lambda: self._fetch_schema_by_id(schema_id)
+        )
 
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
+    async def _fetch_schema_by_id(self, schema_id: str) -> dict:
+        """Get schema from ledger, without sharing requests in flight."""
 
         with IndyErrorHandler("Exception building schema request", LedgerError):
-            request_json = await indy.ledger.build_get_schema_request(
-                public_did, schema_id
-            )
+            request_json = await indy.ledger.build_get_schema_request(None, schema_id)
 
-        response_json = await self._submit(request_json, sign_did=public_info)
+        response_json = await self._submit_read(request_json)
         response = json.loads(response_json)
         if not response["result"]["seqNo"]:
             # schema not found
@@ -519,12 +673,13 @@ class IndySdkLedger(BaseLedger):
             )
 
         parsed_response = json.loads(parsed_schema_json)
+        cache_keys = [f"schema::{schema_id}", f"schema::{response['result']['seqNo']}"]
         if parsed_response and self.pool.cache:
             await self.pool.cache.set(
-                [f"schema::{schema_id}", f"schema::{response['result']['seqNo']}"],
-                parsed_response,
-                self.pool.cache_duration,
+                cache_keys, parsed_response, self.pool.cache_duration
             )
+        if parsed_response:
+            await self._store_object(cache_keys, parsed_response)
 
         return parsed_response
 
@@ -543,7 +698,7 @@ class IndySdkLedger(BaseLedger):
         request_json = await indy.ledger.build_get_txn_request(
             None, None, seq_no=seq_no
         )
-        response = json.loads(await self._submit(request_json))
+        response = json.loads(await self._submit_read(request_json))
 
         # transaction data format assumes node protocol >= 1.4 (circa 2018-07)
         data_txn = (response["result"].get("data", {}) or {}).get("txn", {})
@@ -689,33 +844,86 @@ class IndySdkLedger(BaseLedger):
             credential_definition_id: The schema id of the schema to fetch cred def for
 
         """
+        cache_key = f"credential_definition::{credential_definition_id}"
         if self.pool.cache:
-            result = await self.pool.cache.get(
-                f"credential_definition::{credential_definition_id}"
-            )
+            result = await self.pool.cache.get(cache_key)
             if result:
                 return result
+        stored = await self._get_stored_objects([cache_key], self.pool.cache_duration)
+        if stored:
+            return stored[cache_key]
 
         return await self.fetch_credential_definition(credential_definition_id)
 
+    async def get_credential_definitions(
+        self, credential_definition_ids: Sequence[str]
+    ) -> dict:
+        """
+        Get multiple credential definitions, from the cache where available.
+
+        Cached credential definitions are looked up in a single cache operation,
+        and the remainder are fetched from the ledger concurrently.
+
+        Args:
+            credential_definition_ids: The ids of the cred defs to retrieve
+
+        Returns:
+            A dictionary of cred def ids to cred defs (or None if not found)
+
+        """
+        cred_def_ids = list(dict.fromkeys(credential_definition_ids))
+        found = {}
+        if self.pool.cache:
+            cached = await self.pool.cache.get_many(
+                [
+                    f"credential_definition::{cred_def_id}"
+                    for cred_def_id in cred_def_ids
+                ]
+            )
+            found = {key.split("::", 1)[1]: value for key, value in cached.items()}
+        stored = await self._get_stored_objects(
+            [
+                f"credential_definition::{cred_def_id}"
+                for cred_def_id in cred_def_ids
+                if cred_def_id not in found
+            ],
+            self.pool.cache_duration,
+        )
+        found.update((key.split("::", 1)[1], value) for key, value in stored.items())
+
+        fetched = await fetch_concurrently(
+            self.fetch_credential_definition,
+            (cred_def_id for cred_def_id in cred_def_ids if not found.get(cred_def_id)),
+        )
+        return {
+            cred_def_id: found.get(cred_def_id) or fetched[cred_def_id]
+            for cred_def_id in cred_def_ids
+        }
+
     async def fetch_credential_definition(self, credential_definition_id: str) -> dict:
         """
         Get a credential definition from the ledger by id.
 
+        Concurrent requests for the same cred def share one ledger request.
+
         Args:
             credential_definition_id: The cred def id of the cred def to fetch
 
         """
+        return await self.pool.inflight_reads.run(
+            f"credential_definition::{credential_definition_id}",
+            lambda: self._fetch_credential_definition(credential_definition_id),
+        )
 
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
+    async def _fetch_credential_definition(self, credential_definition_id: str) -> dict:
+        """Get a credential definition from the ledger, without sharing requests."""
 
         with IndyErrorHandler("Exception building cred def request", LedgerError):
             request_json = await indy.ledger.build_get_cred_def_request(
-                public_did, credential_definition_id
+                None, credential_definition_id
             )
 
-        response_json = await self._submit(request_json, sign_did=public_info)
+        response_json = await self._submit_read(request_json)
 
         with IndyErrorHandler("Exception parsing cred def response", LedgerError):
             try:
@@ -730,12 +938,13 @@ class IndySdkLedger(BaseLedger):
                 else:
                     raise
 
+        cache_key = f"credential_definition::{credential_definition_id}"
         if parsed_response and self.pool.cache:
             await self.pool.cache.set(
-                f"credential_definition::{credential_definition_id}",
-                parsed_response,
-                self.pool.cache_duration,
+                cache_key, parsed_response, self.pool.cache_duration
             )
+        if parsed_response:
+            await self._store_object([cache_key], parsed_response)
 
         return parsed_response
 
@@ -757,35 +966,108 @@ class IndySdkLedger(BaseLedger):
         seq_no = tokens[3]
         return (await self.get_schema(seq_no))["id"]
 
+    async def _get_cached_for_did(self, cache_key: str):
+        """Look up a cached verkey or endpoints for a ledger DID."""
+        if self.pool.cache and self.pool.did_cache_duration:
+            return await self.pool.cache.get(cache_key)
+
+    def _did_generation(self, nym: str) -> int:
+        """Count the times the cached records for a ledger DID were cleared."""
+        return self.pool.did_generations.get(nym, 0)
+
+    async def _set_cached_for_did(
+        self, cache_key: str, value, nym: str, generation: int
+    ):
+        """Cache a verkey or endpoints found for a ledger DID.
+
+        Nothing is cached if the records were cleared since the read started.
+        """
+        if (
+            value
+            and self.pool.cache
+            and self.pool.did_cache_duration
+            and generation == self._did_generation(nym)
+        ):
+            await self.pool.cache.set(cache_key, value, self.pool.did_cache_duration)
+
+    async def clear_cached_for_did(self, did: str):
+        """Clear the cached verkey and endpoints for a ledger DID.
+
+        Reads already in flight for the DID are neither cached nor shared with
+        later requests.
+
+        Args:
+            did: The DID whose ledger records have changed
+        """
+        nym = self.did_to_nym(did)
+        self.pool.did_generations[nym] = self._did_generation(nym) + 1
+        if self.pool.cache:
+            await self.pool.cache.clear_many(
+                [f"did_verkey::{nym}", f"did_endpoints::{nym}"]
+            )
+
     async def get_key_for_did(self, did: str) -> str:
         """Fetch the verkey for a ledger DID.
 
+        Concurrent requests for the same DID share one ledger request.
+
         Args:
             did: The DID to look up on the ledger or in the cache
         """
         nym = self.did_to_nym(did)
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
+        cache_key = f"did_verkey::{nym}"
+        result = await self._get_cached_for_did(cache_key)
+        if result:
+            return result
+
+        return await self.pool.inflight_reads.run(
+            (cache_key, self._did_generation(nym)),
+            lambda: self._fetch_key_for_did(did),
+        )
+
+    async def _fetch_key_for_did(self, did: str) -> str:
+        """Fetch the verkey for a ledger DID, without sharing requests in flight."""
+        nym = self.did_to_nym(did)
+        generation = self._did_generation(nym)
         with IndyErrorHandler("Exception building nym request", LedgerError):
-            request_json = await indy.ledger.build_get_nym_request(public_did, nym)
-        response_json = await self._submit(request_json, sign_did=public_info)
+            request_json = await indy.ledger.build_get_nym_request(None, nym)
+        response_json = await self._submit_read(request_json)
         data_json = (json.loads(response_json))["result"]["data"]
-        return full_verkey(did, json.loads(data_json)["verkey"]) if data_json else None
+        verkey = (
+            full_verkey(did, json.loads(data_json)["verkey"]) if data_json else None
+        )
+        await self._set_cached_for_did(f"did_verkey::{nym}", verkey, nym, generation)
+        return verkey
 
     async def get_all_endpoints_for_did(self, did: str) -> dict:
         """Fetch all endpoints for a ledger DID.
 
+        Concurrent requests for the same DID share one ledger request.
+
         Args:
             did: The DID to look up on the ledger or in the cache
         """
         nym = self.did_to_nym(did)
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
+        cache_key = f"did_endpoints::{nym}"
+        result = await self._get_cached_for_did(cache_key)
+        if result:
+            return dict(result)
+
+        endpoints = await self.pool.inflight_reads.run(
+            (cache_key, self._did_generation(nym)),
+            lambda: self._fetch_all_endpoints_for_did(did),
+        )
+        return dict(endpoints) if endpoints else endpoints
+
+    async def _fetch_all_endpoints_for_did(self, did: str) -> dict:
+        """Fetch all endpoints for a ledger DID, without sharing requests."""
+        nym = self.did_to_nym(did)
+        generation = self._did_generation(nym)
         with IndyErrorHandler("Exception building attribute request", LedgerError):
             request_json = await indy.ledger.build_get_attrib_request(
-                public_did, nym, "endpoint", None, None
+                None, nym, "endpoint", None, None
             )
-        response_json = await self._submit(request_json, sign_did=public_info)
+        response_json = await self._submit_read(request_json)
         data_json = json.loads(response_json)["result"]["data"]
 
         if data_json:
@@ -793,6 +1075,9 @@ class IndySdkLedger(BaseLedger):
         else:
             endpoints = None
 
+        await self._set_cached_for_did(
+            f"did_endpoints::{nym}", endpoints, nym, generation
+        )
         return endpoints
 
     async def get_endpoint_for_did(
@@ -807,22 +1092,8 @@ class IndySdkLedger(BaseLedger):
 
         if not endpoint_type:
             endpoint_type = EndpointType.ENDPOINT
-        nym = self.did_to_nym(did)
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
-        with IndyErrorHandler("Exception building attribute request", LedgerError):
-            request_json = await indy.ledger.build_get_attrib_request(
-                public_did, nym, "endpoint", None, None
-            )
-        response_json = await self._submit(request_json, sign_did=public_info)
-        data_json = json.loads(response_json)["result"]["data"]
-        if data_json:
-            endpoint = json.loads(data_json).get("endpoint", None)
-            address = endpoint.get(endpoint_type.indy, None) if endpoint else None
-        else:
-            address = None
-
-        return address
+        endpoints = await self.get_all_endpoints_for_did(did)
+        return endpoints.get(endpoint_type.indy, None) if endpoints else None
 
     async def update_endpoint_for_did(
         self, did: str, endpoint: str, endpoint_type: EndpointType = None
@@ -837,7 +1108,7 @@ class IndySdkLedger(BaseLedger):
         if not endpoint_type:
             endpoint_type = EndpointType.ENDPOINT
 
-        all_exist_endpoints = await self.get_all_endpoints_for_did(did)
+        all_exist_endpoints = await self._fetch_all_endpoints_for_did(did)
         exist_endpoint_of_type = (
             all_exist_endpoints.get(endpoint_type.indy, None)
             if all_exist_endpoints
@@ -863,6 +1134,7 @@ class IndySdkLedger(BaseLedger):
                     nym, nym, None, attr_json, None
                 )
             await self._submit(request_json, True, True)
+            await self.clear_cached_for_did(did)
             return True
         return False
 
@@ -895,6 +1167,7 @@ class IndySdkLedger(BaseLedger):
                 public_info.did, did, verkey, alias, role
             )
         await self._submit(request_json)  # let ledger raise on insufficient privilege
+        await self.clear_cached_for_did(did)
 
         try:
             did_info = await self.wallet.get_local_did(did)
@@ -911,13 +1184,10 @@ class IndySdkLedger(BaseLedger):
         Args:
             did: DID to query for role on the ledger.
         """
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
-
         with IndyErrorHandler("Exception building get-nym request", LedgerError):
-            request_json = await indy.ledger.build_get_nym_request(public_did, did)
+            request_json = await indy.ledger.build_get_nym_request(None, did)
 
-        response_json = await self._submit(request_json)
+        response_json = await self._submit_read(request_json)
         response = json.loads(response_json)
         nym_data = json.loads(response["result"]["data"])
         if not nym_data:
@@ -949,7 +1219,7 @@ class IndySdkLedger(BaseLedger):
         with IndyErrorHandler("Exception building nym request", LedgerError):
             request_json = await indy.ledger.build_get_nym_request(public_did, nym)
 
-        response_json = await self._submit(request_json)
+        response_json = await self._submit_read(request_json)
         data = json.loads((json.loads(response_json))["result"]["data"])
         if not data:
             raise BadLedgerRequestError(
@@ -960,7 +1230,7 @@ class IndySdkLedger(BaseLedger):
         with IndyErrorHandler("Exception building get-txn request", LedgerError):
             txn_req_json = await indy.ledger.build_get_txn_request(None, None, seq_no)
 
-        txn_resp_json = await self._submit(txn_req_json)
+        txn_resp_json = await self._submit_read(txn_req_json)
         txn_resp = json.loads(txn_resp_json)
         txn_resp_data = txn_resp["result"]["data"]
         if not txn_resp_data:
@@ -974,6 +1244,7 @@ class IndySdkLedger(BaseLedger):
 
         # update wallet
         await self.wallet.rotate_did_keypair_apply(public_did)
+        await self.clear_cached_for_did(public_did)
 
     async def get_txn_author_agreement(self, reload: bool = False) -> dict:
         """Get the current transaction author agreement, fetching it if necessary."""
@@ -983,19 +1254,16 @@ class IndySdkLedger(BaseLedger):
 
     async def fetch_txn_author_agreement(self) -> dict:
         """Fetch the current AML and TAA from the ledger."""
-        public_info = await self.wallet.get_public_did()
-        public_did = public_info.did if public_info else None
-
         get_aml_req = await indy.ledger.build_get_acceptance_mechanisms_request(
-            public_did, None, None
+            None, None, None
         )
-        response_json = await self._submit(get_aml_req, sign_did=public_info)
+        response_json = await self._submit_read(get_aml_req)
         aml_found = (json.loads(response_json))["result"]["data"]
 
         get_taa_req = await indy.ledger.build_get_txn_author_agreement_request(
-            public_did, None
+            None, None
         )
-        response_json = await self._submit(get_taa_req, sign_did=public_info)
+        response_json = await self._submit_read(get_taa_req)
         taa_found = (json.loads(response_json))["result"]["data"]
         taa_required = bool(taa_found and taa_found["text"])
         if taa_found:
@@ -1072,13 +1340,34 @@ class IndySdkLedger(BaseLedger):
         return acceptance
 
     async def get_revoc_reg_def(self, revoc_reg_id: str) -> dict:
-        """Get revocation registry definition by ID; augment with ledger timestamp."""
-        public_info = await self.wallet.get_public_did()
+        """Get revocation registry definition by ID; augment with ledger timestamp.
+
+        Definitions are immutable, so are cached for the revocation registry
+        cache duration and kept in the ledger object store, if configured.
+        Concurrent requests for the same definition share one ledger request.
+        """
+        cache_key = f"revoc_reg_def::{revoc_reg_id}"
+        if self.pool.cache:
+            result = await self.pool.cache.get(cache_key)
+            if result:
+                return result
+        stored = await self._get_stored_objects(
+            [cache_key], self.pool.revoc_reg_cache_duration
+        )
+        if stored:
+            return stored[cache_key]
+
+        return await self.pool.inflight_reads.run(
+            cache_key, lambda: self._fetch_revoc_reg_def(revoc_reg_id)
+        )
+
+    async def _fetch_revoc_reg_def(self, revoc_reg_id: str) -> dict:
+        """Get revocation registry definition by ID, without sharing requests."""
         try:
             fetch_req = await indy.ledger.build_get_revoc_reg_def_request(
-                public_info and public_info.did, revoc_reg_id
+                None, revoc_reg_id
             )
-            response_json = await self._submit(fetch_req, sign_did=public_info)
+            response_json = await self._submit_read(fetch_req)
             (
                 found_id,
                 found_def_json,
@@ -1094,17 +1383,22 @@ class IndySdkLedger(BaseLedger):
             raise e
 
         assert found_id == revoc_reg_id
+        cache_key = f"revoc_reg_def::{revoc_reg_id}"
+        if self.pool.cache:
+            await self.pool.cache.set(
+                cache_key, found_def, self.pool.revoc_reg_cache_duration
+            )
+        await self._store_object([cache_key], found_def)
         return found_def
 
     async def get_revoc_reg_entry(self, revoc_reg_id: str, timestamp: int):
         """Get revocation registry entry by revocation registry ID and timestamp."""
-        public_info = await self.wallet.get_public_did()
         with IndyErrorHandler("Exception fetching rev reg entry", LedgerError):
             try:
                 fetch_req = await indy.ledger.build_get_revoc_reg_request(
-                    public_info and public_info.did, revoc_reg_id, timestamp
+                    None, revoc_reg_id, timestamp
                 )
-                response_json = await self._submit(fetch_req, sign_did=public_info)
+                response_json = await self._submit_read(fetch_req)
                 (
                     found_id,
                     found_reg_json,
@@ -1125,6 +1419,11 @@ class IndySdkLedger(BaseLedger):
         """
         Look up a revocation registry delta by ID.
 
+        Deltas up to a time far enough in the past no longer change, and are
+        cached. A delta from the creation of the registry (`fro` of 0) is built
+        from the latest such delta cached for the registry, merged with the
+        increment fetched from the ledger since its end.
+
         :param revoc_reg_id revocation registry id
         :param fro earliest EPOCH time of interest
         :param to latest EPOCH time of interest
@@ -1133,15 +1432,106 @@ class IndySdkLedger(BaseLedger):
         """
         if to is None:
             to = int(time())
-        public_info = await self.wallet.get_public_did()
+        if fro == to:
+            fro = 0
+        if not self.pool.cache:
+            return await self._fetch_revoc_reg_delta(revoc_reg_id, fro, to)
+
+        settled = int(time()) - REVOC_REG_DELTA_SETTLE_TIME
+        cache_key = f"revoc_reg_delta::{revoc_reg_id}::{fro}::{to}"
+        if to <= settled:
+            cached = await self.pool.cache.get(cache_key)
+            if cached:
+                return cached["delta"], cached["timestamp"]
+
+        if fro:
+            delta, delta_timestamp = await self._fetch_revoc_reg_delta(
+                revoc_reg_id, fro, to
+            )
+        else:
+            delta, delta_timestamp = await self._get_full_revoc_reg_delta(
+                revoc_reg_id, to, settled
+            )
+
+        if to <= settled:
+            await self.pool.cache.set(
+                cache_key,
+                {"delta": delta, "timestamp": delta_timestamp},
+                self.pool.revoc_reg_cache_duration,
+            )
+        return delta, delta_timestamp
+
+    async def _get_full_revoc_reg_delta(
+        self, revoc_reg_id: str, to: int, settled: int
+    ) -> (dict, int):
+        """
+        Look up a revocation registry delta from registry creation to a time.
+
+        Extend the latest cached delta for the registry where possible, and
+        cache the result as the latest delta if it reaches further.
+
+        :param revoc_reg_id revocation registry id
+        :param to latest EPOCH time of interest
+        :param settled latest EPOCH time up to which the ledger state is final
+
+        :returns delta response, delta timestamp
+        """
+        latest_key = f"revoc_reg_delta::{revoc_reg_id}"
+        latest = await self.pool.cache.get(latest_key)
+        delta = None
+        if latest and latest["to"] == to:
+            return latest["delta"], latest["timestamp"]
+        if latest and latest["to"] < to:
+            increment, delta_timestamp = await self._fetch_revoc_reg_delta(
+                revoc_reg_id, latest["to"], to
+            )
+            delta = await self._merge_revoc_reg_deltas(latest["delta"], increment)
+        if not delta:
+            delta, delta_timestamp = await self._fetch_revoc_reg_delta(
+                revoc_reg_id, 0, to
+            )
+
+        # the state at the time of the last entry is final once that time is past
+        final_to = to if to <= settled else delta_timestamp
+        if final_to <= settled and (not latest or final_to > latest["to"]):
+            await self.pool.cache.set(
+                latest_key,
+                {"delta": delta, "timestamp": delta_timestamp, "to": final_to},
+                self.pool.revoc_reg_cache_duration,
+            )
+        return delta, delta_timestamp
+
+    async def _merge_revoc_reg_deltas(self, delta: dict, increment: dict) -> dict:
+        """
+        Merge a revocation registry delta with the increment following it.
+
+        :param delta revocation registry delta
+        :param increment delta from the end of the first delta to a later time
+
+        :returns merged delta, or None if the increment does not follow the delta
+        """
+        accum = increment["value"]["accum"]
+        prev_accum = increment["value"].get("prevAccum")
+        if not prev_accum:
+            # no entries in the interval: the increment holds the current accum
+            return delta if accum == delta["value"]["accum"] else None
+        if prev_accum != delta["value"]["accum"]:
+            return None
+        with IndyErrorHandler("Exception merging rev reg deltas", LedgerError):
+            merged_json = await indy.anoncreds.issuer_merge_revocation_registry_deltas(
+                json.dumps(delta), json.dumps(increment)
+            )
+        return json.loads(merged_json)
+
+    async def _fetch_revoc_reg_delta(
+        self, revoc_reg_id: str, fro: int, to: int
+    ) -> (dict, int):
+        """Fetch a revocation registry delta from the ledger."""
         with IndyErrorHandler("Exception building rev reg delta request", LedgerError):
             fetch_req = await indy.ledger.build_get_revoc_reg_delta_request(
-                public_info and public_info.did,
-                revoc_reg_id,
-                0 if fro == to else fro,
-                to,
+                None, revoc_reg_id, fro, to
             )
-        response_json = await self._submit(fetch_req, sign_did=public_info)
+        response_json = await self._submit_read(fetch_req)
         with IndyErrorHandler(
             (
                 "Exception parsing rev reg delta response "
@@ -1172,7 +1562,8 @@ class IndySdkLedger(BaseLedger):
             request_json = await indy.ledger.build_revoc_reg_def_request(
                 did_info.did, json.dumps(revoc_reg_def)
             )
-        await self._submit(request_json, True, True, did_info)
+        resp = await self._submit(request_json, True, True, did_info)
+        return self._txn_time(resp)
 
     async def send_revoc_reg_entry(
         self,
@@ -1194,4 +1585,10 @@ class IndySdkLedger(BaseLedger):
             request_json = await indy.ledger.build_revoc_reg_entry_request(
                 did_info.did, revoc_reg_id, revoc_def_type, json.dumps(revoc_reg_entry)
             )
-        await self._submit(request_json, True, True, did_info)
+        resp = await self._submit(request_json, True, True, did_info)
+        return self._txn_time(resp)
+
+    def _txn_time(self, request_result_json: str) -> int:
+        """Extract the ledger timestamp of a written transaction from the reply."""
+        result = json.loads(request_result_json).get("result") or {}
+        return (result.get("txnMetadata") or {}).get("txnTime")
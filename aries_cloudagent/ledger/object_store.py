@@ -0,0 +1,173 @@
+"""Persistent store for immutable ledger objects."""
+
+import asyncio
+import json
+import sqlite3
+
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from typing import Any, Callable, Mapping, Sequence, Text
+
+from .error import LedgerError
+
+DEFAULT_TIMEOUT = 5
+# stay below the default SQLite limit on the number of query parameters
+MAX_QUERY_KEYS = 500
+
+
+def genesis_ledger_id(genesis_transactions: str) -> str:
+    """Derive the identifier of a ledger from its genesis transactions."""
+    return sha256(genesis_transactions.strip().encode("utf-8")).hexdigest()
+
+
+class LedgerObjectStore:
+    """Store ledger objects which never change in a local SQLite database.
+
+    Schemas, credential definitions and revocation registry definitions are
+    immutable once written to the ledger, so they may be kept across restarts.
+    Objects are stored against a ledger identifier, the hash of the genesis
+    transactions of the pool they were read from, so that objects are never
+    returned for a different ledger. Values must be JSON serializable.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize a `LedgerObjectStore` instance.
+
+        Args:
+            path: the path to the SQLite database file
+
+        """
+        self.path = path
+        self._conn: sqlite3.Connection = None
+        # a single worker thread serializes access to the connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="LedgerObjectStore"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection and create the schema if needed."""
+        if not self._conn:
+            conn = sqlite3.connect(
+                self.path, timeout=DEFAULT_TIMEOUT, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ledger_objects ("
+                    "ledger_id TEXT NOT NULL, key TEXT NOT NULL, "
+                    "value TEXT NOT NULL, PRIMARY KEY (ledger_id, key))"
+                )
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, method: Callable, *args):
+        """Run a database operation on the worker thread."""
+        try:
+            return await asyncio.get_event_loop().run_in_executor(
+                self._executor, method, *args
+            )
+        except sqlite3.Error as err:
+            raise LedgerError(f"Error accessing ledger object store: {err}") from err
+
+    def _get_many(self, ledger_id: Text, keys: Sequence[Text]) -> dict:
+        """Fetch stored values from the database."""
+        conn = self._connect()
+        result = {}
+        for start in range(0, len(keys), MAX_QUERY_KEYS):
+            end = start + MAX_QUERY_KEYS
+            chunk = keys[start:end]
+            for key, value in conn.execute(
+                "SELECT key, value FROM ledger_objects WHERE ledger_id = ? "
+                "AND key IN ({})".format(", ".join("?" * len(chunk))),
+                (ledger_id, *chunk),
+            ):
+                result[key] = json.loads(value)
+        return result
+
+    def _set(self, rows: Sequence[tuple]):
+        """Insert or replace values in the database."""
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ledger_objects (ledger_id, key, value) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def _clear(self, ledger_id: Text):
+        """Remove all values for a ledger from the database."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM ledger_objects WHERE ledger_id = ?", (ledger_id,))
+
+    async def get(self, ledger_id: Text, key: Text) -> Any:
+        """
+        Get a stored ledger object.
+
+        Args:
+            ledger_id: the identifier of the ledger the object was read from
+            key: the key of the object
+
+        Returns:
+            The object found or `None`
+
+        """
+        return (await self.get_many(ledger_id, [key])).get(key)
+
+    async def get_many(self, ledger_id: Text, keys: Sequence[Text]) -> dict:
+        """
+        Get multiple stored ledger objects.
+
+        Args:
+            ledger_id: the identifier of the ledger the objects were read from
+            keys: the keys of the objects
+
+        Returns:
+            A dictionary of the keys which were found to their objects
+
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        return await self._run(self._get_many, ledger_id, keys)
+
+    async def set_many(self, ledger_id: Text, values: Mapping[Text, Any]):
+        """
+        Store ledger objects, replacing any stored under the same keys.
+
+        Args:
+            ledger_id: the identifier of the ledger the objects were read from
+            values: a dictionary of keys to the objects to store
+
+        """
+        try:
+            rows = [
+                (ledger_id, key, json.dumps(value)) for key, value in values.items()
+            ]
+        except (TypeError, ValueError) as err:
+            raise LedgerError(f"Ledger object is not JSON serializable: {err}") from err
+        if rows:
+            await self._run(self._set, rows)
+
+    async def clear(self, ledger_id: Text):
+        """
+        Remove all stored objects for a ledger.
+
+        Args:
+            ledger_id: the identifier of the ledger
+
+        """
+        await self._run(self._clear, ledger_id)
+
+    async def close(self):
+        """Close the database connection."""
+
+        def close():
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+        await asyncio.get_event_loop().run_in_executor(self._executor, close)
+        self._executor.shutdown(wait=False)
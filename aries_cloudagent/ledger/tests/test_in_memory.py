@@ -0,0 +1,246 @@
+import json
+
+from os import path
+from tempfile import TemporaryDirectory
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...indy.issuer import IndyIssuer
+from ...messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
+from ...messaging.schemas.util import SCHEMA_SENT_RECORD_TYPE
+from ...storage.in_memory import InMemoryStorage
+from ...wallet.in_memory import InMemoryWallet
+
+from ..base import Role
+from ..endpoint_type import EndpointType
+from ..error import BadLedgerRequestError, LedgerError, LedgerTransactionError
+from ..in_memory import InMemoryLedger, InMemoryLedgerState
+
+SCHEMA_NAME = "degree"
+SCHEMA_VERSION = "1.0"
+ATTR_NAMES = ["name", "date"]
+REV_REG_ID = "rev-reg-id"
+
+
+class TestInMemoryLedger(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.wallet = InMemoryWallet(self.profile)
+        self.storage = InMemoryStorage(self.profile)
+        self.public_did = await self.wallet.create_public_did()
+        self.ledger = InMemoryLedger(InMemoryLedgerState(), self.wallet, self.storage)
+
+        self.issuer = async_mock.MagicMock(IndyIssuer, autospec=True)
+        self.issuer.make_credential_definition_id = (
+            lambda did, schema, sig, tag: f"{did}:3:CL:{schema['seqNo']}:{tag}"
+        )
+        self.issuer.create_schema = async_mock.CoroutineMock(
+            side_effect=lambda did, name, version, attrs: (
+                f"{did}:2:{name}:{version}",
+                json.dumps(
+                    {
+                        "ver": "1.0",
+                        "id": f"{did}:2:{name}:{version}",
+                        "name": name,
+                        "version": version,
+                        "attrNames": attrs,
+                    }
+                ),
+            )
+        )
+        self.issuer.credential_definition_in_wallet = async_mock.CoroutineMock(
+            return_value=False
+        )
+        self.issuer.create_and_store_credential_definition = async_mock.CoroutineMock(
+            side_effect=lambda did, schema, sig, tag, revoc: (
+                f"{did}:3:CL:{schema['seqNo']}:{tag or 'default'}",
+                json.dumps({"id": f"{did}:3:CL:{schema['seqNo']}:{tag or 'default'}"}),
+            )
+        )
+
+    async def test_nym_endpoints(self):
+        assert self.ledger.backend == "in_memory"
+        assert not self.ledger.read_only
+        did = self.public_did.did
+        assert await self.ledger.get_key_for_did(did) is None
+        assert await self.ledger.get_endpoint_for_did(did) is None
+
+        assert await self.ledger.update_endpoint_for_did(did, "http://1.2.3.4")
+        assert not await self.ledger.update_endpoint_for_did(did, "http://1.2.3.4")
+        assert await self.ledger.update_endpoint_for_did(
+            did, "http://profile", EndpointType.PROFILE
+        )
+        assert await self.ledger.get_key_for_did(f"did:sov:{did}") == (
+            self.public_did.verkey
+        )
+        assert await self.ledger.get_endpoint_for_did(did) == "http://1.2.3.4"
+        assert (
+            await self.ledger.get_endpoint_for_did(did, EndpointType.PROFILE)
+            == "http://profile"
+        )
+        assert await self.ledger.get_nym_role(did) == Role.USER
+
+        other = await self.wallet.create_local_did()
+        await self.ledger.register_nym(other.did, other.verkey, "alias", "ENDORSER")
+        assert await self.ledger.get_nym_role(other.did) == Role.ENDORSER
+        assert (await self.wallet.get_local_did(other.did)).metadata["posted"]
+        with self.assertRaises(BadLedgerRequestError):
+            await self.ledger.get_nym_role("unknown")
+
+        await self.ledger.rotate_public_did_keypair()
+        rotated = await self.ledger.get_key_for_did(did)
+        assert rotated != self.public_did.verkey
+        assert rotated == (await self.wallet.get_public_did()).verkey
+
+    async def test_schema_cred_def(self):
+        schema_id, schema = await self.ledger.create_and_send_schema(
+            self.issuer, SCHEMA_NAME, SCHEMA_VERSION, ATTR_NAMES
+        )
+        assert schema["seqNo"]
+        assert await self.ledger.get_schema(schema_id) == schema
+        assert await self.ledger.get_schema(str(schema["seqNo"])) == schema
+        assert await self.ledger.get_schemas([schema_id]) == {schema_id: schema}
+        assert await self.ledger.create_and_send_schema(
+            self.issuer, SCHEMA_NAME, SCHEMA_VERSION, ATTR_NAMES
+        ) == (schema_id, schema)
+        self.issuer.create_schema.assert_called_once()
+        with self.assertRaises(LedgerTransactionError):
+            await self.ledger.create_and_send_schema(
+                self.issuer, SCHEMA_NAME, SCHEMA_VERSION, ["other"]
+            )
+
+        (
+            cred_def_id,
+            cred_def,
+            novel,
+        ) = await self.ledger.create_and_send_credential_definition(
+            self.issuer, schema_id
+        )
+        assert novel
+        assert await self.ledger.get_credential_definition(cred_def_id) == cred_def
+        assert (
+            await self.ledger.credential_definition_id2schema_id(cred_def_id)
+            == schema_id
+        )
+
+        self.issuer.credential_definition_in_wallet.return_value = True
+        assert await self.ledger.create_and_send_credential_definition(
+            self.issuer, schema_id
+        ) == (cred_def_id, cred_def, False)
+
+        assert len(await self.storage.find_all_records(SCHEMA_SENT_RECORD_TYPE)) == 1
+        assert len(await self.storage.find_all_records(CRED_DEF_SENT_RECORD_TYPE)) == 1
+
+        with self.assertRaises(LedgerError):
+            await self.ledger.create_and_send_credential_definition(
+                self.issuer, "unknown"
+            )
+
+    @async_mock.patch("aries_cloudagent.ledger.in_memory.time")
+    async def test_revocation(self, mock_time):
+        mock_time.return_value = 1000
+        schema_id, _ = await self.ledger.create_and_send_schema(
+            self.issuer, SCHEMA_NAME, SCHEMA_VERSION, ATTR_NAMES
+        )
+        cred_def_id, _, _ = await self.ledger.create_and_send_credential_definition(
+            self.issuer, schema_id
+        )
+        with self.assertRaises(LedgerTransactionError):
+            await self.ledger.send_revoc_reg_entry(
+                REV_REG_ID, "CL_ACCUM", {"ver": "1.0", "value": {"accum": "1"}}
+            )
+        await self.ledger.send_revoc_reg_def(
+            {"id": REV_REG_ID, "credDefId": cred_def_id}
+        )
+        rev_reg_def = await self.ledger.get_revoc_reg_def(REV_REG_ID)
+        assert rev_reg_def["txnTime"]
+        with self.assertRaises(LedgerError):
+            await self.ledger.get_revoc_reg_def("unknown")
+
+        for now, value in (
+            (1000, {"accum": "1"}),
+            (2000, {"prevAccum": "1", "accum": "2", "revoked": [1, 2]}),
+            (3000, {"prevAccum": "2", "accum": "3", "issued": [1]}),
+        ):
+            mock_time.return_value = now
+            await self.ledger.send_revoc_reg_entry(
+                REV_REG_ID, "CL_ACCUM", {"ver": "1.0", "value": value}
+            )
+        with self.assertRaises(LedgerTransactionError):
+            await self.ledger.send_revoc_reg_entry(
+                REV_REG_ID,
+                "CL_ACCUM",
+                {"ver": "1.0", "value": {"prevAccum": "2", "accum": "4"}},
+            )
+
+        assert await self.ledger.get_revoc_reg_entry(REV_REG_ID, 2500) == (
+            {"ver": "1.0", "value": {"accum": "2"}},
+            2000,
+        )
+        with self.assertRaises(LedgerError):
+            await self.ledger.get_revoc_reg_entry(REV_REG_ID, 500)
+
+        assert await self.ledger.get_revoc_reg_delta(REV_REG_ID, 0, 2500) == (
+            {"ver": "1.0", "value": {"accum": "2", "issued": [], "revoked": [1, 2]}},
+            2000,
+        )
+        assert await self.ledger.get_revoc_reg_delta(REV_REG_ID, 2000, 3500) == (
+            {
+                "ver": "1.0",
+                "value": {"prevAccum": "2", "accum": "3", "issued": [1], "revoked": []},
+            },
+            3000,
+        )
+        assert await self.ledger.get_revoc_reg_delta(REV_REG_ID, 500, 3000) == (
+            {"ver": "1.0", "value": {"accum": "3", "issued": [1], "revoked": [2]}},
+            3000,
+        )
+        with self.assertRaises(LedgerError):
+            await self.ledger.get_revoc_reg_delta(REV_REG_ID, 0, 500)
+
+    async def test_read_only_latency(self):
+        self.ledger = InMemoryLedger(
+            InMemoryLedgerState(),
+            self.wallet,
+            self.storage,
+            latency=0.01,
+            read_only=True,
+        )
+        assert self.ledger.read_only
+        with async_mock.patch("asyncio.sleep", async_mock.CoroutineMock()) as sleep:
+            await self.ledger.get_schema("schema-id")
+            sleep.assert_awaited_once_with(0.01)
+        with self.assertRaises(LedgerError):
+            await self.ledger.update_endpoint_for_did(self.public_did.did, "http://ep")
+        assert (await self.ledger.get_txn_author_agreement())["taa_required"] is False
+
+    async def test_journal(self):
+        with TemporaryDirectory() as tmp:
+            journal_file = path.join(tmp, "ledger.journal")
+            self.ledger.state = InMemoryLedgerState(journal_file)
+            other = InMemoryLedger(
+                InMemoryLedgerState(journal_file), self.wallet, self.storage
+            )
+
+            schema_id, schema = await self.ledger.create_and_send_schema(
+                self.issuer, SCHEMA_NAME, SCHEMA_VERSION, ATTR_NAMES
+            )
+            assert await other.get_schema(schema_id) == schema
+            assert await other.get_key_for_did(self.public_did.did)
+
+            await other.register_nym("did", "verkey")
+            assert await self.ledger.get_key_for_did("did") == "verkey"
+
+            txn = {"type": "NYM", "seqNo": 4, "txnTime": 1, "data": {"dest": "x"}}
+            line = json.dumps(txn) + "\n"
+            with open(journal_file, "a") as journal:
+                journal.write(line[:10])  # partly written
+            self.ledger.state.sync()
+            assert "x" not in self.ledger.state.nyms
+            with open(journal_file, "a") as journal:
+                journal.write(line[10:])
+            self.ledger.state.sync()
+            assert "x" in self.ledger.state.nyms
+            assert len(self.ledger.state.txns) == len(other.state.txns) + 1
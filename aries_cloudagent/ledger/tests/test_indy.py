@@ -15,6 +15,7 @@ from ...wallet.did_posture import DIDPosture
 from ...wallet.error import WalletNotFoundError
 
 from ..endpoint_type import EndpointType
+from ..object_store import LedgerObjectStore
 from ..indy import (
     BadLedgerRequestError,
     ClosedPoolError,
@@ -28,6 +29,7 @@ from ..indy import (
     LedgerConfigError,
     LedgerError,
     LedgerTransactionError,
+    LedgerTransientError,
     Role,
     TAA_ACCEPTED_RECORD_TYPE,
 )
@@ -83,6 +85,21 @@ class TestIndySdkLedgerPoolProvider(AsyncTestCase):
             injector=mock_injector,
         )
 
+    async def test_provide_object_store(self):
+        provider = IndySdkLedgerPoolProvider()
+        mock_injector = async_mock.MagicMock(
+            inject=async_mock.MagicMock(return_value=None)
+        )
+        settings = {"ledger.object_store_path": "ledger.sqlite"}
+        pool = provider.provide(settings=settings, injector=mock_injector)
+        assert pool.object_store is None
+
+        settings["ledger.genesis_transactions"] = "genesis-txns"
+        pool = provider.provide(settings=settings, injector=mock_injector)
+        assert isinstance(pool.object_store, LedgerObjectStore)
+        assert pool.object_store.path == "ledger.sqlite"
+        assert pool.ledger_id
+
 
 @pytest.mark.indy
 class TestIndySdkLedger(AsyncTestCase):
@@ -419,6 +436,49 @@ class TestIndySdkLedger(AsyncTestCase):
 
             mock_submit.assert_called_once_with(ledger.pool_handle, "{}")
 
+    @async_mock.patch("indy.pool.set_protocol_version")
+    @async_mock.patch("indy.pool.create_pool_ledger_config")
+    @async_mock.patch("indy.pool.open_pool_ledger")
+    @async_mock.patch("indy.pool.close_pool_ledger")
+    @async_mock.patch("indy.ledger.submit_request")
+    @async_mock.patch("indy.ledger.sign_and_submit_request")
+    async def test_submit_read(
+        self,
+        mock_sign_submit,
+        mock_submit,
+        mock_close_pool,
+        mock_open_ledger,
+        mock_create_config,
+        mock_set_proto,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_wallet.get_public_did = async_mock.CoroutineMock(
+            return_value=self.test_did_info
+        )
+        mock_submit.return_value = '{"op": "REPLY"}'
+
+        ledger = IndySdkLedger(IndySdkLedgerPool("name", checked=True), mock_wallet)
+
+        with self.assertRaises(ClosedPoolError) as context:
+            await ledger._submit_read("{}")
+        assert "submit request to closed pool" in str(context.exception)
+
+        async with ledger:
+            with async_mock.patch.object(
+                ledger, "get_latest_txn_author_acceptance", async_mock.CoroutineMock()
+            ) as mock_get_taa:
+                assert await ledger._submit_read("{}") == '{"op": "REPLY"}'
+
+                mock_wallet.get_public_did.assert_not_called()
+                mock_get_taa.assert_not_called()
+                mock_sign_submit.assert_not_called()
+                mock_submit.assert_called_once_with(ledger.pool_handle, "{}")
+
+                mock_submit.return_value = '{"op": "REQNACK", "reason": "a reason"}'
+                with self.assertRaises(LedgerTransactionError) as context:
+                    await ledger._submit_read("{}")
+                assert "Ledger rejected transaction request" in str(context.exception)
+
     @async_mock.patch("indy.pool.set_protocol_version")
     @async_mock.patch("indy.pool.create_pool_ledger_config")
     @async_mock.patch("indy.pool.open_pool_ledger")
@@ -462,6 +522,41 @@ class TestIndySdkLedger(AsyncTestCase):
                 await ledger._submit("{}", False)
             assert "Ledger rejected transaction request" in str(context.exception)
 
+    @async_mock.patch("indy.pool.set_protocol_version")
+    @async_mock.patch("indy.pool.create_pool_ledger_config")
+    @async_mock.patch("indy.pool.open_pool_ledger")
+    @async_mock.patch("indy.pool.close_pool_ledger")
+    @async_mock.patch("indy.ledger.submit_request")
+    async def test_submit_timeout(
+        self,
+        mock_submit,
+        mock_close_pool,
+        mock_open_ledger,
+        mock_create_config,
+        mock_set_proto,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        ledger = IndySdkLedger(IndySdkLedgerPool("name", checked=True), mock_wallet)
+
+        async with ledger:
+            mock_submit.side_effect = IndyError(ErrorCode.PoolLedgerTimeout)
+            with self.assertRaises(LedgerTransientError):
+                await ledger._submit("{}", False)
+
+            mock_submit.side_effect = IndyError(ErrorCode.CommonInvalidStructure)
+            with self.assertRaises(LedgerTransactionError) as context:
+                await ledger._submit("{}", False)
+            assert not isinstance(context.exception, LedgerTransientError)
+
+            mock_submit.side_effect = IndyError(ErrorCode.PoolLedgerTimeout)
+            with self.assertRaises(LedgerTransientError):
+                await ledger._submit_read("{}")
+
+            mock_submit.side_effect = IndyError(ErrorCode.CommonInvalidStructure)
+            with self.assertRaises(LedgerTransactionError) as context:
+                await ledger._submit_read("{}")
+            assert not isinstance(context.exception, LedgerTransientError)
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
@@ -823,7 +918,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_schema_request")
     @async_mock.patch("indy.ledger.parse_get_schema_response")
     async def test_get_schema(
@@ -850,11 +945,9 @@ class TestIndySdkLedger(AsyncTestCase):
         async with ledger:
             response = await ledger.get_schema("schema_id")
 
-            mock_wallet.get_public_did.assert_called_once_with()
-            mock_build_get_schema_req.assert_called_once_with(mock_did.did, "schema_id")
-            mock_submit.assert_called_once_with(
-                mock_build_get_schema_req.return_value, sign_did=mock_did
-            )
+            mock_wallet.get_public_did.assert_not_called()
+            mock_build_get_schema_req.assert_called_once_with(None, "schema_id")
+            mock_submit.assert_called_once_with(mock_build_get_schema_req.return_value)
             mock_parse_get_schema_resp.assert_called_once_with(mock_submit.return_value)
 
             assert response == json.loads(mock_parse_get_schema_resp.return_value[1])
@@ -864,7 +957,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_schema_request")
     async def test_get_schema_not_found(
         self,
@@ -887,17 +980,15 @@ class TestIndySdkLedger(AsyncTestCase):
         async with ledger:
             response = await ledger.get_schema("schema_id")
 
-            mock_wallet.get_public_did.assert_called_once_with()
-            mock_build_get_schema_req.assert_called_once_with(mock_did.did, "schema_id")
-            mock_submit.assert_called_once_with(
-                mock_build_get_schema_req.return_value, sign_did=mock_did
-            )
+            mock_wallet.get_public_did.assert_not_called()
+            mock_build_get_schema_req.assert_called_once_with(None, "schema_id")
+            mock_submit.assert_called_once_with(mock_build_get_schema_req.return_value)
 
             assert response is None
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_txn_request")
     @async_mock.patch("indy.ledger.build_get_schema_request")
     @async_mock.patch("indy.ledger.parse_get_schema_response")
@@ -944,17 +1035,15 @@ class TestIndySdkLedger(AsyncTestCase):
         async with ledger:
             response = await ledger.get_schema("999")
 
-            mock_wallet.get_public_did.assert_called_once_with()
+            mock_wallet.get_public_did.assert_not_called()
             mock_build_get_txn_req.assert_called_once_with(None, None, seq_no=999)
             mock_build_get_schema_req.assert_called_once_with(
-                mock_did.did, f"{self.test_did}:2:preferences:1.0"
+                None, f"{self.test_did}:2:preferences:1.0"
             )
             mock_submit.assert_has_calls(
                 [
                     async_mock.call(mock_build_get_txn_req.return_value),
-                    async_mock.call(
-                        mock_build_get_schema_req.return_value, sign_did=mock_did
-                    ),
+                    async_mock.call(mock_build_get_schema_req.return_value),
                 ]
             )
             mock_parse_get_schema_resp.assert_called_once_with(submissions[1])
@@ -963,7 +1052,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_txn_request")
     @async_mock.patch("indy.ledger.build_get_schema_request")
     @async_mock.patch("indy.ledger.parse_get_schema_response")
@@ -1007,6 +1096,37 @@ class TestIndySdkLedger(AsyncTestCase):
             with self.assertRaises(LedgerTransactionError):
                 await ledger.get_schema("999")
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch(
+        "aries_cloudagent.ledger.indy.IndySdkLedger._fetch_credential_definition"
+    )
+    async def test_fetch_credential_definition_coalesced(
+        self, mock_fetch_cred_def, mock_close, mock_open
+    ):
+        async def fetch(cred_def_id):
+            await asyncio.sleep(0.01)
+            return {"id": cred_def_id}
+
+        mock_fetch_cred_def.side_effect = fetch
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True), async_mock.MagicMock()
+        )
+
+        async with ledger:
+            results = await asyncio.gather(
+                ledger.get_credential_definition("cred_def_id"),
+                ledger.get_credential_definition("cred_def_id"),
+                ledger.get_credential_definition("other_id"),
+            )
+        assert results == [
+            {"id": "cred_def_id"},
+            {"id": "cred_def_id"},
+            {"id": "other_id"},
+        ]
+        assert mock_fetch_cred_def.call_count == 2
+        assert ledger.pool.inflight_reads.coalesced == 1
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger.get_schema")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
@@ -1645,7 +1765,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_cred_def_request")
     @async_mock.patch("indy.ledger.parse_get_cred_def_response")
     async def test_get_credential_definition(
@@ -1672,12 +1792,10 @@ class TestIndySdkLedger(AsyncTestCase):
         async with ledger:
             response = await ledger.get_credential_definition("cred_def_id")
 
-            mock_wallet.get_public_did.assert_called_once_with()
-            mock_build_get_cred_def_req.assert_called_once_with(
-                mock_did.did, "cred_def_id"
-            )
+            mock_wallet.get_public_did.assert_not_called()
+            mock_build_get_cred_def_req.assert_called_once_with(None, "cred_def_id")
             mock_submit.assert_called_once_with(
-                mock_build_get_cred_def_req.return_value, sign_did=mock_did
+                mock_build_get_cred_def_req.return_value
             )
             mock_parse_get_cred_def_resp.assert_called_once_with(
                 mock_submit.return_value
@@ -1692,7 +1810,101 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch(
+        "aries_cloudagent.ledger.indy.IndySdkLedger.fetch_credential_definition"
+    )
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger.fetch_schema_by_id")
+    @async_mock.patch(
+        "aries_cloudagent.ledger.indy.IndySdkLedger.fetch_schema_by_seq_no"
+    )
+    async def test_get_schemas_credential_definitions(
+        self,
+        mock_fetch_schema_by_seq_no,
+        mock_fetch_schema_by_id,
+        mock_fetch_cred_def,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        cache = InMemoryCache()
+        await cache.set("schema::schema_id", {"id": "cached"})
+        await cache.set("credential_definition::cred_def_id", {"id": "cached"})
+        mock_fetch_schema_by_id.return_value = {"id": "fetched"}
+        mock_fetch_schema_by_seq_no.return_value = {"id": "seq_no"}
+        mock_fetch_cred_def.return_value = {"id": "fetched"}
+
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True, cache=cache), mock_wallet
+        )
+
+        async with ledger:
+            schemas = await ledger.get_schemas(
+                ["schema_id", "other_id", "schema_id", "123"]
+            )
+            assert schemas == {
+                "schema_id": {"id": "cached"},
+                "other_id": {"id": "fetched"},
+                "123": {"id": "seq_no"},
+            }
+            mock_fetch_schema_by_id.assert_called_once_with("other_id")
+            mock_fetch_schema_by_seq_no.assert_called_once_with(123)
+
+            cred_defs = await ledger.get_credential_definitions(
+                ["cred_def_id", "other_id"]
+            )
+            assert cred_defs == {
+                "cred_def_id": {"id": "cached"},
+                "other_id": {"id": "fetched"},
+            }
+            mock_fetch_cred_def.assert_called_once_with("other_id")
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    @async_mock.patch("indy.ledger.build_get_cred_def_request")
+    @async_mock.patch("indy.ledger.parse_get_cred_def_response")
+    async def test_get_credential_definition_object_store(
+        self,
+        mock_parse_get_cred_def_resp,
+        mock_build_get_cred_def_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_parse_get_cred_def_resp.return_value = (
+            None,
+            json.dumps({"id": "cred_def_id"}),
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            object_store = LedgerObjectStore(path.join(tmp, "ledger.sqlite"))
+            for genesis in ("genesis-a", "genesis-a", "genesis-b"):
+                cache = InMemoryCache()
+                ledger = IndySdkLedger(
+                    IndySdkLedgerPool(
+                        "name",
+                        checked=True,
+                        cache=cache,
+                        object_store=object_store,
+                        genesis_transactions=genesis,
+                    ),
+                    mock_wallet,
+                )
+                async with ledger:
+                    result = await ledger.get_credential_definition("cred_def_id")
+                    assert result == {"id": "cred_def_id"}
+                    await cache.flush()
+                    result = await ledger.get_credential_definitions(["cred_def_id"])
+                    assert result == {"cred_def_id": {"id": "cred_def_id"}}
+            await object_store.close()
+
+        assert mock_submit.call_count == 2
+        assert mock_parse_get_cred_def_resp.call_count == 2
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_cred_def_request")
     @async_mock.patch("indy.ledger.parse_get_cred_def_response")
     async def test_get_credential_definition_ledger_not_found(
@@ -1716,12 +1928,10 @@ class TestIndySdkLedger(AsyncTestCase):
         async with ledger:
             response = await ledger.get_credential_definition("cred_def_id")
 
-            mock_wallet.get_public_did.assert_called_once_with()
-            mock_build_get_cred_def_req.assert_called_once_with(
-                mock_did.did, "cred_def_id"
-            )
+            mock_wallet.get_public_did.assert_not_called()
+            mock_build_get_cred_def_req.assert_called_once_with(None, "cred_def_id")
             mock_submit.assert_called_once_with(
-                mock_build_get_cred_def_req.return_value, sign_did=mock_did
+                mock_build_get_cred_def_req.return_value
             )
             mock_parse_get_cred_def_resp.assert_called_once_with(
                 mock_submit.return_value
@@ -1731,7 +1941,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_cred_def_request")
     @async_mock.patch("indy.ledger.parse_get_cred_def_response")
     async def test_fetch_credential_definition_ledger_x(
@@ -1761,7 +1971,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_nym_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_key_for_did(
         self, mock_submit, mock_build_get_nym_req, mock_close, mock_open
     ):
@@ -1781,16 +1991,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_nym_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did)
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_nym_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_nym_req.return_value)
             assert response == self.test_verkey
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_endpoint_for_did(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -1811,16 +2018,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_attrib_req.return_value)
             assert response == endpoint
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_endpoint_of_type_profile_for_did(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -1848,16 +2052,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_attrib_req.return_value)
             assert response == endpoint
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_all_endpoints_for_did(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -1880,16 +2081,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_attrib_req.return_value)
             assert response == json.loads(data_json).get("endpoint")
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_all_endpoints_for_did_none(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -1909,16 +2107,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_attrib_req.return_value)
             assert response is None
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_endpoint_for_did_address_none(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -1938,16 +2133,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_attrib_req.return_value)
             assert response is None
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_endpoint_for_did_no_endpoint(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -1965,10 +2157,7 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            assert mock_submit.called_once_with(mock_build_get_attrib_req.return_value)
             assert response is None
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
@@ -1976,8 +2165,10 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("indy.ledger.build_get_attrib_request")
     @async_mock.patch("indy.ledger.build_attrib_request")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_update_endpoint_for_did(
         self,
+        mock_submit_read,
         mock_submit,
         mock_build_attrib_req,
         mock_build_get_attrib_req,
@@ -1987,16 +2178,9 @@ class TestIndySdkLedger(AsyncTestCase):
         mock_wallet = async_mock.MagicMock()
 
         endpoint = ["http://old.aries.ca", "http://new.aries.ca"]
-        mock_submit.side_effect = [
-            json.dumps(
-                {
-                    "result": {
-                        "data": json.dumps({"endpoint": {"endpoint": endpoint[i]}})
-                    }
-                }
-            )
-            for i in range(len(endpoint))
-        ]
+        mock_submit_read.return_value = json.dumps(
+            {"result": {"data": json.dumps({"endpoint": {"endpoint": endpoint[0]}})}}
+        )
         ledger = IndySdkLedger(IndySdkLedgerPool("name", checked=True), mock_wallet)
 
         async with ledger:
@@ -2005,20 +2189,175 @@ class TestIndySdkLedger(AsyncTestCase):
             )
             response = await ledger.update_endpoint_for_did(self.test_did, endpoint[1])
 
-            assert mock_build_get_attrib_req.called_once_with(
-                self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
+            mock_build_get_attrib_req.assert_called_once_with(
+                None, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            mock_submit.assert_has_calls(
-                [
-                    async_mock.call(
-                        mock_build_get_attrib_req.return_value,
-                        sign_did=mock_wallet.get_public_did.return_value,
-                    ),
-                    async_mock.call(mock_build_attrib_req.return_value, True, True),
-                ]
+            mock_submit_read.assert_called_once_with(
+                mock_build_get_attrib_req.return_value
+            )
+            mock_submit.assert_called_once_with(
+                mock_build_attrib_req.return_value, True, True
             )
             assert response
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("indy.ledger.build_get_nym_request")
+    @async_mock.patch("indy.ledger.build_nym_request")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    async def test_get_key_for_did_cached(
+        self,
+        mock_submit_read,
+        mock_submit,
+        mock_build_nym_req,
+        mock_build_get_nym_req,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_wallet.get_public_did = async_mock.CoroutineMock(
+            return_value=self.test_did_info
+        )
+        mock_wallet.get_local_did = async_mock.CoroutineMock(
+            side_effect=WalletNotFoundError()
+        )
+        mock_submit_read.return_value = json.dumps(
+            {"result": {"data": json.dumps({"verkey": self.test_verkey})}}
+        )
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True, cache=InMemoryCache()), mock_wallet
+        )
+
+        async with ledger:
+            for did in (self.test_did, ledger.nym_to_did(self.test_did)):
+                assert await ledger.get_key_for_did(did) == self.test_verkey
+            mock_submit_read.assert_called_once_with(
+                mock_build_get_nym_req.return_value
+            )
+
+            await ledger.register_nym(self.test_did, self.test_verkey)
+            assert await ledger.get_key_for_did(self.test_did) == self.test_verkey
+            assert mock_submit_read.call_count == 2
+
+        ledger.pool.did_cache_duration = 0
+        async with ledger:
+            await ledger.get_key_for_did(self.test_did)
+            await ledger.get_key_for_did(self.test_did)
+            assert mock_submit_read.call_count == 4
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("indy.ledger.build_get_nym_request")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    async def test_get_key_for_did_cleared_in_flight(
+        self, mock_submit_read, mock_build_get_nym_req, mock_close, mock_open
+    ):
+        reads = []
+
+        async def submit_read(request_json):
+            reads.append(asyncio.get_event_loop().create_future())
+            verkey = await reads[-1]
+            return json.dumps({"result": {"data": json.dumps({"verkey": verkey})}})
+
+        async def read_started(count):
+            for _ in range(100):
+                if len(reads) >= count:
+                    return
+                await asyncio.sleep(0)
+            assert len(reads) >= count
+
+        mock_submit_read.side_effect = submit_read
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True, cache=InMemoryCache()),
+            async_mock.MagicMock(),
+        )
+        fresh_verkey = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+
+        async with ledger:
+            stale = asyncio.ensure_future(ledger.get_key_for_did(self.test_did))
+            await read_started(1)
+            await ledger.clear_cached_for_did(self.test_did)
+
+            # a read started after the change does not join the stale one
+            fresh = asyncio.ensure_future(ledger.get_key_for_did(self.test_did))
+            await read_started(2)
+            reads[1].set_result(fresh_verkey)
+            assert await fresh == fresh_verkey
+
+            # and the stale read does not overwrite the cached result
+            reads[0].set_result(self.test_verkey)
+            assert await stale == self.test_verkey
+            assert await ledger.get_key_for_did(self.test_did) == fresh_verkey
+            assert mock_submit_read.call_count == 2
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("indy.ledger.build_get_attrib_request")
+    @async_mock.patch("indy.ledger.build_attrib_request")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    async def test_update_endpoint_for_did_stale_cache(
+        self,
+        mock_submit_read,
+        mock_submit,
+        mock_build_attrib_req,
+        mock_build_get_attrib_req,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+
+        endpoint = ["http://old.aries.ca", "http://new.aries.ca"]
+        mock_submit_read.return_value = json.dumps(
+            {"result": {"data": json.dumps({"endpoint": {"endpoint": endpoint[0]}})}}
+        )
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True, cache=InMemoryCache()), mock_wallet
+        )
+
+        async with ledger:
+            assert await ledger.get_endpoint_for_did(self.test_did) == endpoint[0]
+            assert await ledger.get_all_endpoints_for_did(self.test_did) == {
+                "endpoint": endpoint[0]
+            }
+            mock_submit_read.assert_called_once()
+
+            # another agent has since changed the endpoints: the cache is stale
+            mock_submit_read.return_value = json.dumps(
+                {
+                    "result": {
+                        "data": json.dumps(
+                            {
+                                "endpoint": {
+                                    "endpoint": endpoint[1],
+                                    "profile": "http://company.com/profile",
+                                }
+                            }
+                        )
+                    }
+                }
+            )
+            assert not await ledger.update_endpoint_for_did(self.test_did, endpoint[1])
+            assert mock_submit_read.call_count == 2
+            mock_submit.assert_not_called()
+
+            assert await ledger.update_endpoint_for_did(self.test_did, endpoint[0])
+            mock_build_attrib_req.assert_called_once_with(
+                ledger.did_to_nym(self.test_did),
+                ledger.did_to_nym(self.test_did),
+                None,
+                json.dumps(
+                    {
+                        "endpoint": {
+                            "endpoint": endpoint[0],
+                            "profile": "http://company.com/profile",
+                        }
+                    }
+                ),
+                None,
+            )
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
@@ -2039,7 +2378,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
         async with ledger:
             with async_mock.patch.object(
-                ledger, "get_all_endpoints_for_did", async_mock.CoroutineMock()
+                ledger, "_fetch_all_endpoints_for_did", async_mock.CoroutineMock()
             ) as mock_get_all:
                 mock_get_all.return_value = None
                 mock_wallet.get_public_did = async_mock.CoroutineMock(
@@ -2066,8 +2405,10 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("indy.ledger.build_get_attrib_request")
     @async_mock.patch("indy.ledger.build_attrib_request")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_update_endpoint_of_type_profile_for_did(
         self,
+        mock_submit_read,
         mock_submit,
         mock_build_attrib_req,
         mock_build_get_attrib_req,
@@ -2078,18 +2419,13 @@ class TestIndySdkLedger(AsyncTestCase):
 
         endpoint = ["http://company.com/oldProfile", "http://company.com/newProfile"]
         endpoint_type = EndpointType.PROFILE
-        mock_submit.side_effect = [
-            json.dumps(
-                {
-                    "result": {
-                        "data": json.dumps(
-                            {"endpoint": {endpoint_type.indy: endpoint[i]}}
-                        )
-                    }
+        mock_submit_read.return_value = json.dumps(
+            {
+                "result": {
+                    "data": json.dumps({"endpoint": {endpoint_type.indy: endpoint[0]}})
                 }
-            )
-            for i in range(len(endpoint))
-        ]
+            }
+        )
         ledger = IndySdkLedger(IndySdkLedgerPool("name", checked=True), mock_wallet)
 
         async with ledger:
@@ -2100,24 +2436,21 @@ class TestIndySdkLedger(AsyncTestCase):
                 self.test_did, endpoint[1], endpoint_type
             )
 
-            assert mock_build_get_attrib_req.called_once_with(
-                self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
+            mock_build_get_attrib_req.assert_called_once_with(
+                None, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            mock_submit.assert_has_calls(
-                [
-                    async_mock.call(
-                        mock_build_get_attrib_req.return_value,
-                        sign_did=mock_wallet.get_public_did.return_value,
-                    ),
-                    async_mock.call(mock_build_attrib_req.return_value, True, True),
-                ]
+            mock_submit_read.assert_called_once_with(
+                mock_build_get_attrib_req.return_value
+            )
+            mock_submit.assert_called_once_with(
+                mock_build_attrib_req.return_value, True, True
             )
             assert response
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_update_endpoint_for_did_duplicate(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -2138,16 +2471,13 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_attrib_req.called_once_with(
                 self.test_did, ledger.did_to_nym(self.test_did), "endpoint", None, None
             )
-            assert mock_submit.called_once_with(
-                mock_build_get_attrib_req.return_value,
-                sign_did=mock_wallet.get_public_did.return_value,
-            )
+            mock_submit.assert_called_once_with(mock_build_get_attrib_req.return_value)
             assert not response
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_update_endpoint_for_did_read_only(
         self, mock_submit, mock_build_get_attrib_req, mock_close, mock_open
     ):
@@ -2303,7 +2633,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_nym_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_nym_role(
         self, mock_submit, mock_build_get_nym_req, mock_close, mock_open
     ):
@@ -2385,7 +2715,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_nym_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_nym_role_did_not_public_x(
         self, mock_submit, mock_build_get_nym_req, mock_close, mock_open
     ):
@@ -2435,7 +2765,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("indy.ledger.build_get_nym_request")
     @async_mock.patch("indy.ledger.build_get_txn_request")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger.register_nym")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_rotate_public_did_keypair(
         self,
         mock_submit,
@@ -2470,7 +2800,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_nym_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_rotate_public_did_keypair_no_nym(
         self, mock_submit, mock_build_get_nym_request, mock_close, mock_open
     ):
@@ -2493,7 +2823,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("indy.ledger.build_get_nym_request")
     @async_mock.patch("indy.ledger.build_get_txn_request")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger.register_nym")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_rotate_public_did_keypair_corrupt_nym_txn(
         self,
         mock_submit,
@@ -2522,7 +2852,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_revoc_reg_def_request")
     @async_mock.patch("indy.ledger.parse_get_revoc_reg_def_response")
     async def test_get_revoc_reg_def(
@@ -2554,7 +2884,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_revoc_reg_def_request")
     async def test_get_revoc_reg_def_indy_x(
         self, mock_indy_build_get_rrdef_req, mock_submit, mock_close, mock_open
@@ -2580,7 +2910,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_revoc_reg_request")
     @async_mock.patch("indy.ledger.parse_get_revoc_reg_response")
     async def test_get_revoc_reg_entry(
@@ -2611,7 +2941,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_revoc_reg_request")
     @async_mock.patch("indy.ledger.parse_get_revoc_reg_response")
     async def test_get_revoc_reg_entry_x(
@@ -2640,7 +2970,7 @@ class TestIndySdkLedger(AsyncTestCase):
 
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     @async_mock.patch("indy.ledger.build_get_revoc_reg_delta_request")
     @async_mock.patch("indy.ledger.parse_get_revoc_reg_delta_response")
     async def test_get_revoc_reg_delta(
@@ -2670,6 +3000,163 @@ class TestIndySdkLedger(AsyncTestCase):
             (result, _) = await ledger.get_revoc_reg_delta("rr-id")
             assert result == {"hello": "world"}
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    @async_mock.patch("indy.ledger.build_get_revoc_reg_def_request")
+    @async_mock.patch("indy.ledger.parse_get_revoc_reg_def_response")
+    async def test_get_revoc_reg_def_cached(
+        self,
+        mock_indy_parse_get_rrdef_resp,
+        mock_indy_build_get_rrdef_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_indy_parse_get_rrdef_resp.return_value = (
+            "rr-id",
+            json.dumps({"...": "..."}),
+        )
+        mock_submit.return_value = json.dumps({"result": {"txnTime": 1234567890}})
+
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool(
+                "name", checked=True, read_only=True, cache=InMemoryCache()
+            ),
+            mock_wallet,
+        )
+
+        async with ledger:
+            for _ in range(2):
+                result = await ledger.get_revoc_reg_def("rr-id")
+                assert result == {"...": "...", "txnTime": 1234567890}
+            mock_submit.assert_called_once_with(
+                mock_indy_build_get_rrdef_req.return_value
+            )
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    @async_mock.patch("indy.ledger.build_get_revoc_reg_delta_request")
+    @async_mock.patch("indy.ledger.parse_get_revoc_reg_delta_response")
+    async def test_get_revoc_reg_delta_cached(
+        self,
+        mock_indy_parse_get_rrd_resp,
+        mock_indy_build_get_rrd_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        delta = {"ver": "1.0", "value": {"accum": "1", "revoked": [2]}}
+        mock_indy_parse_get_rrd_resp.return_value = (
+            "rr-id",
+            json.dumps(delta),
+            1234567890,
+        )
+
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool(
+                "name", checked=True, read_only=True, cache=InMemoryCache()
+            ),
+            mock_wallet,
+        )
+
+        async with ledger:
+            for _ in range(2):
+                result = await ledger.get_revoc_reg_delta("rr-id", 1000, 1234567899)
+                assert result == (delta, 1234567890)
+            mock_indy_build_get_rrd_req.assert_called_once_with(
+                None, "rr-id", 1000, 1234567899
+            )
+
+            # current state is not cached, but builds on the latest cached delta
+            for _ in range(2):
+                result = await ledger.get_revoc_reg_delta("rr-id")
+                assert result == (delta, 1234567890)
+            assert mock_indy_build_get_rrd_req.call_count == 3
+            assert mock_indy_build_get_rrd_req.call_args_list[1][0][2] == 0
+            mock_indy_build_get_rrd_req.assert_called_with(
+                None, "rr-id", 1234567890, async_mock.ANY
+            )
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
+    @async_mock.patch("indy.ledger.build_get_revoc_reg_delta_request")
+    @async_mock.patch("indy.ledger.parse_get_revoc_reg_delta_response")
+    @async_mock.patch("indy.anoncreds.issuer_merge_revocation_registry_deltas")
+    async def test_get_revoc_reg_delta_merged(
+        self,
+        mock_indy_merge_deltas,
+        mock_indy_parse_get_rrd_resp,
+        mock_indy_build_get_rrd_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        deltas = [
+            {"ver": "1.0", "value": {"accum": "1", "revoked": [2]}},
+            {"ver": "1.0", "value": {"prevAccum": "1", "accum": "2", "revoked": [3]}},
+            {"ver": "1.0", "value": {"accum": "2", "revoked": [2, 3]}},
+            {"ver": "1.0", "value": {"prevAccum": "9", "accum": "3", "revoked": [4]}},
+            {"ver": "1.0", "value": {"accum": "3", "revoked": [2, 3, 4]}},
+        ]
+        mock_indy_parse_get_rrd_resp.side_effect = [
+            ("rr-id", json.dumps(deltas[0]), 1000),
+            ("rr-id", json.dumps(deltas[1]), 1500),
+            ("rr-id", json.dumps(deltas[3]), 2500),
+            ("rr-id", json.dumps(deltas[4]), 2500),
+        ]
+        mock_indy_merge_deltas.return_value = json.dumps(deltas[2])
+
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool(
+                "name", checked=True, read_only=True, cache=InMemoryCache()
+            ),
+            mock_wallet,
+        )
+
+        async with ledger:
+            assert await ledger.get_revoc_reg_delta("rr-id", 0, 1200) == (
+                deltas[0],
+                1000,
+            )
+            assert await ledger.get_revoc_reg_delta("rr-id", 0, 2000) == (
+                deltas[2],
+                1500,
+            )
+            mock_indy_build_get_rrd_req.assert_called_with(None, "rr-id", 1200, 2000)
+            mock_indy_merge_deltas.assert_called_once_with(
+                json.dumps(deltas[0]), json.dumps(deltas[1])
+            )
+
+            # increment not following the cached delta: fetch from creation
+            assert await ledger.get_revoc_reg_delta("rr-id", 0, 3000) == (
+                deltas[4],
+                2500,
+            )
+            assert mock_indy_build_get_rrd_req.call_args_list[2][0] == (
+                None,
+                "rr-id",
+                2000,
+                3000,
+            )
+            mock_indy_build_get_rrd_req.assert_called_with(None, "rr-id", 0, 3000)
+
+            # earlier intervals are answered from the cache
+            assert await ledger.get_revoc_reg_delta("rr-id", 1200, 1200) == (
+                deltas[0],
+                1000,
+            )
+            assert await ledger.get_revoc_reg_delta("rr-id", 0, 3000) == (
+                deltas[4],
+                2500,
+            )
+            assert mock_indy_build_get_rrd_req.call_count == 4
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
@@ -2688,7 +3175,12 @@ class TestIndySdkLedger(AsyncTestCase):
             mock_wallet.get_public_did = async_mock.CoroutineMock(
                 return_value=self.test_did_info
             )
-            await ledger.send_revoc_reg_def({"rr": "def"}, issuer_did=None)
+            mock_submit.return_value = json.dumps(
+                {"op": "REPLY", "result": {"txnMetadata": {"txnTime": 1234567890}}}
+            )
+            assert 1234567890 == await ledger.send_revoc_reg_def(
+                {"rr": "def"}, issuer_did=None
+            )
             mock_wallet.get_public_did.assert_called_once()
             assert not mock_wallet.get_local_did.called
             mock_submit.assert_called_once_with(
@@ -2713,7 +3205,12 @@ class TestIndySdkLedger(AsyncTestCase):
             mock_wallet.get_local_did = async_mock.CoroutineMock(
                 return_value=self.test_did_info
             )
-            await ledger.send_revoc_reg_def({"rr": "def"}, issuer_did=self.test_did)
+            mock_submit.return_value = json.dumps(
+                {"op": "REPLY", "result": {"txnMetadata": {"txnTime": 1234567890}}}
+            )
+            assert 1234567890 == await ledger.send_revoc_reg_def(
+                {"rr": "def"}, issuer_did=self.test_did
+            )
             mock_wallet.get_local_did.assert_called_once_with(self.test_did)
             assert not mock_wallet.get_public_did.called
             mock_submit.assert_called_once_with(
@@ -2760,7 +3257,10 @@ class TestIndySdkLedger(AsyncTestCase):
             mock_wallet.get_public_did = async_mock.CoroutineMock(
                 return_value=self.test_did_info
             )
-            await ledger.send_revoc_reg_entry(
+            mock_submit.return_value = json.dumps(
+                {"op": "REPLY", "result": {"txnMetadata": {"txnTime": 1234567890}}}
+            )
+            assert 1234567890 == await ledger.send_revoc_reg_entry(
                 "rr-id", "CL_ACCUM", {"rev-reg": "entry"}, issuer_did=None
             )
             mock_wallet.get_public_did.assert_called_once()
@@ -2787,7 +3287,10 @@ class TestIndySdkLedger(AsyncTestCase):
             mock_wallet.get_local_did = async_mock.CoroutineMock(
                 return_value=self.test_did_info
             )
-            result = await ledger.send_revoc_reg_entry(
+            mock_submit.return_value = json.dumps(
+                {"op": "REPLY", "result": {"txnMetadata": {"txnTime": 1234567890}}}
+            )
+            assert 1234567890 == await ledger.send_revoc_reg_entry(
                 "rr-id", "CL_ACCUM", {"rev-reg": "entry"}, issuer_did=self.test_did
             )
             mock_wallet.get_local_did.assert_called_once_with(self.test_did)
@@ -2843,7 +3346,7 @@ class TestIndySdkLedger(AsyncTestCase):
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_acceptance_mechanisms_request")
     @async_mock.patch("indy.ledger.build_get_txn_author_agreement_request")
-    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit_read")
     async def test_get_txn_author_agreement(
         self,
         mock_submit,
@@ -2873,14 +3376,8 @@ class TestIndySdkLedger(AsyncTestCase):
             assert mock_build_get_taa_req.called_once_with(self.test_did, None)
             mock_submit.assert_has_calls(
                 [
-                    async_mock.call(
-                        mock_build_get_acc_mech_req.return_value,
-                        sign_did=mock_wallet.get_public_did.return_value,
-                    ),
-                    async_mock.call(
-                        mock_build_get_taa_req.return_value,
-                        sign_did=mock_wallet.get_public_did.return_value,
-                    ),
+                    async_mock.call(mock_build_get_acc_mech_req.return_value),
+                    async_mock.call(mock_build_get_taa_req.return_value),
                 ]
             )
             assert response == {
@@ -0,0 +1,56 @@
+import os
+
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from ..error import LedgerError
+from ..object_store import LedgerObjectStore, genesis_ledger_id
+
+LEDGER_A = genesis_ledger_id("genesis-a")
+LEDGER_B = genesis_ledger_id("genesis-b")
+
+
+@pytest.fixture()
+async def store():
+    with TemporaryDirectory() as tmp:
+        store = LedgerObjectStore(os.path.join(tmp, "ledger.sqlite"))
+        await store.set_many(LEDGER_A, {"schema::1": {"id": "1"}})
+        yield store
+        await store.close()
+
+
+class TestLedgerObjectStore:
+    def test_genesis_ledger_id(self):
+        assert genesis_ledger_id("genesis-a\n") == LEDGER_A
+        assert LEDGER_A != LEDGER_B
+
+    @pytest.mark.asyncio
+    async def test_get(self, store):
+        assert await store.get(LEDGER_A, "schema::1") == {"id": "1"}
+        assert await store.get(LEDGER_A, "schema::2") is None
+        assert await store.get(LEDGER_B, "schema::1") is None
+
+    @pytest.mark.asyncio
+    async def test_many(self, store):
+        await store.set_many(
+            LEDGER_A, {f"credential_definition::{i}": {"id": i} for i in range(600)}
+        )
+        keys = [f"credential_definition::{i}" for i in range(-1, 601)]
+        result = await store.get_many(LEDGER_A, keys)
+        assert result == {f"credential_definition::{i}": {"id": i} for i in range(600)}
+        assert await store.get_many(LEDGER_A, []) == {}
+        assert await store.get_many(LEDGER_B, keys) == {}
+
+    @pytest.mark.asyncio
+    async def test_set_x(self, store):
+        with pytest.raises(LedgerError):
+            await store.set_many(LEDGER_A, {"schema::2": object()})
+
+    @pytest.mark.asyncio
+    async def test_persist(self, store):
+        reopened = LedgerObjectStore(store.path)
+        assert await reopened.get(LEDGER_A, "schema::1") == {"id": "1"}
+        await reopened.clear(LEDGER_A)
+        assert await reopened.get(LEDGER_A, "schema::1") is None
+        await reopened.close()
@@ -0,0 +1,67 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+
+from ..util import fetch_concurrently, merge_revoc_reg_entries
+
+
+class TestLedgerUtil(AsyncTestCase):
+    async def test_fetch_concurrently(self):
+        active = 0
+        max_active = 0
+        fetched = []
+
+        async def fetch(key):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(active, max_active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            fetched.append(key)
+            return key * 2
+
+        result = await fetch_concurrently(fetch, [1, 2, 1, 3, 4, 2], 2)
+        assert result == {1: 2, 2: 4, 3: 6, 4: 8}
+        assert list(result) == [1, 2, 3, 4]
+        assert sorted(fetched) == [1, 2, 3, 4]
+        assert max_active == 2
+
+        assert await fetch_concurrently(fetch, ["a"]) == {"a": "aa"}
+        assert await fetch_concurrently(fetch, []) == {}
+
+    async def test_fetch_concurrently_x(self):
+        async def fetch(key):
+            if key == "bad":
+                raise ValueError("not found")
+            return key
+
+        with self.assertRaises(ValueError):
+            await fetch_concurrently(fetch, ["good", "bad"])
+
+    def test_merge_revoc_reg_entries(self):
+        def entry(value: dict) -> dict:
+            return {"ver": "1.0", "value": value}
+
+        assert merge_revoc_reg_entries(
+            [
+                entry({"prevAccum": "1", "accum": "2", "revoked": [1, 2]}),
+                entry({"prevAccum": "2", "accum": "3", "issued": [2], "revoked": [3]}),
+                entry({"prevAccum": "3", "accum": "4", "revoked": [4]}),
+            ]
+        ) == entry(
+            {"prevAccum": "1", "accum": "4", "issued": [2], "revoked": [1, 3, 4]}
+        )
+        assert merge_revoc_reg_entries(
+            [entry({"accum": "1"}), entry({"prevAccum": "1", "accum": "2"})]
+        ) == entry({"accum": "2"})
+
+        assert (
+            merge_revoc_reg_entries(
+                [
+                    entry({"prevAccum": "1", "accum": "2"}),
+                    entry({"prevAccum": "3", "accum": "4"}),
+                ]
+            )
+            is None
+        )
+        assert merge_revoc_reg_entries([]) is None
@@ -0,0 +1,101 @@
+from os import path
+from tempfile import TemporaryDirectory
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
+from ...messaging.schemas.util import SCHEMA_SENT_RECORD_TYPE
+from ...revocation.models.issuer_rev_reg_record import IssuerRevRegRecord
+from ...storage.base import BaseStorage
+from ...storage.record import StorageRecord
+
+from ..base import BaseLedger
+from ..error import LedgerError
+from ..warm_up import warm_up_ledger
+
+TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
+SCHEMA_ID = f"{TEST_DID}:2:degree:1.0"
+CRED_DEF_ID = f"{TEST_DID}:3:CL:12:default"
+REV_REG_ID = f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:0"
+
+
+class TestWarmUpLedger(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger.__aenter__ = async_mock.CoroutineMock(return_value=self.ledger)
+        self.ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        self.ledger.get_schemas = async_mock.CoroutineMock(
+            return_value={SCHEMA_ID: {"id": SCHEMA_ID}}
+        )
+        self.ledger.get_credential_definitions = async_mock.CoroutineMock(
+            return_value={CRED_DEF_ID: {"id": CRED_DEF_ID}}
+        )
+        self.ledger.get_revoc_reg_def = async_mock.CoroutineMock(
+            return_value={"id": REV_REG_ID}
+        )
+
+        self.tmp = TemporaryDirectory()
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            await storage.add_record(
+                StorageRecord(
+                    SCHEMA_SENT_RECORD_TYPE, SCHEMA_ID, {"schema_id": SCHEMA_ID}
+                )
+            )
+            await storage.add_record(
+                StorageRecord(
+                    CRED_DEF_SENT_RECORD_TYPE,
+                    CRED_DEF_ID,
+                    {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID},
+                )
+            )
+            for revoc_reg_id, state, tails_file in (
+                (REV_REG_ID, IssuerRevRegRecord.STATE_ACTIVE, "present"),
+                (f"{REV_REG_ID}-missing", IssuerRevRegRecord.STATE_ACTIVE, "missing"),
+                (f"{REV_REG_ID}-full", IssuerRevRegRecord.STATE_FULL, "missing"),
+            ):
+                await IssuerRevRegRecord(
+                    issuer_did=TEST_DID,
+                    cred_def_id=CRED_DEF_ID,
+                    revoc_reg_id=revoc_reg_id,
+                    tails_local_path=path.join(self.tmp.name, tails_file),
+                    state=state,
+                ).save(session)
+        with open(path.join(self.tmp.name, "present"), "w") as tails:
+            tails.write("tails")
+
+    async def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_warm_up(self):
+        self.profile.context.injector.bind_instance(BaseLedger, self.ledger)
+        result = await warm_up_ledger(self.profile)
+        assert result == {
+            "missing_tails": [f"{REV_REG_ID}-missing"],
+            "schemas": 1,
+            "credential_definitions": 1,
+            "revocation_registry_definitions": 2,
+        }
+        self.ledger.get_schemas.assert_awaited_once_with([SCHEMA_ID])
+        self.ledger.get_credential_definitions.assert_awaited_once_with([CRED_DEF_ID])
+        assert sorted(
+            call.args[0] for call in self.ledger.get_revoc_reg_def.call_args_list
+        ) == [REV_REG_ID, f"{REV_REG_ID}-missing"]
+
+    async def test_warm_up_x(self):
+        self.profile.context.injector.bind_instance(BaseLedger, self.ledger)
+        self.ledger.get_schemas.side_effect = LedgerError("unavailable")
+        self.ledger.get_revoc_reg_def.side_effect = [
+            LedgerError("unavailable"),
+            {"id": REV_REG_ID},
+        ]
+        result = await warm_up_ledger(self.profile)
+        assert result["schemas"] == 0
+        assert result["credential_definitions"] == 1
+        assert result["revocation_registry_definitions"] == 1
+
+    async def test_warm_up_no_ledger(self):
+        assert await warm_up_ledger(self.profile) == {}
@@ -0,0 +1,169 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ..base import BaseLedger
+from ..endpoint_type import EndpointType
+from ..error import LedgerError, LedgerTransactionError, LedgerTransientError
+from ..write_queue import LedgerWriteQueue
+
+ISSUER_DID = "55GkHamhTU1ZbTbV2ab9DE"
+OTHER_DID = "WgWxqztrNooG92RXvxSTWv"
+REV_REG_ID = f"{ISSUER_DID}:4:{ISSUER_DID}:3:CL:12:tag:CL_ACCUM:0"
+
+
+def entry(value: dict) -> dict:
+    return {"ver": "1.0", "value": value}
+
+
+class TestLedgerWriteQueue(AsyncTestCase):
+    async def setUp(self):
+        self.ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger.__aenter__ = async_mock.CoroutineMock(return_value=self.ledger)
+        self.ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        self.ledger.wallet = async_mock.MagicMock(
+            get_public_did=async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(did=ISSUER_DID)
+            )
+        )
+        self.queue = LedgerWriteQueue(self.ledger, retry_delay=0)
+
+    async def test_serialize_per_did(self):
+        running = set()
+        overlaps = []
+
+        async def update_endpoint(did, endpoint, endpoint_type):
+            overlaps.append(did in running)
+            running.add(did)
+            await asyncio.sleep(0.01)
+            running.remove(did)
+            return True
+
+        self.ledger.update_endpoint_for_did.side_effect = update_endpoint
+        futures = [
+            await self.queue.update_endpoint_for_did(did, f"http://{i}")
+            for i in range(3)
+            for did in (ISSUER_DID, OTHER_DID)
+        ]
+        assert self.queue.depth == 6
+        await asyncio.sleep(0)
+        assert self.queue.depth == 4
+        assert self.queue.in_flight == 2
+        assert await asyncio.gather(*futures) == [True] * 6
+        assert not any(overlaps)
+        assert [
+            call.args[1] for call in self.ledger.update_endpoint_for_did.call_args_list
+        ] == ["http://0", "http://0", "http://1", "http://1", "http://2", "http://2"]
+        self.ledger.update_endpoint_for_did.assert_called_with(
+            OTHER_DID, "http://2", EndpointType.ENDPOINT
+        )
+
+        metrics = self.queue.metrics()
+        assert metrics["depth"] == metrics["in_flight"] == 0
+        assert metrics["queued"] == 6
+        assert metrics["latency"]["count"] == {"endpoint": 6}
+
+    async def test_merge_revoc_reg_entries(self):
+        self.ledger.send_revoc_reg_entry.return_value = 1234567890
+        first = await self.queue.send_revoc_reg_entry(
+            REV_REG_ID, "CL_ACCUM", entry({"accum": "1"}), ISSUER_DID
+        )
+        await asyncio.sleep(0)  # in flight, so not merged
+        futures = [
+            await self.queue.send_revoc_reg_entry(
+                REV_REG_ID,
+                "CL_ACCUM",
+                entry({"prevAccum": str(n), "accum": str(n + 1), "revoked": [n]}),
+                ISSUER_DID,
+            )
+            for n in range(1, 4)
+        ]
+        assert futures[0] is futures[1] is futures[2] is not first
+        assert await asyncio.gather(first, *futures) == [1234567890] * 4
+
+        assert self.ledger.send_revoc_reg_entry.call_args_list == [
+            async_mock.call(REV_REG_ID, "CL_ACCUM", entry({"accum": "1"}), ISSUER_DID),
+            async_mock.call(
+                REV_REG_ID,
+                "CL_ACCUM",
+                entry({"prevAccum": "1", "accum": "4", "revoked": [1, 2, 3]}),
+                ISSUER_DID,
+            ),
+        ]
+        assert self.queue.metrics()["merged"] == 2
+
+    async def test_retry(self):
+        self.ledger.send_revoc_reg_def.side_effect = [
+            LedgerTransientError("timeout"),
+            LedgerTransientError("timeout"),
+            1234567890,
+        ]
+        future = await self.queue.send_revoc_reg_def({"id": REV_REG_ID})
+        assert await future == 1234567890
+        assert self.ledger.send_revoc_reg_def.call_count == 3
+        self.ledger.send_revoc_reg_def.assert_called_with({"id": REV_REG_ID}, None)
+        assert self.queue.metrics()["retried"] == 2
+
+    async def test_retry_x(self):
+        self.queue.retries = 1
+        self.ledger.create_and_send_schema.side_effect = LedgerTransientError("timeout")
+        self.ledger.create_and_send_credential_definition.side_effect = (
+            LedgerTransactionError("rejected")
+        )
+        schema = await self.queue.create_and_send_schema(None, "name", "1.0", ["a"])
+        cred_def = await self.queue.create_and_send_credential_definition(
+            None, "schema-id"
+        )
+        with self.assertRaises(LedgerTransientError):
+            await schema
+        with self.assertRaises(LedgerTransactionError):
+            await cred_def
+        assert self.ledger.create_and_send_schema.call_count == 2
+        assert self.ledger.create_and_send_credential_definition.call_count == 1
+        assert self.queue.metrics()["failed"] == 2
+
+    async def test_retry_revoc_reg_entry(self):
+        # the ledger wrote the entry before the request timed out
+        self.ledger.send_revoc_reg_entry.side_effect = LedgerTransientError("timeout")
+        self.ledger.get_revoc_reg_entry.return_value = (entry({"accum": "2"}), 1234)
+        future = await self.queue.send_revoc_reg_entry(
+            REV_REG_ID, "CL_ACCUM", entry({"prevAccum": "1", "accum": "2"})
+        )
+        assert await future == 1234
+        assert self.ledger.send_revoc_reg_entry.call_count == 1
+
+        # the ledger is still at the previous accumulator
+        self.ledger.send_revoc_reg_entry.side_effect = [
+            LedgerTransientError("timeout"),
+            5678,
+        ]
+        self.ledger.get_revoc_reg_entry.return_value = (entry({"accum": "2"}), 1234)
+        future = await self.queue.send_revoc_reg_entry(
+            REV_REG_ID, "CL_ACCUM", entry({"prevAccum": "2", "accum": "3"})
+        )
+        assert await future == 5678
+        assert self.ledger.send_revoc_reg_entry.call_count == 3
+
+        # the initial entry is not on the ledger yet
+        self.ledger.send_revoc_reg_entry.side_effect = [
+            LedgerTransientError("timeout"),
+            9012,
+        ]
+        self.ledger.get_revoc_reg_entry.side_effect = LedgerError("not found")
+        future = await self.queue.send_revoc_reg_entry(
+            REV_REG_ID, "CL_ACCUM", entry({"accum": "1"})
+        )
+        assert await future == 9012
+
+    async def test_retry_revoc_reg_entry_x(self):
+        self.ledger.send_revoc_reg_entry.side_effect = LedgerTransientError("timeout")
+        self.ledger.get_revoc_reg_entry.return_value = (entry({"accum": "9"}), 1234)
+        future = await self.queue.send_revoc_reg_entry(
+            REV_REG_ID, "CL_ACCUM", entry({"prevAccum": "1", "accum": "2"})
+        )
+        with self.assertRaises(LedgerTransactionError) as x_entry:
+            await future
+        assert "accumulator changed" in x_entry.exception.message
+        assert self.ledger.send_revoc_reg_entry.call_count == 1
+        assert self.queue.metrics()["failed"] == 1
@@ -1,3 +1,80 @@
 """Ledger utilities."""
 
+import asyncio
+
+from typing import Any, Awaitable, Callable, Iterable, Optional, Sequence
+
 TAA_ACCEPTED_RECORD_TYPE = "taa_accepted"
+
+DEFAULT_FETCH_CONCURRENCY = 10
+
+
+async def fetch_concurrently(
+    fetch: Callable[[Any], Awaitable],
+    keys: Iterable,
+    max_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+) -> dict:
+    """
+    Fetch ledger objects concurrently, requesting each distinct key once.
+
+    Args:
+        fetch: the coroutine function used to fetch an object by key
+        keys: the keys of the objects to fetch, possibly including duplicates
+        max_concurrency: the maximum number of requests in flight at once
+
+    Returns:
+        A dictionary of each distinct key to its fetched object, in the order
+        the keys were first given
+
+    """
+    keys = list(dict.fromkeys(keys))
+    if len(keys) == 1:
+        return {keys[0]: await fetch(keys[0])}
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(key):
+        async with limit:
+            return await fetch(key)
+
+    results = await asyncio.gather(*(fetch_one(key) for key in keys))
+    return dict(zip(keys, results))
+
+
+def merge_revoc_reg_entries(entries: Sequence[dict]) -> Optional[dict]:
+    """
+    Combine consecutive revocation registry entries (or deltas) into one.
+
+    Each entry must continue from the accumulator of the one before it. The
+    result takes the state of each credential from the last entry to change it.
+
+    Args:
+        entries: the revocation registry entries, oldest first
+
+    Returns:
+        The combined entry, or `None` if the entries are not consecutive
+
+    """
+    if not entries:
+        return None
+    value = entries[0].get("value") or {}
+    accum = value.get("accum")
+    issued = set(value.get("issued") or ())
+    revoked = set(value.get("revoked") or ())
+    for entry in entries[1:]:
+        next_value = entry.get("value") or {}
+        if not accum or next_value.get("prevAccum") != accum:
+            return None
+        next_issued = set(next_value.get("issued") or ())
+        next_revoked = set(next_value.get("revoked") or ())
+        issued = (issued - next_revoked) | next_issued
+        revoked = (revoked - next_issued) | next_revoked
+        accum = next_value.get("accum")
+
+    merged = {"accum": accum}
+    if value.get("prevAccum"):
+        merged["prevAccum"] = value["prevAccum"]
+    if issued:
+        merged["issued"] = sorted(issued)
+    if revoked:
+        merged["revoked"] = sorted(revoked)
+    return {**entries[-1], "value": merged}
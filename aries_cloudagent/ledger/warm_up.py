@@ -0,0 +1,92 @@
+"""Prefetch the ledger objects an agent uses to issue credentials."""
+
+import asyncio
+import logging
+
+from os import path
+
+from ..core.profile import Profile
+from ..messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
+from ..messaging.schemas.util import SCHEMA_SENT_RECORD_TYPE
+from ..revocation.models.issuer_rev_reg_record import IssuerRevRegRecord
+from ..storage.base import BaseStorage
+
+from .base import BaseLedger
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def warm_up_ledger(profile: Profile) -> dict:
+    """
+    Load the schemas, cred defs and rev reg defs created by a wallet into the cache.
+
+    The first credential issued for a credential definition after a restart
+    would otherwise wait on the ledger for each of these. Local tails files of
+    the active revocation registries are checked at the same time, so that any
+    missing file is reported before it is needed.
+
+    Args:
+        profile: the profile of the issuing wallet
+
+    Returns:
+        A dictionary of the number of each type of object loaded, and the ids
+        of revocation registries whose tails files are missing
+
+    """
+    ledger = profile.inject(BaseLedger, required=False)
+    if not ledger:
+        return {}
+
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        schema_ids = {
+            record.tags.get("schema_id")
+            for record in await storage.find_all_records(SCHEMA_SENT_RECORD_TYPE)
+        }
+        cred_def_records = await storage.find_all_records(CRED_DEF_SENT_RECORD_TYPE)
+        rev_reg_records = await IssuerRevRegRecord.query(
+            session, {"state": IssuerRevRegRecord.STATE_ACTIVE}
+        )
+    cred_def_ids = {record.tags.get("cred_def_id") for record in cred_def_records}
+    schema_ids.update(record.tags.get("schema_id") for record in cred_def_records)
+    schema_ids.discard(None)
+    cred_def_ids.discard(None)
+
+    missing_tails = [
+        record.revoc_reg_id
+        for record in rev_reg_records
+        if not (record.tails_local_path and path.isfile(record.tails_local_path))
+    ]
+    for revoc_reg_id in missing_tails:
+        LOGGER.warning("Tails file missing for revocation registry %s", revoc_reg_id)
+
+    async with ledger:
+        schemas, cred_defs, *rev_reg_defs = await asyncio.gather(
+            ledger.get_schemas(sorted(schema_ids)),
+            ledger.get_credential_definitions(sorted(cred_def_ids)),
+            *(
+                ledger.get_revoc_reg_def(record.revoc_reg_id)
+                for record in rev_reg_records
+            ),
+            return_exceptions=True,
+        )
+
+    result = {"missing_tails": missing_tails}
+    for name, found in (("schemas", schemas), ("credential_definitions", cred_defs)):
+        if isinstance(found, Exception):
+            LOGGER.warning("Error loading %s from the ledger: %s", name, found)
+            found = {}
+        result[name] = sum(1 for value in found.values() if value)
+    errors = [err for err in rev_reg_defs if isinstance(err, Exception)]
+    for err in errors:
+        LOGGER.warning("Error loading revocation registry definition: %s", err)
+    result["revocation_registry_definitions"] = len(rev_reg_defs) - len(errors)
+
+    LOGGER.info(
+        "Ledger warm-up loaded %d schemas, %d credential definitions and "
+        "%d revocation registry definitions",
+        result["schemas"],
+        result["credential_definitions"],
+        result["revocation_registry_definitions"],
+    )
+    return result
@@ -0,0 +1,358 @@
+"""Queue for submitting ledger writes in the background."""
+
+import asyncio
+import logging
+import time
+
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Sequence
+
+from ..indy.issuer import IndyIssuer
+from ..utils.stats import Stats
+
+from .base import BaseLedger
+from .endpoint_type import EndpointType
+from .error import LedgerError, LedgerTransactionError, LedgerTransientError
+from .util import merge_revoc_reg_entries
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_MAX_RETRY_DELAY = 30.0
+
+
+class LedgerWrite:
+    """A write waiting in the ledger write queue."""
+
+    def __init__(
+        self,
+        did: str,
+        kind: str,
+        operation: Callable[..., Awaitable],
+        args: Sequence = (),
+        merge_key: str = None,
+    ):
+        """
+        Initialize a `LedgerWrite` instance.
+
+        Args:
+            did: the DID authoring the write
+            kind: the type of write, used for metrics
+            operation: the ledger method performing the write
+            args: the arguments to the operation
+            merge_key: the key identifying writes which may be combined
+
+        """
+        self.did = did
+        self.kind = kind
+        self.operation = operation
+        self.args = list(args)
+        self.merge_key = merge_key
+        self.future = asyncio.get_event_loop().create_future()
+        self.queued_time = time.perf_counter()
+
+    async def run(self):
+        """Perform the write."""
+        return await self.operation(*self.args)
+
+
+class LedgerWriteQueue:
+    """Submit ledger writes in the background, one at a time for each DID.
+
+    Writes are sent in the order they were queued, so that the transactions of
+    one author never race one another, while writes for different DIDs proceed
+    concurrently. Requests which time out are retried with exponential backoff;
+    a revocation registry entry is only sent again if the ledger shows that the
+    request which timed out was not written.
+    A revocation registry entry queued while an earlier entry for the same
+    registry is still waiting is merged into it, and both callers receive the
+    ledger timestamp of the combined entry.
+
+    Each method returns a future for the result of the write, so that callers
+    may continue without waiting for the ledger.
+    """
+
+    def __init__(
+        self,
+        ledger: BaseLedger,
+        *,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+    ):
+        """
+        Initialize a `LedgerWriteQueue` instance.
+
+        Args:
+            ledger: the ledger to write to
+            retries: the number of times to retry a write after a transient error
+            retry_delay: the delay in seconds before the first retry
+            max_retry_delay: the maximum delay in seconds between retries
+
+        """
+        self.ledger = ledger
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.counts = {"queued": 0, "merged": 0, "retried": 0, "failed": 0}
+        self.latency = Stats()
+        self._pending: Dict[str, Deque[LedgerWrite]] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    @property
+    def depth(self) -> int:
+        """Accessor for the number of writes waiting to be sent."""
+        return sum(len(pending) for pending in self._pending.values())
+
+    @property
+    def in_flight(self) -> int:
+        """Accessor for the number of writes being sent."""
+        return len(self._workers)
+
+    def metrics(self) -> dict:
+        """
+        Summarize the state and history of the queue.
+
+        Returns:
+            A dictionary with the queue depth, writes in flight, counts of
+            queued, merged, retried and failed writes, and the time from queueing
+            to completion of each type of write
+
+        """
+        return {
+            "depth": self.depth,
+            "in_flight": self.in_flight,
+            **self.counts,
+            "latency": self.latency.extract(),
+        }
+
+    def submit(
+        self,
+        did: str,
+        kind: str,
+        operation: Callable[..., Awaitable],
+        *args,
+        merge_key: str = None,
+    ) -> asyncio.Future:
+        """
+        Queue a ledger write.
+
+        Args:
+            did: the DID authoring the write
+            kind: the type of write, used for metrics
+            operation: the ledger method performing the write
+            args: the arguments to the operation
+            merge_key: the key identifying revocation registry entries to combine
+
+        Returns:
+            A future for the result of the operation
+
+        """
+        pending = self._pending.setdefault(did, deque())
+        if merge_key:
+            waiting = [write for write in pending if write.merge_key == merge_key]
+            if waiting:
+                # only the last entry waiting may continue into the new one
+                merged = merge_revoc_reg_entries([waiting[-1].args[2], args[2]])
+                if merged:
+                    waiting[-1].args[2] = merged
+                    self.counts["merged"] += 1
+                    return waiting[-1].future
+
+        write = LedgerWrite(did, kind, operation, args, merge_key)
+        pending.append(write)
+        self.counts["queued"] += 1
+        if did not in self._workers:
+            self._workers[did] = asyncio.ensure_future(self._process(did))
+        return write.future
+
+    async def _process(self, did: str):
+        """Send the writes queued for a DID in order."""
+        pending = self._pending[did]
+        try:
+            while pending:
+                await self._perform(pending.popleft())
+        finally:
+            del self._workers[did]
+            if not pending:
+                del self._pending[did]
+
+    async def _perform(self, write: LedgerWrite):
+        """Send a write, retrying on transient errors."""
+        attempt = 0
+        while True:
+            try:
+                async with self.ledger:
+                    result = None
+                    if attempt and write.kind == "revoc_reg_entry":
+                        result = await self._find_revoc_reg_entry(write)
+                    if result is None:
+                        result = await write.run()
+            except LedgerTransientError as err:
+                if attempt >= self.retries:
+                    self._complete(write, error=err)
+                    return
+                delay = min(self.retry_delay * 2 ** attempt, self.max_retry_delay)
+                attempt += 1
+                self.counts["retried"] += 1
+                LOGGER.warning(
+                    "Retrying ledger write %s for %s in %.1fs: %s",
+                    write.kind,
+                    write.did,
+                    delay,
+                    err,
+                )
+                await asyncio.sleep(delay)
+            except Exception as err:
+                self._complete(write, error=err)
+                return
+            else:
+                self._complete(write, result=result)
+                return
+
+    async def _find_revoc_reg_entry(self, write: LedgerWrite) -> Optional[int]:
+        """
+        Look for a revocation registry entry on the ledger before sending it again.
+
+        Args:
+            write: the revocation registry entry write which timed out
+
+        Returns:
+            The ledger timestamp of the entry if the ledger already holds it, or
+            None if the registry is still at the entry's previous accumulator
+
+        Raises:
+            LedgerTransactionError: if the registry is at any other accumulator,
+                so that sending the entry again would not apply
+
+        """
+        (revoc_reg_id, _, revoc_reg_entry) = write.args[:3]
+        value = revoc_reg_entry.get("value") or {}
+        try:
+            (current, txn_time) = await self.ledger.get_revoc_reg_entry(
+                revoc_reg_id, int(time.time())
+            )
+        except LedgerTransientError:
+            raise
+        except LedgerError:
+            current = None  # no entry yet: the registry has only its definition
+        accum = current and current.get("value", {}).get("accum")
+        if accum and accum == value.get("accum"):
+            LOGGER.info(
+                "Revocation registry entry for %s was written before timing out",
+                revoc_reg_id,
+            )
+            return txn_time
+        if accum != value.get("prevAccum"):
+            raise LedgerTransactionError(
+                f"Revocation registry {revoc_reg_id} accumulator changed on the "
+                "ledger while sending an entry"
+            )
+        return None
+
+    def _complete(self, write: LedgerWrite, result=None, error: Exception = None):
+        """Resolve the future of a finished write and record its latency."""
+        self.latency.log(write.kind, time.perf_counter() - write.queued_time)
+        if write.future.done():
+            return
+        if error:
+            self.counts["failed"] += 1
+            LOGGER.error(
+                "Ledger write %s for %s failed: %s", write.kind, write.did, error
+            )
+            write.future.set_exception(error)
+        else:
+            write.future.set_result(result)
+
+    async def _author(self, did: str = None) -> str:
+        """Resolve the DID authoring a write, defaulting to the public DID."""
+        if not did:
+            public_info = await self.ledger.wallet.get_public_did()
+            did = public_info and public_info.did
+        return did
+
+    async def create_and_send_schema(
+        self,
+        issuer: IndyIssuer,
+        schema_name: str,
+        schema_version: str,
+        attribute_names: Sequence[str],
+    ) -> asyncio.Future:
+        """Queue sending a schema to the ledger, for the public DID."""
+        return self.submit(
+            await self._author(),
+            "schema",
+            self.ledger.create_and_send_schema,
+            issuer,
+            schema_name,
+            schema_version,
+            attribute_names,
+        )
+
+    async def create_and_send_credential_definition(
+        self,
+        issuer: IndyIssuer,
+        schema_id: str,
+        signature_type: str = None,
+        tag: str = None,
+        support_revocation: bool = False,
+    ) -> asyncio.Future:
+        """Queue sending a credential definition to the ledger, for the public DID."""
+        return self.submit(
+            await self._author(),
+            "credential_definition",
+            self.ledger.create_and_send_credential_definition,
+            issuer,
+            schema_id,
+            signature_type,
+            tag,
+            support_revocation,
+        )
+
+    async def update_endpoint_for_did(
+        self,
+        did: str,
+        endpoint: str,
+        endpoint_type: EndpointType = EndpointType.ENDPOINT,
+    ) -> asyncio.Future:
+        """Queue updating the endpoint of a DID on the ledger."""
+        return self.submit(
+            did,
+            "endpoint",
+            self.ledger.update_endpoint_for_did,
+            did,
+            endpoint,
+            endpoint_type,
+        )
+
+    async def send_revoc_reg_def(
+        self, revoc_reg_def: dict, issuer_did: str = None
+    ) -> asyncio.Future:
+        """Queue publishing a revocation registry definition."""
+        return self.submit(
+            await self._author(issuer_did),
+            "revoc_reg_def",
+            self.ledger.send_revoc_reg_def,
+            revoc_reg_def,
+            issuer_did,
+        )
+
+    async def send_revoc_reg_entry(
+        self,
+        revoc_reg_id: str,
+        revoc_def_type: str,
+        revoc_reg_entry: dict,
+        issuer_did: str = None,
+    ) -> asyncio.Future:
+        """Queue publishing a revocation registry entry, merging with any waiting."""
+        return self.submit(
+            await self._author(issuer_did),
+            "revoc_reg_entry",
+            self.ledger.send_revoc_reg_entry,
+            revoc_reg_id,
+            revoc_def_type,
+            revoc_reg_entry,
+            issuer_did,
+            merge_key=f"revoc_reg_entry::{revoc_reg_id}",
+        )
@@ -24,8 +24,10 @@ from ..valid import INDY_CRED_DEF_ID, INDY_REV_REG_SIZE, INDY_SCHEMA_ID, INDY_VE
 
 from ...revocation.error import RevocationError, RevocationNotSupportedError
 from ...revocation.indy import IndyRevocation
+from ...revocation.provisioner import RevRegProvisioner
 
 from ...ledger.error import LedgerError
+from ...ledger.write_queue import LedgerWriteQueue
 
 from .util import CredDefQueryStringSchema, CRED_DEF_TAGS, CRED_DEF_SENT_RECORD_TYPE
 
@@ -145,10 +147,11 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
         raise web.HTTPForbidden(reason=reason)
 
     issuer = context.inject(IndyIssuer)
+    write_queue = context.inject(LedgerWriteQueue, required=False)
     try:  # even if in wallet, send it and raise if erroneously so
-        async with ledger:
+        if write_queue:
             (cred_def_id, cred_def, novel) = await shield(
-                ledger.create_and_send_credential_definition(
+                await write_queue.create_and_send_credential_definition(
                     issuer,
                     schema_id,
                     signature_type=None,
@@ -156,6 +159,17 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
                     support_revocation=support_revocation,
                 )
             )
+        else:
+            async with ledger:
+                (cred_def_id, cred_def, novel) = await shield(
+                    ledger.create_and_send_credential_definition(
+                        issuer,
+                        schema_id,
+                        signature_type=None,
+                        tag=tag,
+                        support_revocation=support_revocation,
+                    )
+                )
     except LedgerError as e:
         raise web.HTTPBadRequest(reason=e.message) from e
 
@@ -186,13 +200,23 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
             await registry_record.send_entry(session)
 
             # stage pending registry independent of whether tails server is OK
-            pending_registry_record = await revoc.init_issuer_registry(
-                registry_record.cred_def_id,
-                max_cred_num=registry_record.max_cred_num,
-            )
-            ensure_future(
-                pending_registry_record.stage_pending_registry(session, max_attempts=16)
-            )
+            provisioner = context.inject(RevRegProvisioner, required=False)
+            if provisioner:
+                provisioner.top_up(
+                    context.profile,
+                    registry_record.cred_def_id,
+                    max_cred_num=registry_record.max_cred_num,
+                )
+            else:
+                pending_registry_record = await revoc.init_issuer_registry(
+                    registry_record.cred_def_id,
+                    max_cred_num=registry_record.max_cred_num,
+                )
+                ensure_future(
+                    pending_registry_record.stage_pending_registry(
+                        session, max_attempts=16
+                    )
+                )
 
             tails_server = session.inject(BaseTailsServer)
             (upload_success, reason) = await tails_server.upload_tails_file(
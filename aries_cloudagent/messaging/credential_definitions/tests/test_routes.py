@@ -4,6 +4,7 @@ from asynctest import mock as async_mock
 from ....admin.request_context import AdminRequestContext
 from ....indy.issuer import IndyIssuer
 from ....ledger.base import BaseLedger
+from ....revocation.provisioner import RevRegProvisioner
 from ....storage.base import BaseStorage
 from ....tails.base import BaseTailsServer
 
@@ -107,6 +108,52 @@ class TestCredentialDefinitionRoutes(AsyncTestCase):
                 {"credential_definition_id": CRED_DEF_ID}
             )
 
+    async def test_send_credential_definition_revoc_provisioner(self):
+        self.request.json = async_mock.CoroutineMock(
+            return_value={
+                "schema_id": "WgWxqztrNooG92RXvxSTWv:2:schema_name:1.0",
+                "support_revocation": True,
+                "tag": "tag",
+            }
+        )
+        self.context.settings.set_value("tails_server_base_url", "http://1.2.3.4:8222")
+
+        mock_tails_server = async_mock.MagicMock(
+            upload_tails_file=async_mock.CoroutineMock(return_value=(True, None))
+        )
+        self.context.injector.bind_instance(BaseTailsServer, mock_tails_server)
+        provisioner = async_mock.MagicMock(RevRegProvisioner, autospec=True)
+        self.context.injector.bind_instance(RevRegProvisioner, provisioner)
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", async_mock.MagicMock()
+        ) as test_indy_revoc, async_mock.patch.object(
+            test_module.web, "json_response", async_mock.MagicMock()
+        ) as mock_response:
+            test_indy_revoc.return_value = async_mock.MagicMock(
+                init_issuer_registry=async_mock.CoroutineMock(
+                    return_value=async_mock.MagicMock(
+                        cred_def_id=CRED_DEF_ID,
+                        max_cred_num=1000,
+                        set_tails_file_public_uri=async_mock.CoroutineMock(),
+                        generate_registry=async_mock.CoroutineMock(),
+                        send_def=async_mock.CoroutineMock(),
+                        send_entry=async_mock.CoroutineMock(),
+                    )
+                )
+            )
+
+            await test_module.credential_definitions_send_credential_definition(
+                self.request
+            )
+            mock_response.assert_called_once_with(
+                {"credential_definition_id": CRED_DEF_ID}
+            )
+            test_indy_revoc.return_value.init_issuer_registry.assert_called_once()
+            provisioner.top_up.assert_called_once_with(
+                self.context.profile, CRED_DEF_ID, max_cred_num=1000
+            )
+
     async def test_send_credential_definition_revoc_no_tails_server_x(self):
         self.request.json = async_mock.CoroutineMock(
             return_value={
@@ -5,18 +5,36 @@ import sys
 import uuid
 
 from datetime import datetime
-from typing import Any, Mapping, Sequence, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
+from ...storage.record_cache import RecordValueCache, get_record_cache
+from ...storage.wql import compile_tag_query
+from ...utils.stats import Collector, Timer
+from ...wallet.util import b64_to_str, str_to_b64
 
-from .base import BaseModel, BaseModelSchema
+from .base import BaseModel, BaseModelError, BaseModelSchema
 from ..responder import BaseResponder
-from ..util import datetime_to_str, time_now
+from ..util import datetime_to_str, str_to_datetime, time_now
 from ..valid import INDY_ISO8601_DATETIME
 
 
@@ -60,6 +78,99 @@ def match_post_filter(
     return positive
 
 
+def post_filter_query(
+    post_filter: dict, positive: bool = True, alt: bool = False
+) -> Optional[dict]:
+    """Express a post-filter as an equivalent WQL query over record values.
+
+    Args:
+        post_filter: filter to apply (empty or None filter matches everything)
+        positive: whether matching all filter criteria positively or negatively
+        alt: set to match any (positive=True) value or miss all (positive=False)
+            values in post_filter
+
+    Returns:
+        The WQL query, or None if the filter has no equivalent query
+
+    """
+    if not post_filter:
+        return {}
+    if alt and not positive:
+        # requires a truthy value, which WQL cannot express for non-strings
+        return None
+    query = {}
+    for k, v in post_filter.items():
+        if k.startswith("$"):
+            return None
+        if alt:
+            if not isinstance(v, (list, tuple, set)) or not all(
+                isinstance(val, str) for val in v
+            ):
+                return None
+            query[k] = {"$in": [val for val in v if val]}
+        elif isinstance(v, str):
+            query[k] = v
+        else:
+            return None
+    return query if positive else {"$not": query}
+
+
+def post_filter_matcher(
+    post_filter_positive: dict = None,
+    post_filter_negative: dict = None,
+    alt: bool = False,
+) -> Callable[[str], Optional[dict]]:
+    """Build a matcher applying post-filters to raw stored record values.
+
+    Positive filters on string values are first checked as substrings of the
+    raw JSON value, so that most non-matching rows are rejected before they
+    are decoded.
+
+    Args:
+        post_filter_positive: value filters to apply matching positively
+        post_filter_negative: value filters to apply matching negatively
+        alt: set to match any (positive=True) value or miss all (positive=False)
+            values in post_filter
+
+    Returns:
+        A function returning the decoded value of a matching record, or None
+
+    """
+    hints = []
+    for v in (post_filter_positive or {}).values():
+        if not alt:
+            alts = (v,)
+        elif isinstance(v, (list, tuple, set)):
+            alts = v
+        else:
+            continue
+        if all(isinstance(val, str) for val in alts):
+            hints.append(
+                {json.dumps(val) for val in alts}
+                | {json.dumps(val, ensure_ascii=False) for val in alts}
+            )
+
+    positive_query = post_filter_query(post_filter_positive, positive=True, alt=alt)
+    negative_query = post_filter_query(post_filter_negative, positive=False, alt=alt)
+    if positive_query is not None and negative_query is not None:
+        match_vals = compile_tag_query({"$and": [positive_query, negative_query]})
+    else:
+
+        def match_vals(vals: dict) -> bool:
+            return match_post_filter(
+                vals, post_filter_positive, positive=True, alt=alt
+            ) and match_post_filter(vals, post_filter_negative, positive=False, alt=alt)
+
+    def match(value: str) -> Optional[dict]:
+        for hint in hints:
+            if not any(fragment in value for fragment in hint):
+                return None
+        vals = json.loads(value)
+        return vals if match_vals(vals) else None
+
+    return match
+
+
 class BaseRecord(BaseModel):
     """Represents a single storage record."""
 
@@ -67,6 +178,8 @@ class BaseRecord(BaseModel):
         """BaseRecord metadata."""
 
     DEFAULT_CACHE_TTL = 60
+    RECORD_CACHE_SIZE = 0
+    QUERY_PAGE_MAX_SKIP = 10000
     RECORD_ID_NAME = "id"
     RECORD_TYPE = None
     WEBHOOK_TOPIC = None
@@ -195,6 +308,28 @@ class BaseRecord(BaseModel):
         if cache:
             await cache.clear(cache_key)
 
+    @classmethod
+    def get_record_cache(cls, session: ProfileSession) -> Optional[RecordValueCache]:
+        """Accessor for the record value cache of this record type, if enabled.
+
+        Record classes opt in by setting a positive RECORD_CACHE_SIZE, and the
+        cache is only used when the `record_cache.ttl` setting is positive. The
+        cache is held in process memory and scoped to the backing store, whose
+        writes clear it; writes by other processes are seen once entries expire.
+
+        Args:
+            session: The profile session to use
+        """
+        if cls.RECORD_CACHE_SIZE <= 0 or not session:
+            return None
+        ttl = session.settings.get_int("record_cache.ttl") or 0
+        if ttl <= 0:
+            return None
+        scope = session.inject(BaseStorage).record_cache_scope
+        if scope is None:
+            return None
+        return get_record_cache(scope, cls.RECORD_TYPE, cls.RECORD_CACHE_SIZE, ttl)
+
     @classmethod
     async def retrieve_by_id(
         cls, session: ProfileSession, record_id: str
@@ -205,12 +340,34 @@ class BaseRecord(BaseModel):
             session: The profile session to use
             record_id: The ID of the record to find
         """
-        storage = session.inject(BaseStorage)
-        result = await storage.get_record(
-            cls.RECORD_TYPE, record_id, {"retrieveTags": False}
-        )
-        vals = json.loads(result.value)
-        return cls.from_storage(record_id, vals)
+        cache = cls.get_record_cache(session)
+        if cache is None:
+            storage = session.inject(BaseStorage)
+            result = await storage.get_record(
+                cls.RECORD_TYPE, record_id, {"retrieveTags": False}
+            )
+            vals = json.loads(result.value)
+            return cls.from_storage(record_id, vals)
+
+        start = Timer.now()
+        value = cache.get(record_id)
+        hit = value is not None
+        if not hit:
+            generation = cache.generation
+            storage = session.inject(BaseStorage)
+            result = await storage.get_record(
+                cls.RECORD_TYPE, record_id, {"retrieveTags": False}
+            )
+            value = result.value
+            cache.put(record_id, value, generation)
+        collector = session.inject(Collector, required=False)
+        if collector:
+            collector.log(
+                f"{cls.__name__}.record_cache.{'hit' if hit else 'miss'}",
+                Timer.now() - start,
+                start,
+            )
+        return cls.from_storage(record_id, json.loads(value))
 
     @classmethod
     async def retrieve_by_tag_filter(
@@ -231,9 +388,10 @@ class BaseRecord(BaseModel):
             options={"retrieveTags": False},
         )
         found = None
+        match = post_filter_matcher(post_filter)
         for record in rows:
-            vals = json.loads(record.value)
-            if match_post_filter(vals, post_filter, alt=False):
+            vals = match(record.value)
+            if vals is not None:
                 if found:
                     raise StorageDuplicateError(
                         "Multiple {} records located for {}{}".format(
@@ -277,23 +435,180 @@ class BaseRecord(BaseModel):
             cls.prefix_tag_filter(tag_filter),
             options={"retrieveTags": False},
         )
+        match = post_filter_matcher(post_filter_positive, post_filter_negative, alt)
         result = []
         for record in rows:
-            vals = json.loads(record.value)
-            if match_post_filter(
-                vals,
-                post_filter_positive,
-                positive=True,
-                alt=alt,
-            ) and match_post_filter(
-                vals,
-                post_filter_negative,
-                positive=False,
-                alt=alt,
-            ):
+            vals = match(record.value)
+            if vals is not None:
                 result.append(cls.from_storage(record.id, vals))
         return result
 
+    @classmethod
+    async def query_iter(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> AsyncIterator["BaseRecord"]:
+        """Iterate over stored records.
+
+        Records are fetched from storage one page at a time and yielded as they
+        are matched, without holding the full result set in memory.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+        """
+        storage = session.inject(BaseStorage)
+        search = storage.search_records(
+            cls.RECORD_TYPE,
+            cls.prefix_tag_filter(tag_filter),
+            options={"retrieveTags": False},
+        )
+        match = post_filter_matcher(post_filter_positive, post_filter_negative, alt)
+        try:
+            async for record in search:
+                vals = match(record.value)
+                if vals is not None:
+                    yield cls.from_storage(record.id, vals)
+        finally:
+            await search.close()
+
+    @classmethod
+    async def query_page(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        limit: int = None,
+        cursor: str = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> Tuple[Sequence["BaseRecord"], str]:
+        """Query one page of stored records.
+
+        Records are returned in the stable order of the storage search. The
+        cursor names the last record returned, and the next page resumes after
+        it, so records added or removed between pages are neither repeated nor
+        skipped. Only the requested page is deserialized and held in memory.
+
+        The storage search cannot seek, so each page rescans the records ahead
+        of the cursor and walking all pages costs O(n^2) record reads. A page
+        may skip at most `QUERY_PAGE_MAX_SKIP` records before its cursor;
+        deeper queries should narrow the tag filter instead.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return, or None for all
+            cursor: The opaque cursor returned with the previous page, if any
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+
+        Returns:
+            A tuple of the matching records and the cursor for the next page,
+            which is None when no further records match
+
+        Raises:
+            BaseModelError: If the limit or cursor is invalid, or the cursor lies
+                more than `QUERY_PAGE_MAX_SKIP` records into the search
+
+        """
+        if limit is not None and limit < 1:
+            raise BaseModelError(f"Invalid query limit: {limit}")
+        after_id, after_created = (
+            cls.decode_query_cursor(cursor) if cursor else (None, None)
+        )
+        storage = session.inject(BaseStorage)
+        match = post_filter_matcher(post_filter_positive, post_filter_negative, alt)
+
+        def created_after(value: str) -> bool:
+            created_at = json.loads(value).get("created_at")
+            return bool(created_at) and str_to_datetime(created_at) > after_created
+
+        async def scan(resume: Callable[[StorageRecord], bool]):
+            search = storage.search_records(
+                cls.RECORD_TYPE,
+                cls.prefix_tag_filter(tag_filter),
+                page_size=min(limit + 1, DEFAULT_PAGE_SIZE) if limit else None,
+                options={"retrieveTags": False},
+            )
+            found = after_id is None
+            skipped = 0
+            result = []
+            next_cursor = None
+            try:
+                async for record in search:
+                    if not found:
+                        skipped += 1
+                        if skipped > cls.QUERY_PAGE_MAX_SKIP:
+                            raise BaseModelError(
+                                "Query cursor is too deep: narrow the tag filter"
+                            )
+                        if record.id == after_id:
+                            found = True
+                            continue
+                        found = resume(record)
+                        if not found:
+                            continue
+                    vals = match(record.value)
+                    if vals is not None:
+                        if len(result) == limit:
+                            next_cursor = cls.encode_query_cursor(result[-1])
+                            break
+                        result.append(cls.from_storage(record.id, vals))
+            finally:
+                await search.close()
+            return found, result, next_cursor
+
+        found, result, next_cursor = await scan(lambda record: False)
+        if not found and after_created:
+            # the last record of the previous page is gone: storage order is
+            # creation order, so resume with the first record created after it
+            _, result, next_cursor = await scan(
+                lambda record: created_after(record.value)
+            )
+        return result, next_cursor
+
+    @classmethod
+    def encode_query_cursor(cls, record: "BaseRecord") -> str:
+        """Encode the last record of a page as an opaque query cursor."""
+        return str_to_b64(
+            json.dumps(
+                {
+                    "type": cls.RECORD_TYPE,
+                    "id": record._id,
+                    "created_at": record.created_at,
+                }
+            ),
+            urlsafe=True,
+            pad=False,
+        )
+
+    @classmethod
+    def decode_query_cursor(cls, cursor: str) -> Tuple[str, Optional[datetime]]:
+        """Decode an opaque query cursor into a record ID and creation time."""
+        try:
+            decoded = json.loads(b64_to_str(cursor, urlsafe=True))
+            record_id = decoded["id"]
+            created_at = decoded["created_at"]
+            if decoded["type"] != cls.RECORD_TYPE or not isinstance(record_id, str):
+                raise ValueError()
+            created_at = str_to_datetime(created_at) if created_at else None
+        except (TypeError, ValueError, KeyError) as err:
+            raise BaseModelError(f"Invalid query cursor: {cursor}") from err
+        return record_id, created_at
+
     async def save(
         self,
         session: ProfileSession,
@@ -338,6 +653,52 @@ class BaseRecord(BaseModel):
 
         return self._id
 
+    @classmethod
+    async def save_records(
+        cls,
+        session: ProfileSession,
+        records: Sequence["BaseRecord"],
+        *,
+        reason: str = None,
+        webhook: bool = None,
+    ):
+        """Persist several records to storage with batched storage operations.
+
+        Args:
+            session: The profile session to use
+            records: The records to save, new or existing
+            reason: A reason to add to the log
+            webhook: Flag to override whether the webhooks are sent
+        """
+        added = []
+        updated = []
+        now = time_now()
+        for record in records:
+            record.updated_at = now
+            if record._id:
+                updated.append(record)
+            else:
+                record._id = str(uuid.uuid4())
+                record.created_at = now
+                added.append(record)
+
+        storage = session.inject(BaseStorage)
+        if added:
+            await storage.add_records([record.storage_record for record in added])
+        if updated:
+            await storage.update_records([record.storage_record for record in updated])
+
+        added_ids = {record._id for record in added}
+        for record in records:
+            new_record = record._id in added_ids
+            record.log_state(
+                session,
+                reason or ("Created record" if new_record else "Updated record"),
+                {record.RECORD_TYPE: record.serialize()},
+            )
+            await record.post_save(session, new_record, record._last_state, webhook)
+            record._last_state = record.state
+
     async def post_save(
         self,
         session: ProfileSession,
@@ -372,6 +733,21 @@ class BaseRecord(BaseModel):
             await storage.delete_record(self.storage_record)
         # FIXME - update state and send webhook?
 
+    @classmethod
+    async def delete_records(
+        cls, session: ProfileSession, records: Sequence["BaseRecord"]
+    ):
+        """Remove several stored records with a batched storage operation.
+
+        Args:
+            session: The profile session to use
+            records: The records to remove
+        """
+        stored = [record.storage_record for record in records if record._id]
+        if stored:
+            storage = session.inject(BaseStorage)
+            await storage.delete_records(stored)
+
     @property
     def webhook_payload(self):
         """Return a JSON-serialized version of the record for the webhook."""
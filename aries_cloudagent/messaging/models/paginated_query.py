@@ -0,0 +1,54 @@
+"""Class for paginated query parameters."""
+
+from typing import Tuple
+
+from aiohttp.web import BaseRequest
+from marshmallow import fields
+from marshmallow.validate import Range
+
+from ...storage.base import DEFAULT_PAGE_SIZE
+
+from .openapi import OpenAPISchema
+
+MAXIMUM_PAGE_SIZE = 1000
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated record queries."""
+
+    limit = fields.Int(
+        required=False,
+        description="Maximum number of results to return (default all)",
+        validate=Range(min=1, max=MAXIMUM_PAGE_SIZE),
+        example=DEFAULT_PAGE_SIZE,
+    )
+    cursor = fields.Str(
+        required=False,
+        description="Opaque cursor returned as next_cursor with the previous page",
+    )
+
+
+class PaginatedResultSchema(OpenAPISchema):
+    """Result fields for paginated record queries."""
+
+    next_cursor = fields.Str(
+        required=False,
+        description="Cursor for the next page, absent on the last page",
+    )
+
+
+def get_paginated_query_params(request: BaseRequest) -> Tuple[int, str]:
+    """
+    Read pagination parameters from a request query string.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        A tuple of the page size limit and cursor; both are None when the
+        request does not ask for pagination
+
+    """
+    limit = request.query.get("limit")
+    cursor = request.query.get("cursor") or None
+    return (int(limit) if limit else None, cursor)
@@ -1,16 +1,30 @@
 import json
+import time
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 from marshmallow import EXCLUDE, fields
 
 from ....cache.base import BaseCache
 from ....core.in_memory import InMemoryProfile
-from ....storage.base import BaseStorage, StorageDuplicateError, StorageRecord
+from ....storage import record_cache
+from ....storage.base import (
+    BaseStorage,
+    StorageDuplicateError,
+    StorageNotFoundError,
+    StorageRecord,
+)
+from ....utils.stats import Collector
 
 from ...responder import BaseResponder, MockResponder
 from ...util import time_now
 
-from ..base_record import BaseRecord, BaseRecordSchema
+from ..base import BaseModelError
+from ..base_record import (
+    BaseRecord,
+    BaseRecordSchema,
+    post_filter_matcher,
+    post_filter_query,
+)
 
 
 class BaseRecordImpl(BaseRecord):
@@ -56,6 +70,20 @@ class ARecordImplSchema(BaseRecordSchema):
     code = fields.Str()
 
 
+class CachedRecordImpl(ARecordImpl):
+    class Meta:
+        schema_class = "CachedRecordImplSchema"
+
+    RECORD_TYPE = "cached-record"
+    RECORD_CACHE_SIZE = 2
+
+
+class CachedRecordImplSchema(ARecordImplSchema):
+    class Meta:
+        model_class = CachedRecordImpl
+        unknown = EXCLUDE
+
+
 class UnencTestImpl(BaseRecord):
     TAG_NAMES = {"~a", "~b", "c"}
 
@@ -234,6 +262,295 @@ class TestBaseRecord(AsyncTestCase):
         )
         assert not result
 
+    async def test_query_iter(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a=str(i % 2), b=str(i), code="one").save(session)
+        await ARecordImpl(a="0", b="5", code="two").save(session)
+
+        found = [
+            rec.b
+            async for rec in ARecordImpl.query_iter(
+                session, {"code": "one"}, post_filter_positive={"a": "0"}
+            )
+        ]
+        assert found == ["0", "2", "4"]
+
+        found = [
+            rec.b
+            async for rec in ARecordImpl.query_iter(
+                session,
+                post_filter_positive={"b": ["1", "5"]},
+                post_filter_negative={"a": ["1"]},
+                alt=True,
+            )
+        ]
+        assert found == ["5"]
+
+    def test_post_filter_matcher(self):
+        value = json.dumps({"a": "one", "b": "tw\u00f6", "c": 3})
+        with async_mock.patch.object(json, "loads", wraps=json.loads) as mock_loads:
+            assert post_filter_matcher({"a": "two"})(value) is None
+            assert post_filter_matcher({"a": ["two", "three"]}, alt=True)(value) is None
+            mock_loads.assert_not_called()
+
+            assert post_filter_matcher({"b": "tw\u00f6"})(value)["a"] == "one"
+            assert post_filter_matcher({"c": 3})(value)
+            assert not post_filter_matcher({"c": 4})(value)
+            assert post_filter_matcher({"a": "one"}, {"c": 3})(value) is None
+            assert post_filter_matcher({"a": "ones"}, alt=True)(value)
+            assert post_filter_matcher()(value)
+
+    def test_post_filter_query(self):
+        assert post_filter_query(None) == {}
+        assert post_filter_query({"a": "one"}) == {"a": "one"}
+        assert post_filter_query({"a": "one"}, positive=False) == {"$not": {"a": "one"}}
+        assert post_filter_query({"a": ["one", ""]}, alt=True) == {
+            "a": {"$in": ["one"]}
+        }
+        assert post_filter_query({"a": ["one"]}, positive=False, alt=True) is None
+        assert post_filter_query({"a": 1}) is None
+        assert post_filter_query({"a": "one"}, alt=True) is None
+
+    async def test_query_page(self):
+        session = InMemoryProfile.test_session()
+        records = []
+        for i in range(5):
+            records.append(
+                ARecordImpl(a="odd" if i % 2 else "even", b=str(i), code="one")
+            )
+            await records[i].save(session)
+        await ARecordImpl(a="even", b="5", code="two").save(session)
+
+        # unlimited
+        (result, cursor) = await ARecordImpl.query_page(session, {"code": "one"})
+        assert [rec.b for rec in result] == ["0", "1", "2", "3", "4"]
+        assert cursor is None
+
+        # walk pages
+        found = []
+        cursor = None
+        while True:
+            (result, cursor) = await ARecordImpl.query_page(
+                session, {"code": "one"}, limit=2, cursor=cursor
+            )
+            found.append([rec.b for rec in result])
+            if not cursor:
+                break
+        assert found == [["0", "1"], ["2", "3"], ["4"]]
+
+        # walk pages with post-filter
+        (result, cursor) = await ARecordImpl.query_page(
+            session, {"code": "one"}, limit=2, post_filter_positive={"a": "even"}
+        )
+        assert [rec.b for rec in result] == ["0", "2"]
+        assert cursor
+        (result, cursor) = await ARecordImpl.query_page(
+            session,
+            {"code": "one"},
+            limit=2,
+            cursor=cursor,
+            post_filter_positive={"a": "even"},
+        )
+        assert [rec.b for rec in result] == ["4"]
+        assert cursor is None
+
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, limit=0)
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(session, cursor="not a cursor")
+        with self.assertRaises(BaseModelError):
+            await ARecordImpl.query_page(
+                session, cursor=BaseRecordImpl.encode_query_cursor(BaseRecordImpl())
+            )
+
+    async def test_query_page_stable(self):
+        session = InMemoryProfile.test_session()
+        records = []
+        for i in range(6):
+            records.append(ARecordImpl(a="a", b=str(i), code="one"))
+            await records[i].save(session)
+
+        (result, cursor) = await ARecordImpl.query_page(session, limit=2)
+        assert [rec.b for rec in result] == ["0", "1"]
+
+        # removing a record already returned does not skip the next
+        await records[0].delete_record(session)
+        await ARecordImpl(a="a", b="6", code="one").save(session)
+        (result, cursor) = await ARecordImpl.query_page(session, limit=2, cursor=cursor)
+        assert [rec.b for rec in result] == ["2", "3"]
+
+        # nor does removing the last record of the previous page
+        await records[3].delete_record(session)
+        (result, cursor) = await ARecordImpl.query_page(session, limit=2, cursor=cursor)
+        assert [rec.b for rec in result] == ["4", "5"]
+        (result, cursor) = await ARecordImpl.query_page(session, limit=2, cursor=cursor)
+        assert [rec.b for rec in result] == ["6"]
+        assert cursor is None
+
+    async def test_query_page_max_skip(self):
+        session = InMemoryProfile.test_session()
+        for i in range(4):
+            await ARecordImpl(a="a", b=str(i), code="one").save(session)
+
+        with async_mock.patch.object(ARecordImpl, "QUERY_PAGE_MAX_SKIP", 2):
+            (result, cursor) = await ARecordImpl.query_page(session, limit=2)
+            (result, cursor) = await ARecordImpl.query_page(
+                session, limit=1, cursor=cursor
+            )
+            assert [rec.b for rec in result] == ["2"]
+            with self.assertRaises(BaseModelError):
+                await ARecordImpl.query_page(session, limit=1, cursor=cursor)
+
+    async def test_save_delete_records(self):
+        session = InMemoryProfile.test_session()
+        mock_responder = MockResponder()
+        session.context.injector.bind_instance(BaseResponder, mock_responder)
+        existing = ARecordImpl(a="1", b="0", code="one")
+        await existing.save(session)
+        existing.b = "changed"
+        records = [existing] + [
+            ARecordImpl(a="1", b=str(i), code="one") for i in range(1, 4)
+        ]
+        with async_mock.patch.object(
+            ARecordImpl, "post_save", async_mock.CoroutineMock()
+        ) as mock_post_save:
+            await ARecordImpl.save_records(session, records, reason="batch")
+            assert mock_post_save.await_count == 4
+            assert [call[0][1] for call in mock_post_save.call_args_list] == [
+                False,
+                True,
+                True,
+                True,
+            ]
+
+        found = await ARecordImpl.query(session, {"code": "one"})
+        assert sorted(rec.b for rec in found) == ["1", "2", "3", "changed"]
+        assert all(rec._id for rec in records)
+
+        await ARecordImpl.delete_records(
+            session, records[1:] + [ARecordImpl(a="", b="")]
+        )
+        found = await ARecordImpl.query(session, {"code": "one"})
+        assert [rec._id for rec in found] == [existing._id]
+
+        await ARecordImpl.delete_records(session, [])
+
+    async def test_record_cache(self):
+        session = InMemoryProfile.test_session(settings={"record_cache.ttl": 60})
+        collector = Collector()
+        session.context.injector.bind_instance(Collector, collector)
+        storage = session.inject(BaseStorage)
+        records = [CachedRecordImpl(a="1", b=str(i)) for i in range(3)]
+        for record in records:
+            await record.save(session)
+        assert CachedRecordImpl.get_record_cache(session) is not None
+        assert ARecordImpl.get_record_cache(session) is None
+
+        with async_mock.patch.object(
+            storage, "get_record", async_mock.CoroutineMock(wraps=storage.get_record)
+        ) as mock_get:
+            found = await CachedRecordImpl.retrieve_by_id(session, records[0]._id)
+            assert found.b == "0"
+            found = await CachedRecordImpl.retrieve_by_id(session, records[0]._id)
+            assert found.b == "0"
+            assert mock_get.await_count == 1
+
+            # least recently used entries are evicted beyond the size limit
+            for record in records[1:]:
+                await CachedRecordImpl.retrieve_by_id(session, record._id)
+            assert len(CachedRecordImpl.get_record_cache(session)) == 2
+            await CachedRecordImpl.retrieve_by_id(session, records[0]._id)
+            assert mock_get.await_count == 4
+
+            records[0].b = "changed"
+            await records[0].save(session)
+            found = await CachedRecordImpl.retrieve_by_id(session, records[0]._id)
+            assert found.b == "changed"
+            assert mock_get.await_count == 5
+
+            await records[0].delete_record(session)
+            with self.assertRaises(StorageNotFoundError):
+                await CachedRecordImpl.retrieve_by_id(session, records[0]._id)
+
+        stats = collector.extract(
+            ["CachedRecordImpl.record_cache.hit", "CachedRecordImpl.record_cache.miss"]
+        )
+        assert stats["count"] == {
+            "CachedRecordImpl.record_cache.hit": 1,
+            "CachedRecordImpl.record_cache.miss": 5,
+        }
+
+    async def test_record_cache_disabled(self):
+        session = InMemoryProfile.test_session()
+        assert CachedRecordImpl.get_record_cache(session) is None
+        session = InMemoryProfile.test_session(settings={"record_cache.ttl": 0})
+        assert CachedRecordImpl.get_record_cache(session) is None
+
+    async def test_record_cache_ttl(self):
+        session = InMemoryProfile.test_session(settings={"record_cache.ttl": 60})
+        record = CachedRecordImpl(a="1", b="0")
+        await record.save(session)
+        await CachedRecordImpl.retrieve_by_id(session, record._id)
+        cache = CachedRecordImpl.get_record_cache(session)
+        assert cache.get(record._id)
+        expired = time.perf_counter() + 61
+        with async_mock.patch.object(
+            record_cache.time, "perf_counter", async_mock.MagicMock()
+        ) as mock_clock:
+            mock_clock.return_value = expired
+            assert cache.get(record._id) is None
+        assert not len(cache)
+
+    async def test_record_cache_storage_write(self):
+        session = InMemoryProfile.test_session(settings={"record_cache.ttl": 60})
+        record = CachedRecordImpl(a="1", b="0")
+        await record.save(session)
+        await CachedRecordImpl.retrieve_by_id(session, record._id)
+
+        # writes straight to storage, bypassing BaseRecord, clear the cache too
+        storage = session.inject(BaseStorage)
+        stored = await storage.get_record(CachedRecordImpl.RECORD_TYPE, record._id)
+        value = json.loads(stored.value)
+        value["b"] = "changed"
+        await storage.update_record(stored, json.dumps(value), stored.tags)
+        found = await CachedRecordImpl.retrieve_by_id(session, record._id)
+        assert found.b == "changed"
+
+        await storage.delete_all_records(CachedRecordImpl.RECORD_TYPE)
+        with self.assertRaises(StorageNotFoundError):
+            await CachedRecordImpl.retrieve_by_id(session, record._id)
+
+    async def test_record_cache_profile_scope(self):
+        session = InMemoryProfile.test_session(settings={"record_cache.ttl": 60})
+        other = InMemoryProfile.test_session(settings={"record_cache.ttl": 60})
+        record = CachedRecordImpl(a="1", b="0")
+        await record.save(session)
+        await CachedRecordImpl.retrieve_by_id(session, record._id)
+        assert len(CachedRecordImpl.get_record_cache(session)) == 1
+        with self.assertRaises(StorageNotFoundError):
+            await CachedRecordImpl.retrieve_by_id(other, record._id)
+
+    async def test_record_cache_stale_read(self):
+        session = InMemoryProfile.test_session(settings={"record_cache.ttl": 60})
+        record = CachedRecordImpl(a="1", b="0")
+        await record.save(session)
+        storage = session.inject(BaseStorage)
+        get_record = storage.get_record
+
+        async def write_during_read(*args, **kwargs):
+            result = await get_record(*args, **kwargs)
+            record.b = "changed"
+            await record.save(session)
+            return result
+
+        with async_mock.patch.object(storage, "get_record", write_during_read):
+            found = await CachedRecordImpl.retrieve_by_id(session, record._id)
+        assert found.b == "0"
+        assert not len(CachedRecordImpl.get_record_cache(session))
+        found = await CachedRecordImpl.retrieve_by_id(session, record._id)
+        assert found.b == "changed"
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
@@ -18,6 +18,7 @@ from ...admin.request_context import AdminRequestContext
 from ...indy.issuer import IndyIssuer, IndyIssuerError
 from ...ledger.base import BaseLedger
 from ...ledger.error import LedgerError
+from ...ledger.write_queue import LedgerWriteQueue
 from ...storage.base import BaseStorage
 from ..models.openapi import OpenAPISchema
 from ..valid import B58, NATURAL_NUM, INDY_SCHEMA_ID, INDY_VERSION
@@ -130,15 +131,23 @@ async def schemas_send_schema(request: web.BaseRequest):
         raise web.HTTPForbidden(reason=reason)
 
     issuer = context.inject(IndyIssuer)
-    async with ledger:
-        try:
+    write_queue = context.inject(LedgerWriteQueue, required=False)
+    try:
+        if write_queue:
             schema_id, schema_def = await shield(
-                ledger.create_and_send_schema(
+                await write_queue.create_and_send_schema(
                     issuer, schema_name, schema_version, attributes
                 )
             )
-        except (IndyIssuerError, LedgerError) as err:
-            raise web.HTTPBadRequest(reason=err.roll_up) from err
+        else:
+            async with ledger:
+                schema_id, schema_def = await shield(
+                    ledger.create_and_send_schema(
+                        issuer, schema_name, schema_version, attributes
+                    )
+                )
+    except (IndyIssuerError, LedgerError) as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
 
     return web.json_response({"schema_id": schema_id, "schema": schema_def})
 
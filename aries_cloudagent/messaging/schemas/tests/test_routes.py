@@ -4,6 +4,7 @@ from asynctest import mock as async_mock
 from ....admin.request_context import AdminRequestContext
 from ....indy.issuer import IndyIssuer
 from ....ledger.base import BaseLedger
+from ....ledger.write_queue import LedgerWriteQueue
 from ....storage.base import BaseStorage
 
 from .. import routes as test_module
@@ -62,6 +63,30 @@ class TestSchemaRoutes(AsyncTestCase):
                 {"schema_id": SCHEMA_ID, "schema": {"schema": "def"}}
             )
 
+    async def test_send_schema_write_queue(self):
+        self.request.json = async_mock.CoroutineMock(
+            return_value={
+                "schema_name": "schema_name",
+                "schema_version": "1.0",
+                "attributes": ["table", "drink", "colour"],
+            }
+        )
+        self.ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        self.ledger.wallet = async_mock.MagicMock(
+            get_public_did=async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(did="WgWxqztrNooG92RXvxSTWv")
+            )
+        )
+        write_queue = LedgerWriteQueue(self.ledger)
+        self.context.injector.bind_instance(LedgerWriteQueue, write_queue)
+
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await test_module.schemas_send_schema(self.request)
+            mock_response.assert_called_once_with(
+                {"schema_id": SCHEMA_ID, "schema": {"schema": "def"}}
+            )
+        assert write_queue.metrics()["latency"]["count"] == {"schema": 1}
+
     async def test_send_schema_no_ledger(self):
         self.request.json = async_mock.CoroutineMock(
             return_value={
@@ -2,12 +2,23 @@
 
 from marshmallow import fields, validate, validates_schema, ValidationError
 from aiohttp import web
-from aiohttp_apispec import docs, request_schema, match_info_schema, response_schema
+from aiohttp_apispec import (
+    docs,
+    request_schema,
+    match_info_schema,
+    querystring_schema,
+    response_schema,
+)
 
 from ...admin.request_context import AdminRequestContext
 from ...messaging.valid import JSONWebToken, UUIDFour
 from ...messaging.models.base import BaseModelError
 from ...messaging.models.openapi import OpenAPISchema
+from ...messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+)
 from ...storage.error import StorageError, StorageNotFoundError
 from ...wallet.models.wallet_record import WalletRecord, WalletRecordSchema
 from ...core.error import BaseError
@@ -154,7 +165,7 @@ class CreateWalletTokenResponseSchema(OpenAPISchema):
     )
 
 
-class WalletListSchema(OpenAPISchema):
+class WalletListSchema(PaginatedResultSchema):
     """Result schema for wallet list."""
 
     results = fields.List(
@@ -163,7 +174,12 @@ class WalletListSchema(OpenAPISchema):
     )
 
 
+class WalletListQueryStringSchema(PaginatedQuerySchema):
+    """Parameters and validators for wallet list request query string."""
+
+
 @docs(tags=["multitenancy"], summary="List all subwallets")
+@querystring_schema(WalletListQueryStringSchema())
 @response_schema(WalletListSchema(), 200, description="")
 async def wallets_list(request: web.BaseRequest):
     """
@@ -175,15 +191,24 @@ async def wallets_list(request: web.BaseRequest):
 
     context: AdminRequestContext = request["context"]
 
+    limit, cursor = get_paginated_query_params(request)
+
     async with context.session() as session:
         try:
-            records = await WalletRecord.query(session)
+            records, next_cursor = await WalletRecord.query_page(
+                session, limit=limit, cursor=cursor
+            )
             results = [format_wallet_record(record) for record in records]
-            results.sort(key=lambda w: w["created_at"])
+            if not (limit or cursor):
+                # pages keep storage order so that cursors remain stable
+                results.sort(key=lambda w: w["created_at"])
         except (StorageError, BaseModelError) as err:
             raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(tags=["multitenancy"], summary="Get a single subwallet")
@@ -82,8 +82,11 @@ class TestMultitenantRoutes(AsyncTestCase):
                     )
                 ),
             ]
-            mock_wallet_record.query = async_mock.CoroutineMock()
-            mock_wallet_record.query.return_value = [wallets[2], wallets[0], wallets[1]]
+            mock_wallet_record.query_page = async_mock.CoroutineMock()
+            mock_wallet_record.query_page.return_value = (
+                [wallets[2], wallets[0], wallets[1]],
+                None,
+            )
 
             await test_module.wallets_list(self.request)
             mock_response.assert_called_once_with(
@@ -94,13 +97,13 @@ class TestMultitenantRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "WalletRecord", autospec=True
         ) as mock_wallet_record:
-            mock_wallet_record.query = async_mock.CoroutineMock()
+            mock_wallet_record.query_page = async_mock.CoroutineMock()
 
-            mock_wallet_record.query.side_effect = StorageError()
+            mock_wallet_record.query_page.side_effect = StorageError()
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.wallets_list(self.request)
 
-            mock_wallet_record.query.side_effect = BaseModelError()
+            mock_wallet_record.query_page.side_effect = BaseModelError()
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.wallets_list(self.request)
 
@@ -17,6 +17,11 @@ from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord, ConnRecordSchema
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     ENDPOINT,
     INDY_DID,
@@ -38,7 +43,7 @@ class ConnectionModuleResponseSchema(OpenAPISchema):
     """Response schema for connection module."""
 
 
-class ConnectionListSchema(OpenAPISchema):
+class ConnectionListSchema(PaginatedResultSchema):
     """Result schema for connection list."""
 
     results = fields.List(
@@ -161,7 +166,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -327,17 +332,29 @@ async def connections_list(request: web.BaseRequest):
             v for v in ConnRecord.Role.get(request.query["their_role"]).value
         ]
 
+    limit, cursor = get_paginated_query_params(request)
+
     session = await context.session()
     try:
-        records = await ConnRecord.query(
-            session, tag_filter, post_filter_positive=post_filter, alt=True
+        records, next_cursor = await ConnRecord.query_page(
+            session,
+            tag_filter,
+            limit=limit,
+            cursor=cursor,
+            post_filter_positive=post_filter,
+            alt=True,
         )
         results = [record.serialize() for record in records]
-        results.sort(key=connection_sort_key)
+        if not (limit or cursor):
+            # pages keep storage order so that cursors remain stable
+            results.sort(key=connection_sort_key)
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(tags=["connection"], summary="Fetch a single connection record")
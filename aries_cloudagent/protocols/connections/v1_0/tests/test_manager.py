@@ -638,7 +638,7 @@ class TestConnectionManager(AsyncTestCase):
 
         self.context.update_settings({"public_invites": True})
         with async_mock.patch.object(
-            ConnRecord, "connection_id", autospec=True
+            ConnRecord, "connection_id", "dummy-connection-id"
         ), async_mock.patch.object(
             ConnRecord, "save", autospec=True
         ) as mock_conn_rec_save, async_mock.patch.object(
@@ -456,7 +456,7 @@ class MediationManager:
 
         """
         to_save: Sequence[RouteRecord] = []
-        to_remove: Sequence[RouteRecord] = []
+        to_remove_keys: Sequence[str] = []
         for updated in results:
             if updated.result != KeylistUpdated.RESULT_SUCCESS:
                 # TODO better handle different results?
@@ -475,35 +475,40 @@ class MediationManager:
                 )
                 to_save.append(record)
             elif updated.action == KeylistUpdateRule.RULE_REMOVE:
-                try:
-                    records = await RouteRecord.query(
-                        self.session,
-                        {
-                            "role": RouteRecord.ROLE_CLIENT,
-                            "connection_id": connection_id,
-                            "recipient_key": updated.recipient_key,
-                        },
-                    )
-                except StorageNotFoundError as err:
-                    LOGGER.error(
-                        "No route found while processing keylist update response: %s",
-                        err,
-                    )
-                else:
-                    if len(records) > 1:
+                to_remove_keys.append(updated.recipient_key)
+
+        to_remove: Sequence[RouteRecord] = []
+        if to_remove_keys:
+            try:
+                records = await RouteRecord.query(
+                    self.session,
+                    {
+                        "role": RouteRecord.ROLE_CLIENT,
+                        "connection_id": connection_id,
+                        "recipient_key": {"$in": to_remove_keys},
+                    },
+                )
+            except StorageNotFoundError as err:
+                LOGGER.error(
+                    "No route found while processing keylist update response: %s",
+                    err,
+                )
+            else:
+                by_key = {}
+                for record in records:
+                    by_key.setdefault(record.recipient_key, []).append(record)
+                for recipient_key, found in by_key.items():
+                    if len(found) > 1:
                         LOGGER.error(
-                            f"Too many ({len(records)}) routes found "
+                            f"Too many ({len(found)}) routes found "
                             "while processing keylist update response"
                         )
-                    record = records[0]
-                    to_remove.append(record)
+                    to_remove.append(found[0])
 
-        for record_for_saving in to_save:
-            await record_for_saving.save(
-                self.session, reason="Route successfully added."
-            )
-        for record_for_removal in to_remove:
-            await record_for_removal.delete_record(self.session)
+        await RouteRecord.save_records(
+            self.session, to_save, reason="Route successfully added."
+        )
+        await RouteRecord.delete_records(self.session, to_remove)
 
     async def get_my_keylist(
         self, connection_id: Optional[str] = None
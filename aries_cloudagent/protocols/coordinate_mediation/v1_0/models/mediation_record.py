@@ -20,6 +20,7 @@ class MediationRecord(BaseRecord):
 
     RECORD_TYPE = "mediation_requests"
     RECORD_ID_NAME = "mediation_id"
+    RECORD_CACHE_SIZE = 1000
     TAG_NAMES = {"state", "role", "connection_id"}
 
     STATE_REQUEST = "request"
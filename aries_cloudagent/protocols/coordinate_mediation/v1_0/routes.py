@@ -16,6 +16,11 @@ from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import UUIDFour
 from ....storage.error import StorageError, StorageNotFoundError
 from ...connections.v1_0.routes import ConnIdMatchInfoSchema
@@ -80,7 +85,7 @@ RECIPIENT_TERMS_SCHEMA = fields.List(
 )
 
 
-class MediationListSchema(OpenAPISchema):
+class MediationListSchema(PaginatedResultSchema):
     """Result schema for mediation list query."""
 
     results = fields.List(
@@ -89,7 +94,7 @@ class MediationListSchema(OpenAPISchema):
     )
 
 
-class MediationListQueryStringSchema(OpenAPISchema):
+class MediationListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for mediation record list request query string."""
 
     conn_id = CONNECTION_ID_SCHEMA
@@ -118,7 +123,7 @@ class MediationIdMatchInfoSchema(OpenAPISchema):
     mediation_id = MEDIATION_ID_SCHEMA
 
 
-class GetKeylistQuerySchema(OpenAPISchema):
+class GetKeylistQuerySchema(PaginatedQuerySchema):
     """Get keylist query string paramaters."""
 
     conn_id = CONNECTION_ID_SCHEMA
@@ -134,7 +139,7 @@ class GetKeylistQuerySchema(OpenAPISchema):
     )
 
 
-class KeylistSchema(OpenAPISchema):
+class KeylistSchema(PaginatedResultSchema):
     """Result schema for mediation list query."""
 
     results = fields.List(
@@ -195,14 +200,26 @@ async def list_mediation_requests(request: web.BaseRequest):
     if state:
         tag_filter["state"] = state
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
         session = await context.session()
-        records = await MediationRecord.query(session, tag_filter)
+        records, next_cursor = await MediationRecord.query_page(
+            session, tag_filter, limit=limit, cursor=cursor
+        )
         results = [record.serialize() for record in records]
-        results.sort(key=mediation_sort_key)
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
-    return web.json_response(results)
+
+    if not (limit or cursor):
+        # unpaginated calls keep the original bare-list response
+        results.sort(key=mediation_sort_key)
+        return web.json_response(results)
+    # paginated responses keep storage order so that cursors remain stable
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(tags=["mediation"], summary="Retrieve mediation request record")
@@ -374,13 +391,24 @@ async def get_keylist(request: web.BaseRequest):
     if role:
         tag_filter["role"] = role
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
         session = await context.session()
-        keylists = await RouteRecord.query(session, tag_filter)
+        keylists, next_cursor = await RouteRecord.query_page(
+            session, tag_filter, limit=limit, cursor=cursor
+        )
         results = [record.serialize() for record in keylists]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
-    return web.json_response(results, status=200)
+
+    if not (limit or cursor):
+        # unpaginated calls keep the original bare-list response
+        return web.json_response(results, status=200)
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response, status=200)
 
 
 @docs(
@@ -394,14 +394,19 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
         with async_mock.patch.object(
             RouteRecord, "query", async_mock.CoroutineMock()
         ) as mock_route_rec_query, async_mock.patch.object(
+            RouteRecord, "delete_records", async_mock.CoroutineMock()
+        ) as mock_route_rec_delete, async_mock.patch.object(
             test_module.LOGGER, "error", async_mock.MagicMock()
         ) as mock_logger_error:
             mock_route_rec_query.return_value = [
-                async_mock.MagicMock(delete_record=async_mock.CoroutineMock())
+                async_mock.MagicMock(recipient_key=TEST_VERKEY)
             ] * 2
 
             await manager.store_update_results(TEST_CONN_ID, results)
             mock_logger_error.assert_called_once()
+            mock_route_rec_delete.assert_awaited_once_with(
+                session, mock_route_rec_query.return_value[:1]
+            )
 
     async def test_store_update_results_errors(self, caplog, manager):
         """test_store_update_results with errors."""
@@ -73,8 +73,8 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
         self.context.session = async_mock.CoroutineMock()
         with async_mock.patch.object(
             test_module.MediationRecord,
-            "query",
-            async_mock.CoroutineMock(return_value=[self.mock_record]),
+            "query_page",
+            async_mock.CoroutineMock(return_value=([self.mock_record], None)),
         ) as mock_query, async_mock.patch.object(
             test_module.web, "json_response"
         ) as json_response:
@@ -82,7 +82,9 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
             json_response.assert_called_once_with(
                 [self.mock_record.serialize.return_value]
             )
-            mock_query.assert_called_once_with(self.context.session.return_value, {})
+            mock_query.assert_called_once_with(
+                self.context.session.return_value, {}, limit=None, cursor=None
+            )
 
     async def test_list_mediation_requests_filters(self):
         self.request.query = {
@@ -92,8 +94,8 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
         self.context.session = async_mock.CoroutineMock()
         with async_mock.patch.object(
             test_module.MediationRecord,
-            "query",
-            async_mock.CoroutineMock(return_value=[self.mock_record]),
+            "query_page",
+            async_mock.CoroutineMock(return_value=([self.mock_record], None)),
         ) as mock_query, async_mock.patch.object(
             test_module.web, "json_response"
         ) as json_response:
@@ -107,6 +109,29 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
                     "connection_id": "test-conn-id",
                     "state": MediationRecord.STATE_GRANTED,
                 },
+                limit=None,
+                cursor=None,
+            )
+
+    async def test_list_mediation_requests_paginated(self):
+        self.request.query = {"limit": "1"}
+        self.context.session = async_mock.CoroutineMock()
+        with async_mock.patch.object(
+            test_module.MediationRecord,
+            "query_page",
+            async_mock.CoroutineMock(return_value=([self.mock_record], "next-cursor")),
+        ) as mock_query, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as json_response:
+            await test_module.list_mediation_requests(self.request)
+            json_response.assert_called_once_with(
+                {
+                    "results": [self.mock_record.serialize.return_value],
+                    "next_cursor": "next-cursor",
+                }
+            )
+            mock_query.assert_called_once_with(
+                self.context.session.return_value, {}, limit=1, cursor=None
             )
 
     async def test_list_mediation_requests_x(self):
@@ -114,7 +139,9 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
             test_module,
             "MediationRecord",
             async_mock.MagicMock(
-                query=async_mock.CoroutineMock(side_effect=test_module.StorageError())
+                query_page=async_mock.CoroutineMock(
+                    side_effect=test_module.StorageError()
+                )
             ),
         ) as mock_med_rec:
             with self.assertRaises(test_module.web.HTTPBadRequest):
@@ -124,7 +151,9 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module,
             "MediationRecord",
-            async_mock.MagicMock(query=async_mock.CoroutineMock(return_value=[])),
+            async_mock.MagicMock(
+                query_page=async_mock.CoroutineMock(return_value=([], None))
+            ),
         ) as mock_med_rec, async_mock.patch.object(
             test_module.web, "json_response"
         ) as mock_response:
@@ -401,8 +430,8 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
 
         with async_mock.patch.object(
             test_module.RouteRecord,
-            "query",
-            async_mock.CoroutineMock(return_value=query_results),
+            "query_page",
+            async_mock.CoroutineMock(return_value=(query_results, None)),
         ) as mock_query, async_mock.patch.object(
             self.context, "session", async_mock.CoroutineMock()
         ) as mock_session, async_mock.patch.object(
@@ -415,26 +444,49 @@ class TestCoordinateMediationRoutes(AsyncTestCase):
             mock_query.assert_called_once_with(
                 mock_session.return_value,
                 {"role": MediationRecord.ROLE_SERVER, "connection_id": "test-id"},
+                limit=None,
+                cursor=None,
             )
 
     async def test_get_keylist_no_matching_records(self):
         with async_mock.patch.object(
             test_module.RouteRecord,
-            "query",
-            async_mock.CoroutineMock(return_value=[]),
+            "query_page",
+            async_mock.CoroutineMock(return_value=([], None)),
         ) as mock_query, async_mock.patch.object(
             self.context, "session", async_mock.CoroutineMock()
         ) as mock_session, async_mock.patch.object(
             test_module.web, "json_response"
         ) as mock_response:
             await test_module.get_keylist(self.request)
-            mock_query.assert_called_once_with(mock_session.return_value, {})
+            mock_query.assert_called_once_with(
+                mock_session.return_value, {}, limit=None, cursor=None
+            )
             mock_response.assert_called_once_with([], status=200)
 
+    async def test_get_keylist_paginated(self):
+        self.request.query = {"limit": "1", "cursor": "prev-cursor"}
+        with async_mock.patch.object(
+            test_module.RouteRecord,
+            "query_page",
+            async_mock.CoroutineMock(return_value=([], "next-cursor")),
+        ) as mock_query, async_mock.patch.object(
+            self.context, "session", async_mock.CoroutineMock()
+        ) as mock_session, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            await test_module.get_keylist(self.request)
+            mock_query.assert_called_once_with(
+                mock_session.return_value, {}, limit=1, cursor="prev-cursor"
+            )
+            mock_response.assert_called_once_with(
+                {"results": [], "next_cursor": "next-cursor"}, status=200
+            )
+
     async def test_get_keylist_storage_error(self):
         with async_mock.patch.object(
             test_module.RouteRecord,
-            "query",
+            "query_page",
             async_mock.CoroutineMock(side_effect=test_module.StorageError),
         ) as mock_query, self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.get_keylist(self.request)
@@ -19,6 +19,8 @@ from ....messaging.credential_definitions.util import (
 from ....revocation.indy import IndyRevocation
 from ....revocation.models.revocation_registry import RevocationRegistry
 from ....revocation.models.issuer_rev_reg_record import IssuerRevRegRecord
+from ....revocation.provisioner import RevRegProvisioner
+from ....tails.cache import TailsCache
 from ....storage.base import BaseStorage
 from ....storage.error import StorageNotFoundError
 
@@ -347,6 +349,10 @@ class CredentialManager:
 
             await cred_ex_record.save(session, reason="receive credential offer")
 
+        tails_cache = self._profile.inject(TailsCache, required=False)
+        if tails_cache and tails_cache.prefetch:
+            tails_cache.prefetch_for_offer(self._profile, cred_def_id)
+
         return cred_ex_record
 
     async def create_request(
@@ -509,14 +515,13 @@ class CredentialManager:
                 )
 
             tails_path = None
+            provisioner = self._profile.inject(RevRegProvisioner, required=False)
             if credential_definition["value"].get("revocation"):
                 async with self._profile.session() as session:
                     revoc = IndyRevocation(session)
                     try:
-                        active_rev_reg_rec = (
-                            await revoc.get_active_issuer_rev_reg_record(
-                                cred_ex_record.credential_definition_id
-                            )
+                        active_rev_reg_rec = await revoc.get_issuance_rev_reg_record(
+                            cred_ex_record.credential_definition_id
                         )
                         rev_reg = await active_rev_reg_rec.get_registry()
                         cred_ex_record.revoc_reg_id = active_rev_reg_rec.revoc_reg_id
@@ -532,7 +537,12 @@ class CredentialManager:
                                 state=IssuerRevRegRecord.STATE_POSTED,
                             )
                         )
-                        if not posted_rev_reg_recs:
+                        if provisioner:
+                            # Stage rev regs in background, if not underway already
+                            provisioner.top_up(
+                                self._profile, cred_ex_record.credential_definition_id
+                            )
+                        elif not posted_rev_reg_recs:
                             # Send next 2 rev regs, publish tails files in background
                             old_rev_reg_recs = sorted(
                                 await IssuerRevRegRecord.query_by_cred_def_id(
@@ -599,18 +609,26 @@ class CredentialManager:
                             IssuerRevRegRecord.STATE_FULL,
                         )
 
-                        # Send next 1 rev reg, publish tails file in background
-                        revoc = IndyRevocation(session)
-                        pending_rev_reg_rec = await revoc.init_issuer_registry(
-                            active_rev_reg_rec.cred_def_id,
-                            max_cred_num=active_rev_reg_rec.max_cred_num,
-                        )
-                        asyncio.ensure_future(
-                            pending_rev_reg_rec.stage_pending_registry(
-                                session,
-                                max_attempts=16,
+                        if provisioner:
+                            # A spare takes over: stage its replacement in background
+                            provisioner.top_up(
+                                self._profile,
+                                active_rev_reg_rec.cred_def_id,
+                                max_cred_num=active_rev_reg_rec.max_cred_num,
+                            )
+                        else:
+                            # Send next 1 rev reg, publish tails file in background
+                            revoc = IndyRevocation(session)
+                            pending_rev_reg_rec = await revoc.init_issuer_registry(
+                                active_rev_reg_rec.cred_def_id,
+                                max_cred_num=active_rev_reg_rec.max_cred_num,
+                            )
+                            asyncio.ensure_future(
+                                pending_rev_reg_rec.stage_pending_registry(
+                                    session,
+                                    max_attempts=16,
+                                )
                             )
-                        )
 
             except IndyIssuerRevocationRegistryFullError:
                 # unlucky: duelling instance issued last cred near same time as us
@@ -620,13 +638,26 @@ class CredentialManager:
                         IssuerRevRegRecord.STATE_FULL,
                     )
 
+                if provisioner:
+                    provisioner.top_up(
+                        self._profile,
+                        active_rev_reg_rec.cred_def_id,
+                        max_cred_num=active_rev_reg_rec.max_cred_num,
+                    )
+
                 if retries > 0:
                     # use next rev reg; at worst, lucky instance is putting one up
-                    LOGGER.info(
-                        "Waiting 1s and retrying: revocation registry %s is full",
-                        active_rev_reg_rec.revoc_reg_id,
-                    )
-                    await asyncio.sleep(1)
+                    if provisioner:
+                        LOGGER.info(
+                            "Retrying on spare: revocation registry %s is full",
+                            active_rev_reg_rec.revoc_reg_id,
+                        )
+                    else:
+                        LOGGER.info(
+                            "Waiting 1s and retrying: revocation registry %s is full",
+                            active_rev_reg_rec.revoc_reg_id,
+                        )
+                        await asyncio.sleep(1)
                     return await self.issue_credential(
                         cred_ex_record=cred_ex_record,
                         comment=comment,
@@ -736,7 +767,11 @@ class CredentialManager:
 
         if revoc_reg_def:
             revoc_reg = RevocationRegistry.from_definition(revoc_reg_def, True)
-            await revoc_reg.get_or_fetch_local_tails_path()
+            tails_cache = self._profile.inject(TailsCache, required=False)
+            if tails_cache:
+                await tails_cache.get_tails_path(revoc_reg)
+            else:
+                await revoc_reg.get_or_fetch_local_tails_path()
         try:
             credential_id = await holder.store_credential(
                 credential_definition,
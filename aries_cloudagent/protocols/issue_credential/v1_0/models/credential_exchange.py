@@ -22,6 +22,7 @@ class V10CredentialExchange(BaseExchangeRecord):
 
     RECORD_TYPE = "credential_exchange_v10"
     RECORD_ID_NAME = "credential_exchange_id"
+    RECORD_CACHE_SIZE = 1000
     WEBHOOK_TOPIC = "issue_credential"
     TAG_NAMES = {"~thread_id"} if unencrypted_tags else {"thread_id"}
 
@@ -18,6 +18,11 @@ from ....indy.issuer import IndyIssuerError
 from ....ledger.error import LedgerError
 from ....messaging.credential_definitions.util import CRED_DEF_TAGS
 from ....messaging.models.base import BaseModelError, OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_CRED_REV_ID,
@@ -56,7 +61,7 @@ class IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for Issue Credential Module."""
 
 
-class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
+class V10CredentialExchangeListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange list query."""
 
     connection_id = fields.UUID(
@@ -93,7 +98,7 @@ class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
     )
 
 
-class V10CredentialExchangeListResultSchema(OpenAPISchema):
+class V10CredentialExchangeListResultSchema(PaginatedResultSchema):
     """Result schema for Aries#0036 v1.0 credential exchange query."""
 
     results = fields.List(
@@ -355,18 +360,25 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
         async with context.session() as session:
-            records = await V10CredentialExchange.query(
+            records, next_cursor = await V10CredentialExchange.query_page(
                 session=session,
                 tag_filter=tag_filter,
+                limit=limit,
+                cursor=cursor,
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(tags=["issue-credential"], summary="Fetch a single credential exchange record")
@@ -13,6 +13,8 @@ from .....indy.holder import IndyHolder
 from .....indy.issuer import IndyIssuer
 from .....messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
 from .....ledger.base import BaseLedger
+from .....revocation.provisioner import RevRegProvisioner
+from .....tails.cache import TailsCache
 from .....storage.base import StorageRecord
 from .....storage.error import StorageNotFoundError
 
@@ -594,6 +596,29 @@ class TestCredentialManager(AsyncTestCase):
             proposal = CredentialProposal.deserialize(exchange.credential_proposal_dict)
             assert proposal.credential_proposal.attributes == preview.attributes
 
+    async def test_receive_offer_prefetch_tails(self):
+        indy_offer = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID}
+        offer = CredentialOffer(
+            credential_preview=CredentialPreview(
+                attributes=(CredAttrSpec(name="legalName", value="value"),)
+            ),
+            offers_attach=[CredentialOffer.wrap_indy_offer(indy_offer)],
+        )
+        tails_cache = async_mock.MagicMock(TailsCache, autospec=True, prefetch=True)
+        self.context.injector.bind_instance(TailsCache, tails_cache)
+
+        with async_mock.patch.object(
+            V10CredentialExchange, "save", autospec=True
+        ), async_mock.patch.object(
+            V10CredentialExchange,
+            "retrieve_by_connection_and_thread",
+            async_mock.CoroutineMock(side_effect=StorageNotFoundError()),
+        ):
+            await self.manager.receive_offer(offer, "test_conn_id")
+            tails_cache.prefetch_for_offer.assert_called_once_with(
+                self.profile, CRED_DEF_ID
+            )
+
     async def test_receive_free_offer(self):
         connection_id = "test_conn_id"
         indy_offer = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID}
@@ -871,7 +896,7 @@ class TestCredentialManager(AsyncTestCase):
         ) as asyncio_mock, async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
         ) as save_ex:
-            revoc.return_value.get_active_issuer_rev_reg_record = async_mock.CoroutineMock(
+            revoc.return_value.get_issuance_rev_reg_record = async_mock.CoroutineMock(
                 return_value=async_mock.MagicMock(  # active_rev_reg_rec
                     revoc_reg_id=REV_REG_ID,
                     get_registry=async_mock.CoroutineMock(
@@ -1028,7 +1053,7 @@ class TestCredentialManager(AsyncTestCase):
             V10CredentialExchange, "save", autospec=True
         ) as save_ex:
             revoc.return_value = async_mock.MagicMock(
-                get_active_issuer_rev_reg_record=(
+                get_issuance_rev_reg_record=(
                     async_mock.CoroutineMock(
                         return_value=async_mock.MagicMock(  # active_rev_reg_rec
                             revoc_reg_id=REV_REG_ID,
@@ -1072,6 +1097,67 @@ class TestCredentialManager(AsyncTestCase):
             assert ret_exchange.state == V10CredentialExchange.STATE_ISSUED
             assert ret_cred_issue._thread_id == thread_id
 
+    async def test_issue_credential_fills_rr_provisioner(self):
+        indy_offer = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID, "nonce": "0"}
+        indy_cred_req = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID}
+
+        stored_exchange = V10CredentialExchange(
+            credential_exchange_id="dummy-cxid",
+            connection_id="test_conn_id",
+            credential_definition_id=CRED_DEF_ID,
+            credential_offer=indy_offer,
+            credential_request=indy_cred_req,
+            credential_proposal_dict=CredentialProposal(
+                credential_proposal=CredentialPreview.deserialize(
+                    {"attributes": [{"name": "attr", "value": "value"}]}
+                ),
+                cred_def_id=CRED_DEF_ID,
+                schema_id=SCHEMA_ID,
+            ).serialize(),
+            initiator=V10CredentialExchange.INITIATOR_SELF,
+            role=V10CredentialExchange.ROLE_ISSUER,
+            state=V10CredentialExchange.STATE_REQUEST_RECEIVED,
+            thread_id="thread-id",
+        )
+
+        issuer = async_mock.MagicMock()
+        cred = {"indy": "credential"}
+        issuer.create_credential = async_mock.CoroutineMock(
+            return_value=(json.dumps(cred), "1000")
+        )
+        self.context.injector.bind_instance(IndyIssuer, issuer)
+        provisioner = async_mock.MagicMock(RevRegProvisioner, autospec=True)
+        self.context.injector.bind_instance(RevRegProvisioner, provisioner)
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as revoc, async_mock.patch.object(
+            V10CredentialExchange, "save", autospec=True
+        ):
+            revoc.return_value.get_issuance_rev_reg_record = async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(  # active_rev_reg_rec
+                    revoc_reg_id=REV_REG_ID,
+                    cred_def_id=CRED_DEF_ID,
+                    max_cred_num=1000,
+                    get_registry=async_mock.CoroutineMock(
+                        return_value=async_mock.MagicMock(  # rev_reg
+                            tails_local_path="dummy-path",
+                            max_creds=1000,
+                            get_or_fetch_local_tails_path=(async_mock.CoroutineMock()),
+                        )
+                    ),
+                    set_state=async_mock.CoroutineMock(),
+                )
+            )
+            (ret_exchange, _) = await self.manager.issue_credential(
+                stored_exchange, retries=0
+            )
+            assert ret_exchange.credential == cred
+            revoc.return_value.init_issuer_registry.assert_not_called()
+            provisioner.top_up.assert_called_once_with(
+                self.profile, CRED_DEF_ID, max_cred_num=1000
+            )
+
     async def test_issue_credential_request_bad_state(self):
         connection_id = "test_conn_id"
         indy_offer = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID}
@@ -1134,8 +1220,8 @@ class TestCredentialManager(AsyncTestCase):
         ) as revoc, async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
         ) as save_ex:
-            revoc.return_value.get_active_issuer_rev_reg_record = (
-                async_mock.CoroutineMock(side_effect=test_module.StorageNotFoundError())
+            revoc.return_value.get_issuance_rev_reg_record = async_mock.CoroutineMock(
+                side_effect=test_module.StorageNotFoundError()
             )
             revoc.return_value.init_issuer_registry = async_mock.CoroutineMock(
                 return_value=async_mock.MagicMock(  # pending_rev_reg_rec
@@ -1193,8 +1279,8 @@ class TestCredentialManager(AsyncTestCase):
         ) as revoc, async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
         ) as save_ex:
-            revoc.return_value.get_active_issuer_rev_reg_record = (
-                async_mock.CoroutineMock(side_effect=test_module.StorageNotFoundError())
+            revoc.return_value.get_issuance_rev_reg_record = async_mock.CoroutineMock(
+                side_effect=test_module.StorageNotFoundError()
             )
             issuer_rr_rec.query_by_cred_def_id = async_mock.CoroutineMock(
                 side_effect=[
@@ -1251,20 +1337,16 @@ class TestCredentialManager(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "IndyRevocation", autospec=True
         ) as revoc:
-            revoc.return_value.get_active_issuer_rev_reg_record = (
-                async_mock.CoroutineMock(
-                    return_value=async_mock.MagicMock(  # active_rev_reg_rec
-                        revoc_reg_id=REV_REG_ID,
-                        set_state=async_mock.CoroutineMock(),
-                        get_registry=async_mock.CoroutineMock(
-                            return_value=async_mock.MagicMock(  # rev_reg
-                                tails_local_path="dummy-path",
-                                get_or_fetch_local_tails_path=(
-                                    async_mock.CoroutineMock()
-                                ),
-                            )
-                        ),
-                    )
+            revoc.return_value.get_issuance_rev_reg_record = async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(  # active_rev_reg_rec
+                    revoc_reg_id=REV_REG_ID,
+                    set_state=async_mock.CoroutineMock(),
+                    get_registry=async_mock.CoroutineMock(
+                        return_value=async_mock.MagicMock(  # rev_reg
+                            tails_local_path="dummy-path",
+                            get_or_fetch_local_tails_path=(async_mock.CoroutineMock()),
+                        )
+                    ),
                 )
             )
 
@@ -1273,6 +1355,73 @@ class TestCredentialManager(AsyncTestCase):
                     stored_exchange, comment=comment, retries=1
                 )
 
+    async def test_issue_credential_rr_full_provisioner(self):
+        indy_offer = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID, "nonce": "0"}
+        indy_cred_req = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID}
+
+        stored_exchange = V10CredentialExchange(
+            credential_exchange_id="dummy-cxid",
+            connection_id="test_conn_id",
+            credential_definition_id=CRED_DEF_ID,
+            credential_offer=indy_offer,
+            credential_request=indy_cred_req,
+            credential_proposal_dict=CredentialProposal(
+                credential_proposal=CredentialPreview.deserialize(
+                    {"attributes": [{"name": "attr", "value": "value"}]}
+                ),
+                cred_def_id=CRED_DEF_ID,
+                schema_id=SCHEMA_ID,
+            ).serialize(),
+            initiator=V10CredentialExchange.INITIATOR_SELF,
+            role=V10CredentialExchange.ROLE_ISSUER,
+            state=V10CredentialExchange.STATE_REQUEST_RECEIVED,
+            thread_id="thread-id",
+        )
+
+        issuer = async_mock.MagicMock()
+        cred = {"indy": "credential"}
+        issuer.create_credential = async_mock.CoroutineMock(
+            side_effect=[
+                test_module.IndyIssuerRevocationRegistryFullError("Nope"),
+                (json.dumps(cred), "1"),
+            ]
+        )
+        self.context.injector.bind_instance(IndyIssuer, issuer)
+        provisioner = async_mock.MagicMock(RevRegProvisioner, autospec=True)
+        self.context.injector.bind_instance(RevRegProvisioner, provisioner)
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as revoc, async_mock.patch.object(
+            V10CredentialExchange, "save", autospec=True
+        ), async_mock.patch.object(
+            asyncio, "sleep", async_mock.CoroutineMock()
+        ) as mock_sleep:
+            revoc.return_value.get_issuance_rev_reg_record = async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(  # active_rev_reg_rec
+                    revoc_reg_id=REV_REG_ID,
+                    cred_def_id=CRED_DEF_ID,
+                    max_cred_num=1000,
+                    set_state=async_mock.CoroutineMock(),
+                    get_registry=async_mock.CoroutineMock(
+                        return_value=async_mock.MagicMock(  # rev_reg
+                            tails_local_path="dummy-path",
+                            max_creds=1000,
+                            get_or_fetch_local_tails_path=(async_mock.CoroutineMock()),
+                        )
+                    ),
+                )
+            )
+
+            (ret_exchange, _) = await self.manager.issue_credential(
+                stored_exchange, retries=1
+            )
+            assert ret_exchange.credential == cred
+            mock_sleep.assert_not_called()
+            provisioner.top_up.assert_called_once_with(
+                self.profile, CRED_DEF_ID, max_cred_num=1000
+            )
+
     async def test_receive_credential(self):
         connection_id = "test_conn_id"
         indy_cred = {"indy": "credential"}
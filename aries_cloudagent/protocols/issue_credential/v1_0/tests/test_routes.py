@@ -33,8 +33,8 @@ class TestCredentialRoutes(AsyncTestCase):
         with async_mock.patch.object(
             test_module, "V10CredentialExchange", autospec=True
         ) as mock_cred_ex:
-            mock_cred_ex.query = async_mock.CoroutineMock()
-            mock_cred_ex.query.return_value = [mock_cred_ex]
+            mock_cred_ex.query_page = async_mock.CoroutineMock()
+            mock_cred_ex.query_page.return_value = ([mock_cred_ex], None)
             mock_cred_ex.serialize = async_mock.MagicMock()
             mock_cred_ex.serialize.return_value = {"hello": "world"}
 
@@ -46,6 +46,30 @@ class TestCredentialRoutes(AsyncTestCase):
                     {"results": [mock_cred_ex.serialize.return_value]}
                 )
 
+    async def test_credential_exchange_list_paginated(self):
+        self.request.query = {"limit": "10"}
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex:
+            mock_cred_ex.query_page = async_mock.CoroutineMock()
+            mock_cred_ex.query_page.return_value = ([mock_cred_ex], "next-cursor")
+            mock_cred_ex.serialize = async_mock.MagicMock()
+            mock_cred_ex.serialize.return_value = {"hello": "world"}
+
+            with async_mock.patch.object(
+                test_module.web, "json_response"
+            ) as mock_response:
+                await test_module.credential_exchange_list(self.request)
+                assert mock_cred_ex.query_page.call_args[1]["limit"] == 10
+                assert mock_cred_ex.query_page.call_args[1]["cursor"] is None
+                mock_response.assert_called_once_with(
+                    {
+                        "results": [mock_cred_ex.serialize.return_value],
+                        "next_cursor": "next-cursor",
+                    }
+                )
+
     async def test_credential_exchange_list_x(self):
         self.request.query = {
             "thread_id": "dummy",
@@ -59,7 +83,7 @@ class TestCredentialRoutes(AsyncTestCase):
         ) as mock_cred_ex:
             mock_cred_ex.connection_id = "conn-123"
             mock_cred_ex.thread_id = "conn-123"
-            mock_cred_ex.query = async_mock.CoroutineMock(
+            mock_cred_ex.query_page = async_mock.CoroutineMock(
                 side_effect=test_module.StorageError()
             )
             with self.assertRaises(test_module.web.HTTPBadRequest):
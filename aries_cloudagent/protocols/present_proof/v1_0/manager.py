@@ -1,5 +1,6 @@
 """Classes to manage presentations."""
 
+import asyncio
 import json
 import logging
 import time
@@ -10,9 +11,11 @@ from ....core.profile import ProfileSession
 from ....indy.holder import IndyHolder, IndyHolderError
 from ....indy.verifier import IndyVerifier
 from ....ledger.base import BaseLedger
+from ....ledger.util import fetch_concurrently
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.responder import BaseResponder
 from ....revocation.models.revocation_registry import RevocationRegistry
+from ....tails.cache import TailsCache, TailsFileUse
 
 from .models.presentation_exchange import V10PresentationExchange
 from .messages.presentation_ack import PresentationAck
@@ -224,6 +227,12 @@ class PresentationManager:
             self._session, reason="receive presentation request"
         )
 
+        tails_cache = self._session.inject(TailsCache, required=False)
+        if tails_cache and tails_cache.prefetch:
+            tails_cache.prefetch_for_proof_request(
+                self._session.profile, presentation_exchange_record.presentation_request
+            )
+
         return presentation_exchange_record
 
     async def create_presentation(
@@ -280,6 +289,8 @@ class PresentationManager:
         req_attrs = presentation_request.get("requested_attributes", {})
         for reft in attr_creds:
             requested_referents[reft] = {"cred_id": attr_creds[reft]["cred_id"]}
+            if "timestamp" in attr_creds[reft]:  # supplied by the caller
+                requested_referents[reft]["timestamp"] = attr_creds[reft]["timestamp"]
             if reft in req_attrs and reft in non_revoc_intervals:
                 requested_referents[reft]["non_revoked"] = non_revoc_intervals[reft]
 
@@ -287,6 +298,8 @@ class PresentationManager:
         req_preds = presentation_request.get("requested_predicates", {})
         for reft in preds_creds:
             requested_referents[reft] = {"cred_id": preds_creds[reft]["cred_id"]}
+            if "timestamp" in preds_creds[reft]:  # supplied by the caller
+                requested_referents[reft]["timestamp"] = preds_creds[reft]["timestamp"]
             if reft in req_preds and reft in non_revoc_intervals:
                 requested_referents[reft]["non_revoked"] = non_revoc_intervals[reft]
             """
@@ -304,33 +317,6 @@ class PresentationManager:
                     await holder.get_credential(credential_id)
                 )
 
-        # Get all schemas, credential definitions, and revocation registries in use
-        ledger = self._session.inject(BaseLedger)
-        schemas = {}
-        credential_definitions = {}
-        revocation_registries = {}
-
-        async with ledger:
-            for credential in credentials.values():
-                schema_id = credential["schema_id"]
-                if schema_id not in schemas:
-                    schemas[schema_id] = await ledger.get_schema(schema_id)
-
-                credential_definition_id = credential["cred_def_id"]
-                if credential_definition_id not in credential_definitions:
-                    credential_definitions[
-                        credential_definition_id
-                    ] = await ledger.get_credential_definition(credential_definition_id)
-
-                if credential.get("rev_reg_id"):
-                    revocation_registry_id = credential["rev_reg_id"]
-                    if revocation_registry_id not in revocation_registries:
-                        revocation_registries[
-                            revocation_registry_id
-                        ] = RevocationRegistry.from_definition(
-                            await ledger.get_revoc_reg_def(revocation_registry_id), True
-                        )
-
         # Get delta with non-revocation interval defined in "non_revoked"
         # of the presentation request or attributes
         epoch_now = int(time.time())
@@ -342,66 +328,65 @@ class PresentationManager:
         )
         """
 
-        revoc_reg_deltas = {}
-        async with ledger:
-            for precis in requested_referents.values():  # cred_id, non-revoc interval
-                credential_id = precis["cred_id"]
-                if not credentials[credential_id].get("rev_reg_id"):
-                    continue
-                if "timestamp" in precis:
-                    continue
-                rev_reg_id = credentials[credential_id]["rev_reg_id"]
-                reft_non_revoc_interval = precis.get("non_revoked")
-                if reft_non_revoc_interval:
-                    key = (
-                        f"{rev_reg_id}_"
-                        f"{reft_non_revoc_interval.get('from', 0)}_"
-                        f"{reft_non_revoc_interval.get('to', epoch_now)}"
-                    )
-                    if key not in revoc_reg_deltas:
-                        (delta, delta_timestamp) = await ledger.get_revoc_reg_delta(
-                            rev_reg_id,
-                            reft_non_revoc_interval.get("from", 0),
-                            reft_non_revoc_interval.get("to", epoch_now),
-                        )
-                        revoc_reg_deltas[key] = (
-                            rev_reg_id,
-                            credential_id,
-                            delta,
-                            delta_timestamp,
-                        )
-                    for stamp_me in requested_referents.values():
-                        # often one cred satisfies many requested attrs/preds
-                        if stamp_me["cred_id"] == credential_id:
-                            stamp_me["timestamp"] = revoc_reg_deltas[key][3]
-
-                """
-                referent_non_revoc_interval = precis.get(
-                    "non_revoked", non_revoc_interval
+        # Collect the revocation registry deltas in use: often one cred satisfies
+        # many requested attrs/preds, and the first referent's interval applies
+        delta_keys = {}  # credential id -> (rev reg id, from, to)
+        for precis in requested_referents.values():  # cred_id, non-revoc interval
+            credential_id = precis["cred_id"]
+            rev_reg_id = credentials[credential_id].get("rev_reg_id")
+            if not rev_reg_id or credential_id in delta_keys:
+                continue
+            if "timestamp" in precis:
+                continue
+            reft_non_revoc_interval = precis.get("non_revoked")
+            if reft_non_revoc_interval:
+                delta_keys[credential_id] = (
+                    rev_reg_id,
+                    reft_non_revoc_interval.get("from", 0),
+                    reft_non_revoc_interval.get("to", epoch_now),
                 )
 
-                if referent_non_revoc_interval:
-                    key = (
-                        f"{rev_reg_id}_{referent_non_revoc_interval.get('from', 0)}_"
-                        f"{referent_non_revoc_interval.get('to', epoch_now)}"
-                    )
-                    if key not in revoc_reg_deltas:
-                        (delta, delta_timestamp) = await ledger.get_revoc_reg_delta(
-                            rev_reg_id,
-                            referent_non_revoc_interval.get("from", 0),
-                            referent_non_revoc_interval.get("to", epoch_now),
-                        )
-                        revoc_reg_deltas[key] = (
-                            rev_reg_id,
-                            credential_id,
-                            delta,
-                            delta_timestamp,
-                        )
-                    for stamp_me in requested_referents.values():
-                        # often one cred satisfies many requested attrs/preds
-                        if stamp_me["cred_id"] == credential_id:
-                            stamp_me["timestamp"] = revoc_reg_deltas[key][3]
-                """
+        # Get all schemas, credential definitions, revocation registries and
+        # revocation registry deltas in use, fetching distinct objects concurrently
+        ledger = self._session.inject(BaseLedger)
+        async with ledger:
+            (
+                schemas,
+                credential_definitions,
+                rev_reg_defs,
+                deltas,
+            ) = await asyncio.gather(
+                ledger.get_schemas(
+                    [credential["schema_id"] for credential in credentials.values()]
+                ),
+                ledger.get_credential_definitions(
+                    [credential["cred_def_id"] for credential in credentials.values()]
+                ),
+                fetch_concurrently(
+                    ledger.get_revoc_reg_def,
+                    (
+                        credential["rev_reg_id"]
+                        for credential in credentials.values()
+                        if credential.get("rev_reg_id")
+                    ),
+                ),
+                fetch_concurrently(
+                    lambda key: ledger.get_revoc_reg_delta(*key), delta_keys.values()
+                ),
+            )
+        revocation_registries = {
+            rev_reg_id: RevocationRegistry.from_definition(rev_reg_def, True)
+            for rev_reg_id, rev_reg_def in rev_reg_defs.items()
+        }
+
+        revoc_reg_deltas = {}
+        for credential_id, key in delta_keys.items():
+            if key not in revoc_reg_deltas:
+                (delta, delta_timestamp) = deltas[key]
+                revoc_reg_deltas[key] = (key[0], credential_id, delta, delta_timestamp)
+            for stamp_me in requested_referents.values():
+                if stamp_me["cred_id"] == credential_id and "timestamp" not in stamp_me:
+                    stamp_me["timestamp"] = revoc_reg_deltas[key][3]
 
         # Get revocation states to prove non-revoked
         revocation_states = {}
@@ -415,18 +400,19 @@ class PresentationManager:
                 revocation_states[rev_reg_id] = {}
 
             rev_reg = revocation_registries[rev_reg_id]
-            tails_local_path = await rev_reg.get_or_fetch_local_tails_path()
-
+            tails_cache = self._session.inject(TailsCache, required=False)
             try:
-                revocation_states[rev_reg_id][delta_timestamp] = json.loads(
-                    await holder.create_revocation_state(
-                        credentials[credential_id]["cred_rev_id"],
-                        rev_reg.reg_def,
-                        delta,
-                        delta_timestamp,
-                        tails_local_path,
+                # hold the tails file against eviction while it is read
+                async with TailsFileUse(tails_cache, rev_reg) as tails_local_path:
+                    revocation_states[rev_reg_id][delta_timestamp] = json.loads(
+                        await holder.create_revocation_state(
+                            credentials[credential_id]["cred_rev_id"],
+                            rev_reg.reg_def,
+                            delta,
+                            delta_timestamp,
+                            tails_local_path,
+                        )
                     )
-                )
             except IndyHolderError as e:
                 LOGGER.error(
                     f"Failed to create revocation state: {e.error_code}, {e.message}"
@@ -555,56 +541,45 @@ class PresentationManager:
         indy_proof_request = presentation_exchange_record.presentation_request
         indy_proof = presentation_exchange_record.presentation
 
-        schema_ids = []
-        credential_definition_ids = []
-
-        schemas = {}
-        credential_definitions = {}
-        rev_reg_defs = {}
-        rev_reg_entries = {}
-
         identifiers = indy_proof["identifiers"]
+        rev_reg_ids = [
+            identifier["rev_reg_id"]
+            for identifier in identifiers
+            if identifier.get("rev_reg_id")
+        ]
+        rev_reg_entry_keys = [
+            (identifier["rev_reg_id"], identifier["timestamp"])
+            for identifier in identifiers
+            if identifier.get("rev_reg_id") and identifier.get("timestamp")
+        ]
+
+        # Fetch distinct schemas, cred defs and revocation objects concurrently
         ledger = self._session.inject(BaseLedger)
         async with ledger:
-            for identifier in identifiers:
-                schema_ids.append(identifier["schema_id"])
-                credential_definition_ids.append(identifier["cred_def_id"])
-
-                # Build schemas for anoncreds
-                if identifier["schema_id"] not in schemas:
-                    schemas[identifier["schema_id"]] = await ledger.get_schema(
-                        identifier["schema_id"]
-                    )
-
-                if identifier["cred_def_id"] not in credential_definitions:
-                    credential_definitions[
-                        identifier["cred_def_id"]
-                    ] = await ledger.get_credential_definition(
-                        identifier["cred_def_id"]
-                    )
+            (
+                schemas,
+                credential_definitions,
+                rev_reg_defs,
+                found_rev_reg_entries,
+            ) = await asyncio.gather(
+                ledger.get_schemas(
+                    [identifier["schema_id"] for identifier in identifiers]
+                ),
+                ledger.get_credential_definitions(
+                    [identifier["cred_def_id"] for identifier in identifiers]
+                ),
+                fetch_concurrently(ledger.get_revoc_reg_def, rev_reg_ids),
+                fetch_concurrently(
+                    lambda key: ledger.get_revoc_reg_entry(*key), rev_reg_entry_keys
+                ),
+            )
 
-                if identifier.get("rev_reg_id"):
-                    if identifier["rev_reg_id"] not in rev_reg_defs:
-                        rev_reg_defs[
-                            identifier["rev_reg_id"]
-                        ] = await ledger.get_revoc_reg_def(identifier["rev_reg_id"])
-
-                    if identifier.get("timestamp"):
-                        rev_reg_entries.setdefault(identifier["rev_reg_id"], {})
-
-                        if (
-                            identifier["timestamp"]
-                            not in rev_reg_entries[identifier["rev_reg_id"]]
-                        ):
-                            (
-                                found_rev_reg_entry,
-                                _found_timestamp,
-                            ) = await ledger.get_revoc_reg_entry(
-                                identifier["rev_reg_id"], identifier["timestamp"]
-                            )
-                            rev_reg_entries[identifier["rev_reg_id"]][
-                                identifier["timestamp"]
-                            ] = found_rev_reg_entry
+        rev_reg_entries = {}
+        for (
+            (rev_reg_id, timestamp),
+            (found_rev_reg_entry, _found_timestamp),
+        ) in found_rev_reg_entries.items():
+            rev_reg_entries.setdefault(rev_reg_id, {})[timestamp] = found_rev_reg_entry
 
         verifier = self._session.inject(IndyVerifier)
         presentation_exchange_record.verified = json.dumps(  # tag: needs string value
@@ -21,6 +21,7 @@ class V10PresentationExchange(BaseExchangeRecord):
 
     RECORD_TYPE = "presentation_exchange_v10"
     RECORD_ID_NAME = "presentation_exchange_id"
+    RECORD_CACHE_SIZE = 1000
     WEBHOOK_TOPIC = "present_proof"
     TAG_NAMES = {"~thread_id"} if unencrypted_tags else {"thread_id"}
 
@@ -21,6 +21,11 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_CRED_REV_ID,
@@ -60,7 +65,7 @@ class PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V10PresentationExchangeListQueryStringSchema(OpenAPISchema):
+class V10PresentationExchangeListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -97,7 +102,7 @@ class V10PresentationExchangeListQueryStringSchema(OpenAPISchema):
     )
 
 
-class V10PresentationExchangeListSchema(OpenAPISchema):
+class V10PresentationExchangeListSchema(PaginatedResultSchema):
     """Result schema for an Aries RFC 37 v1.0 presentation exchange query."""
 
     results = fields.List(
@@ -483,17 +488,24 @@ async def presentation_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
-        records = await V10PresentationExchange.query(
+        records, next_cursor = await V10PresentationExchange.query_page(
             session=session,
             tag_filter=tag_filter,
+            limit=limit,
+            cursor=cursor,
             post_filter_positive=post_filter,
         )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    response = {"results": results}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(tags=["present-proof"], summary="Fetch a single presentation exchange record")
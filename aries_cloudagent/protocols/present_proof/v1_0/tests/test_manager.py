@@ -13,6 +13,7 @@ from .....ledger.base import BaseLedger
 from .....messaging.request_context import RequestContext
 from .....messaging.responder import BaseResponder, MockResponder
 from .....storage.error import StorageNotFoundError
+from .....tails.cache import TailsCache
 from .....indy.verifier import IndyVerifier
 from .....indy.sdk.verifier import IndySdkVerifier
 
@@ -93,6 +94,12 @@ class TestPresentationManager(AsyncTestCase):
         self.ledger.get_credential_definition = async_mock.CoroutineMock(
             return_value={"value": {"revocation": {"...": "..."}}}
         )
+        self.ledger.get_schemas = async_mock.CoroutineMock(
+            return_value={S_ID: async_mock.MagicMock()}
+        )
+        self.ledger.get_credential_definitions = async_mock.CoroutineMock(
+            return_value={CD_ID: {"value": {"revocation": {"...": "..."}}}}
+        )
         self.ledger.get_revoc_reg_def = async_mock.CoroutineMock(
             return_value={
                 "ver": "1.0",
@@ -287,6 +294,54 @@ class TestPresentationManager(AsyncTestCase):
 
             assert exchange_out.state == V10PresentationExchange.STATE_REQUEST_RECEIVED
 
+    async def test_receive_request_prefetch_tails(self):
+        exchange_in = V10PresentationExchange(presentation_request={"nonce": "1"})
+        tails_cache = async_mock.MagicMock(TailsCache, autospec=True, prefetch=True)
+        self.session.context.injector.bind_instance(TailsCache, tails_cache)
+
+        with async_mock.patch.object(V10PresentationExchange, "save", autospec=True):
+            await self.manager.receive_request(exchange_in)
+            tails_cache.prefetch_for_proof_request.assert_called_once_with(
+                self.session.profile, {"nonce": "1"}
+            )
+
+    async def test_create_presentation_tails_cache(self):
+        exchange_in = V10PresentationExchange()
+        indy_proof_req = await PRES_PREVIEW.indy_proof_request(
+            name=PROOF_REQ_NAME,
+            version=PROOF_REQ_VERSION,
+            nonce=PROOF_REQ_NONCE,
+            ledger=self.ledger,
+        )
+        exchange_in.presentation_request = indy_proof_req
+
+        more_magic_rr = async_mock.MagicMock(
+            get_or_fetch_local_tails_path=async_mock.CoroutineMock()
+        )
+        tails_cache = async_mock.MagicMock(TailsCache, autospec=True)
+        tails_cache.get_tails_path = async_mock.CoroutineMock(
+            return_value="/tmp/sample/tails/path"
+        )
+        self.session.context.injector.bind_instance(TailsCache, tails_cache)
+        with async_mock.patch.object(
+            V10PresentationExchange, "save", autospec=True
+        ), async_mock.patch.object(
+            test_module, "AttachDecorator", autospec=True
+        ) as mock_attach_decorator, async_mock.patch.object(
+            test_module, "RevocationRegistry", autospec=True
+        ) as mock_rr:
+            mock_rr.from_definition = async_mock.MagicMock(return_value=more_magic_rr)
+            mock_attach_decorator.from_indy_dict = async_mock.MagicMock(
+                return_value=mock_attach_decorator
+            )
+
+            req_creds = await indy_proof_req_preview2indy_requested_creds(
+                indy_proof_req, holder=self.holder
+            )
+            await self.manager.create_presentation(exchange_in, req_creds)
+            tails_cache.get_tails_path.assert_awaited_once_with(more_magic_rr)
+            more_magic_rr.get_or_fetch_local_tails_path.assert_not_called()
+
     async def test_create_presentation(self):
         exchange_in = V10PresentationExchange()
         indy_proof_req = await PRES_PREVIEW.indy_proof_request(
@@ -328,6 +383,56 @@ class TestPresentationManager(AsyncTestCase):
             )
             save_ex.assert_called_once()
             assert exchange_out.state == V10PresentationExchange.STATE_PRESENTATION_SENT
+            self.ledger.get_revoc_reg_def.assert_called_once_with(RR_ID)
+            self.ledger.get_revoc_reg_delta.assert_called_once()
+            for precis in req_creds["requested_attributes"].values():
+                assert precis["timestamp"] == NOW
+
+    async def test_create_presentation_timestamp_supplied(self):
+        exchange_in = V10PresentationExchange()
+        indy_proof_req = await PRES_PREVIEW.indy_proof_request(
+            name=PROOF_REQ_NAME,
+            version=PROOF_REQ_VERSION,
+            nonce=PROOF_REQ_NONCE,
+            ledger=self.ledger,
+        )
+
+        exchange_in.presentation_request = indy_proof_req
+
+        more_magic_rr = async_mock.MagicMock(
+            get_or_fetch_local_tails_path=async_mock.CoroutineMock(
+                return_value="/tmp/sample/tails/path"
+            )
+        )
+        with async_mock.patch.object(
+            V10PresentationExchange, "save", autospec=True
+        ) as save_ex, async_mock.patch.object(
+            test_module, "AttachDecorator", autospec=True
+        ) as mock_attach_decorator, async_mock.patch.object(
+            test_module, "RevocationRegistry", autospec=True
+        ) as mock_rr:
+            mock_rr.from_definition = async_mock.MagicMock(return_value=more_magic_rr)
+
+            mock_attach_decorator.from_indy_dict = async_mock.MagicMock(
+                return_value=mock_attach_decorator
+            )
+
+            req_creds = await indy_proof_req_preview2indy_requested_creds(
+                indy_proof_req, holder=self.holder
+            )
+            for precis in (
+                *req_creds["requested_attributes"].values(),
+                *req_creds["requested_predicates"].values(),
+            ):
+                precis["timestamp"] = NOW - 1
+
+            await self.manager.create_presentation(exchange_in, req_creds)
+            self.ledger.get_revoc_reg_delta.assert_not_called()
+            for precis in (
+                *req_creds["requested_attributes"].values(),
+                *req_creds["requested_predicates"].values(),
+            ):
+                assert precis["timestamp"] == NOW - 1
 
     async def test_create_presentation_proof_req_non_revoc_interval_none(self):
         exchange_in = V10PresentationExchange()
@@ -442,6 +547,12 @@ class TestPresentationManager(AsyncTestCase):
         self.ledger.get_credential_definition = async_mock.CoroutineMock(
             return_value={"value": {"revocation": None}}
         )
+        self.ledger.get_schemas = async_mock.CoroutineMock(
+            return_value={S_ID: async_mock.MagicMock()}
+        )
+        self.ledger.get_credential_definitions = async_mock.CoroutineMock(
+            return_value={CD_ID: {"value": {"revocation": None}}}
+        )
         self.session.context.injector.bind_instance(BaseLedger, self.ledger)
 
         exchange_in = V10PresentationExchange()
@@ -927,6 +1038,12 @@ class TestPresentationManager(AsyncTestCase):
             save_ex.assert_called_once()
 
             assert exchange_out.state == (V10PresentationExchange.STATE_VERIFIED)
+            self.ledger.get_schemas.assert_called_once_with([S_ID, S_ID])
+            self.ledger.get_revoc_reg_def.assert_called_once_with(RR_ID)
+            self.ledger.get_revoc_reg_entry.assert_called_once_with(RR_ID, NOW)
+            rev_reg_entries = self.verifier.verify_presentation.call_args[0][5]
+            assert list(rev_reg_entries) == [RR_ID]
+            assert list(rev_reg_entries[RR_ID]) == [NOW]
 
     async def test_send_presentation_ack(self):
         exchange = V10PresentationExchange()
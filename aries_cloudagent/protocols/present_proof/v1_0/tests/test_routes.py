@@ -66,8 +66,11 @@ class TestProofRoutes(AsyncTestCase):
             # Since we are mocking import
             importlib.reload(test_module)
 
-            mock_presentation_exchange.query = async_mock.CoroutineMock()
-            mock_presentation_exchange.query.return_value = [mock_presentation_exchange]
+            mock_presentation_exchange.query_page = async_mock.CoroutineMock()
+            mock_presentation_exchange.query_page.return_value = (
+                [mock_presentation_exchange],
+                None,
+            )
             mock_presentation_exchange.serialize = async_mock.MagicMock()
             mock_presentation_exchange.serialize.return_value = {
                 "thread_id": "sample-thread-id"
@@ -97,7 +100,7 @@ class TestProofRoutes(AsyncTestCase):
             # Since we are mocking import
             importlib.reload(test_module)
 
-            mock_presentation_exchange.query = async_mock.CoroutineMock(
+            mock_presentation_exchange.query_page = async_mock.CoroutineMock(
                 side_effect=test_module.StorageError()
             )
 
@@ -169,6 +169,8 @@ class RoutingManager:
             exist[route.recipient_key] = route
 
         updated = []
+        create = {}
+        delete = {}
         for update in updates:
             result = RouteUpdated(
                 recipient_key=update.recipient_key, action=update.action
@@ -177,31 +179,52 @@ class RoutingManager:
             if not recip_key:
                 result.result = RouteUpdated.RESULT_CLIENT_ERROR
             elif update.action == RouteUpdate.ACTION_CREATE:
-                if recip_key in exist:
+                if recip_key in exist or recip_key in create:
                     result.result = RouteUpdated.RESULT_NO_CHANGE
                 else:
-                    try:
-                        await self.create_route_record(
-                            client_connection_id=client_connection_id,
-                            recipient_key=recip_key,
-                        )
-                    except RoutingManagerError:
-                        result.result = RouteUpdated.RESULT_SERVER_ERROR
-                    else:
-                        result.result = RouteUpdated.RESULT_SUCCESS
+                    create[recip_key] = result
             elif update.action == RouteUpdate.ACTION_DELETE:
-                if recip_key in exist:
-                    try:
-                        await self.delete_route_record(exist[recip_key])
-                    except StorageError:
-                        result.result = RouteUpdated.RESULT_SERVER_ERROR
-                    else:
-                        result.result = RouteUpdated.RESULT_SUCCESS
+                if recip_key in exist and recip_key not in delete:
+                    delete[recip_key] = result
                 else:
                     result.result = RouteUpdated.RESULT_NO_CHANGE
             else:
                 result.result = RouteUpdated.RESULT_CLIENT_ERROR
             updated.append(result)
+
+        # apply all creations and all deletions as one storage operation each
+        if create:
+            outcome = RouteUpdated.RESULT_SUCCESS
+            if client_connection_id:
+                try:
+                    await RouteRecord.save_records(
+                        self.session,
+                        [
+                            RouteRecord(
+                                connection_id=client_connection_id,
+                                recipient_key=recip_key,
+                            )
+                            for recip_key in create
+                        ],
+                        reason="Created new route",
+                    )
+                except StorageError:
+                    outcome = RouteUpdated.RESULT_SERVER_ERROR
+            else:
+                outcome = RouteUpdated.RESULT_SERVER_ERROR
+            for result in create.values():
+                result.result = outcome
+        if delete:
+            outcome = RouteUpdated.RESULT_SUCCESS
+            try:
+                await RouteRecord.delete_records(
+                    self.session, [exist[recip_key] for recip_key in delete]
+                )
+            except StorageError:
+                outcome = RouteUpdated.RESULT_SERVER_ERROR
+            for result in delete.values():
+                result.result = outcome
+
         return updated
 
     async def send_create_route(
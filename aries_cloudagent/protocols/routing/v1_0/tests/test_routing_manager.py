@@ -247,9 +247,9 @@ class TestRoutingManager(AsyncTestCase):
 
     async def test_update_routes_create_server_error(self):
         with async_mock.patch.object(
-            self.manager, "create_route_record", async_mock.CoroutineMock()
-        ) as mock_mgr_create_route_record:
-            mock_mgr_create_route_record.side_effect = RoutingManagerError()
+            RouteRecord, "save_records", async_mock.CoroutineMock()
+        ) as mock_save_records:
+            mock_save_records.side_effect = StorageError()
             results = await self.manager.update_routes(
                 client_connection_id=TEST_CONN_ID,
                 updates=[
@@ -264,6 +264,52 @@ class TestRoutingManager(AsyncTestCase):
             assert results[0].action == RouteUpdate.ACTION_CREATE
             assert results[0].result == RouteUpdated.RESULT_SERVER_ERROR
 
+    async def test_update_routes_create_no_connection(self):
+        results = await self.manager.update_routes(
+            client_connection_id=None,
+            updates=[
+                RouteUpdate(
+                    recipient_key=TEST_ROUTE_VERKEY, action=RouteUpdate.ACTION_CREATE
+                )
+            ],
+        )
+        assert len(results) == 1
+        assert results[0].result == RouteUpdated.RESULT_SERVER_ERROR
+
+    async def test_update_routes_batch(self):
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        new_keys = [f"{TEST_VERKEY[:-2]}{i:02d}" for i in range(20)]
+        with async_mock.patch.object(
+            self.session.storage,
+            "add_records",
+            async_mock.CoroutineMock(wraps=self.session.storage.add_records),
+        ) as mock_add_records, async_mock.patch.object(
+            self.session.storage,
+            "delete_records",
+            async_mock.CoroutineMock(wraps=self.session.storage.delete_records),
+        ) as mock_delete_records:
+            results = await self.manager.update_routes(
+                client_connection_id=TEST_CONN_ID,
+                updates=[
+                    RouteUpdate(recipient_key=key, action=RouteUpdate.ACTION_CREATE)
+                    for key in new_keys + new_keys[:1]
+                ]
+                + [
+                    RouteUpdate(
+                        recipient_key=TEST_ROUTE_VERKEY,
+                        action=RouteUpdate.ACTION_DELETE,
+                    )
+                ],
+            )
+            mock_add_records.assert_awaited_once()
+            mock_delete_records.assert_awaited_once()
+        assert [result.result for result in results] == (
+            [RouteUpdated.RESULT_SUCCESS] * 20
+            + [RouteUpdated.RESULT_NO_CHANGE, RouteUpdated.RESULT_SUCCESS]
+        )
+        routes = await self.manager.get_routes(TEST_CONN_ID)
+        assert sorted(route.recipient_key for route in routes) == new_keys
+
     async def test_update_routes_delete_absent(self):
         results = await self.manager.update_routes(
             client_connection_id=TEST_CONN_ID,
@@ -281,9 +327,9 @@ class TestRoutingManager(AsyncTestCase):
     async def test_update_routes_delete_server_error(self):
         await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
         with async_mock.patch.object(
-            self.manager, "delete_route_record", async_mock.CoroutineMock()
-        ) as mock_mgr_delete_route_record:
-            mock_mgr_delete_route_record.side_effect = StorageError()
+            RouteRecord, "delete_records", async_mock.CoroutineMock()
+        ) as mock_delete_records:
+            mock_delete_records.side_effect = StorageError()
             results = await self.manager.update_routes(
                 client_connection_id=TEST_CONN_ID,
                 updates=[
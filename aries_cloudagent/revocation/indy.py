@@ -1,6 +1,6 @@
 """Indy revocation registry management."""
 
-from typing import Sequence
+from typing import Dict, Sequence, Tuple
 
 from ..core.profile import ProfileSession
 from ..ledger.base import BaseLedger
@@ -15,6 +15,7 @@ class IndyRevocation:
     """Class for managing Indy credential revocation."""
 
     REV_REG_CACHE = {}
+    ISSUANCE_COUNTS: Dict[Tuple[str, str], int] = {}
 
     def __init__(self, session: ProfileSession):
         """Initialize the IndyRevocation instance."""
@@ -78,6 +79,34 @@ class IndyRevocation:
             f"No active issuer revocation record found for cred def id {cred_def_id}"
         )
 
+    async def get_issuance_rev_reg_record(
+        self, cred_def_id: str
+    ) -> "IssuerRevRegRecord":
+        """Return the active registry to issue the next credential from.
+
+        With the `revocation.issuance_shards` setting above 1, issuance is spread
+        round-robin over that many of the oldest active registries, so that
+        concurrent issuance does not contend for a single registry. Each call
+        takes the next turn, so only issuance itself should call this.
+
+        Args:
+            cred_def_id: ID of the base credential definition
+        """
+        shards = self._session.settings.get_int("revocation.issuance_shards") or 1
+        current = sorted(
+            await IssuerRevRegRecord.query_by_cred_def_id(
+                self._session, cred_def_id, IssuerRevRegRecord.STATE_ACTIVE
+            )
+        )[:shards]
+        if current:
+            key = (self._session.profile.name, cred_def_id)
+            count = IndyRevocation.ISSUANCE_COUNTS.get(key, 0)
+            IndyRevocation.ISSUANCE_COUNTS[key] = count + 1
+            return current[count % len(current)]
+        raise StorageNotFoundError(
+            f"No active issuer revocation record found for cred def id {cred_def_id}"
+        )
+
     async def get_issuer_rev_reg_record(
         self, revoc_reg_id: str
     ) -> "IssuerRevRegRecord":
@@ -1,5 +1,6 @@
 """Classes to manage credential revocation."""
 
+import asyncio
 import json
 import logging
 from typing import Mapping, Sequence, Text
@@ -14,10 +15,29 @@ from .models.issuer_rev_reg_record import IssuerRevRegRecord
 from .models.issuer_cred_rev_record import IssuerCredRevRecord
 
 
+# number of revocation registries to publish revocations for at once
+PUBLISH_CONCURRENCY = 4
+
+
 class RevocationManagerError(BaseError):
     """Revocation manager error."""
 
 
+class RevocationPublishError(RevocationManagerError):
+    """Error publishing pending revocations for some revocation registries."""
+
+    def __init__(self, *args, published: Mapping[Text, Sequence[Text]], **kwargs):
+        """
+        Initialize a RevocationPublishError.
+
+        Args:
+            published: mapping from each revocation registry id published
+                to its cred rev ids published and cleared from pending
+        """
+        super().__init__(*args, **kwargs)
+        self.published = published
+
+
 class RevocationManager:
     """Class for managing revocation operations."""
 
@@ -102,7 +122,7 @@ class RevocationManager:
             )
             if delta_json:
                 issuer_rr_rec.revoc_reg_entry = json.loads(delta_json)
-                await issuer_rr_rec.send_entry(self._session)
+                await (await issuer_rr_rec.send_entry(self._session))
                 await issuer_rr_rec.clear_pending(self._session)
 
         else:
@@ -114,6 +134,9 @@ class RevocationManager:
         """
         Publish pending revocations to the ledger.
 
+        Revocation registries are processed concurrently, up to
+        `PUBLISH_CONCURRENCY` at a time, each in its own session.
+
         Args:
             rrid2crid: Mapping from revocation registry identifiers to all credential
                 revocation identifiers within each to publish. Specify null/empty map
@@ -133,10 +156,29 @@ class RevocationManager:
                     - no pending revocations from any other revocation registries.
 
         Returns: mapping from each revocation registry id to its cred rev ids published.
+
+        Raises:
+            RevocationPublishError: if publication failed for any revocation
+                registry, holding the revocations published for the others
+
         """
-        result = {}
         issuer: IndyIssuer = self._session.inject(IndyIssuer)
+        semaphore = asyncio.Semaphore(PUBLISH_CONCURRENCY)
+
+        async def publish(issuer_rr_rec: IssuerRevRegRecord, crids: Sequence[Text]):
+            async with semaphore, self._session.profile.session() as session:
+                (delta_json, failed_crids) = await issuer.revoke_credentials(
+                    issuer_rr_rec.revoc_reg_id,
+                    issuer_rr_rec.tails_local_path,
+                    crids,
+                )
+                issuer_rr_rec.revoc_reg_entry = json.loads(delta_json)
+                await (await issuer_rr_rec.send_entry(session))
+                published = [crid for crid in crids if crid not in failed_crids]
+                await issuer_rr_rec.clear_pending(session, published)
+                return published
 
+        to_publish = []
         issuer_rr_recs = await IssuerRevRegRecord.query_by_pending(self._session)
         for issuer_rr_rec in issuer_rr_recs:
             rrid = issuer_rr_rec.revoc_reg_id
@@ -150,18 +192,28 @@ class RevocationManager:
                     if crid in (rrid2crid[rrid] or []) or not rrid2crid[rrid]
                 ]
             if crids:
-                (delta_json, failed_crids) = await issuer.revoke_credentials(
-                    issuer_rr_rec.revoc_reg_id,
-                    issuer_rr_rec.tails_local_path,
-                    crids,
-                )
-                issuer_rr_rec.revoc_reg_entry = json.loads(delta_json)
-                await issuer_rr_rec.send_entry(self._session)
-                published = [crid for crid in crids if crid not in failed_crids]
-                result[issuer_rr_rec.revoc_reg_id] = published
-                await issuer_rr_rec.clear_pending(self._session, published)
+                to_publish.append((issuer_rr_rec, crids))
 
-        return result
+        results = await asyncio.gather(
+            *(publish(issuer_rr_rec, crids) for (issuer_rr_rec, crids) in to_publish),
+            return_exceptions=True,
+        )
+        published = {}
+        failed = {}
+        for ((issuer_rr_rec, _), result) in zip(to_publish, results):
+            if isinstance(result, Exception):
+                failed[issuer_rr_rec.revoc_reg_id] = result
+            else:
+                published[issuer_rr_rec.revoc_reg_id] = result
+        if failed:
+            # every other registry has finished: report what was published too
+            raise RevocationPublishError(
+                "Failed to publish pending revocations for revocation registries "
+                f"{', '.join(failed)}; published and cleared {published}",
+                published=published,
+            ) from next(iter(failed.values()))
+
+        return published
 
     async def clear_pending_revocations(
         self, purge: Mapping[Text, Sequence[Text]] = None
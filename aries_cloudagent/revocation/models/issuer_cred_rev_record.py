@@ -84,6 +84,27 @@ class IssuerCredRevRecord(BaseRecord):
 
         return await cls.query(session, tag_filter)
 
+    @classmethod
+    async def query_by_cred_rev_ids(
+        cls,
+        session: ProfileSession,
+        rev_reg_id: str,
+        cred_rev_ids: Sequence[str],
+    ) -> Sequence["IssuerCredRevRecord"]:
+        """Retrieve the issuer cred rev records for several cred rev ids at once.
+
+        Args:
+            session: the profile session to use
+            rev_reg_id: the rev reg id of the credentials
+            cred_rev_ids: the cred rev ids of the credentials
+        """
+        if not cred_rev_ids:
+            return []
+        return await cls.query(
+            session,
+            {"rev_reg_id": rev_reg_id, "cred_rev_id": {"$in": list(cred_rev_ids)}},
+        )
+
     @classmethod
     async def retrieve_by_ids(
         cls,
@@ -4,11 +4,11 @@ import json
 import logging
 import uuid
 
-from asyncio import shield
+from asyncio import get_event_loop, shield
 from functools import total_ordering
 from os.path import join
 from shutil import move
-from typing import Any, Sequence
+from typing import Any, Awaitable, Sequence
 from urllib.parse import urlparse
 
 from marshmallow import fields, validate
@@ -25,6 +25,7 @@ from ...messaging.valid import (
     UUIDFour,
 )
 from ...ledger.base import BaseLedger
+from ...ledger.write_queue import LedgerWriteQueue
 from ...tails.base import BaseTailsServer
 
 from ..error import RevocationError
@@ -208,6 +209,25 @@ class IssuerRevRegRecord(BaseRecord):
         await self.send_def(session)
         await self.send_entry(session)
 
+        try:
+            await self.upload_tails_file(session, max_attempts=max_attempts)
+        except RevocationError as err:
+            LOGGER.error(err.message)
+
+        LOGGER.info("Staged pending registry %s", self.revoc_reg_id)
+
+    async def upload_tails_file(self, session: ProfileSession, max_attempts: int = 5):
+        """
+        Upload the tails file of the registry to the tails server.
+
+        Args:
+            session: The profile session to use
+            max_attempts: The maximum number of attempts to make
+
+        Raises:
+            RevocationError: if the tails file fails to upload
+
+        """
         tails_server: BaseTailsServer = session.inject(BaseTailsServer)
         (upload_success, reason) = await tails_server.upload_tails_file(
             session.context,
@@ -218,14 +238,11 @@ class IssuerRevRegRecord(BaseRecord):
             max_attempts=max_attempts,
         )
         if not upload_success:
-            LOGGER.error(
-                "Tails file for rev reg %s failed to upload: %s",
-                self.revoc_reg_id,
-                reason,
+            raise RevocationError(
+                f"Tails file for rev reg {self.revoc_reg_id} failed to upload: "
+                f"{reason}"
             )
 
-        LOGGER.info("Staged pending registry %s", self.revoc_reg_id)
-
     async def send_def(self, session: ProfileSession):
         """Send the revocation registry definition to the ledger."""
         if not (self.revoc_reg_def and self.issuer_did):
@@ -240,15 +257,34 @@ class IssuerRevRegRecord(BaseRecord):
                 )
             )
 
-        ledger: BaseLedger = session.inject(BaseLedger)
-        async with ledger:
-            await ledger.send_revoc_reg_def(self.revoc_reg_def, self.issuer_did)
+        write_queue = session.inject(LedgerWriteQueue, required=False)
+        if write_queue:
+            await (
+                await write_queue.send_revoc_reg_def(
+                    self.revoc_reg_def, self.issuer_did
+                )
+            )
+        else:
+            ledger: BaseLedger = session.inject(BaseLedger)
+            async with ledger:
+                await ledger.send_revoc_reg_def(self.revoc_reg_def, self.issuer_did)
 
         self.state = IssuerRevRegRecord.STATE_POSTED
         await self.save(session, reason="Published revocation registry definition")
 
-    async def send_entry(self, session: ProfileSession):
-        """Send a registry entry to the ledger."""
+    async def send_entry(self, session: ProfileSession) -> Awaitable[int]:
+        """
+        Send a registry entry to the ledger.
+
+        With a ledger write queue, the entry is queued, to be merged with any
+        entries for the registry still waiting, and the caller may continue
+        before it is written. The initial entry of a registry is always awaited,
+        so that the registry is active on return.
+
+        Returns:
+            An awaitable for the ledger timestamp of the entry
+
+        """
         if not (
             self.revoc_reg_id
             and self.revoc_def_type
@@ -270,19 +306,32 @@ class IssuerRevRegRecord(BaseRecord):
                 )
             )
 
-        ledger: BaseLedger = session.inject(BaseLedger)
-        async with ledger:
-            await ledger.send_revoc_reg_entry(
+        write_queue = session.inject(LedgerWriteQueue, required=False)
+        if write_queue:
+            sent = await write_queue.send_revoc_reg_entry(
                 self.revoc_reg_id,
                 self.revoc_def_type,
                 self.revoc_reg_entry,
                 self.issuer_did,
             )
+        else:
+            ledger: BaseLedger = session.inject(BaseLedger)
+            async with ledger:
+                txn_time = await ledger.send_revoc_reg_entry(
+                    self.revoc_reg_id,
+                    self.revoc_def_type,
+                    self.revoc_reg_entry,
+                    self.issuer_did,
+                )
+            sent = get_event_loop().create_future()
+            sent.set_result(txn_time)
         if self.state == IssuerRevRegRecord.STATE_POSTED:
+            await sent
             self.state = IssuerRevRegRecord.STATE_ACTIVE  # initial entry activates
             await self.save(
                 session, reason="Published initial revocation registry entry"
             )
+        return sent
 
     async def mark_pending(self, session: ProfileSession, cred_rev_id: str) -> None:
         """Mark a credential revocation id as revoked pending publication to ledger.
@@ -1,22 +1,29 @@
 """Classes for managing a revocation registry."""
 
+import asyncio
+import hashlib
 import logging
+import os
 import re
 
 from os.path import join
 from pathlib import Path
+from tempfile import mkstemp
+
+import base58
 
-from requests import Session
-from requests.exceptions import RequestException
+from aiohttp import ClientError, ClientSession
 
 from ...indy.util import indy_client_dir
+from ...utils.single_flight import SingleFlight
 
 from ..error import RevocationError
-import hashlib
-import base58
 
 LOGGER = logging.getLogger(__name__)
 
+TAILS_CHUNK_SIZE = 65536  # should be multiple of 32 bytes for sha256
+TAILS_WRITE_SIZE = 1048576  # bytes to collect before each write to disk
+
 
 class RevocationRegistry:
     """Manage a revocation registry and tails file."""
@@ -24,6 +31,9 @@ class RevocationRegistry:
     MIN_SIZE = 4
     MAX_SIZE = 32768
 
+    # downloads in progress, shared by all instances for the same tails file
+    _tails_downloads = SingleFlight()
+
     def __init__(
         self,
         registry_id: str = None,
@@ -154,32 +164,72 @@ class RevocationRegistry:
         return tails_file_path.is_file()
 
     async def retrieve_tails(self):
-        """Fetch the tails file from the public URI."""
+        """
+        Fetch the tails file from the public URI.
+
+        Concurrent requests for the same tails file share one download.
+        """
         if not self._tails_public_uri:
             raise RevocationError("Tails file public URI is empty")
 
+        tails_file_path = self.get_receiving_tails_local_path()
+        self.tails_local_path = await RevocationRegistry._tails_downloads.run(
+            tails_file_path, lambda: self._download_tails(tails_file_path)
+        )
+        return self.tails_local_path
+
+    async def _download_tails(self, tails_file_path: str) -> str:
+        """
+        Download the tails file, checking its hash.
+
+        The file is written to a temporary file in the same directory and
+        renamed once complete, so that a partial download is never found at
+        the tails file path. Disk writes and hashing run off the event loop.
+        """
         LOGGER.info(
             "Downloading the tails file for the revocation registry: %s",
             self.registry_id,
         )
 
-        tails_file_path = Path(self.get_receiving_tails_local_path())
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
+        loop = asyncio.get_event_loop()
+        tails_file_dir = Path(tails_file_path).parent
+        await loop.run_in_executor(
+            None, lambda: tails_file_dir.mkdir(parents=True, exist_ok=True)
+        )
+        fd, tmp_path = mkstemp(dir=tails_file_dir, prefix=".", suffix=".part")
+        file_hasher = hashlib.sha256()
 
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            file_hasher = hashlib.sha256()
+        def write(tails_file, buf: bytes):
+            tails_file.write(buf)
+            file_hasher.update(buf)
 
-            with Session() as req_session:
+        try:
+            with os.fdopen(fd, "wb") as tails_file:
                 try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
+                    async with ClientSession() as session:
+                        async with session.get(self._tails_public_uri) as resp:
+                            if resp.status != 200:
+                                raise RevocationError(
+                                    "Error retrieving tails file: "
+                                    f"{resp.status} {resp.reason}"
+                                )
+                            pending = bytearray()
+                            async for buf in resp.content.iter_chunked(
+                                TAILS_CHUNK_SIZE
+                            ):
+                                pending.extend(buf)
+                                if len(pending) >= TAILS_WRITE_SIZE:
+                                    await loop.run_in_executor(
+                                        None, write, tails_file, bytes(pending)
+                                    )
+                                    pending.clear()
+                            await loop.run_in_executor(
+                                None, write, tails_file, bytes(pending)
+                            )
+                except (ClientError, asyncio.TimeoutError) as err:
+                    raise RevocationError(
+                        f"Error retrieving tails file: {err}"
+                    ) from err
 
             download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
             if download_tails_hash != self.tails_hash:
@@ -187,8 +237,13 @@ class RevocationRegistry:
                     "The hash of the downloaded tails file does not match."
                 )
 
-        self.tails_local_path = tails_file_path
-        return self.tails_local_path
+            await loop.run_in_executor(None, os.replace, tmp_path, tails_file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return tails_file_path
 
     async def get_or_fetch_local_tails_path(self):
         """Get the local tails path, retrieving from the remote if necessary."""
@@ -94,3 +94,26 @@ class TestIssuerCredRevRecord(AsyncTestCase):
             await IssuerCredRevRecord.retrieve_by_ids(
                 self.session, rev_reg_id=REV_REG_ID, cred_rev_id="2"
             )
+
+    async def test_query_by_cred_rev_ids(self):
+        recs = [
+            IssuerCredRevRecord(
+                state=IssuerCredRevRecord.STATE_ISSUED,
+                cred_ex_id=test_module.UUIDFour.EXAMPLE,
+                rev_reg_id=REV_REG_ID,
+                cred_rev_id=str(i + 1),
+            )
+            for i in range(4)
+        ]
+        await IssuerCredRevRecord.save_records(self.session, recs)
+
+        found = await IssuerCredRevRecord.query_by_cred_rev_ids(
+            self.session, REV_REG_ID, ["2", "4", "5"]
+        )
+        assert sorted(rec.cred_rev_id for rec in found) == ["2", "4"]
+        assert not await IssuerCredRevRecord.query_by_cred_rev_ids(
+            self.session, f"{REV_REG_ID}-other", ["2"]
+        )
+        assert not await IssuerCredRevRecord.query_by_cred_rev_ids(
+            self.session, REV_REG_ID, []
+        )
@@ -8,6 +8,7 @@ from ....core.in_memory import InMemoryProfile
 from ....indy.issuer import IndyIssuer, IndyIssuerError
 from ....indy.util import indy_client_dir
 from ....ledger.base import BaseLedger
+from ....ledger.write_queue import LedgerWriteQueue
 from ....tails.base import BaseTailsServer
 from ....wallet.base import DIDInfo
 
@@ -149,6 +150,52 @@ class TestIssuerRevRegRecord(AsyncTestCase):
         with self.assertRaises(RevocationError) as x_state:
             await rec_full.send_entry(self.session)
 
+    async def test_send_entry_write_queue(self):
+        self.ledger.send_revoc_reg_entry.return_value = 1234567890
+        self.ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        write_queue = LedgerWriteQueue(self.ledger)
+        self.session.context.injector.bind_instance(LedgerWriteQueue, write_queue)
+        rec = IssuerRevRegRecord(
+            issuer_did=TEST_DID,
+            revoc_reg_id=REV_REG_ID,
+            revoc_def_type="CL_ACCUM",
+            revoc_reg_entry={"ver": "1.0", "value": {"accum": "1"}},
+            tails_public_uri="http://localhost/dummy",
+            state=IssuerRevRegRecord.STATE_POSTED,
+        )
+        sent = await rec.send_entry(self.session)
+        assert sent.done()
+        assert rec.state == IssuerRevRegRecord.STATE_ACTIVE
+        self.ledger.send_revoc_reg_entry.assert_called_once_with(
+            REV_REG_ID, "CL_ACCUM", rec.revoc_reg_entry, TEST_DID
+        )
+
+        # later entries are left to the queue
+        rec.revoc_reg_entry = {"ver": "1.0", "value": {"prevAccum": "1", "accum": "2"}}
+        sent = await rec.send_entry(self.session)
+        assert not sent.done()
+        assert await sent == 1234567890
+        assert write_queue.metrics()["queued"] == 2
+
+    async def test_send_def_write_queue(self):
+        self.ledger.send_revoc_reg_def.return_value = 1234567890
+        self.ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        write_queue = LedgerWriteQueue(self.ledger)
+        self.session.context.injector.bind_instance(LedgerWriteQueue, write_queue)
+        rec = IssuerRevRegRecord(
+            issuer_did=TEST_DID,
+            revoc_reg_id=REV_REG_ID,
+            revoc_reg_def={"value": {"tailsLocation": "http://localhost/dummy"}},
+            tails_public_uri="http://localhost/dummy",
+            state=IssuerRevRegRecord.STATE_GENERATED,
+        )
+        await rec.send_def(self.session)
+        assert rec.state == IssuerRevRegRecord.STATE_POSTED
+        self.ledger.send_revoc_reg_def.assert_called_once_with(
+            rec.revoc_reg_def, TEST_DID
+        )
+        assert write_queue.metrics()["latency"]["count"]["revoc_reg_def"] == 1
+
     async def test_pending(self):
         rec = IssuerRevRegRecord()
         await rec.mark_pending(self.session, "1")
@@ -209,6 +256,27 @@ class TestIssuerRevRegRecord(AsyncTestCase):
         ) as mock_move:
             await rec.stage_pending_registry(self.session)
 
+    async def test_upload_tails_file(self):
+        rec = IssuerRevRegRecord(
+            issuer_did=TEST_DID,
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path="/tmp/tails",
+        )
+        with self.assertRaises(RevocationError) as x_upload:
+            await rec.upload_tails_file(self.session, max_attempts=2)
+        assert "Internal Server Error" in x_upload.exception.message
+
+        self.tails_server.upload_tails_file.return_value = (True, "tails-hash")
+        await rec.upload_tails_file(self.session)
+        self.tails_server.upload_tails_file.assert_called_with(
+            self.session.context,
+            REV_REG_ID,
+            "/tmp/tails",
+            interval=0.25,
+            backoff=-0.5,
+            max_attempts=5,
+        )
+
     async def test_send_rev_reg_undef(self):
         rec = IssuerRevRegRecord()
         with self.assertRaises(RevocationError):
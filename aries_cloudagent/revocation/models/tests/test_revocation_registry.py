@@ -1,9 +1,13 @@
+import asyncio
 import json
 
 import pytest
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 from copy import deepcopy
+from hashlib import sha256
 from pathlib import Path
 from shutil import rmtree
 
@@ -99,75 +103,52 @@ class TestRevocationRegistry(AsyncTestCase):
         rev_reg = RevocationRegistry.from_definition(REV_REG_DEF, public_def=False)
         with self.assertRaises(RevocationError) as x_retrieve:
             await rev_reg.retrieve_tails()
-            assert x_retrieve.message.contains("Tails file public URI is empty")
-
-        rr_def_public = deepcopy(REV_REG_DEF)
-        rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
-        rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
-
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                side_effect=test_module.RequestException("Not this time")
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains("Error retrieving tails file")
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
+        assert "Tails file public URI is empty" in str(x_retrieve.exception)
+
+        tails_content = b"tails" * 300000
+        requests = []
+
+        async def serve_tails(request):
+            requests.append(request.path)
+            if request.path == "/fail":
+                raise web.HTTPNotFound()
+            return web.Response(body=tails_content)
+
+        app = web.Application()
+        app.add_routes([web.get("/{name}", serve_tails)])
+        async with TestServer(app) as server:
+            rr_def_public = deepcopy(REV_REG_DEF)
+            rr_def_public["value"]["tailsLocation"] = str(server.make_url("/fail"))
+            rr_def_public["value"]["tailsHash"] = base58.b58encode(
+                sha256(tails_content).digest()
+            ).decode("utf-8")
+            rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
+            tails_dir = Path(rev_reg.tails_local_path).parent
 
             with self.assertRaises(RevocationError) as x_retrieve:
                 await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains(
-                    "The hash of the downloaded tails file does not match."
-                )
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session, async_mock.patch.object(
-            base58, "b58encode", async_mock.MagicMock()
-        ) as mock_b58enc, async_mock.patch.object(
-            Path, "is_file", autospec=True
-        ) as mock_is_file:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
+            assert "Error retrieving tails file" in str(x_retrieve.exception)
+            assert not list(tails_dir.iterdir())
+
+            rev_reg.tails_public_uri = str(server.make_url("/tails"))
+            with async_mock.patch.object(
+                RevocationRegistry, "tails_hash", "not-the-hash"
+            ):
+                with self.assertRaises(RevocationError) as x_retrieve:
+                    await rev_reg.get_or_fetch_local_tails_path()
+                assert "does not match" in str(x_retrieve.exception)
+            assert not list(tails_dir.iterdir())
+
+            requests.clear()
+            other = RevocationRegistry.from_definition(rr_def_public, public_def=True)
+            other.tails_public_uri = rev_reg.tails_public_uri
+            paths = await asyncio.gather(
+                rev_reg.get_or_fetch_local_tails_path(), other.retrieve_tails()
             )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
-            mock_is_file.return_value = False
-
-            mock_b58enc.return_value = async_mock.MagicMock(
-                decode=async_mock.MagicMock(return_value=TAILS_HASH)
-            )
-            await rev_reg.get_or_fetch_local_tails_path()
-
-            rmtree(TAILS_DIR, ignore_errors=True)
+            assert paths == [rev_reg.tails_local_path] * 2
+            assert requests == ["/tails"]
+            assert rev_reg.has_local_tails_file()
+            assert Path(rev_reg.tails_local_path).read_bytes() == tails_content
+            assert [path.name for path in tails_dir.iterdir()] == [
+                rr_def_public["value"]["tailsHash"]
+            ]
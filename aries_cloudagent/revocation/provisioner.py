@@ -0,0 +1,215 @@
+"""Keep spare revocation registries staged ahead of issuance."""
+
+import asyncio
+import logging
+
+from typing import Dict, Sequence, Tuple
+
+from ..core.profile import Profile
+
+from .indy import IndyRevocation
+from .models.issuer_rev_reg_record import IssuerRevRegRecord
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SPARE_REGISTRIES = 1
+
+
+class RevRegProvisioner:
+    """Stage revocation registries in the background before issuance needs them.
+
+    Issuance uses the oldest active revocation registry for a credential
+    definition, or the oldest few under the `revocation.issuance_shards`
+    setting; any further active registries are spares, which take over in turn
+    as each fills. The provisioner tops up the spares of a credential
+    definition, generating, publishing and uploading the tails file of each new
+    registry, so that issuance need not wait on registry creation when a
+    registry in use fills. Registries are only made active once their tails
+    files are uploaded, and those left part-staged are resumed by the next
+    top-up.
+    """
+
+    def __init__(self, spares: int = DEFAULT_SPARE_REGISTRIES):
+        """
+        Initialize a `RevRegProvisioner` instance.
+
+        Args:
+            spares: the number of registries to keep staged for each credential
+                definition, in addition to the registries in use
+
+        """
+        self.spares = spares
+        self._provisions: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    def top_up(
+        self, profile: Profile, cred_def_id: str, max_cred_num: int = None
+    ) -> asyncio.Future:
+        """
+        Top up the spare registries of a credential definition in the background.
+
+        Args:
+            profile: the profile of the issuing wallet
+            cred_def_id: the credential definition identifier
+            max_cred_num: the size of any new registries, defaulting to the size
+                of the oldest registry for the credential definition
+
+        Returns:
+            A future for the records of the registries staged
+
+        """
+        return asyncio.ensure_future(self._top_up(profile, cred_def_id, max_cred_num))
+
+    async def _top_up(
+        self, profile: Profile, cred_def_id: str, max_cred_num: int = None
+    ) -> Sequence[IssuerRevRegRecord]:
+        """Top up the spare registries, logging any error."""
+        try:
+            return await self.provision(profile, cred_def_id, max_cred_num)
+        except Exception:
+            LOGGER.exception(
+                "Error provisioning revocation registries for cred def %s",
+                cred_def_id,
+            )
+            return []
+
+    async def top_up_all(self, profile: Profile) -> Sequence[IssuerRevRegRecord]:
+        """
+        Top up the spare registries of every credential definition in use.
+
+        Args:
+            profile: the profile of the issuing wallet
+
+        Returns:
+            The records of the registries staged
+
+        """
+        async with profile.session() as session:
+            cred_def_ids = {
+                record.cred_def_id
+                for record in await IssuerRevRegRecord.query(
+                    session, {"state": IssuerRevRegRecord.STATE_ACTIVE}
+                )
+            }
+        staged = await asyncio.gather(
+            *(
+                self._top_up(profile, cred_def_id)
+                for cred_def_id in sorted(cred_def_ids)
+            )
+        )
+        return [record for records in staged for record in records]
+
+    async def provision(
+        self, profile: Profile, cred_def_id: str, max_cred_num: int = None
+    ) -> Sequence[IssuerRevRegRecord]:
+        """
+        Stage registries until a credential definition has its spares.
+
+        Concurrent calls for the same credential definition share one run.
+
+        Args:
+            profile: the profile of the issuing wallet
+            cred_def_id: the credential definition identifier
+            max_cred_num: the size of any new registries, defaulting to the size
+                of the oldest registry for the credential definition
+
+        Returns:
+            The records of the registries staged
+
+        """
+        key = (profile.name, cred_def_id)
+        provision = self._provisions.get(key)
+        if not provision:
+            provision = asyncio.ensure_future(
+                self._provision(profile, cred_def_id, max_cred_num)
+            )
+            self._provisions[key] = provision
+            provision.add_done_callback(lambda _: self._provisions.pop(key, None))
+        return await asyncio.shield(provision)
+
+    async def _provision(
+        self, profile: Profile, cred_def_id: str, max_cred_num: int = None
+    ) -> Sequence[IssuerRevRegRecord]:
+        """Stage registries for a credential definition, one run at a time."""
+        staged = []
+        while True:
+            async with profile.session() as session:
+                rev_reg_recs = sorted(
+                    await IssuerRevRegRecord.query_by_cred_def_id(session, cred_def_id)
+                )  # prefer to reuse prior rev reg size
+                active = [
+                    record
+                    for record in rev_reg_recs
+                    if record.state == IssuerRevRegRecord.STATE_ACTIVE
+                ]
+                shards = profile.settings.get_int("revocation.issuance_shards") or 1
+                needed = self.spares + shards - len(active)
+                if needed <= 0:
+                    return staged
+
+                # resume registries left part-staged before creating any more
+                pending = [
+                    record
+                    for record in rev_reg_recs
+                    if record.state == IssuerRevRegRecord.STATE_POSTED
+                    or (
+                        record.state == IssuerRevRegRecord.STATE_GENERATED
+                        and record.tails_public_uri
+                    )
+                ][:needed]
+                revoc = IndyRevocation(session)
+                for _ in range(needed - len(pending)):
+                    pending.append(
+                        await revoc.init_issuer_registry(
+                            cred_def_id,
+                            max_cred_num=max_cred_num
+                            or (rev_reg_recs[0].max_cred_num if rev_reg_recs else None),
+                        )
+                    )
+
+            results = await asyncio.gather(
+                *(self._stage(profile, record) for record in pending),
+                return_exceptions=True,
+            )
+            errors = [err for err in results if isinstance(err, Exception)]
+            staged.extend(
+                record
+                for record, result in zip(pending, results)
+                if not isinstance(result, Exception)
+            )
+            if errors:
+                # give up until the next top-up rather than retrying forever
+                raise errors[0]
+
+    async def _stage(self, profile: Profile, record: IssuerRevRegRecord):
+        """
+        Generate and publish a registry and upload its tails file.
+
+        Staging resumes from the state of the record. The initial registry
+        entry, which makes the registry active, is only published once the tails
+        file is uploaded: a registry whose upload fails stays posted, for the
+        next top-up to resume.
+        """
+        async with profile.session() as session:
+            if record.state == IssuerRevRegRecord.STATE_INIT:
+                try:
+                    await asyncio.shield(record.generate_registry(session))
+                except Exception:
+                    # nothing is on the ledger yet, so there is nothing to resume
+                    await record.delete_record(session)
+                    raise
+            if record.state == IssuerRevRegRecord.STATE_GENERATED:
+                tails_base_url = session.settings.get("tails_server_base_url")
+                await record.set_tails_file_public_uri(
+                    session, f"{tails_base_url}/{record.revoc_reg_id}"
+                )
+                await record.send_def(session)
+            await record.upload_tails_file(session, max_attempts=16)
+            await record.send_entry(session)
+            LOGGER.info("Staged pending registry %s", record.revoc_reg_id)
+
+    async def stop(self):
+        """Cancel any registries being staged."""
+        provisions = list(self._provisions.values())
+        for provision in provisions:
+            provision.cancel()
+        await asyncio.gather(*provisions, return_exceptions=True)
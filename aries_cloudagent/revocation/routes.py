@@ -21,7 +21,13 @@ from ..indy.util import tails_path
 from ..indy.issuer import IndyIssuerError
 from ..ledger.error import LedgerError
 from ..messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
+from ..messaging.models.base import BaseModelError
 from ..messaging.models.openapi import OpenAPISchema
+from ..messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    PaginatedResultSchema,
+    get_paginated_query_params,
+)
 from ..messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_CRED_REV_ID,
@@ -175,7 +181,7 @@ class RevRegIssuedResultSchema(OpenAPISchema):
     )
 
 
-class RevRegsCreatedSchema(OpenAPISchema):
+class RevRegsCreatedSchema(PaginatedResultSchema):
     """Result schema for request for revocation registries created."""
 
     rev_reg_ids = fields.List(
@@ -196,7 +202,7 @@ class RevRegUpdateTailsFileUriSchema(OpenAPISchema):
     )
 
 
-class RevRegsCreatedQueryStringSchema(OpenAPISchema):
+class RevRegsCreatedQueryStringSchema(PaginatedQuerySchema):
     """Query string parameters and validators for rev regs created request."""
 
     cred_def_id = fields.Str(
@@ -321,7 +327,13 @@ async def publish_revocations(request: web.BaseRequest):
 
     try:
         results = await rev_manager.publish_pending_revocations(rrid2crid)
-    except (RevocationError, StorageError, IndyIssuerError, LedgerError) as err:
+    except (
+        RevocationManagerError,
+        RevocationError,
+        StorageError,
+        IndyIssuerError,
+        LedgerError,
+    ) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
     return web.json_response({"rrid2crid": results})
 
@@ -422,14 +434,25 @@ async def rev_regs_created(request: web.BaseRequest):
     session = await context.session()
 
     search_tags = [
-        tag for tag in vars(RevRegsCreatedQueryStringSchema)["_declared_fields"]
+        tag
+        for tag in vars(RevRegsCreatedQueryStringSchema)["_declared_fields"]
+        if tag not in vars(PaginatedQuerySchema)["_declared_fields"]
     ]
     tag_filter = {
         tag: request.query[tag] for tag in search_tags if tag in request.query
     }
-    found = await IssuerRevRegRecord.query(session, tag_filter)
+    limit, cursor = get_paginated_query_params(request)
+    try:
+        found, next_cursor = await IssuerRevRegRecord.query_page(
+            session, tag_filter, limit=limit, cursor=cursor
+        )
+    except (StorageError, BaseModelError) as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"rev_reg_ids": [record.revoc_reg_id for record in found]})
+    response = {"rev_reg_ids": [record.revoc_reg_id for record in found]}
+    if next_cursor:
+        response["next_cursor"] = next_cursor
+    return web.json_response(response)
 
 
 @docs(
@@ -697,13 +720,13 @@ async def send_rev_reg_entry(request: web.BaseRequest):
     try:
         revoc = IndyRevocation(session)
         rev_reg = await revoc.get_issuer_rev_reg_record(rev_reg_id)
-        await rev_reg.send_entry(session)
+        await (await rev_reg.send_entry(session))
         LOGGER.debug("published registry entry: %s", rev_reg_id)
 
     except StorageNotFoundError as err:
         raise web.HTTPNotFound(reason=err.roll_up) from err
 
-    except RevocationError as err:
+    except (RevocationError, LedgerError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
     return web.json_response({"result": rev_reg.serialize()})
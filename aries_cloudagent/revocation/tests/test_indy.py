@@ -136,6 +136,36 @@ class TestIndyRevocation(AsyncTestCase):
         with self.assertRaises(StorageNotFoundError):
             result = await self.revoc.get_active_issuer_rev_reg_record(CRED_DEF_ID)
 
+    async def test_get_issuance_rev_reg_record_shards(self):
+        CRED_DEF_ID = f"{self.test_did}:3:CL:1234:shards"
+        self.session.settings.set_value("revocation.issuance_shards", 2)
+        recs = []
+        for n in range(3):
+            rec = await self.revoc.init_issuer_registry(CRED_DEF_ID)
+            rec.revoc_reg_id = f"dummy-{n}"
+            rec.state = IssuerRevRegRecord.STATE_ACTIVE
+            await rec.save(self.session)
+            recs.append(rec)
+
+        results = [
+            await self.revoc.get_issuance_rev_reg_record(CRED_DEF_ID) for _ in range(4)
+        ]
+        assert sorted(result.revoc_reg_id for result in results) == [
+            "dummy-0",
+            "dummy-0",
+            "dummy-1",
+            "dummy-1",
+        ]
+        assert (
+            IndyRevocation.ISSUANCE_COUNTS[(self.session.profile.name, CRED_DEF_ID)]
+            == 4
+        )
+
+        # looking up the active registry does not take a turn
+        for _ in range(2):
+            result = await self.revoc.get_active_issuer_rev_reg_record(CRED_DEF_ID)
+            assert result.revoc_reg_id == "dummy-0"
+
     async def test_get_issuer_rev_reg_record(self):
         CRED_DEF_ID = f"{self.test_did}:3:CL:1234:default"
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from asynctest import mock as async_mock
@@ -7,7 +8,7 @@ from time import time
 
 from ...core.in_memory import InMemoryProfile
 from ...indy.holder import IndyHolder
-from ...indy.issuer import IndyIssuer
+from ...indy.issuer import IndyIssuer, IndyIssuerError
 from ...messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
 from ...messaging.request_context import RequestContext
 from ...protocols.issue_credential.v1_0.models.credential_exchange import (
@@ -32,6 +33,15 @@ TAILS_HASH = "8UW1Sz5cqoUnK9hqQk7nvtKK65t7Chu3ui866J23sFyJ"
 TAILS_LOCAL = f"{TAILS_DIR}/{TAILS_HASH}"
 
 
+def mock_send_entry(txn_time: int = 1234) -> async_mock.MagicMock:
+    async def send_entry(session):
+        sent = asyncio.get_event_loop().create_future()
+        sent.set_result(txn_time)
+        return sent
+
+    return async_mock.MagicMock(side_effect=send_entry)
+
+
 class TestRevocationManager(AsyncTestCase):
     async def setUp(self):
         self.session = InMemoryProfile.test_session()
@@ -54,7 +64,7 @@ class TestRevocationManager(AsyncTestCase):
             mock_issuer_rev_reg_record = async_mock.MagicMock(
                 revoc_reg_id=REV_REG_ID,
                 tails_local_path=TAILS_LOCAL,
-                send_entry=async_mock.CoroutineMock(),
+                send_entry=mock_send_entry(),
                 clear_pending=async_mock.CoroutineMock(),
             )
             mock_rev_reg = async_mock.MagicMock(
@@ -167,7 +177,7 @@ class TestRevocationManager(AsyncTestCase):
             revoc_reg_id=REV_REG_ID,
             tails_local_path=TAILS_LOCAL,
             pending_pub=["1", "2"],
-            send_entry=async_mock.CoroutineMock(),
+            send_entry=mock_send_entry(),
             clear_pending=async_mock.CoroutineMock(),
         )
         with async_mock.patch.object(
@@ -210,14 +220,14 @@ class TestRevocationManager(AsyncTestCase):
                 revoc_reg_id=REV_REG_ID,
                 tails_local_path=TAILS_LOCAL,
                 pending_pub=["1", "2"],
-                send_entry=async_mock.CoroutineMock(),
+                send_entry=mock_send_entry(),
                 clear_pending=async_mock.CoroutineMock(),
             ),
             async_mock.MagicMock(
                 revoc_reg_id=f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:tag2",
                 tails_local_path=TAILS_LOCAL,
                 pending_pub=["9", "99"],
-                send_entry=async_mock.CoroutineMock(),
+                send_entry=mock_send_entry(),
                 clear_pending=async_mock.CoroutineMock(),
             ),
         ]
@@ -262,14 +272,14 @@ class TestRevocationManager(AsyncTestCase):
                 revoc_reg_id=REV_REG_ID,
                 tails_local_path=TAILS_LOCAL,
                 pending_pub=["1", "2"],
-                send_entry=async_mock.CoroutineMock(),
+                send_entry=mock_send_entry(),
                 clear_pending=async_mock.CoroutineMock(),
             ),
             async_mock.MagicMock(
                 revoc_reg_id=f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:tag2",
                 tails_local_path=TAILS_LOCAL,
                 pending_pub=["9", "99"],
-                send_entry=async_mock.CoroutineMock(),
+                send_entry=mock_send_entry(),
                 clear_pending=async_mock.CoroutineMock(),
             ),
         ]
@@ -293,6 +303,56 @@ class TestRevocationManager(AsyncTestCase):
             mock_issuer_rev_reg_records[0].clear_pending.assert_called_once()
             mock_issuer_rev_reg_records[1].clear_pending.assert_not_called()
 
+    async def test_publish_pending_revocations_concurrent(self):
+        rrids = [REV_REG_ID, f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:tag2"]
+        mock_issuer_rev_reg_records = [
+            async_mock.MagicMock(
+                revoc_reg_id=rrid,
+                tails_local_path=TAILS_LOCAL,
+                pending_pub=["1", "2"],
+                send_entry=mock_send_entry(),
+                clear_pending=async_mock.CoroutineMock(),
+            )
+            for rrid in rrids
+        ]
+        running = set()
+        overlapped = []
+
+        async def revoke_credentials(rrid, tails_path, crids):
+            running.add(rrid)
+            await asyncio.sleep(0.01)
+            overlapped.append(len(running) > 1)
+            running.remove(rrid)
+            if rrid != REV_REG_ID:
+                raise IndyIssuerError("failed")
+            return (json.dumps({"ver": "1.0", "value": {}}), ["2"])
+
+        with async_mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_by_pending",
+            async_mock.CoroutineMock(return_value=mock_issuer_rev_reg_records),
+        ):
+            issuer = async_mock.MagicMock(IndyIssuer, autospec=True)
+            issuer.revoke_credentials = async_mock.CoroutineMock(
+                side_effect=revoke_credentials
+            )
+            self.session.context.injector.bind_instance(IndyIssuer, issuer)
+
+            with self.assertRaises(test_module.RevocationPublishError) as x_publish:
+                await self.manager.publish_pending_revocations()
+            assert x_publish.exception.published == {REV_REG_ID: ["1"]}
+            assert rrids[1] in x_publish.exception.message
+            assert isinstance(x_publish.exception.__cause__, IndyIssuerError)
+            assert overlapped[0]
+            mock_issuer_rev_reg_records[0].clear_pending.assert_called_once_with(
+                async_mock.ANY, ["1"]
+            )
+            # each registry is published in a session of its own
+            (session, _) = mock_issuer_rev_reg_records[0].clear_pending.call_args[0]
+            assert session is not self.session
+            mock_issuer_rev_reg_records[0].send_entry.assert_called_once_with(session)
+            mock_issuer_rev_reg_records[1].clear_pending.assert_not_called()
+
     async def test_clear_pending(self):
         mock_issuer_rev_reg_records = [
             async_mock.MagicMock(
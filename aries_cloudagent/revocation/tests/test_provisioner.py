@@ -0,0 +1,167 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...ledger.base import BaseLedger
+
+from ..error import RevocationError
+from ..models.issuer_rev_reg_record import IssuerRevRegRecord
+from ..provisioner import RevRegProvisioner
+
+from .. import provisioner as test_module
+
+TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
+CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:default"
+OTHER_CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:other"
+
+
+class TestRevRegProvisioner(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger.__aenter__ = async_mock.CoroutineMock(return_value=self.ledger)
+        self.ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        self.ledger.get_credential_definition = async_mock.CoroutineMock(
+            return_value={"value": {"revocation": {"maxCredNum": 10}}}
+        )
+        self.profile.context.injector.bind_instance(BaseLedger, self.ledger)
+        self.provisioner = RevRegProvisioner(spares=2)
+
+        self.staged = []
+        self.generate_error = None
+        self.upload_error = None
+
+        async def generate_registry(record, session):
+            await asyncio.sleep(0.01)
+            if self.generate_error:
+                raise self.generate_error
+            record.revoc_reg_id = f"{record.cred_def_id}:{record._id}"
+            await record.set_state(session, IssuerRevRegRecord.STATE_GENERATED)
+
+        async def set_tails_file_public_uri(record, session, tails_file_uri):
+            record.tails_public_uri = tails_file_uri
+            await record.save(session)
+
+        async def send_def(record, session):
+            await record.set_state(session, IssuerRevRegRecord.STATE_POSTED)
+
+        async def upload_tails_file(record, session, max_attempts=5):
+            if self.upload_error:
+                raise self.upload_error
+
+        async def send_entry(record, session):
+            self.staged.append(record)
+            await record.set_state(session, IssuerRevRegRecord.STATE_ACTIVE)
+
+        for name, fake in (
+            ("generate_registry", generate_registry),
+            ("set_tails_file_public_uri", set_tails_file_public_uri),
+            ("send_def", send_def),
+            ("upload_tails_file", upload_tails_file),
+            ("send_entry", send_entry),
+        ):
+            patcher = async_mock.patch.object(IssuerRevRegRecord, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def add_active(self, cred_def_id: str = CRED_DEF_ID):
+        async with self.profile.session() as session:
+            await IssuerRevRegRecord(
+                issuer_did=TEST_DID,
+                cred_def_id=cred_def_id,
+                max_cred_num=10,
+                state=IssuerRevRegRecord.STATE_ACTIVE,
+            ).save(session)
+
+    async def test_provision(self):
+        await self.add_active()
+        staged = await self.provisioner.provision(self.profile, CRED_DEF_ID)
+        assert staged == self.staged
+        assert len(staged) == 2
+        assert all(record.max_cred_num == 10 for record in staged)
+        assert await self.provisioner.provision(self.profile, CRED_DEF_ID) == []
+
+        async with self.profile.session() as session:
+            active = await IssuerRevRegRecord.query_by_cred_def_id(
+                session, CRED_DEF_ID, IssuerRevRegRecord.STATE_ACTIVE
+            )
+        assert len(active) == 3
+
+    async def test_provision_shards(self):
+        await self.add_active()
+        self.profile.settings.set_value("revocation.issuance_shards", 3)
+        staged = await self.provisioner.provision(self.profile, CRED_DEF_ID)
+        assert len(staged) == 4
+
+    async def test_provision_shared(self):
+        first, second = await asyncio.gather(
+            self.provisioner.provision(self.profile, CRED_DEF_ID, max_cred_num=20),
+            self.provisioner.provision(self.profile, CRED_DEF_ID),
+        )
+        assert first == second
+        assert len(self.staged) == 3
+        assert all(record.max_cred_num == 20 for record in self.staged)
+
+    async def test_top_up_x(self):
+        await self.add_active()
+        self.upload_error = RevocationError("tails server down")
+        with self.assertRaises(RevocationError):
+            await self.provisioner.provision(self.profile, CRED_DEF_ID)
+
+        with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+            assert (await self.provisioner.top_up(self.profile, CRED_DEF_ID)) == []
+            mock_logger.exception.assert_called_once()
+
+    async def test_provision_resume(self):
+        await self.add_active()
+        self.upload_error = RevocationError("tails server down")
+        with self.assertRaises(RevocationError):
+            await self.provisioner.provision(self.profile, CRED_DEF_ID)
+        async with self.profile.session() as session:
+            posted = await IssuerRevRegRecord.query_by_cred_def_id(
+                session, CRED_DEF_ID, IssuerRevRegRecord.STATE_POSTED
+            )
+        assert len(posted) == 2
+        assert not self.staged
+
+        self.upload_error = None
+        staged = await self.provisioner.provision(self.profile, CRED_DEF_ID)
+        assert sorted(record.revoc_reg_id for record in staged) == sorted(
+            record.revoc_reg_id for record in posted
+        )
+        async with self.profile.session() as session:
+            assert (
+                len(await IssuerRevRegRecord.query_by_cred_def_id(session, CRED_DEF_ID))
+                == 3
+            )
+
+    async def test_provision_generate_x(self):
+        await self.add_active()
+        self.generate_error = RevocationError("no space left")
+        with self.assertRaises(RevocationError):
+            await self.provisioner.provision(self.profile, CRED_DEF_ID)
+        async with self.profile.session() as session:
+            records = await IssuerRevRegRecord.query_by_cred_def_id(
+                session, CRED_DEF_ID
+            )
+        assert [record.state for record in records] == [IssuerRevRegRecord.STATE_ACTIVE]
+
+    async def test_top_up_all(self):
+        await self.add_active(CRED_DEF_ID)
+        await self.add_active(OTHER_CRED_DEF_ID)
+        staged = await self.provisioner.top_up_all(self.profile)
+        assert len(staged) == 4
+        assert {record.cred_def_id for record in staged} == {
+            CRED_DEF_ID,
+            OTHER_CRED_DEF_ID,
+        }
+
+    async def test_stop(self):
+        top_up = self.provisioner.top_up(self.profile, CRED_DEF_ID)
+        await asyncio.sleep(0)
+        await self.provisioner.stop()
+        with self.assertRaises(asyncio.CancelledError):
+            await top_up
+        assert not self.staged
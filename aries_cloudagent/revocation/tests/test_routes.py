@@ -1,3 +1,5 @@
+import asyncio
+
 from aiohttp.web import HTTPBadRequest, HTTPNotFound
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
@@ -7,6 +9,7 @@ from ...storage.in_memory import InMemoryStorage
 from ...tails.base import BaseTailsServer
 
 from .. import routes as test_module
+from ..manager import RevocationPublishError
 
 
 class TestRevocationRoutes(AsyncTestCase):
@@ -171,6 +174,12 @@ class TestRevocationRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.publish_revocations(self.request)
 
+            pub_pending.side_effect = RevocationPublishError(
+                "partial", published={"rr-id": ["1"]}
+            )
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.publish_revocations(self.request)
+
     async def test_clear_pending_revocations(self):
         self.request.json = async_mock.CoroutineMock()
 
@@ -293,16 +302,59 @@ class TestRevocationRoutes(AsyncTestCase):
         }
 
         with async_mock.patch.object(
-            test_module.IssuerRevRegRecord, "query", async_mock.CoroutineMock()
+            test_module.IssuerRevRegRecord, "query_page", async_mock.CoroutineMock()
         ) as mock_query, async_mock.patch.object(
             test_module.web, "json_response", async_mock.Mock()
         ) as mock_json_response:
-            mock_query.return_value = [async_mock.MagicMock(revoc_reg_id="dummy")]
+            mock_query.return_value = (
+                [async_mock.MagicMock(revoc_reg_id="dummy")],
+                None,
+            )
 
             result = await test_module.rev_regs_created(self.request)
             mock_json_response.assert_called_once_with({"rev_reg_ids": ["dummy"]})
             assert result is mock_json_response.return_value
 
+    async def test_rev_regs_created_paginated(self):
+        self.request.query = {
+            "state": test_module.IssuerRevRegRecord.STATE_ACTIVE,
+            "limit": "1",
+            "cursor": "dummy-cursor",
+        }
+
+        with async_mock.patch.object(
+            test_module.IssuerRevRegRecord, "query_page", async_mock.CoroutineMock()
+        ) as mock_query, async_mock.patch.object(
+            test_module.web, "json_response", async_mock.Mock()
+        ) as mock_json_response:
+            mock_query.return_value = (
+                [async_mock.MagicMock(revoc_reg_id="dummy")],
+                "next-cursor",
+            )
+
+            result = await test_module.rev_regs_created(self.request)
+            mock_query.assert_awaited_once_with(
+                async_mock.ANY,
+                {"state": test_module.IssuerRevRegRecord.STATE_ACTIVE},
+                limit=1,
+                cursor="dummy-cursor",
+            )
+            mock_json_response.assert_called_once_with(
+                {"rev_reg_ids": ["dummy"], "next_cursor": "next-cursor"}
+            )
+            assert result is mock_json_response.return_value
+
+    async def test_rev_regs_created_x(self):
+        self.request.query = {"cursor": "dummy-cursor"}
+
+        with async_mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_page",
+            async_mock.CoroutineMock(side_effect=test_module.BaseModelError()),
+        ):
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.rev_regs_created(self.request)
+
     async def test_get_rev_reg(self):
         REV_REG_ID = "{}:4:{}:3:CL:1234:default:CL_ACCUM:default".format(
             self.test_did, self.test_did
@@ -438,12 +490,10 @@ class TestRevocationRoutes(AsyncTestCase):
         )
         CRED_REV_ID = "1"
 
-        self.request.json = async_mock.CoroutineMock(
-            return_value={
-                "rev_reg_id": REV_REG_ID,
-                "cred_rev_id": CRED_REV_ID,
-            }
-        )
+        self.request.query = {
+            "rev_reg_id": REV_REG_ID,
+            "cred_rev_id": CRED_REV_ID,
+        }
 
         with async_mock.patch.object(
             test_module.IssuerCredRevRecord,
@@ -667,6 +717,11 @@ class TestRevocationRoutes(AsyncTestCase):
                 await test_module.send_rev_reg_def(self.request)
 
     async def test_send_rev_reg_entry(self):
+        async def send_entry(session):
+            sent = asyncio.get_event_loop().create_future()
+            sent.set_result(1234)
+            return sent
+
         REV_REG_ID = "{}:4:{}:3:CL:1234:default:CL_ACCUM:default".format(
             self.test_did, self.test_did
         )
@@ -680,7 +735,7 @@ class TestRevocationRoutes(AsyncTestCase):
             mock_indy_revoc.return_value = async_mock.MagicMock(
                 get_issuer_rev_reg_record=async_mock.CoroutineMock(
                     return_value=async_mock.MagicMock(
-                        send_entry=async_mock.CoroutineMock(),
+                        send_entry=async_mock.MagicMock(side_effect=send_entry),
                         serialize=async_mock.MagicMock(return_value="dummy"),
                     )
                 )
@@ -733,6 +788,31 @@ class TestRevocationRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.send_rev_reg_entry(self.request)
 
+    async def test_send_rev_reg_entry_ledger_x(self):
+        async def send_entry(session):
+            sent = asyncio.get_event_loop().create_future()
+            sent.set_exception(test_module.LedgerError("rejected"))
+            return sent
+
+        REV_REG_ID = "{}:4:{}:3:CL:1234:default:CL_ACCUM:default".format(
+            self.test_did, self.test_did
+        )
+        self.request.match_info = {"rev_reg_id": REV_REG_ID}
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as mock_indy_revoc:
+            mock_indy_revoc.return_value = async_mock.MagicMock(
+                get_issuer_rev_reg_record=async_mock.CoroutineMock(
+                    return_value=async_mock.MagicMock(
+                        send_entry=async_mock.MagicMock(side_effect=send_entry),
+                    )
+                )
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.send_rev_reg_entry(self.request)
+
     async def test_update_rev_reg(self):
         REV_REG_ID = "{}:4:{}:3:CL:1234:default:CL_ACCUM:default".format(
             self.test_did, self.test_did
@@ -1,7 +1,7 @@
 """Abstract base classes for non-secrets storage."""
 
 from abc import ABC, abstractmethod
-from typing import Mapping, Sequence
+from typing import Mapping, Optional, Sequence
 
 from .error import StorageError, StorageDuplicateError, StorageNotFoundError
 from .record import StorageRecord
@@ -25,6 +25,16 @@ def validate_record(record: StorageRecord, *, delete=False):
 class BaseStorage(ABC):
     """Abstract stored records interface."""
 
+    @property
+    def record_cache_scope(self) -> Optional[object]:
+        """
+        Accessor for the backing store, to scope caches of its record values.
+
+        Backends which return a store here must clear cached values of the
+        records they write with `record_cache.clear_record_cache`.
+        """
+        return None
+
     @abstractmethod
     async def add_record(self, record: StorageRecord):
         """
@@ -74,6 +84,44 @@ class BaseStorage(ABC):
 
         """
 
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        Backends override this method to store the records in fewer operations.
+
+        Args:
+            records: `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            await self.add_record(record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records.
+
+        The stored value and tags of each record are replaced with those of
+        the given `StorageRecord`.
+
+        Args:
+            records: `StorageRecord` instances carrying the new values and tags
+
+        """
+        for record in records:
+            await self.update_record(record, record.value, record.tags)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        Args:
+            records: `StorageRecord` instances to delete
+
+        """
+        for record in records:
+            await self.delete_record(record)
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping = None, options: Mapping = None
     ) -> StorageRecord:
@@ -1,6 +1,6 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
-from typing import Mapping, Sequence
+from typing import Mapping, Optional, Sequence, Set
 
 from ..core.in_memory import InMemoryProfile
 
@@ -17,6 +17,8 @@ from .error import (
     StorageSearchError,
 )
 from .record import StorageRecord
+from .record_cache import clear_record_cache
+from .wql import compile_tag_query, compile_tag_value_match
 
 
 class InMemoryStorage(BaseStorage, BaseStorageSearch):
@@ -32,6 +34,11 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         """
         self.profile = profile
 
+    @property
+    def record_cache_scope(self) -> InMemoryProfile:
+        """Accessor for the backing store, to scope caches of its record values."""
+        return self.profile
+
     async def add_record(self, record: StorageRecord):
         """
         Add a new record to the store.
@@ -48,6 +55,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         if record.id in self.profile.records:
             raise StorageDuplicateError("Duplicate record")
         self.profile.records[record.id] = record
+        _index_record(self.profile, record)
 
     async def get_record(
         self, record_type: str, record_id: str, options: Mapping = None
@@ -90,7 +98,11 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         oldrec = self.profile.records.get(record.id)
         if not oldrec:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        self.profile.records[record.id] = oldrec._replace(value=value, tags=tags)
+        newrec = oldrec._replace(value=value, tags=tags)
+        _unindex_record(self.profile, oldrec, sequence=False)
+        self.profile.records[record.id] = newrec
+        _index_record(self.profile, newrec)
+        clear_record_cache(self.profile, record.type, [record.id])
 
     async def delete_record(self, record: StorageRecord):
         """
@@ -106,7 +118,78 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         validate_record(record, delete=True)
         if record.id not in self.profile.records:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        del self.profile.records[record.id]
+        _unindex_record(self.profile, self.profile.records.pop(record.id))
+        clear_record_cache(self.profile, record.type, [record.id])
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        No record is stored unless all of them can be stored.
+
+        Args:
+            records: `StorageRecord` instances to be stored
+
+        Raises:
+            StorageDuplicateError: If a record ID is already in use
+
+        """
+        ids = set()
+        for record in records:
+            validate_record(record)
+            if record.id in self.profile.records or record.id in ids:
+                raise StorageDuplicateError("Duplicate record")
+            ids.add(record.id)
+        for record in records:
+            self.profile.records[record.id] = record
+            _index_record(self.profile, record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records.
+
+        No record is updated unless all of them can be updated.
+
+        Args:
+            records: `StorageRecord` instances carrying the new values and tags
+
+        Raises:
+            StorageNotFoundError: If a record is not found
+
+        """
+        for record in records:
+            validate_record(record)
+            if record.id not in self.profile.records:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+        for record in records:
+            oldrec = self.profile.records[record.id]
+            newrec = oldrec._replace(value=record.value, tags=record.tags)
+            _unindex_record(self.profile, oldrec, sequence=False)
+            self.profile.records[record.id] = newrec
+            _index_record(self.profile, newrec)
+            clear_record_cache(self.profile, record.type, [record.id])
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        No record is deleted unless all of them can be deleted.
+
+        Args:
+            records: `StorageRecord` instances to delete
+
+        Raises:
+            StorageNotFoundError: If a record is not found
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+            if record.id not in self.profile.records:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+        for record_id in {record.id for record in records}:
+            _unindex_record(self.profile, self.profile.records.pop(record_id))
+        for record in records:
+            clear_record_cache(self.profile, record.type, [record.id])
 
     async def find_all_records(
         self,
@@ -115,9 +198,11 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         options: Mapping = None,
     ):
         """Retrieve all records matching a particular type filter and tag query."""
+        match = compile_tag_query(tag_query)
         results = []
-        for record in self.profile.records.values():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
+        for record_id in _search_ids(self.profile, type_filter, tag_query):
+            record = self.profile.records[record_id]
+            if match(record.tags):
                 results.append(record)
         return results
 
@@ -127,12 +212,14 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         tag_query: Mapping = None,
     ):
         """Remove all records matching a particular type filter and tag query."""
+        match = compile_tag_query(tag_query)
         ids = []
-        for record_id, record in self.profile.records.items():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
+        for record_id in _search_ids(self.profile, type_filter, tag_query):
+            if match(self.profile.records[record_id].tags):
                 ids.append(record_id)
         for record_id in ids:
-            del self.profile.records[record_id]
+            _unindex_record(self.profile, self.profile.records.pop(record_id))
+        clear_record_cache(self.profile, type_filter, ids)
 
     def search_records(
         self,
@@ -159,73 +246,128 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         )
 
 
+def _index_record(profile: InMemoryProfile, record: StorageRecord):
+    """Add a stored record to the type and tag indexes of the profile."""
+    type_ids = profile.record_type_index.setdefault(record.type, {})
+    if record.id not in type_ids:
+        type_ids[record.id] = next(profile.record_sequence)
+    tag_ids = profile.record_tag_index.setdefault(record.type, {})
+    for name, value in (record.tags or {}).items():
+        if isinstance(value, str):
+            tag_ids.setdefault((name, value), set()).add(record.id)
+
+
+def _unindex_record(
+    profile: InMemoryProfile, record: StorageRecord, sequence: bool = True
+):
+    """Remove a stored record from the type and tag indexes of the profile."""
+    if sequence:
+        type_ids = profile.record_type_index.get(record.type)
+        if type_ids is not None:
+            type_ids.pop(record.id, None)
+            if not type_ids:
+                del profile.record_type_index[record.type]
+    tag_ids = profile.record_tag_index.get(record.type)
+    if tag_ids is None:
+        return
+    for name, value in (record.tags or {}).items():
+        if isinstance(value, str):
+            ids = tag_ids.get((name, value))
+            if ids is not None:
+                ids.discard(record.id)
+                if not ids:
+                    del tag_ids[(name, value)]
+    if not tag_ids:
+        del profile.record_tag_index[record.type]
+
+
+def _tag_query_candidates(tag_ids: dict, tag_query: Mapping) -> Optional[Set[str]]:
+    """
+    Determine the candidate record IDs for a tag query from the tag index.
+
+    The result is a superset of the matching record IDs, or None when the
+    query cannot be narrowed by the index (range operators, `$not`, `$neq`,
+    malformed subqueries). Candidates must still be checked with the
+    compiled tag query.
+    """
+    result = None
+    for k, v in (tag_query or {}).items():
+        if k == "$and":
+            if not isinstance(v, list):
+                continue
+            found = None
+            for opt in v:
+                opt_ids = (
+                    _tag_query_candidates(tag_ids, opt)
+                    if isinstance(opt, dict)
+                    else None
+                )
+                if opt_ids is not None:
+                    found = opt_ids if found is None else found & opt_ids
+        elif k == "$or":
+            if not isinstance(v, list) or not v:
+                continue
+            found = set()
+            for opt in v:
+                opt_ids = (
+                    _tag_query_candidates(tag_ids, opt)
+                    if isinstance(opt, dict)
+                    else None
+                )
+                if opt_ids is None:
+                    found = None
+                    break
+                found |= opt_ids
+        elif isinstance(v, str) and k[0] != "$":
+            found = tag_ids.get((k, v), set())
+        elif (
+            isinstance(v, dict)
+            and len(v) == 1
+            and isinstance(v.get("$in"), list)
+            and all(isinstance(opt, str) for opt in v["$in"])
+        ):
+            found = set()
+            for opt in v["$in"]:
+                found |= tag_ids.get((k, opt), set())
+        else:
+            continue
+        if found is None:
+            continue
+        result = found if result is None else result & found
+        if not result:
+            break
+    return result
+
+
+def _search_ids(
+    profile: InMemoryProfile, type_filter: str, tag_query: Mapping
+) -> Sequence[str]:
+    """Snapshot the IDs of records which may match a type filter and tag query."""
+    type_ids = profile.record_type_index.get(type_filter)
+    if not type_ids:
+        return []
+    candidates = _tag_query_candidates(
+        profile.record_tag_index.get(type_filter, {}), tag_query
+    )
+    if candidates is None:
+        return list(type_ids)
+    return sorted(candidates, key=type_ids.__getitem__)
+
+
 def tag_value_match(value: str, match: dict) -> bool:
     """Match a single tag against a tag subquery.
 
-    TODO: What type coercion is needed? (support int or float values?)
+    Searches compile the subquery once with `compile_tag_value_match` instead.
     """
-    if len(match) != 1:
-        raise StorageSearchError("Unsupported subquery: {}".format(match))
-    if value is None:
-        return False
-    op = list(match.keys())[0]
-    cmp_val = match[op]
-    if op == "$in":
-        if not isinstance(cmp_val, list):
-            raise StorageSearchError("Expected list for $in value")
-        chk = value in cmp_val
-    else:
-        if not isinstance(cmp_val, str):
-            raise StorageSearchError("Expected string for filter value")
-        if op == "$neq":
-            chk = value != cmp_val
-        elif op == "$gt":
-            chk = float(value) > float(cmp_val)
-        elif op == "$gte":
-            chk = float(value) >= float(cmp_val)
-        elif op == "$lt":
-            chk = float(value) < float(cmp_val)
-        elif op == "$lte":
-            chk = float(value) <= float(cmp_val)
-        # elif op == "$like":  NYI
-        else:
-            raise StorageSearchError(f"Unsupported match operator: {op}")
-    return chk
+    return compile_tag_value_match(match)(value)
 
 
 def tag_query_match(tags: dict, tag_query: dict) -> bool:
-    """Match simple tag filters (string values)."""
-    result = True
-    if not tags:
-        tags = {}
-    if tag_query:
-        for k, v in tag_query.items():
-            if k == "$or":
-                if not isinstance(v, list):
-                    raise StorageSearchError("Expected list for $or filter value")
-                chk = False
-                for opt in v:
-                    if tag_query_match(tags, opt):
-                        chk = True
-                        break
-            elif k == "$not":
-                if not isinstance(v, dict):
-                    raise StorageSearchError("Expected dict for $not filter value")
-                chk = not tag_query_match(tags, v)
-            elif k[0] == "$":
-                raise StorageSearchError("Unexpected filter operator: {}".format(k))
-            elif isinstance(v, str):
-                chk = tags.get(k) == v
-            elif isinstance(v, dict):
-                chk = tag_value_match(tags.get(k), v)
-            else:
-                raise StorageSearchError(
-                    "Expected string or dict for filter value, got {}".format(v)
-                )
-            if not chk:
-                result = False
-                break
-    return result
+    """Match simple tag filters (string values).
+
+    Searches compile the query once with `compile_tag_query` instead.
+    """
+    return compile_tag_query(tag_query)(tags)
 
 
 class InMemoryStorageSearch(BaseStorageSearchSession):
@@ -250,8 +392,10 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             options: Dictionary of backend-specific options
 
         """
-        self._cache = profile.records.copy()
-        self._iter = iter(self._cache)
+        self._profile = profile
+        self._match = compile_tag_query(tag_query)
+        self._ids = _search_ids(profile, type_filter, tag_query)
+        self._iter = iter(self._ids)
         self.page_size = page_size or DEFAULT_PAGE_SIZE
         self.tag_query = tag_query
         self.type_filter = type_filter
@@ -271,7 +415,7 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             StorageSearchError: If the search query has not been opened
 
         """
-        if self._cache is None:
+        if self._ids is None:
             raise StorageSearchError("Search query is complete")
 
         ret = []
@@ -283,18 +427,16 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
                 id = next(self._iter)
             except StopIteration:
                 break
-            record = self._cache[id]
-            if record.type == check_type and tag_query_match(
-                record.tags, self.tag_query
-            ):
+            record = self._profile.records.get(id)
+            if record and record.type == check_type and self._match(record.tags):
                 ret.append(record)
                 i -= 1
 
         if not ret:
-            self._cache = None
+            self._ids = None
 
         return ret
 
     async def close(self):
         """Dispose of the search query."""
-        self._cache = None
+        self._ids = None
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import logging
-from typing import Mapping, Sequence
+from typing import Awaitable, Callable, Mapping, Sequence
 
 from indy import non_secrets
 from indy.error import IndyError, ErrorCode
@@ -22,10 +22,13 @@ from .error import (
     StorageSearchError,
 )
 from .record import StorageRecord
+from .record_cache import clear_record_cache
 from ..indy.sdk.wallet_setup import IndyOpenWallet
 
 LOGGER = logging.getLogger(__name__)
 
+BATCH_CONCURRENCY = 10
+
 
 class IndySdkStorage(BaseStorage, BaseStorageSearch):
     """Indy Non-Secrets interface."""
@@ -45,6 +48,11 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
         """Accessor for IndyOpenWallet instance."""
         return self._wallet
 
+    @property
+    def record_cache_scope(self) -> IndyOpenWallet:
+        """Accessor for the backing store, to scope caches of its record values."""
+        return self._wallet
+
     async def add_record(self, record: StorageRecord):
         """
         Add a new record to the store.
@@ -145,6 +153,8 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
             if x_indy.error_code == ErrorCode.WalletItemNotFound:
                 raise StorageNotFoundError(f"Record not found: {record.id}")
             raise StorageError(str(x_indy))
+        finally:
+            clear_record_cache(self._wallet, record.type, [record.id])
 
     async def delete_record(self, record: StorageRecord):
         """
@@ -167,6 +177,75 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
             if x_indy.error_code == ErrorCode.WalletItemNotFound:
                 raise StorageNotFoundError(f"Record not found: {record.id}")
             raise StorageError(str(x_indy))
+        finally:
+            clear_record_cache(self._wallet, record.type, [record.id])
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        The non-secrets API has no batch or transaction support, so the
+        wallet operations are submitted concurrently, up to `BATCH_CONCURRENCY`
+        at a time. The batch is not atomic: if one operation fails, the others
+        may still have been applied.
+
+        Args:
+            records: `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            validate_record(record)
+        await self._gather(self.add_record, records)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing records.
+
+        Args:
+            records: `StorageRecord` instances carrying the new values and tags
+
+        """
+        for record in records:
+            validate_record(record)
+        await self._gather(
+            lambda record: self.update_record(record, record.value, record.tags),
+            records,
+        )
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        Args:
+            records: `StorageRecord` instances to delete
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+        await self._gather(self.delete_record, records)
+
+    async def _gather(
+        self,
+        operation: Callable[[StorageRecord], Awaitable],
+        records: Sequence[StorageRecord],
+    ):
+        """Apply a wallet operation to each record, `BATCH_CONCURRENCY` at a time.
+
+        Every operation runs even if another fails; the first error is raised
+        once all have completed.
+        """
+        limit = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def apply(record: StorageRecord):
+            async with limit:
+                return await operation(record)
+
+        results = await asyncio.gather(
+            *(apply(record) for record in records), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
     async def find_all_records(
         self,
@@ -191,10 +270,15 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
         tag_query: Mapping = None,
     ):
         """Remove all records matching a particular type filter and tag query."""
-        async for row in self.search_records(
+        search = self.search_records(
             type_filter, tag_query, options={"retrieveTags": False}
-        ):
-            await self.delete_record(row)
+        )
+        while True:
+            buf = await search.fetch()
+            if buf:
+                await self.delete_records(buf)
+            else:
+                break
 
     def search_records(
         self,
@@ -0,0 +1,109 @@
+"""Process-local cache of stored record values, cleared by storage writes."""
+
+import time
+
+from collections import OrderedDict
+from typing import Optional, Sequence
+from weakref import WeakKeyDictionary
+
+
+class RecordValueCache:
+    """Bounded LRU cache of stored record values, keyed by record ID."""
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: the maximum number of values held
+            ttl: the number of seconds for which a value is held
+
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self._values = OrderedDict()
+
+    def get(self, record_id: str) -> Optional[str]:
+        """Fetch an unexpired stored value, marking it as most recently used."""
+        entry = self._values.get(record_id)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires <= time.perf_counter():
+            del self._values[record_id]
+            return None
+        self._values.move_to_end(record_id)
+        return value
+
+    def put(self, record_id: str, value: str, generation: int):
+        """
+        Cache a stored value read at the given generation.
+
+        Values read before the most recent invalidation may be stale and are
+        not cached.
+        """
+        if generation != self.generation:
+            return
+        self._values[record_id] = (value, time.perf_counter() + self.ttl)
+        self._values.move_to_end(record_id)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def invalidate(self, record_ids: Sequence[str] = None):
+        """Remove stored values after a write, or all values if no IDs given."""
+        self.generation += 1
+        if record_ids is None:
+            self._values.clear()
+            return
+        for record_id in record_ids:
+            self._values.pop(record_id, None)
+
+    def __len__(self) -> int:
+        """Accessor for the number of cached values."""
+        return len(self._values)
+
+
+# Record value caches per backing store, so that wallets never share entries
+RECORD_CACHES: "WeakKeyDictionary[object, dict]" = WeakKeyDictionary()
+
+
+def get_record_cache(
+    scope: object, record_type: str, max_size: int, ttl: float
+) -> RecordValueCache:
+    """
+    Fetch the value cache of a record type in a backing store, creating it.
+
+    Args:
+        scope: the backing store, as given by `BaseStorage.record_cache_scope`
+        record_type: the record type
+        max_size: the maximum number of values held, if created
+        ttl: the number of seconds for which a value is held, if created
+
+    """
+    caches = RECORD_CACHES.get(scope)
+    if caches is None:
+        caches = RECORD_CACHES[scope] = {}
+    cache = caches.get(record_type)
+    if cache is None:
+        cache = caches[record_type] = RecordValueCache(max_size, ttl)
+    return cache
+
+
+def clear_record_cache(
+    scope: object, record_type: str, record_ids: Sequence[str] = None
+):
+    """
+    Invalidate cached values of a record type after a write to the backing store.
+
+    Args:
+        scope: the backing store, as given by `BaseStorage.record_cache_scope`
+        record_type: the record type written
+        record_ids: the IDs of the records written, or None for all
+
+    """
+    if scope is None:
+        return
+    cache = RECORD_CACHES.get(scope, {}).get(record_type)
+    if cache is not None:
+        cache.invalidate(record_ids)
@@ -156,6 +156,135 @@ class TestInMemoryStorage:
         with pytest.raises(StorageNotFoundError):
             await store.find_record(record.type, {}, None)
 
+    @pytest.mark.asyncio
+    async def test_find_all_indexed(self, store):
+        records = [
+            test_record({"a": "one", "b": "x"}),
+            test_record({"a": "two", "b": "x"}),
+            test_record({"a": "three", "b": "y", "z": "5"}),
+        ]
+        for record in records:
+            await store.add_record(record)
+        await store.add_record(test_missing_record())
+
+        async def found_ids(tag_query):
+            rows = await store.find_all_records("TYPE", tag_query)
+            return [row.id for row in rows]
+
+        assert await found_ids({"b": "x"}) == [records[0].id, records[1].id]
+        assert await found_ids({"a": {"$in": ["three", "one"]}}) == [
+            records[0].id,
+            records[2].id,
+        ]
+        assert await found_ids({"$or": [{"a": "two"}, {"b": "y"}]}) == [
+            records[1].id,
+            records[2].id,
+        ]
+        assert await found_ids({"b": "x", "a": "two"}) == [records[1].id]
+        assert await found_ids({"b": "x", "a": "three"}) == []
+        assert await found_ids({"a": "missing"}) == []
+        assert await found_ids({"z": {"$gt": "1"}}) == [records[2].id]
+        assert await found_ids({"$not": {"b": "x"}}) == [records[2].id]
+
+        # indexes follow updates and deletes
+        await store.update_record(records[0], "UPDATED", {"a": "one", "b": "y"})
+        assert await found_ids({"b": "x"}) == [records[1].id]
+        assert await found_ids({"b": "y"}) == [records[0].id, records[2].id]
+        await store.delete_record(records[2])
+        assert await found_ids({"b": "y"}) == [records[0].id]
+        await store.delete_all_records("TYPE", {"a": "one"})
+        assert await found_ids({}) == [records[1].id]
+
+    @pytest.mark.asyncio
+    async def test_batch(self, store):
+        records = [test_record({"tag": str(i)}) for i in range(3)]
+        await store.add_records(records)
+        rows = await store.find_all_records("TYPE", {})
+        assert sorted(row.id for row in rows) == sorted(rec.id for rec in records)
+
+        with pytest.raises(StorageDuplicateError):
+            await store.add_records(records[:1])
+
+        await store.update_records(
+            [rec._replace(value="UPDATED", tags={"tag": "upd"}) for rec in records[:2]]
+        )
+        rows = await store.find_all_records("TYPE", {"tag": "upd"})
+        assert sorted(row.id for row in rows) == sorted(rec.id for rec in records[:2])
+        assert all(row.value == "UPDATED" for row in rows)
+
+        await store.delete_records(records[1:])
+        rows = await store.find_all_records("TYPE", {})
+        assert [row.id for row in rows] == [records[0].id]
+
+        with pytest.raises(StorageNotFoundError):
+            await store.delete_records(records[1:2])
+        with pytest.raises(StorageError):
+            await store.add_records([test_record()._replace(id=None)])
+
+
+class TestInMemoryStorageIndex:
+    @pytest.mark.asyncio
+    async def test_index_maintenance(self, store):
+        records = [
+            test_record({"a": "one", "b": "x"}),
+            test_record({"a": "two", "b": "x"}),
+        ]
+        for record in records:
+            await store.add_record(record)
+        assert store.profile.record_tag_index["TYPE"] == {
+            ("a", "one"): {records[0].id},
+            ("a", "two"): {records[1].id},
+            ("b", "x"): {records[0].id, records[1].id},
+        }
+
+        await store.update_record(records[0], "UPDATED", {"a": "one"})
+        assert store.profile.record_tag_index["TYPE"] == {
+            ("a", "one"): {records[0].id},
+            ("a", "two"): {records[1].id},
+            ("b", "x"): {records[1].id},
+        }
+        assert list(store.profile.record_type_index["TYPE"]) == [
+            records[0].id,
+            records[1].id,
+        ]
+
+        await store.delete_all_records("TYPE", {"a": "one"})
+        await store.delete_record(records[1])
+        assert not store.profile.record_type_index
+        assert not store.profile.record_tag_index
+
+    @pytest.mark.asyncio
+    async def test_batch_atomic(self, store):
+        existing = test_record()
+        await store.add_record(existing)
+        missing = test_record()
+
+        with pytest.raises(StorageDuplicateError):
+            await store.add_records([missing, existing])
+        with pytest.raises(StorageNotFoundError):
+            await store.get_record(missing.type, missing.id)
+
+        with pytest.raises(StorageNotFoundError):
+            await store.update_records(
+                [existing._replace(value="UPDATED"), missing._replace(value="X")]
+            )
+        assert (await store.get_record(existing.type, existing.id)).value == "TEST"
+
+        with pytest.raises(StorageNotFoundError):
+            await store.delete_records([existing, missing])
+        assert await store.get_record(existing.type, existing.id)
+
+    @pytest.mark.asyncio
+    async def test_search_snapshot(self, store):
+        records = [test_record({"tag": "a"}) for _ in range(3)]
+        for record in records:
+            await store.add_record(record)
+        search = store.search_records("TYPE", {"tag": "a"}, None)
+        await store.delete_record(records[1])
+        await store.add_record(test_record({"tag": "a"}))
+        rows = await search.fetch(10)
+        assert [row.id for row in rows] == [records[0].id, records[2].id]
+
 
 class TestInMemoryStorageSearch:
     @pytest.mark.asyncio
@@ -271,3 +400,15 @@ class TestInMemoryTagQuery:
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"a": -1})
         assert "Expected string or dict for filter value" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    async def test_search_validation(self, store):
+        with pytest.raises(StorageSearchError):
+            await store.find_all_records("TYPE", {"a": {"$near": "aardvark"}})
+        with pytest.raises(StorageSearchError):
+            store.search_records("TYPE", {"$or": "aardvark"})
+
+        record = test_record({"a": "aardvark", "b": "bear"})
+        await store.add_record(record)
+        found = await store.find_all_records(record.type, {"a": {"$like": "%dvark"}})
+        assert [row.id for row in found] == [record.id]
@@ -229,6 +229,35 @@ class TestIndySdkStorage(test_in_memory_storage.TestInMemoryStorage):
                 with pytest.raises(test_module.StorageError):
                     await storage.delete_record(rec)
 
+    @pytest.mark.asyncio
+    async def test_add_records_concurrency(self):
+        storage = IndySdkStorage(async_mock.MagicMock(handle=1))
+        in_flight = []
+        peak = 0
+
+        async def add_wallet_record(handle, record_type, record_id, value, tags):
+            nonlocal peak
+            in_flight.append(record_id)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.001)
+            in_flight.remove(record_id)
+            if record_id == "3":
+                raise test_module.IndyError(ErrorCode.CommonInvalidStructure)
+
+        records = [
+            StorageRecord(type="connection", value="{}", id=str(i)) for i in range(25)
+        ]
+        with async_mock.patch.object(
+            test_module.non_secrets,
+            "add_wallet_record",
+            async_mock.CoroutineMock(side_effect=add_wallet_record),
+        ) as mock_add:
+            with pytest.raises(test_module.StorageError):
+                await storage.add_records(records)
+        # the batch is not atomic: every record is still submitted
+        assert mock_add.call_count == len(records)
+        assert peak == test_module.BATCH_CONCURRENCY
+
     @pytest.mark.asyncio
     async def test_storage_search_x(self):
         with async_mock.patch(
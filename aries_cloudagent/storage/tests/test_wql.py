@@ -0,0 +1,68 @@
+import pytest
+
+from ..error import StorageSearchError
+from ..wql import compile_tag_query, compile_tag_value_match
+
+TAGS = {"a": "aardvark", "b": "bear", "z": "0", "p": "50%_off"}
+
+
+class TestWQL:
+    def test_compile_tag_query(self):
+        assert compile_tag_query(None)(None)
+        assert compile_tag_query({})(TAGS)
+        assert not compile_tag_query({"a": "aardvark"})(None)
+        assert compile_tag_query({"a": "aardvark", "b": "bear"})(TAGS)
+        assert not compile_tag_query({"a": "aardvark", "b": "bee"})(TAGS)
+        assert compile_tag_query({"$or": [{"a": "alligator"}, {"b": "bear"}]})(TAGS)
+        assert not compile_tag_query({"$or": []})(TAGS)
+        assert compile_tag_query({"$and": [{"a": "aardvark"}, {"z": "0"}]})(TAGS)
+        assert not compile_tag_query({"$and": [{"a": "aardvark"}, {"z": "1"}]})(TAGS)
+        assert compile_tag_query({"$not": {"a": "alligator"}})(TAGS)
+        assert compile_tag_query({"a": {"$in": ["aardvark", "alligator"]}})(TAGS)
+        assert not compile_tag_query({"c": {"$neq": "cat"}})(TAGS)
+
+    def test_compile_tag_value_match(self):
+        assert compile_tag_value_match({"$gt": "-0.5"})("0")
+        assert compile_tag_value_match({"$gte": "0"})("0")
+        assert compile_tag_value_match({"$lt": "1"})("0")
+        assert compile_tag_value_match({"$lte": "0"})("0")
+        assert not compile_tag_value_match({"$lt": "1"})("bear")
+        assert not compile_tag_value_match({"$lt": "1"})(None)
+        assert not compile_tag_value_match({"$in": ["a", "b"]})(["a"])
+        assert compile_tag_value_match({"$in": ["a", None]})(None) is False
+
+    def test_like(self):
+        assert compile_tag_query({"a": {"$like": "aard%"}})(TAGS)
+        assert compile_tag_query({"a": {"$like": "%dvar_"}})(TAGS)
+        assert compile_tag_query({"a": {"$like": "%"}})(TAGS)
+        assert not compile_tag_query({"a": {"$like": "aard"}})(TAGS)
+        assert not compile_tag_query({"a": {"$like": "Aard%"}})(TAGS)
+        assert compile_tag_query({"p": {"$like": "50%off"}})(TAGS)
+        assert not compile_tag_query({"p": {"$like": "5.%"}})(TAGS)
+        assert compile_tag_query({"p": {"$like": "5_%"}})(TAGS)
+        assert not compile_tag_query({"c": {"$like": "%"}})(TAGS)
+
+    def test_compile_errors(self):
+        with pytest.raises(StorageSearchError) as excinfo:
+            compile_tag_query({"$or": "-1"})
+        assert "Expected list" in str(excinfo.value)
+
+        with pytest.raises(StorageSearchError) as excinfo:
+            compile_tag_query({"$and": {"a": "aardvark"}})
+        assert "Expected list" in str(excinfo.value)
+
+        with pytest.raises(StorageSearchError) as excinfo:
+            compile_tag_query({"$or": [{"a": {"$near": "aardvark"}}]})
+        assert "Unsupported match operator" in str(excinfo.value)
+
+        with pytest.raises(StorageSearchError) as excinfo:
+            compile_tag_query({"z": {"$gt": "zero"}})
+        assert "Expected numeric string" in str(excinfo.value)
+
+        with pytest.raises(StorageSearchError) as excinfo:
+            compile_tag_query({"a": {"$like": ["aard%"]}})
+        assert "Expected string" in str(excinfo.value)
+
+        with pytest.raises(StorageSearchError) as excinfo:
+            compile_tag_query(["a"])
+        assert "Expected dict for tag query" in str(excinfo.value)
@@ -0,0 +1,143 @@
+"""Compiler for WQL tag queries."""
+
+import re
+
+from typing import Callable, Mapping, Optional
+
+from .error import StorageSearchError
+
+TagQueryPredicate = Callable[[Optional[Mapping]], bool]
+TagValuePredicate = Callable[[Optional[str]], bool]
+
+RANGE_OPERATORS = {
+    "$gt": float.__gt__,
+    "$gte": float.__ge__,
+    "$lt": float.__lt__,
+    "$lte": float.__le__,
+}
+
+
+def compile_tag_query(tag_query: Mapping) -> TagQueryPredicate:
+    """Compile a WQL tag query into a reusable predicate over record tags.
+
+    Supported operators are `$and`, `$or` and `$not` to combine subqueries,
+    and `$neq`, `$in`, `$gt`, `$gte`, `$lt`, `$lte` and `$like` to match tag
+    values. Range operators compare tag values numerically, and tag values
+    which are not numeric do not match. `$like` patterns use `%` to match any
+    sequence of characters and `_` to match a single character.
+
+    Args:
+        tag_query: The tag query to compile, where an empty query matches all
+
+    Returns:
+        A function accepting a tag dictionary (or None) and returning whether
+        it matches the query
+
+    Raises:
+        StorageSearchError: If the tag query is not valid
+
+    """
+    match = _compile_query(tag_query)
+
+    def match_tags(tags: Optional[Mapping]) -> bool:
+        return match(tags or {})
+
+    return match_tags
+
+
+def compile_tag_value_match(match: Mapping) -> TagValuePredicate:
+    """Compile a WQL tag value subquery into a predicate over a single tag value.
+
+    Args:
+        match: The subquery, containing exactly one match operator
+
+    Returns:
+        A function accepting a tag value (or None) and returning whether it
+        matches the subquery
+
+    Raises:
+        StorageSearchError: If the subquery is not valid
+
+    """
+    if not isinstance(match, dict) or len(match) != 1:
+        raise StorageSearchError("Unsupported subquery: {}".format(match))
+    ((op, cmp_val),) = match.items()
+    if op == "$in":
+        if not isinstance(cmp_val, list):
+            raise StorageSearchError("Expected list for $in value")
+        if all(isinstance(opt, str) for opt in cmp_val):
+            options = frozenset(cmp_val)
+            return lambda value: isinstance(value, str) and value in options
+        return lambda value: value is not None and value in cmp_val
+
+    if not isinstance(cmp_val, str):
+        raise StorageSearchError("Expected string for filter value")
+    if op == "$neq":
+        return lambda value: value is not None and value != cmp_val
+    if op == "$like":
+        pattern = re.compile(
+            "".join(
+                ".*" if c == "%" else "." if c == "_" else re.escape(c) for c in cmp_val
+            ),
+            re.DOTALL,
+        )
+        return lambda value: isinstance(value, str) and bool(pattern.fullmatch(value))
+    if op in RANGE_OPERATORS:
+        try:
+            operand = float(cmp_val)
+        except ValueError:
+            raise StorageSearchError(
+                "Expected numeric string for {} value, got {}".format(op, cmp_val)
+            ) from None
+        compare = RANGE_OPERATORS[op]
+
+        def match_range(value: Optional[str]) -> bool:
+            if value is None:
+                return False
+            try:
+                return compare(float(value), operand)
+            except (TypeError, ValueError):
+                return False
+
+        return match_range
+    raise StorageSearchError(f"Unsupported match operator: {op}")
+
+
+def _compile_query(tag_query: Mapping) -> Callable[[Mapping], bool]:
+    """Compile a tag query into a predicate over a (non-empty) tag dictionary."""
+    if not tag_query:
+        return lambda tags: True
+    if not isinstance(tag_query, dict):
+        raise StorageSearchError(
+            "Expected dict for tag query, got {}".format(tag_query)
+        )
+    clauses = [_compile_clause(k, v) for k, v in tag_query.items()]
+    if len(clauses) == 1:
+        return clauses[0]
+    return lambda tags: all(clause(tags) for clause in clauses)
+
+
+def _compile_clause(key: str, val) -> Callable[[Mapping], bool]:
+    """Compile a single clause of a tag query."""
+    if key in ("$and", "$or"):
+        if not isinstance(val, list):
+            raise StorageSearchError(f"Expected list for {key} filter value")
+        subqueries = [_compile_query(opt) for opt in val]
+        if key == "$and":
+            return lambda tags: all(sub(tags) for sub in subqueries)
+        return lambda tags: any(sub(tags) for sub in subqueries)
+    if key == "$not":
+        if not isinstance(val, dict):
+            raise StorageSearchError("Expected dict for $not filter value")
+        subquery = _compile_query(val)
+        return lambda tags: not subquery(tags)
+    if key.startswith("$"):
+        raise StorageSearchError("Unexpected filter operator: {}".format(key))
+    if isinstance(val, str):
+        return lambda tags: tags.get(key) == val
+    if isinstance(val, dict):
+        value_match = compile_tag_value_match(val)
+        return lambda tags: value_match(tags.get(key))
+    raise StorageSearchError(
+        "Expected string or dict for filter value, got {}".format(val)
+    )
@@ -0,0 +1,487 @@
+"""Local cache of tails files downloaded from tails servers."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+
+from collections import OrderedDict
+from os.path import dirname, isfile, join
+from typing import Dict, Iterable, Mapping
+
+import base58
+
+from ..core.profile import Profile
+from ..indy.holder import IndyHolder
+from ..indy.util import indy_client_dir
+from ..ledger.base import BaseLedger
+from ..revocation.models.revocation_registry import RevocationRegistry
+from ..utils.single_flight import SingleFlight
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = ".cache_index.json"
+HASH_CHUNK_SIZE = 1048576
+PREFETCH_CREDENTIALS = 100  # held credentials to check for registries to prefetch
+
+
+def tails_file_hash(tails_file_path: str) -> str:
+    """Compute the base58-encoded sha256 hash of a tails file, blocking."""
+    file_hasher = hashlib.sha256()
+    with open(tails_file_path, "rb") as tails_file:
+        for buf in iter(lambda: tails_file.read(HASH_CHUNK_SIZE), b""):
+            file_hasher.update(buf)
+    return base58.b58encode(file_hasher.digest()).decode("utf-8")
+
+
+class TailsCacheEntry:
+    """A tails file held in the cache."""
+
+    def __init__(
+        self,
+        path: str,
+        rev_reg_id: str,
+        tails_hash: str,
+        size: int,
+        last_used: float = None,
+        verified: float = None,
+    ):
+        """
+        Initialize a `TailsCacheEntry` instance.
+
+        Args:
+            path: the local path of the tails file
+            rev_reg_id: the revocation registry identifier
+            tails_hash: the expected hash of the tails file
+            size: the size of the tails file in bytes
+            last_used: when the tails file was last used
+            verified: the modification time of the tails file when its hash was
+                last checked, if it has been
+
+        """
+        self.path = path
+        self.rev_reg_id = rev_reg_id
+        self.tails_hash = tails_hash
+        self.size = size
+        self.last_used = last_used or time.time()
+        self.verified = verified
+
+    def serialize(self) -> dict:
+        """Dump the entry to a dictionary for the index."""
+        return {
+            "path": self.path,
+            "rev_reg_id": self.rev_reg_id,
+            "tails_hash": self.tails_hash,
+            "size": self.size,
+            "last_used": self.last_used,
+        }
+
+    @classmethod
+    def deserialize(cls, value: Mapping) -> "TailsCacheEntry":
+        """Load an entry from the index."""
+        return cls(**value)
+
+
+class TailsFileUse:
+    """A use of a tails file, during which the cache does not evict it."""
+
+    def __init__(self, cache: "TailsCache", rev_reg: RevocationRegistry):
+        """
+        Initialize a `TailsFileUse` instance.
+
+        Args:
+            cache: the tails cache holding the file, or None to fetch the tails
+                file of the registry without a cache
+            rev_reg: the revocation registry of the tails file
+
+        """
+        self.cache = cache
+        self.rev_reg = rev_reg
+        self.path = None
+
+    async def __aenter__(self) -> str:
+        """Pin the tails file and get its local path, downloading if necessary."""
+        if not self.cache:
+            return await self.rev_reg.get_or_fetch_local_tails_path()
+        self.path = self.rev_reg.get_receiving_tails_local_path()
+        self.cache._pin(self.path)
+        try:
+            return await self.cache.get_tails_path(self.rev_reg)
+        except BaseException:
+            self.cache._unpin(self.path)
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Unpin the tails file."""
+        if self.cache:
+            self.cache._unpin(self.path)
+
+
+class TailsCache:
+    """Track downloaded tails files, evicting the least recently used.
+
+    Only tails files downloaded through the cache are managed: the tails files
+    of the agent's own revocation registries are never evicted. The index of
+    files is kept beside them, so that the cache survives restarts; the hash of
+    each file is checked in a worker thread when it is first used after it was
+    indexed or changed, and a file which no longer matches is downloaded again.
+    Files held by a `use` are not evicted until the use ends.
+    """
+
+    def __init__(
+        self, max_size: int = None, prefetch: bool = False, tails_dir: str = None
+    ):
+        """
+        Initialize a `TailsCache` instance.
+
+        Args:
+            max_size: the disk budget in bytes for cached tails files, if any
+            prefetch: whether to prefetch tails files for offers and proof requests
+            tails_dir: the directory holding tails files, defaulting to the
+                indy-client tails directory
+
+        """
+        self.max_size = max_size
+        self.prefetch = prefetch
+        self.tails_dir = tails_dir
+        self.counts = {"hits": 0, "misses": 0, "evictions": 0, "corrupt": 0}
+        self._entries: "OrderedDict[str, TailsCacheEntry]" = OrderedDict()
+        self._in_use: Dict[str, int] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._verifications = SingleFlight()
+        self._fetches = SingleFlight()
+
+    @property
+    def size(self) -> int:
+        """Accessor for the total size of the cached tails files."""
+        return sum(entry.size for entry in self._entries.values())
+
+    @property
+    def index_path(self) -> str:
+        """Accessor for the path of the index file."""
+        return join(self.tails_dir, INDEX_FILE_NAME)
+
+    def metrics(self) -> dict:
+        """
+        Summarize the state and history of the cache.
+
+        Returns:
+            A dictionary with the number and total size of cached tails files,
+            the number in use, and counts of hits, misses, evictions and corrupt
+            files found
+
+        """
+        return {
+            "entries": len(self._entries),
+            "in_use": len(self._in_use),
+            "size": self.size,
+            "max_size": self.max_size,
+            **self.counts,
+        }
+
+    async def load(self):
+        """Load the index of cached tails files, dropping any now missing."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self.tails_dir = self.tails_dir or indy_client_dir("tails", create=True)
+            loop = asyncio.get_event_loop()
+            entries = await loop.run_in_executor(None, self._read_index)
+            for entry in sorted(entries, key=lambda entry: entry.last_used):
+                self._entries[entry.path] = entry
+            self._loaded = True
+
+    def _read_index(self) -> Iterable[TailsCacheEntry]:
+        """Read the index file, blocking."""
+        try:
+            with open(self.index_path) as index_file:
+                values = json.load(index_file)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError):
+            LOGGER.warning("Ignoring unreadable tails cache index %s", self.index_path)
+            return []
+        return [
+            TailsCacheEntry.deserialize(value)
+            for value in values
+            if isfile(value.get("path", ""))
+        ]
+
+    async def save(self):
+        """Write the index of cached tails files."""
+        values = [entry.serialize() for entry in self._entries.values()]
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._write_index, values)
+
+    def _write_index(self, values: Iterable[dict]):
+        """Write the index file atomically, blocking."""
+        os.makedirs(self.tails_dir, exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w") as index_file:
+            json.dump(values, index_file)
+        os.replace(tmp_path, self.index_path)
+
+    async def get_tails_path(self, rev_reg: RevocationRegistry) -> str:
+        """
+        Get the local path of a tails file, downloading it if necessary.
+
+        The file may be evicted as soon as the path is returned: callers reading
+        the file should hold it with `use` instead.
+
+        Args:
+            rev_reg: the revocation registry of the tails file
+
+        Returns:
+            The local path of the tails file
+
+        """
+        await self.load()
+        tails_file_path = rev_reg.get_receiving_tails_local_path()
+        entry = self._entries.get(tails_file_path)
+        if entry:
+            if await self._verify(entry):
+                self.counts["hits"] += 1
+                entry.last_used = time.time()
+                self._entries.move_to_end(tails_file_path)
+                return tails_file_path
+        elif isfile(tails_file_path):
+            return tails_file_path  # not downloaded by the cache: leave be
+
+        self.counts["misses"] += 1
+        return await self._fetches.run(tails_file_path, lambda: self._fetch(rev_reg))
+
+    def use(self, rev_reg: RevocationRegistry) -> TailsFileUse:
+        """
+        Hold a tails file for use, as an async context manager.
+
+        The tails file is downloaded if necessary and is not evicted until the
+        context exits::
+
+            async with tails_cache.use(rev_reg) as tails_local_path:
+                ...
+
+        Args:
+            rev_reg: the revocation registry of the tails file
+
+        Returns:
+            The use of the tails file, entered for its local path
+
+        """
+        return TailsFileUse(self, rev_reg)
+
+    def _pin(self, path: str):
+        """Protect a tails file from eviction while in use."""
+        self._in_use[path] = self._in_use.get(path, 0) + 1
+
+    def _unpin(self, path: str):
+        """Release a tails file from use."""
+        count = self._in_use.pop(path, 0) - 1
+        if count > 0:
+            self._in_use[path] = count
+
+    async def _fetch(self, rev_reg: RevocationRegistry) -> str:
+        """Download a tails file into the cache, evicting others to make room."""
+        tails_file_path = await rev_reg.retrieve_tails()
+        stat = os.stat(tails_file_path)
+        self._entries[tails_file_path] = TailsCacheEntry(
+            tails_file_path,
+            rev_reg.registry_id,
+            rev_reg.tails_hash,
+            stat.st_size,
+            verified=stat.st_mtime,  # checked in download
+        )
+        await self._evict(keep=tails_file_path)
+        await self.save()
+        return tails_file_path
+
+    async def _verify(self, entry: TailsCacheEntry) -> bool:
+        """Check the hash of a tails file if it changed since last checked."""
+        try:
+            mtime = os.stat(entry.path).st_mtime
+        except FileNotFoundError:
+            self._entries.pop(entry.path, None)
+            return False
+        if entry.verified == mtime:
+            return True
+
+        loop = asyncio.get_event_loop()
+        tails_hash = await self._verifications.run(
+            entry.path, lambda: loop.run_in_executor(None, tails_file_hash, entry.path)
+        )
+        if tails_hash == entry.tails_hash:
+            entry.verified = mtime
+            return True
+
+        LOGGER.warning(
+            "Tails file for revocation registry %s is corrupt, downloading again",
+            entry.rev_reg_id,
+        )
+        self.counts["corrupt"] += 1
+        await self._remove(entry)
+        return False
+
+    async def _evict(self, keep: str = None):
+        """Remove the least recently used tails files until within budget."""
+        if not self.max_size:
+            return
+        size = self.size
+        for entry in list(self._entries.values()):
+            if size <= self.max_size:
+                break
+            if entry.path == keep or entry.path in self._in_use:
+                continue
+            LOGGER.info(
+                "Evicting tails file for revocation registry %s from cache",
+                entry.rev_reg_id,
+            )
+            self.counts["evictions"] += 1
+            size -= entry.size
+            await self._remove(entry)
+
+    async def _remove(self, entry: TailsCacheEntry):
+        """Delete a tails file and its entry."""
+        self._entries.pop(entry.path, None)
+
+        def remove():
+            try:
+                os.remove(entry.path)
+                os.rmdir(dirname(entry.path))  # one registry per directory
+            except OSError:
+                pass
+
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, remove)
+
+    def prefetch_registries(
+        self, profile: Profile, rev_reg_ids: Iterable[str]
+    ) -> asyncio.Future:
+        """
+        Download the tails files of revocation registries in the background.
+
+        Args:
+            profile: the profile to resolve registries on the ledger
+            rev_reg_ids: the revocation registry identifiers
+
+        Returns:
+            A future for the local paths of the tails files fetched
+
+        """
+        return asyncio.ensure_future(self._prefetch(profile, set(rev_reg_ids)))
+
+    async def _prefetch(self, profile: Profile, rev_reg_ids: Iterable[str]) -> list:
+        """Download tails files, logging any error."""
+        ledger = profile.inject(BaseLedger, required=False)
+        if not (ledger and rev_reg_ids):
+            return []
+
+        async def fetch(rev_reg_id: str) -> str:
+            async with ledger:
+                rev_reg_def = await ledger.get_revoc_reg_def(rev_reg_id)
+            rev_reg = RevocationRegistry.from_definition(rev_reg_def, True)
+            return await self.get_tails_path(rev_reg)
+
+        fetched = []
+        for rev_reg_id, result in zip(
+            sorted(rev_reg_ids),
+            await asyncio.gather(
+                *(fetch(rev_reg_id) for rev_reg_id in sorted(rev_reg_ids)),
+                return_exceptions=True,
+            ),
+        ):
+            if isinstance(result, Exception):
+                LOGGER.warning(
+                    "Error prefetching tails file for revocation registry %s: %s",
+                    rev_reg_id,
+                    result,
+                )
+            else:
+                fetched.append(result)
+        return fetched
+
+    def prefetch_for_offer(self, profile: Profile, cred_def_id: str) -> asyncio.Future:
+        """
+        Prefetch tails files for a credential offer, in the background.
+
+        An offer does not name the revocation registry of the credential to
+        come, so the registries of credentials already held for its credential
+        definition are fetched, as the most likely to be used.
+
+        Args:
+            profile: the profile of the holder
+            cred_def_id: the credential definition identifier of the offer
+
+        Returns:
+            A future for the local paths of the tails files fetched
+
+        """
+
+        async def prefetch():
+            holder = profile.inject(IndyHolder)
+            credentials = await holder.get_credentials(
+                0, PREFETCH_CREDENTIALS, {"cred_def_id": cred_def_id}
+            )
+            return await self._prefetch(
+                profile,
+                {cred["rev_reg_id"] for cred in credentials if cred.get("rev_reg_id")},
+            )
+
+        return asyncio.ensure_future(self._log_errors(prefetch()))
+
+    def prefetch_for_proof_request(
+        self, profile: Profile, proof_request: dict
+    ) -> asyncio.Future:
+        """
+        Prefetch tails files for a proof request, in the background.
+
+        If the request asks for proof of non-revocation, the tails files of the
+        registries of credentials held which match it are fetched.
+
+        Args:
+            profile: the profile of the holder
+            proof_request: the indy proof request
+
+        Returns:
+            A future for the local paths of the tails files fetched
+
+        """
+
+        async def prefetch():
+            if not (
+                proof_request.get("non_revoked")
+                or any(
+                    spec.get("non_revoked")
+                    for specs in (
+                        proof_request.get("requested_attributes", {}),
+                        proof_request.get("requested_predicates", {}),
+                    )
+                    for spec in specs.values()
+                )
+            ):
+                return []
+            holder = profile.inject(IndyHolder)
+            credentials = (
+                await holder.get_credentials_for_presentation_request_by_referent(
+                    proof_request, (), 0, PREFETCH_CREDENTIALS, {}
+                )
+            )
+            return await self._prefetch(
+                profile,
+                {
+                    cred["cred_info"]["rev_reg_id"]
+                    for cred in credentials
+                    if cred["cred_info"].get("rev_reg_id")
+                },
+            )
+
+        return asyncio.ensure_future(self._log_errors(prefetch()))
+
+    async def _log_errors(self, coro) -> list:
+        """Await a prefetch, logging any error."""
+        try:
+            return await coro
+        except Exception:
+            LOGGER.exception("Error prefetching tails files")
+            return []
@@ -1,9 +1,8 @@
 """Indy tails server interface class."""
 
-from ..utils.http import put, PutError
-
 from .base import BaseTailsServer
 from .error import TailsServerNotConfiguredError
+from .upload import TailsUploadError, TailsUploadPipeline
 
 
 class IndyTailsServer(BaseTailsServer):
@@ -37,17 +36,23 @@ class IndyTailsServer(BaseTailsServer):
                 "tails_server_upload_url setting is not set"
             )
 
+        # shared, so that the limit on concurrent uploads holds across the agent
+        pipeline = context.inject(TailsUploadPipeline, required=False)
+        if not pipeline:
+            pipeline = TailsUploadPipeline()
+
         try:
             return (
                 True,
-                await put(
+                await pipeline.upload(
                     f"{tails_server_upload_url}/{rev_reg_id}",
-                    {"tails": tails_file_path},
+                    rev_reg_id,
+                    tails_file_path,
                     {"genesis": genesis_transactions},
                     interval=interval,
                     backoff=backoff,
                     max_attempts=max_attempts,
                 ),
             )
-        except PutError as x_put:
-            return (False, x_put.message)
+        except TailsUploadError as x_upload:
+            return (False, x_upload.message)
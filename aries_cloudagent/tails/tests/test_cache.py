@@ -0,0 +1,223 @@
+import os
+
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...indy.holder import IndyHolder
+from ...ledger.base import BaseLedger
+from ...revocation.models import revocation_registry
+from ...revocation.models.revocation_registry import RevocationRegistry
+
+from .. import cache as test_module
+from ..cache import TailsCache
+
+TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
+CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:default"
+CONTENT = {"a": b"tails-a", "b": b"tails-b", "c": b"tails-c"}
+
+
+class TestTailsCache(AsyncTestCase):
+    async def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.tails_dir = join(self.tmp.name, "tails")
+        self.cache = TailsCache(max_size=15, tails_dir=self.tails_dir)
+        self.tails_hashes = {}
+        for name, content in CONTENT.items():
+            path = join(self.tmp.name, name)
+            with open(path, "wb") as tails_file:
+                tails_file.write(content)
+            self.tails_hashes[name] = test_module.tails_file_hash(path)
+
+        self.downloads = []
+
+        async def retrieve_tails(rev_reg):
+            self.downloads.append(rev_reg.registry_id)
+            os.makedirs(os.path.dirname(rev_reg.tails_local_path), exist_ok=True)
+            with open(rev_reg.tails_local_path, "wb") as tails_file:
+                tails_file.write(CONTENT[rev_reg.registry_id[-1]])
+            return rev_reg.tails_local_path
+
+        patcher = async_mock.patch.object(
+            RevocationRegistry, "retrieve_tails", retrieve_tails
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = async_mock.patch.object(
+            revocation_registry,
+            "indy_client_dir",
+            lambda subpath, create=False: join(self.tmp.name, subpath),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def tearDown(self):
+        self.tmp.cleanup()
+
+    def rev_reg_def(self, name: str) -> dict:
+        rev_reg_id = f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:{name}"
+        return {
+            "id": rev_reg_id,
+            "credDefId": CRED_DEF_ID,
+            "revocDefType": "CL_ACCUM",
+            "tag": name,
+            "value": {
+                "maxCredNum": 10,
+                "tailsHash": self.tails_hashes[name],
+                "tailsLocation": f"http://tails.example/{rev_reg_id}",
+            },
+        }
+
+    def rev_reg(self, name: str) -> RevocationRegistry:
+        return RevocationRegistry.from_definition(self.rev_reg_def(name), True)
+
+    async def test_fetch_hit_evict(self):
+        path_a = await self.cache.get_tails_path(self.rev_reg("a"))
+        assert await self.cache.get_tails_path(self.rev_reg("a")) == path_a
+        path_b = await self.cache.get_tails_path(self.rev_reg("b"))
+        assert exists(path_a) and exists(path_b)
+        assert self.cache.size == 14
+
+        await self.cache.get_tails_path(self.rev_reg("a"))  # b least recently used
+        path_c = await self.cache.get_tails_path(self.rev_reg("c"))
+        assert not exists(path_b)
+        assert not exists(os.path.dirname(path_b))
+        assert exists(path_a) and exists(path_c)
+        assert len(self.downloads) == 3
+        assert self.cache.metrics() == {
+            "entries": 2,
+            "in_use": 0,
+            "size": 14,
+            "max_size": 15,
+            "hits": 2,
+            "misses": 3,
+            "evictions": 1,
+            "corrupt": 0,
+        }
+
+    async def test_use(self):
+        async with self.cache.use(self.rev_reg("a")) as path_a:
+            async with self.cache.use(self.rev_reg("a")):
+                assert self.cache.metrics()["in_use"] == 1
+            # a is in use, so b goes although a is least recently used
+            await self.cache.get_tails_path(self.rev_reg("b"))
+            path_c = await self.cache.get_tails_path(self.rev_reg("c"))
+            assert exists(path_a) and exists(path_c)
+            assert self.cache.counts["evictions"] == 1
+        assert self.cache.metrics()["in_use"] == 0
+
+        # no longer in use, a goes next
+        await self.cache.get_tails_path(self.rev_reg("b"))
+        assert not exists(path_a)
+
+        # a deleted file is dropped from the index, even when already dropped
+        rev_reg = self.rev_reg("b")
+        os.remove(await self.cache.get_tails_path(rev_reg))
+        entry = self.cache._entries[rev_reg.get_receiving_tails_local_path()]
+        assert not await self.cache._verify(entry)
+        assert not await self.cache._verify(entry)
+
+        with async_mock.patch.object(
+            RevocationRegistry, "retrieve_tails", async_mock.CoroutineMock()
+        ) as mock_retrieve:
+            mock_retrieve.side_effect = OSError("no space left")
+            with self.assertRaises(OSError):
+                async with self.cache.use(self.rev_reg("a")):
+                    pass
+        assert self.cache.metrics()["in_use"] == 0
+
+    async def test_corrupt(self):
+        path = await self.cache.get_tails_path(self.rev_reg("a"))
+        with open(path, "wb") as tails_file:
+            tails_file.write(b"corrupt")
+        os.utime(path, (1, 1))
+        assert await self.cache.get_tails_path(self.rev_reg("a")) == path
+        with open(path, "rb") as tails_file:
+            assert tails_file.read() == CONTENT["a"]
+        assert len(self.downloads) == 2
+        assert self.cache.counts["corrupt"] == 1
+
+    async def test_index(self):
+        path = await self.cache.get_tails_path(self.rev_reg("a"))
+        cache = TailsCache(tails_dir=self.tails_dir)
+        with async_mock.patch.object(
+            test_module, "tails_file_hash", async_mock.MagicMock()
+        ) as mock_hash:
+            mock_hash.return_value = self.tails_hashes["a"]
+            assert await cache.get_tails_path(self.rev_reg("a")) == path
+            assert await cache.get_tails_path(self.rev_reg("a")) == path
+            mock_hash.assert_called_once_with(path)
+        assert len(self.downloads) == 1
+        assert cache.counts["hits"] == 2
+
+        with open(cache.index_path, "w") as index_file:
+            index_file.write("{")
+        cache = TailsCache(tails_dir=self.tails_dir)
+        await cache.load()
+        assert not cache.metrics()["entries"]
+
+    async def test_unmanaged(self):
+        rev_reg = self.rev_reg("a")
+        path = rev_reg.get_receiving_tails_local_path()
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as tails_file:
+            tails_file.write(b"issuer tails")
+        assert await self.cache.get_tails_path(rev_reg) == path
+        assert not self.downloads
+        assert not self.cache.metrics()["entries"]
+
+    async def test_prefetch(self):
+        profile = InMemoryProfile.test_profile()
+        ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        ledger.__aenter__ = async_mock.CoroutineMock(return_value=ledger)
+        ledger.__aexit__ = async_mock.CoroutineMock(return_value=False)
+        ledger.get_revoc_reg_def = async_mock.CoroutineMock(
+            side_effect=lambda rev_reg_id: self.rev_reg_def(rev_reg_id[-1])
+        )
+        holder = async_mock.MagicMock(IndyHolder, autospec=True)
+        holder.get_credentials = async_mock.CoroutineMock(
+            return_value=[
+                {"rev_reg_id": f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:a"},
+                {"rev_reg_id": None},
+            ]
+        )
+        holder.get_credentials_for_presentation_request_by_referent = (
+            async_mock.CoroutineMock(
+                return_value=[
+                    {"cred_info": {"rev_reg_id": f"{TEST_DID}:4:{CRED_DEF_ID}:x:b"}},
+                    {"cred_info": {"rev_reg_id": f"{TEST_DID}:4:{CRED_DEF_ID}:x:z"}},
+                ]
+            )
+        )
+        profile.context.injector.bind_instance(BaseLedger, ledger)
+        profile.context.injector.bind_instance(IndyHolder, holder)
+
+        fetched = await self.cache.prefetch_for_offer(profile, CRED_DEF_ID)
+        assert len(fetched) == 1
+        holder.get_credentials.assert_awaited_once_with(
+            0, test_module.PREFETCH_CREDENTIALS, {"cred_def_id": CRED_DEF_ID}
+        )
+
+        proof_request = {
+            "requested_attributes": {"0_name_uuid": {"name": "name"}},
+            "requested_predicates": {},
+        }
+        assert await self.cache.prefetch_for_proof_request(profile, proof_request) == []
+        holder.get_credentials_for_presentation_request_by_referent.assert_not_called()
+
+        proof_request["non_revoked"] = {"to": 1234567890}
+        with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+            fetched = await self.cache.prefetch_for_proof_request(
+                profile, proof_request
+            )
+            mock_logger.warning.assert_called_once()  # no registry z
+        assert len(fetched) == 1
+        assert len(self.downloads) == 2
+
+        holder.get_credentials.side_effect = Exception("wallet closed")
+        with async_mock.patch.object(test_module, "LOGGER") as mock_logger:
+            assert await self.cache.prefetch_for_offer(profile, CRED_DEF_ID) == []
+            mock_logger.exception.assert_called_once()
@@ -4,6 +4,7 @@ from asynctest import mock as async_mock
 from ...config.injection_context import InjectionContext
 
 from .. import indy_tails_server as test_module
+from ..upload import TailsUploadPipeline
 
 TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
 CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:default"
@@ -25,19 +26,27 @@ class TestIndyTailsServer(AsyncTestCase):
                 "tails_server_upload_url": "http://1.2.3.4:8088",
             }
         )
+        pipeline = async_mock.MagicMock(TailsUploadPipeline, autospec=True)
+        pipeline.upload = async_mock.CoroutineMock(return_value="tails-hash")
+        context.injector.bind_instance(TailsUploadPipeline, pipeline)
         indy_tails = test_module.IndyTailsServer()
 
-        with async_mock.patch.object(
-            test_module, "put", async_mock.CoroutineMock()
-        ) as mock_put:
-            mock_put.return_value = "tails-hash"
-            (ok, text) = await indy_tails.upload_tails_file(
-                context,
-                REV_REG_ID,
-                "/tmp/dummy/path",
-            )
-            assert ok
-            assert text == "tails-hash"
+        (ok, text) = await indy_tails.upload_tails_file(
+            context,
+            REV_REG_ID,
+            "/tmp/dummy/path",
+        )
+        assert ok
+        assert text == "tails-hash"
+        pipeline.upload.assert_awaited_once_with(
+            f"http://1.2.3.4:8088/{REV_REG_ID}",
+            REV_REG_ID,
+            "/tmp/dummy/path",
+            {"genesis": "dummy"},
+            interval=1.0,
+            backoff=0.25,
+            max_attempts=5,
+        )
 
     async def test_upload_x(self):
         context = InjectionContext(
@@ -49,9 +58,11 @@ class TestIndyTailsServer(AsyncTestCase):
         indy_tails = test_module.IndyTailsServer()
 
         with async_mock.patch.object(
-            test_module, "put", async_mock.CoroutineMock()
-        ) as mock_put:
-            mock_put.side_effect = test_module.PutError("Server down for maintenance")
+            TailsUploadPipeline, "upload", async_mock.CoroutineMock()
+        ) as mock_upload:
+            mock_upload.side_effect = test_module.TailsUploadError(
+                "Server down for maintenance"
+            )
 
             (ok, text) = await indy_tails.upload_tails_file(
                 context, REV_REG_ID, "/tmp/dummy/path"
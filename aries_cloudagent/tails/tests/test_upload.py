@@ -0,0 +1,164 @@
+import asyncio
+
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from .. import upload as test_module
+from ..cache import tails_file_hash
+from ..upload import TailsUploadError, TailsUploadPipeline
+
+TEST_DID = "55GkHamhTU1ZbTbV2ab9DE"
+CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:default"
+REV_REG_ID = f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:0"
+TAILS_CONTENT = b"tails" * 300000
+
+
+class TestTailsUploadPipeline(AsyncTestCase):
+    async def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.tails_file_path = join(self.tmp.name, "tails")
+        with open(self.tails_file_path, "wb") as tails_file:
+            tails_file.write(TAILS_CONTENT)
+
+        self.received = []
+        self.failures = 0
+        self.active = 0
+        self.max_active = 0
+
+        async def receive_tails(request):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            try:
+                fields = {}
+                reader = await request.multipart()
+                async for part in reader:
+                    fields[part.name] = (part.filename, await part.read())
+                await asyncio.sleep(0.01)
+            finally:
+                self.active -= 1
+            if self.failures:
+                self.failures -= 1
+                raise web.HTTPInternalServerError()
+            if request.match_info["rev_reg_id"] in self.received:
+                raise web.HTTPConflict()
+            self.received.append(request.match_info["rev_reg_id"])
+            self.fields = fields
+            return web.Response(text="tails-hash")
+
+        app = web.Application()
+        app.add_routes([web.put("/{rev_reg_id}", receive_tails)])
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.pipeline = TailsUploadPipeline(max_concurrent=2, chunk_size=65536)
+
+    async def tearDown(self):
+        await self.server.close()
+        self.tmp.cleanup()
+
+    def url(self, rev_reg_id: str = REV_REG_ID) -> str:
+        return str(self.server.make_url(f"/{rev_reg_id}"))
+
+    async def test_upload(self):
+        result = await self.pipeline.upload(
+            self.url(),
+            REV_REG_ID,
+            self.tails_file_path,
+            {"genesis": "genesis-txns", "skipped": None},
+            tails_hash=tails_file_hash(self.tails_file_path),
+        )
+        assert result == "tails-hash"
+        assert self.fields == {
+            "genesis": (None, b"genesis-txns"),
+            "tails": ("tails", TAILS_CONTENT),
+        }
+        metrics = self.pipeline.metrics()
+        assert metrics["uploads"] == {}
+        assert metrics["uploaded"] == 1
+        assert metrics["bytes"] == len(TAILS_CONTENT)
+        assert metrics["latency"]["avg"]["upload"] > 0
+
+        # an earlier attempt got through
+        assert (
+            await self.pipeline.upload(self.url(), REV_REG_ID, self.tails_file_path)
+            == "409: Conflict"
+        )
+
+    async def test_upload_retry(self):
+        self.failures = 1
+        await self.pipeline.upload(
+            self.url(), REV_REG_ID, self.tails_file_path, interval=0.01
+        )
+        assert self.pipeline.counts["retried"] == 1
+
+        self.failures = 3
+        with self.assertRaises(TailsUploadError):
+            await self.pipeline.upload(
+                self.url(),
+                REV_REG_ID,
+                self.tails_file_path,
+                interval=0.01,
+                max_attempts=3,
+            )
+        assert self.pipeline.counts["failed"] == 1
+        assert self.pipeline.metrics()["uploads"] == {}
+
+    async def test_upload_concurrency(self):
+        uploads = [
+            self.pipeline.upload(
+                self.url(f"{REV_REG_ID}{n}"), f"{REV_REG_ID}{n}", self.tails_file_path
+            )
+            for n in range(5)
+        ]
+        await asyncio.gather(*uploads)
+        assert len(self.received) == 5
+        assert self.max_active <= 2
+
+    async def test_upload_duplicate(self):
+        with async_mock.patch.object(
+            test_module, "tails_file_hash", async_mock.MagicMock()
+        ) as mock_hash:
+            results = await asyncio.gather(
+                *(
+                    self.pipeline.upload(self.url(), REV_REG_ID, self.tails_file_path)
+                    for _ in range(3)
+                )
+            )
+            mock_hash.assert_not_called()
+        assert results == ["tails-hash"] * 3
+        assert self.received == [REV_REG_ID]
+        assert self.pipeline.counts["uploaded"] == 1
+        assert self.pipeline.metrics()["uploads"] == {}
+
+    async def test_upload_progress(self):
+        progress = []
+        read = self.pipeline._read
+
+        async def watch_read(upload):
+            async for buf in read(upload):
+                progress.append(self.pipeline.metrics()["uploads"][REV_REG_ID]["sent"])
+                yield buf
+
+        self.pipeline._read = watch_read
+        await self.pipeline.upload(self.url(), REV_REG_ID, self.tails_file_path)
+        assert len(progress) == -(-len(TAILS_CONTENT) // 65536)
+        assert progress == sorted(progress)
+        assert progress[-1] == len(TAILS_CONTENT)
+
+    async def test_upload_x(self):
+        with self.assertRaises(TailsUploadError) as x_upload:
+            await self.pipeline.upload(
+                self.url(), REV_REG_ID, self.tails_file_path, tails_hash="not-the-hash"
+            )
+        assert "does not match" in x_upload.exception.message
+
+        with self.assertRaises(TailsUploadError):
+            await self.pipeline.upload(
+                self.url(), REV_REG_ID, join(self.tmp.name, "missing")
+            )
+        assert not self.received
+        assert test_module.DEFAULT_MAX_CONCURRENT_UPLOADS > 1
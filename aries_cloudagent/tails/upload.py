@@ -0,0 +1,292 @@
+"""Pipeline for uploading tails files to a tails server."""
+
+import asyncio
+import logging
+import os
+import time
+
+from os.path import basename
+from typing import AsyncIterator, Dict, Mapping
+
+from aiohttp import ClientError, ClientSession, MultipartWriter
+from aiohttp.payload import AsyncIterablePayload
+from aiohttp.web import HTTPConflict
+
+from ..core.error import BaseError
+from ..utils.repeat import RepeatSequence
+from ..utils.single_flight import SingleFlight
+from ..utils.stats import Stats
+
+from .cache import tails_file_hash
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_UPLOADS = 4
+UPLOAD_CHUNK_SIZE = 1048576
+UPLOAD_REQUEST_TIMEOUT = 60.0  # per attempt, for the largest tails files
+
+
+class TailsUploadError(BaseError):
+    """Error raised when a tails file upload fails."""
+
+
+class TailsUpload:
+    """The progress of a tails file upload."""
+
+    def __init__(self, rev_reg_id: str, path: str, size: int):
+        """
+        Initialize a `TailsUpload` instance.
+
+        Args:
+            rev_reg_id: the revocation registry identifier
+            path: the local path of the tails file
+            size: the size of the tails file in bytes
+
+        """
+        self.rev_reg_id = rev_reg_id
+        self.path = path
+        self.size = size
+        self.sent = 0
+        self.attempts = 0
+        self.queued_time = time.perf_counter()
+
+    def serialize(self) -> dict:
+        """Summarize the progress of the upload."""
+        return {"size": self.size, "sent": self.sent, "attempts": self.attempts}
+
+
+class TailsUploadPipeline:
+    """Upload tails files, streaming each from disk, a few at a time.
+
+    Tails files given an expected hash are checked once, off the event loop,
+    before their first attempt, and all are read from disk in chunks by a
+    worker thread as they are sent. Uploads beyond the concurrency limit wait
+    their turn, so that staging many revocation registries at once does not
+    saturate the tails server, and an upload for a revocation registry whose
+    tails file is already being uploaded joins the upload in flight.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        """
+        Initialize a `TailsUploadPipeline` instance.
+
+        Args:
+            max_concurrent: the maximum number of uploads in progress at once
+            chunk_size: the number of bytes to read from disk at a time
+
+        """
+        self.max_concurrent = max_concurrent
+        self.chunk_size = chunk_size
+        self.counts = {"uploaded": 0, "failed": 0, "retried": 0, "bytes": 0}
+        self.latency = Stats()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._uploads: Dict[str, TailsUpload] = {}
+        self._flights = SingleFlight()
+
+    def metrics(self) -> dict:
+        """
+        Summarize the state and history of the pipeline.
+
+        Returns:
+            A dictionary with the progress of each upload in the pipeline, counts
+            of uploads completed, failed and retried and of bytes sent, and the
+            time from queueing to completion of uploads and of each attempt
+
+        """
+        return {
+            "uploads": {
+                rev_reg_id: upload.serialize()
+                for rev_reg_id, upload in self._uploads.items()
+            },
+            **self.counts,
+            "latency": self.latency.extract(),
+        }
+
+    async def upload(
+        self,
+        url: str,
+        rev_reg_id: str,
+        tails_file_path: str,
+        extra_data: Mapping[str, str] = None,
+        *,
+        tails_hash: str = None,
+        max_attempts: int = 5,
+        interval: float = 1.0,
+        backoff: float = 0.25,
+        request_timeout: float = UPLOAD_REQUEST_TIMEOUT,
+    ) -> str:
+        """
+        Upload a tails file, retrying on failure.
+
+        The tails server accepts whole files only, so each attempt sends the
+        file again; a conflict is taken as an earlier attempt having succeeded.
+
+        Args:
+            url: the address to put the tails file to
+            rev_reg_id: the revocation registry identifier
+            tails_file_path: the local path of the tails file
+            extra_data: further form fields to send with the tails file
+            tails_hash: the expected hash of the tails file, if it is to be
+                checked before upload
+            max_attempts: the maximum number of attempts to make
+            interval: the interval between attempts, in seconds
+            backoff: the backoff interval, in seconds
+            request_timeout: the timeout of each attempt, in seconds
+
+        Returns:
+            The text of the tails server response
+
+        """
+        return await self._flights.run(
+            rev_reg_id,
+            lambda: self._upload_file(
+                url,
+                rev_reg_id,
+                tails_file_path,
+                extra_data,
+                tails_hash,
+                max_attempts,
+                interval,
+                backoff,
+                request_timeout,
+            ),
+        )
+
+    async def _upload_file(
+        self,
+        url: str,
+        rev_reg_id: str,
+        tails_file_path: str,
+        extra_data: Mapping[str, str],
+        tails_hash: str,
+        max_attempts: int,
+        interval: float,
+        backoff: float,
+        request_timeout: float,
+    ) -> str:
+        """Check and upload a tails file, the only upload for its registry."""
+        loop = asyncio.get_event_loop()
+        try:
+            size = (await loop.run_in_executor(None, os.stat, tails_file_path)).st_size
+            if tails_hash:
+                file_hash = await loop.run_in_executor(
+                    None, tails_file_hash, tails_file_path
+                )
+        except OSError as err:
+            raise TailsUploadError(f"Cannot read tails file: {err}") from err
+        if tails_hash and file_hash != tails_hash:
+            raise TailsUploadError(
+                f"Tails file for revocation registry {rev_reg_id} does not match "
+                "its hash"
+            )
+
+        upload = TailsUpload(rev_reg_id, tails_file_path, size)
+        self._uploads[rev_reg_id] = upload
+        try:
+            result = await self._upload(
+                url,
+                upload,
+                extra_data or {},
+                max_attempts,
+                interval,
+                backoff,
+                request_timeout,
+            )
+        except TailsUploadError:
+            self.counts["failed"] += 1
+            raise
+        finally:
+            del self._uploads[rev_reg_id]
+            self.latency.log("upload", time.perf_counter() - upload.queued_time)
+
+        self.counts["uploaded"] += 1
+        self.counts["bytes"] += size
+        LOGGER.debug(
+            "Uploaded tails file for revocation registry %s: %d bytes in %.2fs",
+            rev_reg_id,
+            size,
+            time.perf_counter() - upload.queued_time,
+        )
+        return result
+
+    async def _upload(
+        self,
+        url: str,
+        upload: TailsUpload,
+        extra_data: Mapping[str, str],
+        max_attempts: int,
+        interval: float,
+        backoff: float,
+        request_timeout: float,
+    ) -> str:
+        """Put the tails file to the tails server until accepted."""
+        async with ClientSession() as session:
+            async for attempt in RepeatSequence(max_attempts, interval, backoff):
+                if upload.attempts:
+                    self.counts["retried"] += 1
+                upload.attempts += 1
+                upload.sent = 0
+                try:
+                    async with self._semaphore:
+                        start = time.perf_counter()
+                        async with attempt.timeout(request_timeout):
+                            async with session.put(
+                                url, data=self._form(upload, extra_data)
+                            ) as response:
+                                if (
+                                    response.status < 200 or response.status >= 300
+                                ) and response.status != HTTPConflict.status_code:
+                                    raise ClientError(
+                                        "Bad response from server: "
+                                        f"{response.status}, {response.reason}"
+                                    )
+                                result = await response.text()
+                        self.latency.log("attempt", time.perf_counter() - start)
+                        return result
+                except (ClientError, asyncio.TimeoutError) as err:
+                    LOGGER.warning(
+                        "Attempt %d to upload tails file for revocation registry "
+                        "%s failed: %s",
+                        upload.attempts,
+                        upload.rev_reg_id,
+                        err,
+                    )
+                    if attempt.final:
+                        raise TailsUploadError(
+                            "Exceeded maximum tails file upload attempts"
+                        ) from err
+
+    def _form(self, upload: TailsUpload, extra_data: Mapping[str, str]):
+        """Build the multipart form streaming the tails file."""
+        writer = MultipartWriter("form-data")
+        for name, value in extra_data.items():
+            if value is not None:
+                part = writer.append(value)
+                part.set_content_disposition("form-data", name=name)
+        part = writer.append_payload(
+            AsyncIterablePayload(
+                self._read(upload), content_type="application/octet-stream"
+            )
+        )
+        part.set_content_disposition(
+            "form-data", name="tails", filename=basename(upload.path)
+        )
+        return writer
+
+    async def _read(self, upload: TailsUpload) -> AsyncIterator[bytes]:
+        """Read a tails file in chunks, off the event loop."""
+        loop = asyncio.get_event_loop()
+        tails_file = await loop.run_in_executor(None, open, upload.path, "rb")
+        try:
+            while True:
+                buf = await loop.run_in_executor(None, tails_file.read, self.chunk_size)
+                if not buf:
+                    break
+                upload.sent += len(buf)
+                yield buf
+        finally:
+            await loop.run_in_executor(None, tails_file.close)
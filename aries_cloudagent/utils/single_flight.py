@@ -0,0 +1,55 @@
+"""Utils for coalescing concurrent requests."""
+
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Share the result of concurrent calls for the same key.
+
+    While a call for a key is in flight, further calls for that key wait for
+    and receive its result (or exception) instead of starting another call.
+    Once the call completes, the next call for the key starts afresh.
+    """
+
+    def __init__(self):
+        """Initialize the `SingleFlight` instance."""
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> int:
+        """Accessor for the number of calls in flight."""
+        return len(self._pending)
+
+    def _handle_done(self, key: Hashable, fut: asyncio.Future):
+        """Remove a completed call, and retrieve any exception it raised."""
+        if self._pending.get(key) is fut:
+            del self._pending[key]
+        if not fut.cancelled():
+            fut.exception()
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable]) -> Any:
+        """
+        Run a call for a key, or join the call already in flight.
+
+        Cancelling one caller does not cancel the shared call for the others.
+
+        Args:
+            key: the key identifying the request
+            fetch: a function returning the awaitable to run if no call for the
+                key is in flight
+
+        Returns:
+            The result of the shared call
+
+        """
+        fut = self._pending.get(key)
+        if fut:
+            self.coalesced += 1
+        else:
+            fut = asyncio.ensure_future(fetch())
+            self._pending[key] = fut
+            fut.add_done_callback(lambda fut: self._handle_done(key, fut))
+        return await asyncio.shield(fut)
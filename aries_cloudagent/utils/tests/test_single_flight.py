@@ -0,0 +1,56 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+
+from ..single_flight import SingleFlight
+
+
+class TestSingleFlight(AsyncTestCase):
+    async def test_run(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch(val):
+            calls.append(val)
+            await asyncio.sleep(0.01)
+            return val
+
+        results = await asyncio.gather(
+            flight.run("a", lambda: fetch(1)),
+            flight.run("a", lambda: fetch(2)),
+            flight.run("b", lambda: fetch(3)),
+        )
+        assert results == [1, 1, 3]
+        assert calls == [1, 3]
+        assert flight.coalesced == 1
+        assert not flight.pending
+
+        assert await flight.run("a", lambda: fetch(4)) == 4
+        assert calls == [1, 3, 4]
+
+    async def test_run_x(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(
+            flight.run("a", fetch), flight.run("a", fetch), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert not flight.pending
+
+    async def test_cancel_caller(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(flight.run("a", fetch))
+        second = asyncio.ensure_future(flight.run("a", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+        assert first.cancelled()
@@ -15,6 +15,7 @@ from ..admin.request_context import AdminRequestContext
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
 from ..ledger.error import LedgerConfigError, LedgerError
+from ..ledger.write_queue import LedgerWriteQueue
 from ..messaging.models.openapi import OpenAPISchema
 from ..messaging.valid import (
     DID_POSTURE,
@@ -320,8 +321,12 @@ async def wallet_set_public_did(request: web.BaseRequest):
                 endpoint = session.settings.get("default_endpoint")
                 await wallet.set_did_endpoint(info.did, endpoint, ledger)
 
-            async with ledger:
-                await ledger.update_endpoint_for_did(info.did, endpoint)
+            write_queue = session.inject(LedgerWriteQueue, required=False)
+            if write_queue:
+                await (await write_queue.update_endpoint_for_did(info.did, endpoint))
+            else:
+                async with ledger:
+                    await ledger.update_endpoint_for_did(info.did, endpoint)
 
             # Add multitenant relay mapping so implicit invitations are still routed
             if multitenant_mgr and wallet_id:
@@ -1,3 +1,5 @@
+import asyncio
+
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
@@ -5,6 +7,7 @@ from aiohttp.web import HTTPForbidden
 
 from ...admin.request_context import AdminRequestContext
 from ...ledger.base import BaseLedger
+from ...ledger.write_queue import LedgerWriteQueue
 from ...wallet.base import BaseWallet, DIDInfo
 from ...multitenant.manager import MultitenantManager
 
@@ -405,6 +408,34 @@ class TestWalletRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.wallet_set_public_did(self.request)
 
+    async def test_set_public_did_write_queue_x(self):
+        self.request.query = {"did": self.test_did}
+
+        Ledger = async_mock.MagicMock()
+        ledger = Ledger()
+        ledger.get_key_for_did = async_mock.CoroutineMock()
+        ledger.__aenter__ = async_mock.CoroutineMock(return_value=ledger)
+        self.session_inject[BaseLedger] = ledger
+
+        async def update_endpoint_for_did(did, endpoint):
+            written = asyncio.get_event_loop().create_future()
+            written.set_exception(test_module.LedgerError("rejected"))
+            return written
+
+        write_queue = async_mock.MagicMock(
+            update_endpoint_for_did=async_mock.MagicMock(
+                side_effect=update_endpoint_for_did
+            )
+        )
+        self.session_inject[LedgerWriteQueue] = write_queue
+
+        self.wallet.set_public_did.return_value = DIDInfo(
+            self.test_did, self.test_verkey, DIDPosture.PUBLIC.metadata
+        )
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module.wallet_set_public_did(self.request)
+        write_queue.update_endpoint_for_did.assert_called_once()
+
     async def test_set_public_did_no_wallet_did(self):
         self.request.query = {"did": self.test_did}
 
@@ -3,6 +3,7 @@ import logging
 import os
 import random
 import sys
+import tempfile
 
 import json
 
@@ -158,7 +159,7 @@ class BaseAgent(DemoAgent):
 class AliceAgent(BaseAgent):
     def __init__(self, port: int, **kwargs):
         super().__init__("Alice", port, seed=None, **kwargs)
-        self.extra_args = [
+        self.extra_args = (self.extra_args or []) + [
             "--auto-respond-credential-offer",
             "--auto-store-credential",
             "--monitor-ping",
@@ -257,12 +258,27 @@ async def main(
     tails_server_base_url: str = None,
     issue_count: int = 300,
     wallet_type: str = None,
+    in_memory_ledger: bool = False,
+    ledger_latency: float = None,
 ):
 
-    genesis = await default_genesis_txns()
-    if not genesis:
-        print("Error retrieving ledger genesis transactions")
-        sys.exit(1)
+    genesis = None
+    ledger_args = None
+    journal_dir = None
+    if in_memory_ledger:
+        # agents share an in-memory ledger through a journal file
+        journal_dir = tempfile.TemporaryDirectory()
+        ledger_args = [
+            ("--ledger-type", "in_memory"),
+            ("--ledger-journal-file", os.path.join(journal_dir.name, "ledger.journal")),
+        ]
+        if ledger_latency:
+            ledger_args.append(("--ledger-latency", str(ledger_latency)))
+    else:
+        genesis = await default_genesis_txns()
+        if not genesis:
+            print("Error retrieving ledger genesis transactions")
+            sys.exit(1)
 
     alice = None
     faber = None
@@ -276,6 +292,7 @@ async def main(
             genesis_data=genesis,
             timing=show_timing,
             wallet_type=wallet_type,
+            extra_args=ledger_args,
         )
         await alice.listen_webhooks(start_port + 2)
 
@@ -285,17 +302,24 @@ async def main(
             timing=show_timing,
             tails_server_base_url=tails_server_base_url,
             wallet_type=wallet_type,
+            extra_args=ledger_args,
         )
 
         await faber.listen_webhooks(start_port + 5)
-        await faber.register_did()
+        if not in_memory_ledger:
+            # the in-memory ledger registers public DIDs on their first write
+            await faber.register_did()
 
         if routing:
             alice_router = RoutingAgent(
-                start_port + 6, genesis_data=genesis, timing=show_timing
+                start_port + 6,
+                genesis_data=genesis,
+                timing=show_timing,
+                extra_args=ledger_args,
             )
             await alice_router.listen_webhooks(start_port + 8)
-            await alice_router.register_did()
+            if not in_memory_ledger:
+                await alice_router.register_did()
 
         with log_timer("Startup duration:"):
             if alice_router:
@@ -507,6 +531,9 @@ async def main(
             LOGGER.exception("Error terminating agent:")
             terminated = False
 
+    if journal_dir:
+        journal_dir.cleanup()
+
     run_timer.stop()
     await asyncio.sleep(0.1)
 
@@ -569,6 +596,17 @@ if __name__ == "__main__":
         metavar="<wallet-type>",
         help="Set the agent wallet type",
     )
+    parser.add_argument(
+        "--in-memory-ledger",
+        action="store_true",
+        help="Use an in-memory ledger shared by the agents instead of a ledger pool",
+    )
+    parser.add_argument(
+        "--ledger-latency",
+        type=float,
+        metavar="<seconds>",
+        help="Set an artificial delay for each request to the in-memory ledger",
+    )
     args = parser.parse_args()
 
     tails_server_base_url = args.tails_server_base_url or os.getenv("PUBLIC_TAILS_URL")
@@ -592,6 +630,8 @@ if __name__ == "__main__":
                 tails_server_base_url,
                 args.count,
                 args.wallet_type,
+                args.in_memory_ledger,
+                args.ledger_latency,
             )
         )
     except KeyboardInterrupt:
@@ -0,0 +1,160 @@
+"""
+Benchmark signed versus unsigned submission of ledger read requests.
+
+Reads are submitted to a local stand-in for the indy pool, which replies after
+a fixed latency, so the python3-indy package is needed but libindy and a
+running ledger are not. The stand-in signs requests with the agent's key from
+an in-memory wallet, as libindy would, and TAA acceptance is looked up in the
+cache (or in storage, when run with --no-cache) for each signed request.
+
+Usage:
+    python scripts/benchmark_ledger_reads.py [--reads N] [--latency MS] [--no-cache]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import indy.ledger  # noqa:E402
+
+from aries_cloudagent.cache.in_memory import InMemoryCache  # noqa:E402
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa:E402
+from aries_cloudagent.ledger.indy import (  # noqa:E402
+    IndySdkLedger,
+    IndySdkLedgerPool,
+    TAA_ACCEPTED_RECORD_TYPE,
+)
+from aries_cloudagent.storage.in_memory import InMemoryStorage  # noqa:E402
+from aries_cloudagent.storage.record import StorageRecord  # noqa:E402
+from aries_cloudagent.wallet.in_memory import InMemoryWallet  # noqa:E402
+
+POOL_NAME = "benchmark"
+REPLY = json.dumps({"op": "REPLY", "result": {"data": None}})
+ACCEPTANCE = {
+    "text": "I accept the transaction author agreement",
+    "version": "1.0",
+    "digest": "0" * 64,
+    "mechanism": "wallet_agreement",
+    "time": 1600000000,
+}
+
+
+async def run(reads: int, latency: float, use_cache: bool):
+    """Time read requests submitted along the signed and unsigned paths."""
+    profile = InMemoryProfile.test_profile()
+    wallet = InMemoryWallet(profile)
+    wallet.opened = SimpleNamespace(handle=1)
+    public_did = await wallet.create_public_did()
+
+    cache = None
+    if use_cache:
+        cache = InMemoryCache()
+        await cache.set(f"{TAA_ACCEPTED_RECORD_TYPE}::{POOL_NAME}", ACCEPTANCE)
+    storage = InMemoryStorage(profile)
+    await storage.add_record(
+        StorageRecord(
+            TAA_ACCEPTED_RECORD_TYPE,
+            json.dumps(ACCEPTANCE),
+            {"pool_name": POOL_NAME},
+        )
+    )
+
+    pool = IndySdkLedgerPool(POOL_NAME, checked=True, cache=cache)
+    pool.handle = 1
+    ledger = IndySdkLedger(pool, wallet)
+    ledger.get_indy_storage = lambda: storage
+
+    async def submit_request(pool_handle, request_json):
+        await asyncio.sleep(latency)
+        return REPLY
+
+    async def sign_and_submit_request(pool_handle, wallet_handle, did, request_json):
+        request = json.loads(request_json)
+        verkey = (await wallet.get_local_did(did)).verkey
+        request["signature"] = (
+            await wallet.sign_message(request_json.encode(), verkey)
+        ).hex()
+        return await submit_request(pool_handle, json.dumps(request))
+
+    async def append_taa(request_json, text, version, digest, mechanism, time):
+        request = json.loads(request_json)
+        request["taaAcceptance"] = {
+            "mechanism": mechanism,
+            "taaDigest": digest,
+            "time": time,
+        }
+        return json.dumps(request)
+
+    request_json = json.dumps(
+        {
+            "identifier": public_did.did,
+            "operation": {"type": "105", "dest": public_did.did},
+            "protocolVersion": 2,
+            "reqId": 1,
+        }
+    )
+
+    async def signed_read():
+        public_info = await wallet.get_public_did()
+        await ledger._submit(request_json, sign_did=public_info)
+
+    async def unsigned_read():
+        await ledger._submit_read(request_json)
+
+    with mock.patch.object(
+        indy.ledger, "submit_request", submit_request
+    ), mock.patch.object(
+        indy.ledger, "sign_and_submit_request", sign_and_submit_request
+    ), mock.patch.object(
+        indy.ledger, "append_txn_author_agreement_acceptance_to_request", append_taa
+    ):
+        results = {}
+        for label, read in (("signed", signed_read), ("unsigned", unsigned_read)):
+            await read()  # warm up
+            start = time.perf_counter()
+            for _ in range(reads):
+                await read()
+            results[label] = (time.perf_counter() - start) / reads
+
+    for label, per_read in results.items():
+        print(f"{label:>8} read: {per_read * 1e6:10.1f} us")
+    saving = results["signed"] - results["unsigned"]
+    print(
+        f"  saving: {saving * 1e6:10.1f} us per read "
+        f"({saving / results['signed']:.0%})"
+    )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--reads", type=int, default=2000, help="number of reads for each path"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="simulated pool round trip time in milliseconds",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="look up TAA acceptance in storage instead of the cache",
+    )
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        run(args.reads, args.latency / 1000, not args.no_cache)
+    )
+
+
+if __name__ == "__main__":
+    main()